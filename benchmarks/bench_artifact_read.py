@@ -0,0 +1,163 @@
+"""Compare the peak memory and time of loading an artifact, before and after
+the single-pass read.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_artifact_read.py --size-mib 1024
+
+A signed artifact holding one float64 array of ``--size-mib`` MiB is written
+to a temporary directory and loaded the way the serving layer loads it:
+read, SHA-256, HMAC verify, unpickle.  Two pipelines are measured:
+
+* ``before`` — the previous load path: whole-artifact SHA-256 pass, a copy of
+  the payload, a second pass for the HMAC, and an ``io.BytesIO`` that copies
+  any payload that is not ``bytes``;
+* ``after`` — ``map_or_read`` + ``digest_artifact`` (one pass computing both
+  digests) + ``unpickle_payload`` reading the payload in place.
+
+Each runs over a local file and over an object-store-like handle without a
+file descriptor.  ``before`` memory-maps local files directly; ``after``
+maps a private copy of them, as the serving layer does now.  Peak memory is
+measured with ``tracemalloc``, so page-cache pages of a mapping are not
+counted; it includes the loaded model itself (one artifact's worth for
+format 1).  Pass ``--format 2`` for a sectioned artifact, whose array stays
+in the mapping.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import hashlib
+import io
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from recotem.artifact.format import is_sectioned_payload, parse_header_from_bytes
+from recotem.artifact.io import (
+    artifact_payload,
+    digest_artifact,
+    map_or_read,
+    verify_digest,
+    write_artifact,
+)
+from recotem.artifact.signing import (
+    KeyRing,
+    SafeUnpickler,
+    unpickle_payload,
+    verify_hmac,
+)
+
+_KEY_RING = KeyRing("bench:" + "ab" * 32)
+
+
+class _ObjectStoreFile:
+    """A file handle with a known size and no file descriptor, like fsspec's."""
+
+    def __init__(self, path: Path) -> None:
+        self._fh = open(path, "rb")  # noqa: SIM115 - closed in __exit__
+        self.size = path.stat().st_size
+
+    def read(self, size: int = -1) -> bytes:
+        return self._fh.read(size)
+
+    def readinto(self, buffer: Any) -> int:
+        return self._fh.readinto(buffer)
+
+    def __enter__(self) -> _ObjectStoreFile:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self._fh.close()
+
+
+def _open_local(path: Path) -> Any:
+    return open(path, "rb")  # noqa: SIM115 - used as a context manager
+
+
+def _read_before(fh: Any, cap: int) -> Any:
+    """The previous ``map_or_read``: one ``read`` without a descriptor."""
+    if isinstance(fh, _ObjectStoreFile):
+        return fh.read(cap + 1)
+    return map_or_read(fh, cap, owned=True)
+
+
+def _load_before(path: Path, opener: Callable[[Path], Any]) -> Any:
+    cap = path.stat().st_size
+    with opener(path) as fh:
+        data = _read_before(fh, cap)
+    hashlib.sha256(data).hexdigest()
+    hdr = parse_header_from_bytes(data, cap)
+    payload = artifact_payload(data, hdr.payload_offset)
+    verify_hmac(
+        _KEY_RING,
+        hdr.kid,
+        hdr.kid.encode("utf-8"),
+        hdr.header_data,
+        payload,
+        hdr.hmac_digest,
+    )
+    if is_sectioned_payload(payload):
+        return unpickle_payload(payload)  # only the manifest was ever copied
+    return SafeUnpickler(io.BytesIO(payload)).load()
+
+
+def _load_after(path: Path, opener: Callable[[Path], Any]) -> Any:
+    cap = path.stat().st_size
+    with opener(path) as fh:
+        data = map_or_read(fh, cap)
+    digest = digest_artifact(data, _KEY_RING, cap)
+    verify_digest(digest)
+    return unpickle_payload(digest.payload)
+
+
+def _measure(load: Callable[[], Any]) -> tuple[float, int]:
+    """Return ``(seconds, peak traced bytes)`` of one *load* call."""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    model = load()
+    seconds = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del model
+    return seconds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mib", type=int, default=256)
+    parser.add_argument("--format", type=int, choices=(1, 2), default=1)
+    args = parser.parse_args()
+
+    factors = np.random.default_rng(0).random(args.size_mib * (1 << 20) // 8)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.recotem"
+        write_artifact(
+            {"factors": factors},
+            {"recipe_name": "bench"},
+            _KEY_RING,
+            str(path),
+            versioning="always_overwrite",
+            format_version=args.format,
+        )
+        del factors
+        size = path.stat().st_size
+        print(f"artifact={size / (1 << 20):.0f} MiB format={args.format}")
+        for source, opener in (("local", _open_local), ("remote", _ObjectStoreFile)):
+            for label, load in (("before", _load_before), ("after", _load_after)):
+                seconds, peak = _measure(lambda: load(path, opener))  # noqa: B023
+                print(
+                    f"{source:>6} {label:>6}: {seconds:6.2f} s  "
+                    f"peak {peak / (1 << 20):8.0f} MiB ({peak / size:.2f}x)"
+                )
+
+
+if __name__ == "__main__":
+    main()
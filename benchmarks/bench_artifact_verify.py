@@ -0,0 +1,91 @@
+"""Compare verifying a format-2 artifact with a format-3 (chunked) one.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_artifact_verify.py --size-mib 1024
+
+A signed artifact holding one float64 array of ``--size-mib`` MiB is written
+in both formats to a temporary directory, mapped, and verified the way the
+serving layer verifies it (``digest_artifact`` + ``verify_digest``):
+
+* ``format 2`` — SHA-256 and HMAC over the whole file, on one core;
+* ``format 3`` — the header HMAC plus per-chunk SHA-256 digests, hashed on
+  1, 2, 4, ... up to ``--max-workers`` threads.
+
+Deserialization is not timed.  Format-3 speedups need as many idle cores as
+threads.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from recotem.artifact import integrity
+from recotem.artifact.io import (
+    digest_artifact,
+    map_or_read,
+    verify_digest,
+    write_artifact,
+)
+from recotem.artifact.signing import KeyRing
+
+_KEY_RING = KeyRing("bench:" + "ab" * 32)
+
+
+def _verify_seconds(path: Path, repeat: int) -> float:
+    """Best-of-*repeat* seconds to digest and verify *path*."""
+    cap = path.stat().st_size
+    best = float("inf")
+    for _ in range(repeat):
+        with open(path, "rb") as fh:
+            data = map_or_read(fh, cap)
+        started = time.perf_counter()
+        verify_digest(digest_artifact(data, _KEY_RING, cap))
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mib", type=int, default=256)
+    parser.add_argument("--max-workers", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    factors = np.random.default_rng(0).random(args.size_mib * (1 << 20) // 8)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {}
+        for version in (2, 3):
+            paths[version] = Path(tmp) / f"bench-{version}.recotem"
+            write_artifact(
+                {"factors": factors},
+                {"recipe_name": "bench"},
+                _KEY_RING,
+                str(paths[version]),
+                versioning="always_overwrite",
+                format_version=version,
+            )
+        del factors
+        size = paths[2].stat().st_size
+        print(f"artifact={size / (1 << 20):.0f} MiB")
+
+        baseline = _verify_seconds(paths[2], args.repeat)
+        print(f"format 2          : {baseline:6.3f} s")
+        workers = 1
+        while workers <= args.max_workers:
+            integrity.VERIFY_WORKERS = workers
+            seconds = _verify_seconds(paths[3], args.repeat)
+            print(
+                f"format 3 {workers:>2} thread{'s' if workers > 1 else ' '}: "
+                f"{seconds:6.3f} s ({baseline / seconds:.2f}x)"
+            )
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
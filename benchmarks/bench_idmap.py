@@ -0,0 +1,90 @@
+"""Compare the compact ID index with irspack's list + dict mapper.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_idmap.py --n-ids 2000000
+
+For each mapper this reports the Python heap held after load (tracemalloc),
+the time to restore it from its pickled form, and the lookup latency.  The
+compact index is pickled with protocol 5 and out-of-band buffers, which is
+how artifact format 2 stores it (so its arrays are memory-mapped on load).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import pickle
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+
+def _measure(load: Callable[[], Any]) -> tuple[Any, float, int]:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    obj = load()
+    elapsed = time.perf_counter() - started
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, elapsed, held
+
+
+def _lookup_ns(contains: Callable[[str], Any], keys: list[str]) -> float:
+    started = time.perf_counter()
+    for key in keys:
+        contains(key)
+    return (time.perf_counter() - started) / len(keys) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n-ids", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    from recotem._idindex import StringIndex
+
+    ids = [f"user-{i:012d}" for i in range(args.n_ids)]
+    keys = ids[:: max(1, args.n_ids // 100_000)]
+
+    legacy_blob = pickle.dumps(ids, protocol=5)
+    started = time.perf_counter()
+    index = StringIndex.from_strings(ids)
+    build = time.perf_counter() - started
+    buffers: list[pickle.PickleBuffer] = []
+    compact_blob = pickle.dumps(
+        index.to_state(), protocol=5, buffer_callback=buffers.append
+    )
+    raw = [b.raw() for b in buffers]
+    del ids, index
+    gc.collect()
+
+    def load_legacy() -> dict[str, int]:
+        loaded = pickle.loads(legacy_blob)
+        return {uid: i for i, uid in enumerate(loaded)}
+
+    def load_compact() -> StringIndex:
+        return StringIndex.from_state(pickle.loads(compact_blob, buffers=raw))
+
+    legacy, legacy_s, legacy_bytes = _measure(load_legacy)
+    legacy_ns = _lookup_ns(legacy.__contains__, keys)
+    del legacy
+    compact, compact_s, compact_bytes = _measure(load_compact)
+    compact_ns = _lookup_ns(compact.__contains__, keys)
+
+    mib = 1 << 20
+    print(f"ids: {args.n_ids:,}  (compact build at train time: {build:.2f} s)")
+    print(f"{'mapper':<10}{'heap MiB':>12}{'load s':>10}{'lookup ns':>12}")
+    print(
+        f"{'list+dict':<10}{legacy_bytes / mib:>12.1f}{legacy_s:>10.3f}{legacy_ns:>12.0f}"
+    )
+    print(
+        f"{'compact':<10}{compact_bytes / mib:>12.1f}{compact_s:>10.3f}{compact_ns:>12.0f}"
+        f"   (+{compact.nbytes / mib:.1f} MiB mapped sections)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Compare locked and copy-on-write ``ModelRegistry.get()`` under contention.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_registry.py --threads 16 --recipes 50
+
+Reader threads call ``get()`` in a tight loop while one writer hot-swaps a
+recipe every ``--swap-interval-ms``.  Two registries are measured:
+
+* ``locked`` — the previous design, every ``get()`` inside a
+  ``threading.Lock`` (reproduced here as a subclass);
+* ``cow`` — the current ``ModelRegistry``, reading a published snapshot
+  without a lock.
+
+Reported is the total ``get()`` throughput across all readers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+
+from recotem.serving.registry import ModelEntry, ModelRegistry
+
+
+class LockedRegistry(ModelRegistry):
+    """``ModelRegistry`` whose reads take the writer lock, as before."""
+
+    def get(self, name: str) -> ModelEntry | None:
+        with self._lock:
+            return self._snapshot.entries.get(name)
+
+
+def _entry(name: str) -> ModelEntry:
+    return ModelEntry(name=name, recommender=object(), header={}, kid="bench")
+
+
+def _run(
+    registry: ModelRegistry,
+    names: list[str],
+    threads: int,
+    seconds: float,
+    swap_interval: float,
+) -> float:
+    """Return ``get()`` calls per second summed over *threads* readers."""
+    for name in names:
+        registry.replace(name, _entry(name))
+    stop = threading.Event()
+    counts = [0] * threads
+    start = threading.Barrier(threads + 2)
+
+    def reader(slot: int) -> None:
+        n = len(names)
+        i = slot
+        done = 0
+        get = registry.get
+        start.wait()
+        while not stop.is_set():
+            for _ in range(1000):
+                get(names[i % n])
+                i += 1
+            done += 1000
+        counts[slot] = done
+
+    def writer() -> None:
+        i = 0
+        start.wait()
+        while not stop.wait(swap_interval):
+            name = names[i % len(names)]
+            registry.replace(name, _entry(name))
+            i += 1
+
+    workers = [threading.Thread(target=reader, args=(t,)) for t in range(threads)]
+    workers.append(threading.Thread(target=writer))
+    for w in workers:
+        w.start()
+    start.wait()
+    began = time.perf_counter()
+    time.sleep(seconds)
+    stop.set()
+    for w in workers:
+        w.join()
+    return sum(counts) / (time.perf_counter() - began)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--recipes", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--swap-interval-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    names = [f"recipe-{i}" for i in range(args.recipes)]
+    swap_interval = args.swap_interval_ms / 1000
+    results = {
+        label: _run(cls(), names, args.threads, args.seconds, swap_interval)
+        for label, cls in (("locked", LockedRegistry), ("cow", ModelRegistry))
+    }
+    print(
+        f"threads={args.threads} recipes={args.recipes} "
+        f"swap_interval_ms={args.swap_interval_ms}"
+    )
+    for label, rate in results.items():
+        print(f"{label:>7}: {rate / 1e6:8.2f} M get()/s")
+    print(f"speedup: {results['cow'] / results['locked']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
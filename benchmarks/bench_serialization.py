@@ -0,0 +1,97 @@
+"""Compare pre-encoded response assembly with the pydantic model path.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_serialization.py --limit 1000
+
+The model path is what ``:recommend`` did before responses were pre-encoded:
+one ``RecommendItem.model_validate`` per item, a ``RecommendResponse``,
+FastAPI's re-validation against ``response_model`` and a JSON dump.  The
+encoded path splices the metadata fragments built by
+``build_metadata_index``.  Both produce the same bytes, which is checked
+before timing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+from pydantic import TypeAdapter
+
+from recotem.metadata.loader import build_metadata_index
+from recotem.serving import encoding
+from recotem.serving.schemas import RecommendItem, RecommendResponse
+
+_VERSION = "sha256:" + "0" * 64
+
+
+def _per_call_us(fn: Callable[[], bytes], repeat: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--n-items", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    ids = [f"item-{i:08d}" for i in range(args.n_items)]
+    df = pd.DataFrame(
+        {
+            "title": [f"Product {i}" for i in range(args.n_items)],
+            "category": rng.choice(["tools", "home", "garden"], args.n_items),
+            "price": rng.uniform(1, 100, args.n_items).round(2),
+        },
+        index=pd.Index(ids, name="item_id"),
+    )
+    meta = build_metadata_index(df)
+    picked = rng.choice(args.n_items, size=args.limit, replace=False)
+    results = [
+        (ids[i], float(s)) for i, s in zip(picked, rng.random(args.limit), strict=True)
+    ]
+    adapter = TypeAdapter(RecommendResponse)
+
+    def model_path() -> bytes:
+        items = []
+        for item_id, score in results:
+            fields = dict(meta.get(item_id, {}))
+            fields["item_id"] = item_id
+            fields["score"] = score
+            items.append(RecommendItem.model_validate(fields))
+        response = RecommendResponse(
+            request_id="bench", recipe="demo", model_version=_VERSION, items=items
+        )
+        # FastAPI validates the returned model against response_model again.
+        return adapter.dump_json(adapter.validate_python(response))
+
+    def encoded_path() -> bytes:
+        scores = encoding.encode_scores([score for _, score in results])
+        item_parts = encoding.item_parts_lookup(meta)
+        items = []
+        for (item_id, _), score in zip(results, scores, strict=True):
+            head, tail = item_parts(item_id)
+            items.append(head + score + tail)
+        return encoding.recommend_body("bench", "demo", _VERSION, items)
+
+    assert model_path() == encoded_path(), "encoded body differs from model body"
+
+    model_us = _per_call_us(model_path, args.repeat)
+    encoded_us = _per_call_us(encoded_path, args.repeat)
+    print(f"limit={args.limit} items with 3 metadata fields")
+    print(f"{'path':<10}{'us/response':>14}")
+    print(f"{'model':<10}{model_us:>14.0f}")
+    print(f"{'encoded':<10}{encoded_us:>14.0f}   ({model_us / encoded_us:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
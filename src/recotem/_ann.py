@@ -0,0 +1,240 @@
+"""Approximate nearest-neighbour (ANN) retrieval for factor recommenders.
+
+IALS, TruncatedSVD and BPRFM score a user as ``u · V.T (+ b)``: one inner
+product per catalog item.  For catalogs with millions of items that full pass
+is the latency floor of ``:recommend``.  :class:`IVFIndex` is an inverted-file
+("IVF-Flat") index over the item factors.  Items are clustered with k-means,
+and a query only scores the items in its ``n_probe`` most promising clusters.
+
+Inner-product search is reduced to Euclidean search with the usual MIPS
+augmentation.  Item vector ``x = [v, b]`` becomes ``[x, sqrt(M² - |x|²)]``,
+where ``M`` is the largest item norm, and a query ``[u, 1]`` becomes
+``[u, 1, 0]``.  Minimising the L2 distance to a centroid is then equivalent
+to maximising the inner product, so standard k-means applies.
+
+The index stores only centroids and the item order per cluster.  Candidate
+scores are recomputed from the recommender's own factors, so every returned
+score is exact.  The index is therefore an optimisation of *which* items get
+scored, never of *how*.
+
+This module lives at package level (like ``recotem._idmap``) because training
+builds the index and serving queries it.  It is pickled as a plain ``dict`` of
+NumPy arrays (:meth:`IVFIndex.to_state`), so no new class enters the
+unpickling allow-list.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+#: irspack classes whose scores are an inner product of user and item factors.
+SUPPORTED_CLASSES: frozenset[str] = frozenset(
+    {"IALSRecommender", "TruncatedSVDRecommender", "BPRFMRecommender"}
+)
+
+_KMEANS_ITERATIONS = 20
+_KMEANS_POINTS_PER_LIST = 64
+_ASSIGN_CHUNK = 65536
+
+
+@dataclass(frozen=True)
+class FactorView:
+    """User / item factors of a factor recommender.
+
+    ``score(user) = user_factors[user] @ item_factors.T + item_bias``.
+    """
+
+    user_factors: np.ndarray
+    item_factors: np.ndarray
+    item_bias: np.ndarray | None = None
+
+    def score(self, query: np.ndarray, items: np.ndarray | None = None) -> np.ndarray:
+        """Exact float64 scores of one user *query* over *items* (default: all)."""
+        factors = self.item_factors if items is None else self.item_factors[items]
+        scores = np.asarray(factors @ query, dtype=np.float64)
+        if self.item_bias is not None:
+            bias = self.item_bias if items is None else self.item_bias[items]
+            scores = scores + bias
+        return scores
+
+
+def factor_view(recommender: Any) -> FactorView | None:
+    """Return the factor view of *recommender*, or ``None`` if unsupported."""
+    name = type(recommender).__name__
+    if name not in SUPPORTED_CLASSES:
+        return None
+    if name == "BPRFMRecommender":
+        fm = recommender.fm
+        return FactorView(
+            np.asarray(fm.user_embeddings),
+            np.ascontiguousarray(fm.item_embeddings),
+            np.asarray(fm.item_biases),
+        )
+    # Candidate rescoring gathers item rows, so keep them contiguous
+    # (TruncatedSVD's item factors are a transposed view).
+    return FactorView(
+        np.asarray(recommender.get_user_embedding()),
+        np.ascontiguousarray(recommender.get_item_embedding()),
+    )
+
+
+def cold_user_factors(recommender: Any, X: Any) -> np.ndarray | None:
+    """Fold cold-start profiles *X* into user factors, when the model can.
+
+    BPRFM has no fold-in, so it returns ``None`` and callers score exactly.
+    """
+    name = type(recommender).__name__
+    if name == "IALSRecommender":
+        return np.asarray(recommender.compute_user_embedding(X))
+    if name == "TruncatedSVDRecommender":
+        return np.asarray(recommender.decomposer.transform(X))
+    return None
+
+
+class IVFIndex:
+    """Inverted-file index over augmented item factors.
+
+    Parameters
+    ----------
+    centroids:
+        ``(n_lists, dim)`` cluster centres in the augmented space.
+    list_offsets:
+        ``(n_lists + 1,)`` start offsets of each cluster in *list_items*.
+    list_items:
+        Item indices grouped by cluster.
+    n_probe:
+        Clusters scanned per query.
+    has_bias:
+        Whether the item vectors carry a bias column (BPRFM).
+    """
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        list_offsets: np.ndarray,
+        list_items: np.ndarray,
+        n_probe: int,
+        has_bias: bool,
+    ) -> None:
+        self.centroids = centroids
+        self.list_offsets = list_offsets
+        self.list_items = list_items
+        self.n_probe = int(n_probe)
+        self.has_bias = bool(has_bias)
+        self._half_sq_norms = 0.5 * np.einsum("ij,ij->i", centroids, centroids)
+
+    @property
+    def n_lists(self) -> int:
+        return int(self.centroids.shape[0])
+
+    @classmethod
+    def build(cls, view: FactorView, n_lists: int, seed: int = 0) -> IVFIndex:
+        """Cluster *view*'s items into *n_lists* lists (0 = ``sqrt(n_items)``)."""
+        items = _augment_items(view)
+        n_items = items.shape[0]
+        if n_lists <= 0:
+            n_lists = max(1, round(math.sqrt(n_items)))
+        n_lists = min(n_lists, n_items)
+        rng = np.random.default_rng(seed)
+        centroids = _kmeans(items, n_lists, rng)
+        assign = _nearest_centroid(items, centroids)
+        counts = np.bincount(assign, minlength=n_lists)
+        list_offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        list_items = np.argsort(assign, kind="stable").astype(np.int64)
+        return cls(
+            centroids,
+            list_offsets,
+            list_items,
+            n_probe=n_lists,
+            has_bias=view.item_bias is not None,
+        )
+
+    def to_state(self) -> dict[str, Any]:
+        return {
+            "kind": "ivf_flat",
+            "centroids": self.centroids,
+            "list_offsets": self.list_offsets,
+            "list_items": self.list_items,
+            "n_probe": self.n_probe,
+            "has_bias": self.has_bias,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> IVFIndex:
+        return cls(
+            np.asarray(state["centroids"]),
+            np.asarray(state["list_offsets"]),
+            np.asarray(state["list_items"]),
+            n_probe=state["n_probe"],
+            has_bias=state["has_bias"],
+        )
+
+    def candidates(self, queries: np.ndarray) -> list[np.ndarray]:
+        """Return the candidate item indices for each row of user *queries*."""
+        augmented = _augment_queries(queries, self.has_bias)
+        affinity = augmented @ self.centroids.T - self._half_sq_norms
+        n_probe = min(self.n_probe, self.n_lists)
+        if n_probe < self.n_lists:
+            probes = np.argpartition(-affinity, n_probe - 1, axis=1)[:, :n_probe]
+        else:
+            probes = np.broadcast_to(np.arange(self.n_lists), affinity.shape)
+        offsets = self.list_offsets
+        result: list[np.ndarray] = []
+        for row in probes:
+            result.append(
+                np.concatenate(
+                    [self.list_items[offsets[p] : offsets[p + 1]] for p in row]
+                )
+            )
+        return result
+
+
+def _augment_items(view: FactorView) -> np.ndarray:
+    items = np.asarray(view.item_factors, dtype=np.float64)
+    if view.item_bias is not None:
+        items = np.hstack([items, np.asarray(view.item_bias, np.float64)[:, None]])
+    sq_norms = np.einsum("ij,ij->i", items, items)
+    slack = np.sqrt(np.maximum(sq_norms.max(initial=0.0) - sq_norms, 0.0))
+    return np.hstack([items, slack[:, None]])
+
+
+def _augment_queries(queries: np.ndarray, has_bias: bool) -> np.ndarray:
+    q = np.asarray(queries, dtype=np.float64)
+    extra = 2 if has_bias else 1
+    out = np.zeros((q.shape[0], q.shape[1] + extra))
+    out[:, : q.shape[1]] = q
+    if has_bias:
+        out[:, q.shape[1]] = 1.0
+    return out
+
+
+def _nearest_centroid(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    half_sq_norms = 0.5 * np.einsum("ij,ij->i", centroids, centroids)
+    out = np.empty(points.shape[0], dtype=np.int64)
+    for start in range(0, points.shape[0], _ASSIGN_CHUNK):
+        block = points[start : start + _ASSIGN_CHUNK]
+        out[start : start + len(block)] = np.argmax(
+            block @ centroids.T - half_sq_norms, axis=1
+        )
+    return out
+
+
+def _kmeans(points: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    """Lloyd's k-means on a bounded sample; empty clusters are re-seeded."""
+    n_sample = min(points.shape[0], k * _KMEANS_POINTS_PER_LIST)
+    sample = points[rng.choice(points.shape[0], size=n_sample, replace=False)]
+    centroids = sample[rng.choice(n_sample, size=k, replace=False)].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        assign = _nearest_centroid(sample, centroids)
+        counts = np.bincount(assign, minlength=k)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        filled = counts > 0
+        centroids[filled] = sums[filled] / counts[filled, None]
+        if not filled.all():
+            centroids[~filled] = sample[rng.choice(n_sample, size=(~filled).sum())]
+    return centroids
@@ -0,0 +1,345 @@
+"""Offline bulk top-k export behind ``recotem score``.
+
+Exporting recommendations for every user through the HTTP API costs one
+request, one JSON encode and one decode per user.  Here the verified
+``IDMappedRecommender`` is scored directly instead:
+
+* IDs are read lazily and grouped into chunks of ``chunk_size``.  Each chunk
+  is one ``get_recommendation_for_known_user_batch`` call (or one
+  ``get_recommendation_for_new_user_batch`` call with single-item seeds for
+  ``related`` exports).
+* Chunks are scored on a process pool started with ``forkserver`` (or
+  ``spawn`` where that is unavailable).  Forking the parent after it has
+  unpickled the model could inherit OpenMP/BLAS locks held by threads that
+  do not exist in the child, so each worker caps its BLAS pool and then loads
+  and verifies the artifact once itself through *load_model*.
+* Results come back as Arrow tables in input order and are appended to a
+  Parquet or CSV file on any fsspec path.  At most ``2 * workers`` chunks are
+  in flight, so memory does not grow with the number of IDs.
+
+The output is a long table with one row per recommended item:
+``user_id, rank, item_id, score`` (or ``item_id, rank, related_item_id,
+score`` for related exports).  ``rank`` starts at 1.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import multiprocessing
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Literal
+
+import fsspec
+import numpy as np
+import pyarrow as pa
+import structlog
+
+from recotem._idmap import IDMappedRecommender
+
+logger = structlog.get_logger(__name__)
+
+OutputFormat = Literal["parquet", "csv"]
+
+USER_SCHEMA = pa.schema(
+    [
+        ("user_id", pa.string()),
+        ("rank", pa.int32()),
+        ("item_id", pa.string()),
+        ("score", pa.float64()),
+    ]
+)
+RELATED_SCHEMA = pa.schema(
+    [
+        ("item_id", pa.string()),
+        ("rank", pa.int32()),
+        ("related_item_id", pa.string()),
+        ("score", pa.float64()),
+    ]
+)
+
+DEFAULT_CHUNK_SIZE = 1024
+
+# Seconds between ``score_progress`` log lines.
+_PROGRESS_INTERVAL = 10.0
+
+# Loaded once per worker process by ``_init_worker``.
+_WORKER_RECOMMENDER: IDMappedRecommender | None = None
+
+
+@dataclass
+class ScoreStats:
+    """Counters reported when an export finishes."""
+
+    scored: int = 0
+    skipped: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        """IDs scored per second of wall-clock time."""
+        return self.scored / self.seconds if self.seconds > 0 else 0.0
+
+
+def infer_format(path: str) -> OutputFormat:
+    """``csv`` for a ``.csv`` / ``.csv.gz`` path, ``parquet`` otherwise."""
+    lowered = path.lower()
+    return "csv" if lowered.endswith((".csv", ".csv.gz")) else "parquet"
+
+
+def read_ids(path: str) -> Iterator[str]:
+    """Yield the non-blank lines of the text file at *path* (any fsspec URI)."""
+    with fsspec.open(path, "rt", encoding="utf-8", compression="infer") as fh:
+        for line in fh:
+            value = line.strip()
+            if value:
+                yield value
+
+
+def load_recommender(
+    uri: str,
+    signing_keys: str,
+    *,
+    max_artifact_bytes: int,
+    max_payload_bytes: int,
+) -> IDMappedRecommender:
+    """Read, verify and unpickle the ``IDMappedRecommender`` artifact at *uri*.
+
+    *signing_keys* is the raw ``RECOTEM_SIGNING_KEYS`` value, so a
+    ``functools.partial`` of this function can be sent to pool workers.
+    """
+    from recotem._irspack_compat import check_artifact_irspack_version
+    from recotem.artifact.compression import payload_compression
+    from recotem.artifact.format import ArtifactError
+    from recotem.artifact.io import read_artifact
+    from recotem.artifact.signing import KeyRing, unpickle_payload
+
+    hdr, payload = read_artifact(
+        uri, KeyRing(signing_keys), max_bytes=max_artifact_bytes
+    )
+    header_dict = json.loads(hdr.header_data)
+    # Refuse a skewed irspack before unpickling, as serve does.
+    check_artifact_irspack_version(
+        header_dict, name=str(header_dict.get("recipe_name") or uri)
+    )
+    recommender = unpickle_payload(
+        payload,
+        compression=payload_compression(header_dict),
+        max_decompressed_bytes=max_payload_bytes,
+    )
+    if not isinstance(recommender, IDMappedRecommender):
+        raise ArtifactError(
+            f"artifact payload is {type(recommender).__name__}, "
+            "not a recotem IDMappedRecommender"
+        )
+    return recommender
+
+
+def score_chunk(
+    recommender: IDMappedRecommender,
+    ids: list[str],
+    limit: int,
+    related: bool,
+) -> pa.Table:
+    """Score *ids* (all known to *recommender*) and return their rows."""
+    if related:
+        ranked = recommender.get_recommendation_for_new_user_batch(
+            [[iid] for iid in ids], limit
+        )
+        schema = RELATED_SCHEMA
+    else:
+        ranked = recommender.get_recommendation_for_known_user_batch(ids, limit)
+        schema = USER_SCHEMA
+    subjects: list[str] = []
+    ranks: list[int] = []
+    items: list[str] = []
+    scores: list[float] = []
+    for subject, row in zip(ids, ranked, strict=True):
+        rank = 0
+        for item_id, score in row:
+            if not math.isfinite(score):
+                continue
+            rank += 1
+            subjects.append(subject)
+            ranks.append(rank)
+            items.append(item_id)
+            scores.append(score)
+    return pa.Table.from_arrays(
+        [
+            pa.array(subjects, pa.string()),
+            pa.array(ranks, pa.int32()),
+            pa.array(items, pa.string()),
+            pa.array(np.asarray(scores, dtype=np.float64)),
+        ],
+        schema=schema,
+    )
+
+
+def export_scores(
+    recommender: IDMappedRecommender,
+    output: str,
+    *,
+    ids: Iterable[str] | None = None,
+    limit: int = 10,
+    related: bool = False,
+    fmt: OutputFormat | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    load_model: Callable[[], IDMappedRecommender] | None = None,
+) -> ScoreStats:
+    """Write the top-*limit* items for *ids* to *output* and return the counts.
+
+    *ids* defaults to every user (or every item when *related*) known to the
+    model.  IDs the model does not know are skipped and counted in
+    ``ScoreStats.skipped``.
+
+    With ``workers > 1``, *load_model* must be a picklable callable that
+    returns the same model; each worker calls it once.  Without it the export
+    scores in-process.
+    """
+    known = (
+        recommender._mapper.item_id_to_index
+        if related
+        else recommender._mapper.user_id_to_index
+    )
+    if ids is None:
+        ids = recommender.item_ids if related else recommender.user_ids
+    stats = ScoreStats()
+    started = time.perf_counter()
+
+    def chunks() -> Iterator[list[str]]:
+        it = iter(ids)
+        while batch := list(islice(it, chunk_size)):
+            kept = [i for i in batch if i in known]
+            stats.skipped += len(batch) - len(kept)
+            if kept:
+                yield kept
+
+    writer = _TableWriter(
+        output,
+        fmt or infer_format(output),
+        RELATED_SCHEMA if related else USER_SCHEMA,
+    )
+    last_progress = started
+    try:
+        for n_ids, table in _scored_chunks(
+            recommender, chunks(), limit, related, workers, load_model
+        ):
+            writer.write(table)
+            stats.scored += n_ids
+            stats.rows += table.num_rows
+            now = time.perf_counter()
+            if now - last_progress >= _PROGRESS_INTERVAL:
+                last_progress = now
+                logger.info(
+                    "score_progress",
+                    scored=stats.scored,
+                    rows=stats.rows,
+                    per_second=round(stats.scored / (now - started), 1),
+                )
+    finally:
+        writer.close()
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _scored_chunks(
+    recommender: IDMappedRecommender,
+    chunks: Iterator[list[str]],
+    limit: int,
+    related: bool,
+    workers: int,
+    load_model: Callable[[], IDMappedRecommender] | None,
+) -> Iterator[tuple[int, pa.Table]]:
+    """Yield ``(len(chunk), table)`` for each chunk, in input order."""
+    if workers <= 1 or load_model is None:
+        for chunk in chunks:
+            yield len(chunk), score_chunk(recommender, chunk, limit, related)
+        return
+
+    method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    blas_threads = max(1, (os.cpu_count() or 1) // workers)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context(method),
+        initializer=_init_worker,
+        initargs=(blas_threads, load_model),
+    ) as pool:
+        inflight: deque[tuple[int, Future[pa.Table]]] = deque()
+        for chunk in chunks:
+            inflight.append(
+                (len(chunk), pool.submit(_score_in_worker, chunk, limit, related))
+            )
+            if len(inflight) >= 2 * workers:
+                n, future = inflight.popleft()
+                yield n, future.result()
+        while inflight:
+            n, future = inflight.popleft()
+            yield n, future.result()
+
+
+def _init_worker(
+    blas_threads: int, load_model: Callable[[], IDMappedRecommender]
+) -> None:
+    global _WORKER_RECOMMENDER
+    # N workers each running a BLAS pool sized for the whole machine would
+    # oversubscribe the cores; threadpoolctl is optional.  The cap goes on
+    # before the model is loaded so no pool is ever sized for the machine.
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        pass
+    else:
+        threadpool_limits(blas_threads)
+    _WORKER_RECOMMENDER = load_model()
+
+
+def _score_in_worker(ids: list[str], limit: int, related: bool) -> pa.Table:
+    assert _WORKER_RECOMMENDER is not None, "worker started without a model"
+    return score_chunk(_WORKER_RECOMMENDER, ids, limit, related)
+
+
+class _TableWriter:
+    """Append Arrow tables to one Parquet or CSV file on an fsspec path."""
+
+    def __init__(self, path: str, fmt: OutputFormat, schema: pa.Schema) -> None:
+        self._fh = fsspec.open(path, "wb", compression="infer").open()
+        self._writer: Any
+        try:
+            if fmt == "csv":
+                from pyarrow import csv as pa_csv
+
+                self._writer = pa_csv.CSVWriter(self._fh, schema)
+            else:
+                import pyarrow.parquet as pq
+
+                self._writer = pq.ParquetWriter(self._fh, schema)
+        except BaseException:
+            self._fh.close()
+            raise
+
+    def write(self, table: pa.Table) -> None:
+        if table.num_rows:
+            self._writer.write_table(table)
+
+    def close(self) -> None:
+        try:
+            self._writer.close()
+        finally:
+            self._fh.close()
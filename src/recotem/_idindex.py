@@ -0,0 +1,270 @@
+"""Compact string-ID index used by ``IDMappedRecommender``.
+
+irspack's ``IDMapper`` keeps the IDs as a ``list[str]`` plus a
+``dict[str, int]``.  With tens of millions of users that is several GB of
+Python objects, and every artifact load rebuilds the dict.  :class:`StringIndex`
+stores the same IDs as an Arrow-style string array (one UTF-8 buffer plus an
+``int64`` offsets array) and an open-addressing hash table of row numbers.
+All three are plain NumPy arrays, so format-2 artifacts store them as
+mappable sections and loading is a memory map rather than a rebuild.
+
+The hash is CRC-32 of the UTF-8 ID, spread over the table with Fibonacci
+hashing.  It is stable across processes, unlike ``hash()``, and costs about
+as much as a ``dict`` lookup.  The table uses linear probing at a load factor
+of at most 1/2 and is only ever built, never mutated.  The hash is not
+keyed: IDs come from the training data, not from requests.
+
+Like ``recotem._ann``, the index crosses the pickle boundary as a plain dict
+(:meth:`StringIndex.to_state`), so the unpickling allow-list is unchanged.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any, overload
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import scipy.sparse as sps
+
+_MIN_CAPACITY = 8
+_MAX_CAPACITY = 1 << 32
+_FIBONACCI = 0x9E3779B1
+
+
+class StringIndex(Sequence[str]):
+    """Immutable sequence of distinct string IDs with O(1) reverse lookup.
+
+    Indexing returns the ID at a position; :meth:`position` (or the
+    :attr:`positions` mapping view) returns the position of an ID.
+    """
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray, slots: np.ndarray):
+        self._data = data
+        self._offsets = offsets
+        self._slots = slots
+        # memoryview indexing yields Python ints, several times faster than
+        # NumPy scalar indexing on the lookup path.
+        self._buf = _native_view(data)
+        self._offsets_view = _native_view(offsets)
+        self._slots_view = _native_view(slots)
+        self._mask = len(slots) - 1
+        self._shift = 32 - (len(slots).bit_length() - 1)
+        self.positions = _PositionView(self)
+
+    @classmethod
+    def from_strings(cls, ids: Iterable[Any]) -> StringIndex:
+        """Build from *ids* (converted with ``str``).
+
+        Raises
+        ------
+        ValueError
+            If *ids* contains duplicates.
+        """
+        array = pa.array([str(i) for i in ids], type=pa.large_string())
+        if len(array) and pc.count_distinct(array).as_py() != len(array):
+            raise ValueError("Duplicates in ids.")
+        _, offsets_buf, data_buf = array.buffers()
+        offsets = np.frombuffer(offsets_buf, dtype=np.int64)[: len(array) + 1].copy()
+        data = (
+            np.frombuffer(data_buf, dtype=np.uint8)[: offsets[-1]].copy()
+            if data_buf is not None
+            else np.zeros(0, dtype=np.uint8)
+        )
+        buf = memoryview(data)
+        bounds = offsets.tolist()
+        hashes = np.fromiter(
+            (zlib.crc32(buf[bounds[i] : bounds[i + 1]]) for i in range(len(array))),
+            dtype=np.uint64,
+            count=len(array),
+        )
+        return cls(data, offsets, _build_slots(hashes))
+
+    def to_state(self) -> dict[str, Any]:
+        return {
+            "kind": "crc32_fibonacci_linear",
+            "data": self._data,
+            "offsets": self._offsets,
+            "slots": self._slots,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> StringIndex:
+        return cls(
+            np.asarray(state["data"]),
+            np.asarray(state["offsets"]),
+            np.asarray(state["slots"]),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the buffers (IDs, offsets and hash table)."""
+        return int(self._data.nbytes + self._offsets.nbytes + self._slots.nbytes)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("StringIndex index out of range")
+        return self._decode(index)
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._decode(i) for i in range(len(self)))
+
+    def __contains__(self, value: object) -> bool:
+        return self.position(value) is not None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StringIndex):
+            return np.array_equal(self._offsets, other._offsets) and np.array_equal(
+                self._data, other._data
+            )
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other, strict=True)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"StringIndex(n={len(self)})"
+
+    def position(self, value: object) -> int | None:
+        """Return the position of *value*, or ``None`` if absent."""
+        if not isinstance(value, str):
+            return None
+        key = value.encode("utf-8")
+        slots = self._slots_view
+        offsets = self._offsets_view
+        buf = self._buf
+        mask = self._mask
+        slot = ((zlib.crc32(key) * _FIBONACCI) & 0xFFFFFFFF) >> self._shift
+        while True:
+            row = slots[slot]
+            if row < 0:
+                return None
+            if buf[offsets[row] : offsets[row + 1]] == key:
+                return row
+            slot = (slot + 1) & mask
+
+    def _decode(self, row: int) -> str:
+        offsets = self._offsets_view
+        return str(self._buf[offsets[row] : offsets[row + 1]], "utf-8")
+
+
+class _PositionView(Mapping[str, int]):
+    """``dict``-like ``id -> position`` view over a :class:`StringIndex`."""
+
+    __slots__ = ("_index",)
+
+    def __init__(self, index: StringIndex) -> None:
+        self._index = index
+
+    def __getitem__(self, key: str) -> int:
+        row = self._index.position(key)
+        if row is None:
+            raise KeyError(key)
+        return row
+
+    def get(self, key: str, default: Any = None) -> Any:
+        row = self._index.position(key)
+        return default if row is None else row
+
+    def __contains__(self, key: object) -> bool:
+        return self._index.position(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class CompactIDMapper:
+    """Drop-in for the subset of irspack's ``IDMapper`` that recotem uses.
+
+    Exposes ``user_ids`` / ``item_ids`` (position -> id),
+    ``user_id_to_index`` / ``item_id_to_index`` (id -> position) and
+    :meth:`list_of_user_profile_to_matrix`.
+    """
+
+    def __init__(self, user_ids: StringIndex, item_ids: StringIndex) -> None:
+        self.user_ids = user_ids
+        self.item_ids = item_ids
+        self.user_id_to_index = user_ids.positions
+        self.item_id_to_index = item_ids.positions
+
+    def list_of_user_profile_to_matrix(
+        self, users_info: Sequence[Iterable[str]]
+    ) -> sps.csr_matrix:
+        """Pack item-id profiles into a CSR matrix; unknown ids are ignored."""
+        position = self.item_ids.position
+        cols: list[int] = []
+        indptr = [0]
+        for profile in users_info:
+            for iid in profile:
+                col = position(iid)
+                if col is not None:
+                    cols.append(col)
+            indptr.append(len(cols))
+        return sps.csr_matrix(
+            (np.ones(len(cols)), cols, indptr),
+            shape=(len(users_info), len(self.item_ids)),
+        )
+
+
+def _native_view(array: np.ndarray) -> memoryview:
+    """Native-format memoryview of *array*.
+
+    Arrays restored from artifact sections carry an explicit byte-order
+    format (``=i``) that memoryview cannot index, so recast through bytes.
+    """
+    code = {1: "B", 4: "i", 8: "q"}[array.dtype.itemsize]
+    return memoryview(np.ascontiguousarray(array)).cast("B").cast(code)
+
+
+def _build_slots(hashes: np.ndarray) -> np.ndarray:
+    """Linear-probing table of row numbers (``-1`` = empty), built in rounds.
+
+    Each round places every pending row whose current probe slot is free;
+    when several rows contend for one slot the lowest row wins and the rest
+    advance.  A row is placed at the first slot of its probe sequence that
+    was free when it got there, and slots are never freed, so a lookup that
+    stops at the first empty slot finds every row.
+    """
+    n = len(hashes)
+    capacity = _MIN_CAPACITY
+    while capacity < 2 * n:
+        capacity *= 2
+    if capacity > _MAX_CAPACITY:
+        raise ValueError(f"too many ids for one index: {n}")
+    dtype = np.int32 if n < 2**31 else np.int64
+    slots = np.full(capacity, -1, dtype=dtype)
+    shift = np.uint64(32 - (capacity.bit_length() - 1))
+    mixed = (hashes * np.uint64(_FIBONACCI)) & np.uint64(0xFFFFFFFF)
+    probe = (mixed >> shift).astype(np.int64)
+    pending = np.arange(n, dtype=np.int64)
+    while pending.size:
+        free = np.flatnonzero(slots[probe[pending]] == -1)
+        targets, first = np.unique(probe[pending[free]], return_index=True)
+        slots[targets] = pending[free[first]]
+        placed = np.zeros(pending.size, dtype=bool)
+        placed[free[first]] = True
+        pending = pending[~placed]
+        probe[pending] = (probe[pending] + 1) & (capacity - 1)
+    return slots
@@ -29,7 +29,13 @@ this change -- this is intentional for the 2.0.0a0 pre-release.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+import numpy as np
+
+from recotem._ann import FactorView, IVFIndex, cold_user_factors, factor_view
+from recotem._idindex import CompactIDMapper, StringIndex
 
 # IPython stub: install before any irspack import.  Irspack pulls in fastprogress
 # at import time, which in turn imports IPython.display.  The stub provides only
@@ -40,21 +46,31 @@ from collections.abc import Iterable
 # Both "IPython" and "IPython.display" are checked independently so a partial
 # real-IPython install (IPython present but IPython.display absent) is handled.
 from recotem._ipython_stub import install as _install_ipython_stub
+from recotem._neighbors import NeighborTable
 
 _install_ipython_stub()
 
-from irspack.utils.id_mapping import IDMapper  # noqa: E402
-
 
 class IDMappedRecommender:
-    """String-keyed recommender wrapper around irspack IDMapper.
+    """String-keyed recommender wrapper around a trained irspack recommender.
 
-    Wraps any trained irspack recommender and exposes user/item IDs as strings.
-    Reconstructs the transient ``_mapper`` on unpickle via __setstate__.
+    Exposes user/item IDs as strings.  ``user_ids`` / ``item_ids`` are
+    :class:`~recotem._idindex.StringIndex` sequences (one UTF-8 buffer plus
+    offsets and a hash table, pickled as plain array dicts); the transient
+    ``_mapper`` views over them are rebuilt on unpickle via __setstate__.
+    Artifacts that pickled plain ``list[str]`` IDs are converted on load.
 
     The class is defined here (``recotem._idmap``) rather than in
     ``recotem.training._compat`` so that the recorded FQCN is not tied
     to either the training or the serving sub-package.
+
+    When training attached an ANN index (``ann_index``, see
+    ``recotem._ann``), factor models retrieve candidates from it and rescore
+    them exactly instead of scoring the whole catalog.  Setting
+    ``exact_search`` (a per-process switch, never pickled) disables it.
+
+    A ``neighbor_table`` (see ``recotem._neighbors``) answers single-seed and
+    small multi-seed related-item requests without scoring the catalog.
     """
 
     def __init__(
@@ -64,9 +80,12 @@ class IDMappedRecommender:
         item_ids: Iterable[str],
     ) -> None:
         self.recommender = recommender
-        self.user_ids: list[str] = [str(u) for u in user_ids]
-        self.item_ids: list[str] = [str(i) for i in item_ids]
-        self._mapper: IDMapper = IDMapper(self.user_ids, self.item_ids)
+        self.user_ids = StringIndex.from_strings(user_ids)
+        self.item_ids = StringIndex.from_strings(item_ids)
+        self._mapper = CompactIDMapper(self.user_ids, self.item_ids)
+        self.ann_index: dict[str, Any] | None = None
+        self.neighbor_table: dict[str, Any] | None = None
+        self.exact_search = False
 
     # ------------------------------------------------------------------
     # State protocol (used by the artifact serializer)
@@ -75,25 +94,48 @@ class IDMappedRecommender:
     def __getstate__(self) -> dict:
         state = dict(self.__dict__)
         state.pop("_mapper", None)
+        state.pop("_ann", None)
+        state.pop("_neighbors", None)
+        state.pop("exact_search", None)
+        state["user_ids"] = self.user_ids.to_state()
+        state["item_ids"] = self.item_ids.to_state()
         return state
 
     def __setstate__(self, state: dict) -> None:
+        state.setdefault("ann_index", None)
+        state.setdefault("neighbor_table", None)
+        state.setdefault("exact_search", False)
         self.__dict__.update(state)
-        self.user_ids = [str(u) for u in self.user_ids]
-        self.item_ids = [str(i) for i in self.item_ids]
-        self._mapper = IDMapper(self.user_ids, self.item_ids)
+        self.user_ids = _string_index(self.user_ids)
+        self.item_ids = _string_index(self.item_ids)
+        self._mapper = CompactIDMapper(self.user_ids, self.item_ids)
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    def attach_ann_index(self, index: IVFIndex) -> None:
+        """Store *index* (as plain state) for candidate retrieval."""
+        self.ann_index = index.to_state()
+        self.__dict__.pop("_ann", None)
+
+    def attach_neighbor_table(self, table: dict[str, Any]) -> None:
+        """Store a ``recotem._neighbors.build_neighbor_table`` result."""
+        self.neighbor_table = table
+        self.__dict__.pop("_neighbors", None)
+
     def get_recommendation_for_known_user_id(
         self,
         user_id: str,
         cutoff: int = 20,
+        exclude_item_ids: Iterable[str] | None = None,
     ) -> list[tuple[str, float]]:
         """Return top-*cutoff* (item_id, score) pairs for a known user.
 
+        Items in *exclude_item_ids* are masked to ``-inf`` before top-k
+        selection, so up to *cutoff* items are still returned.  Unknown ids
+        in *exclude_item_ids* are ignored.
+
         Raises
         ------
         KeyError
@@ -105,20 +147,358 @@ class IDMappedRecommender:
         uid = str(user_id)
         if uid not in self._mapper.user_id_to_index:
             raise KeyError(uid)
-        return self._mapper.recommend_for_known_user_id(
-            self.recommender,
-            uid,
-            cutoff=cutoff,
-        )
+        return self.get_recommendation_for_known_user_batch(
+            [uid], cutoff, [exclude_item_ids]
+        )[0]
 
     def get_recommendation_for_new_user(
         self,
         item_ids: Iterable[str],
         cutoff: int = 20,
+        exclude_item_ids: Iterable[str] | None = None,
     ) -> list[tuple[str, float]]:
-        """Return top-*cutoff* (item_id, score) pairs for a cold-start user."""
-        return self._mapper.recommend_for_new_user(
-            self.recommender,
-            [str(iid) for iid in item_ids],
-            cutoff=cutoff,
+        """Return top-*cutoff* (item_id, score) pairs for a cold-start user.
+
+        *exclude_item_ids* is masked before top-k selection, as in
+        :meth:`get_recommendation_for_known_user_id`.
+        """
+        return self.get_recommendation_for_new_user_batch(
+            [item_ids], cutoff, [exclude_item_ids]
+        )[0]
+
+    def get_recommendation_for_known_user_batch(
+        self,
+        user_ids: Sequence[str],
+        cutoff: int | Sequence[int] = 20,
+        exclude_item_ids: Sequence[Iterable[str] | None] | None = None,
+    ) -> list[list[tuple[str, float]]]:
+        """Return top-k (item_id, score) lists for several known users at once.
+
+        All users are mapped to indices up-front and scored with a single
+        ``get_score_remove_seen`` call, so the cost of a batch is one score
+        block plus one row-wise top-k rather than one full pass per user.
+
+        *cutoff* is either a single int applied to every row or one int per
+        user (same length as *user_ids*).  *exclude_item_ids*, when given,
+        holds one optional id list per user; those items are masked to
+        ``-inf`` before top-k selection.
+
+        Raises
+        ------
+        KeyError
+            If any *user_id* was not in the training set.  Callers that need
+            per-element error reporting must filter unknown users first.
+        """
+        uids = [str(u) for u in user_ids]
+        cutoffs = _expand_cutoffs(cutoff, len(uids))
+        if not uids:
+            return []
+        position = self.user_ids.position
+        rows = np.empty(len(uids), dtype=np.int64)
+        for pos, uid in enumerate(uids):
+            row = position(uid)
+            if row is None:
+                raise KeyError(uid)
+            rows[pos] = row
+
+        def exact(sub: np.ndarray) -> object:
+            return self.recommender.get_score_remove_seen(rows[sub])
+
+        ann = self._ann_search()
+        if ann is not None:
+            index, view = ann
+            return self._ann_top_k_rows(
+                index,
+                view,
+                view.user_factors[rows],
+                self.recommender.X_train_all[rows],
+                cutoffs,
+                exclude_item_ids,
+                exact,
+            )
+        scores = self.recommender.get_score_remove_seen(rows)
+        return self._top_k_rows(scores, cutoffs, exclude_item_ids)
+
+    def get_recommendation_for_new_user_batch(
+        self,
+        item_id_lists: Sequence[Iterable[str]],
+        cutoff: int | Sequence[int] = 20,
+        exclude_item_ids: Sequence[Iterable[str] | None] | None = None,
+    ) -> list[list[tuple[str, float]]]:
+        """Return top-k (item_id, score) lists for several cold-start profiles.
+
+        Rows the neighbour table can answer are served from it.  The rest
+        are packed into one sparse (n_profiles x n_items) matrix and scored
+        with a single ``get_score_cold_user_remove_seen`` call.  Unknown seed
+        ids are ignored.  *exclude_item_ids* behaves as in
+        :meth:`get_recommendation_for_known_user_batch`.
+        """
+        profiles = [[str(iid) for iid in ids] for ids in item_id_lists]
+        cutoffs = _expand_cutoffs(cutoff, len(profiles))
+        if not profiles:
+            return []
+        table = self._neighbor_lookup()
+        if table is None:
+            return self._score_new_user_rows(profiles, cutoffs, exclude_item_ids)
+
+        excluded = (
+            self._excluded_columns(exclude_item_ids, len(profiles))
+            if exclude_item_ids is not None
+            else None
         )
+        item_index = self._mapper.item_id_to_index
+        results: list[list[tuple[str, float]] | None] = []
+        for row, ids in enumerate(profiles):
+            seeds = [item_index[iid] for iid in ids if iid in item_index]
+            ranked = None
+            if seeds and len(set(seeds)) == len(seeds):
+                ranked = table.related(
+                    seeds, cutoffs[row], set(excluded[row]) if excluded else set()
+                )
+            results.append(
+                None
+                if ranked is None
+                else [(self.item_ids[i], score) for i, score in ranked]
+            )
+        pending = [row for row, ranked in enumerate(results) if ranked is None]
+        if pending:
+            scored = self._score_new_user_rows(
+                [profiles[row] for row in pending],
+                [cutoffs[row] for row in pending],
+                [exclude_item_ids[row] for row in pending]
+                if exclude_item_ids is not None
+                else None,
+            )
+            for row, ranked in zip(pending, scored, strict=True):
+                results[row] = ranked
+        return results  # type: ignore[return-value]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _score_new_user_rows(
+        self,
+        profiles: list[list[str]],
+        cutoffs: list[int],
+        exclude_item_ids: Sequence[Iterable[str] | None] | None,
+    ) -> list[list[tuple[str, float]]]:
+        """Score cold-start profiles with the model (ANN or exact)."""
+        X = self._mapper.list_of_user_profile_to_matrix(profiles)
+
+        def exact(sub: np.ndarray) -> object:
+            return self.recommender.get_score_cold_user_remove_seen(X[sub])
+
+        ann = self._ann_search()
+        if ann is not None:
+            queries = cold_user_factors(self.recommender, X)
+            if queries is not None:
+                index, view = ann
+                return self._ann_top_k_rows(
+                    index, view, queries, X, cutoffs, exclude_item_ids, exact
+                )
+        scores = self.recommender.get_score_cold_user_remove_seen(X)
+        return self._top_k_rows(scores, cutoffs, exclude_item_ids)
+
+    def _neighbor_lookup(self) -> NeighborTable | None:
+        """Return the cached neighbour-table view, or ``None`` if absent."""
+        if self.neighbor_table is None:
+            return None
+        cached = self.__dict__.get("_neighbors")
+        if cached is None:
+            cached = NeighborTable(self.neighbor_table)
+            self._neighbors = cached
+        return cached
+
+    def _ann_search(self) -> tuple[IVFIndex, FactorView] | None:
+        """Return the (index, factors) pair to search, or ``None`` for exact."""
+        if self.exact_search or self.ann_index is None:
+            return None
+        cached = self.__dict__.get("_ann")
+        if cached is None:
+            view = factor_view(self.recommender)
+            if view is None:
+                return None
+            cached = (IVFIndex.from_state(self.ann_index), view)
+            self._ann = cached
+        return cached
+
+    def _ann_top_k_rows(
+        self,
+        index: IVFIndex,
+        view: FactorView,
+        queries: np.ndarray,
+        seen: Any,
+        cutoffs: list[int],
+        exclude_item_ids: Sequence[Iterable[str] | None] | None,
+        exact: Callable[[np.ndarray], object],
+    ) -> list[list[tuple[str, float]]]:
+        """Top-k from ANN candidates, rescored exactly.
+
+        *seen* is the CSR interaction matrix of the queried rows; those items
+        and the excluded ones are masked like in :meth:`_top_k_rows`.  A row
+        whose candidates hold fewer eligible items than its cutoff is scored
+        exactly via *exact* (called with the row positions), so ANN never
+        returns a shorter list than exact search would.
+        """
+        excluded = (
+            self._excluded_columns(exclude_item_ids, len(cutoffs))
+            if exclude_item_ids is not None
+            else None
+        )
+        item_ids = self.item_ids
+        results: list[list[tuple[str, float]]] = []
+        fallback: list[int] = []
+        for row, candidates in enumerate(index.candidates(queries)):
+            cutoff = cutoffs[row]
+            if cutoff <= 0:
+                results.append([])
+                continue
+            scores = view.score(queries[row], candidates)
+            blocked = seen.indices[seen.indptr[row] : seen.indptr[row + 1]]
+            if excluded is not None and excluded[row]:
+                blocked = np.concatenate([blocked, excluded[row]])
+            scores[~np.isfinite(scores)] = -np.inf
+            if blocked.size:
+                scores[np.isin(candidates, blocked)] = -np.inf
+            n_eligible = int(np.count_nonzero(scores > -np.inf))
+            if n_eligible < cutoff:
+                fallback.append(row)
+                results.append([])
+                continue
+            if cutoff < len(scores):
+                top = np.argpartition(-scores, cutoff - 1)[:cutoff]
+            else:
+                top = np.arange(len(scores))
+            top = top[np.argsort(-scores[top], kind="stable")]
+            results.append(
+                [
+                    (item_ids[i], s)
+                    for i, s in zip(
+                        candidates[top].tolist(), scores[top].tolist(), strict=True
+                    )
+                ]
+            )
+        if fallback:
+            sub = np.asarray(fallback, dtype=np.int64)
+            exact_rows = self._top_k_rows(
+                exact(sub),
+                [cutoffs[row] for row in fallback],
+                [exclude_item_ids[row] for row in fallback]
+                if exclude_item_ids is not None
+                else None,
+            )
+            for row, ranked in zip(fallback, exact_rows, strict=True):
+                results[row] = ranked
+        return results
+
+    def _top_k_rows(
+        self,
+        scores: object,
+        cutoffs: list[int],
+        exclude_item_ids: Sequence[Iterable[str] | None] | None = None,
+    ) -> list[list[tuple[str, float]]]:
+        """Select the top ``cutoffs[row]`` items of every row of *scores*.
+
+        Excluded items are masked to ``-inf`` *before* selection, so a row
+        only comes back short when the model has fewer eligible candidates
+        than its cutoff -- never because a caller-side filter removed items
+        after the fact.
+
+        Non-finite scores are never returned: irspack masks seen items to
+        ``-inf`` and its single-user path skips any ``inf`` score, so they are
+        folded into ``-inf`` here and trimmed after selection.  Because they
+        sort last they only reach the top-k window when a row has fewer
+        finite candidates than its cutoff.
+        """
+        block = np.asarray(scores, dtype=np.float64)
+        if block.ndim != 2 or block.shape[0] != len(cutoffs):
+            raise ValueError(
+                f"score block shape {block.shape} does not match "
+                f"{len(cutoffs)} requested rows"
+            )
+        n_items = block.shape[1]
+        if n_items != len(self.item_ids):
+            raise ValueError("`score.shape[1]` inconsistent with `len(self.item_ids)`")
+        k = min(max(cutoffs, default=0), n_items)
+        if k <= 0:
+            return [[] for _ in cutoffs]
+
+        block = np.where(np.isfinite(block), block, -np.inf)
+        if exclude_item_ids is not None:
+            self._mask_excluded(block, exclude_item_ids)
+        if k < n_items:
+            candidates = np.argpartition(block, n_items - k, axis=1)[:, n_items - k :]
+        else:
+            candidates = np.broadcast_to(np.arange(n_items), block.shape)
+        top_scores = np.take_along_axis(block, candidates, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top_index = np.take_along_axis(candidates, order, axis=1).tolist()
+        top_scores = np.take_along_axis(top_scores, order, axis=1).tolist()
+
+        item_ids = self.item_ids
+        results: list[list[tuple[str, float]]] = []
+        for row_index, row_scores, row_cutoff in zip(
+            top_index, top_scores, cutoffs, strict=True
+        ):
+            row: list[tuple[str, float]] = []
+            for iid, score in zip(row_index[:row_cutoff], row_scores, strict=False):
+                if score == -np.inf:
+                    break
+                row.append((item_ids[iid], score))
+            results.append(row)
+        return results
+
+    def _mask_excluded(
+        self,
+        block: np.ndarray,
+        exclude_item_ids: Sequence[Iterable[str] | None],
+    ) -> None:
+        """Set ``block[row, item]`` to ``-inf`` for every excluded item."""
+        rows: list[int] = []
+        cols: list[int] = []
+        for row, row_cols in enumerate(
+            self._excluded_columns(exclude_item_ids, block.shape[0])
+        ):
+            rows.extend([row] * len(row_cols))
+            cols.extend(row_cols)
+        if rows:
+            block[rows, cols] = -np.inf
+
+    def _excluded_columns(
+        self,
+        exclude_item_ids: Sequence[Iterable[str] | None],
+        n_rows: int,
+    ) -> list[list[int]]:
+        """Map each row's excluded ids to item indices, ignoring unknown ids."""
+        if len(exclude_item_ids) != n_rows:
+            raise ValueError(
+                f"expected {n_rows} exclude lists, got {len(exclude_item_ids)}"
+            )
+        item_index = self._mapper.item_id_to_index
+        result: list[list[int]] = []
+        for ids in exclude_item_ids:
+            cols: list[int] = []
+            for iid in ids or ():
+                col = item_index.get(str(iid))
+                if col is not None:
+                    cols.append(col)
+            result.append(cols)
+        return result
+
+
+def _string_index(ids: Any) -> StringIndex:
+    """Restore a pickled :class:`StringIndex` state, or convert a legacy list."""
+    if isinstance(ids, dict):
+        return StringIndex.from_state(ids)
+    return StringIndex.from_strings(ids)
+
+
+def _expand_cutoffs(cutoff: int | Sequence[int], n: int) -> list[int]:
+    """Normalise a scalar or per-row cutoff into a list of *n* ints."""
+    if isinstance(cutoff, int):
+        return [cutoff] * n
+    cutoffs = [int(c) for c in cutoff]
+    if len(cutoffs) != n:
+        raise ValueError(f"expected {n} cutoffs, got {len(cutoffs)}")
+    return cutoffs
@@ -0,0 +1,169 @@
+"""Precomputed item-to-item neighbour table for ``:recommend-related``.
+
+A related-items request is a cold-user scoring pass over the whole catalog,
+even for the common single-seed "similar products" case.  The table stores,
+for every item, the top-``k`` items of that single-seed pass (seed masked,
+exactly as ``get_score_cold_user_remove_seen`` does).  A single-seed request
+becomes a slice of that row.
+
+Small multi-seed requests are merged with the threshold algorithm.  This only
+applies to models whose cold-user score is linear in the seed profile
+(item-KNN, SLIM, RP3beta / P3alpha, TruncatedSVD), where the score of a
+profile is the sum of its single-seed scores.  An item missing from a seed's
+list scores at most that list's last entry, so the merged top-k is exact once
+every returned item is in all lists and outranks every upper bound.
+Otherwise the caller falls back to the model.
+
+Like ``recotem._ann``, the table is pickled as a plain ``dict`` of NumPy
+arrays, so format-2 artifacts store it as mappable sections.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import scipy.sparse as sps
+
+#: irspack classes whose cold-user score is linear in the seed profile.
+LINEAR_PROFILE_CLASSES: frozenset[str] = frozenset(
+    {
+        "AsymmetricCosineKNNRecommender",
+        "CosineKNNRecommender",
+        "DenseSLIMRecommender",
+        "JaccardKNNRecommender",
+        "P3alphaRecommender",
+        "RP3betaRecommender",
+        "SLIMRecommender",
+        "TruncatedSVDRecommender",
+        "TverskyIndexKNNRecommender",
+    }
+)
+
+# Score-block cells per build step (~128 MiB of float64).
+_BUILD_BLOCK_CELLS = 1 << 24
+
+
+def build_neighbor_table(recommender: Any, k: int, max_seeds: int) -> dict[str, Any]:
+    """Score every item as a single seed and keep its top-*k* neighbours.
+
+    Rows with fewer than *k* finite scores are padded with index ``-1``.
+    Scores keep the dtype the recommender returns.
+    """
+    n_items = recommender.X_train_all.shape[1]
+    k = max(1, min(k, n_items - 1))
+    indices = np.full((n_items, k), -1, dtype=np.int32)
+    scores: np.ndarray | None = None
+    step = max(1, _BUILD_BLOCK_CELLS // n_items)
+    for start in range(0, n_items, step):
+        stop = min(start + step, n_items)
+        seeds = sps.csr_matrix(
+            (
+                np.ones(stop - start),
+                np.arange(start, stop),
+                np.arange(stop - start + 1),
+            ),
+            shape=(stop - start, n_items),
+        )
+        block = np.asarray(recommender.get_score_cold_user_remove_seen(seeds))
+        if scores is None:
+            dtype = block.dtype if block.dtype.kind == "f" else np.dtype(np.float64)
+            scores = np.full((n_items, k), -np.inf, dtype=dtype)
+        block = np.where(np.isfinite(block), block, -np.inf)
+        top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(block, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        indices[start:stop] = np.where(np.isfinite(top_scores), top, -1)
+        scores[start:stop] = top_scores
+    return {
+        "kind": "topk",
+        "k": k,
+        "indices": indices,
+        "scores": scores,
+        "linear": type(recommender).__name__ in LINEAR_PROFILE_CLASSES,
+        "max_seeds": max_seeds,
+    }
+
+
+class NeighborTable:
+    """Read-side view over a :func:`build_neighbor_table` state dict."""
+
+    def __init__(self, state: dict[str, Any]) -> None:
+        self.k = int(state["k"])
+        self.indices = np.asarray(state["indices"])
+        self.scores = np.asarray(state["scores"])
+        self.linear = bool(state["linear"])
+        self.max_seeds = int(state["max_seeds"])
+
+    def related(
+        self, seeds: list[int], cutoff: int, excluded: set[int]
+    ) -> list[tuple[int, float]] | None:
+        """Ranked ``(item_index, score)`` pairs, or ``None`` to use the model.
+
+        *seeds* must be distinct known item indices.  Seeds and *excluded*
+        items are never returned.
+        """
+        if cutoff <= 0:
+            return []
+        if len(seeds) == 1:
+            return self._single(seeds[0], cutoff, excluded)
+        if self.linear and len(seeds) <= self.max_seeds:
+            return self._merge(seeds, cutoff, excluded)
+        return None
+
+    def _row(self, seed: int) -> tuple[list[int], list[float]]:
+        row = self.indices[seed]
+        n_valid = int(np.count_nonzero(row >= 0))
+        return row[:n_valid].tolist(), self.scores[seed, :n_valid].tolist()
+
+    def _single(
+        self, seed: int, cutoff: int, excluded: set[int]
+    ) -> list[tuple[int, float]] | None:
+        items, scores = self._row(seed)
+        ranked: list[tuple[int, float]] = []
+        for item, score in zip(items, scores, strict=True):
+            if item in excluded:
+                continue
+            ranked.append((item, score))
+            if len(ranked) == cutoff:
+                return ranked
+        # A full row that ran out may hide eligible items beyond its k-th entry.
+        return None if len(items) == self.k else ranked
+
+    def _merge(
+        self, seeds: list[int], cutoff: int, excluded: set[int]
+    ) -> list[tuple[int, float]] | None:
+        floors: list[float] = []
+        sums: dict[int, float] = {}
+        members: dict[int, int] = {}
+        for pos, seed in enumerate(seeds):
+            items, scores = self._row(seed)
+            floors.append(scores[-1] if len(items) == self.k else -np.inf)
+            for item, score in zip(items, scores, strict=True):
+                sums[item] = sums.get(item, 0.0) + score
+                members[item] = members.get(item, 0) | (1 << pos)
+        complete = (1 << len(seeds)) - 1
+        blocked = excluded.union(seeds)
+        bounds: list[tuple[float, int, bool]] = []
+        for item, total in sums.items():
+            if item in blocked:
+                continue
+            mask = members[item]
+            for pos, floor in enumerate(floors):
+                if not mask & (1 << pos):
+                    total += floor
+            if total > -np.inf:
+                bounds.append((total, item, mask == complete))
+        bounds.sort(key=lambda b: -b[0])
+        top = bounds[:cutoff]
+        if not all(is_complete for _, _, is_complete in top):
+            return None
+        # Upper bound of everything not returned, including unlisted items.
+        rest = sum(floors)
+        if len(bounds) > cutoff:
+            rest = max(rest, bounds[cutoff][0])
+        if rest > -np.inf and (len(top) < cutoff or top[-1][0] < rest):
+            return None
+        return [(item, score) for score, item, _ in top]
@@ -0,0 +1,166 @@
+"""Optional payload compression for .recotem artifacts.
+
+A recipe's ``output.compression`` compresses the artifact payload with
+``gzip`` (standard library) or ``zstd`` (needs the ``recotem[binary]``
+extra).  Factor and similarity matrices typically shrink several times,
+which cuts object-store egress, watcher download time and headroom against
+``RECOTEM_MAX_ARTIFACT_BYTES``.
+
+* The codec is recorded in the header JSON under ``"compression"``; no key
+  means an uncompressed payload.
+* The HMAC covers the compressed bytes, so a tampered payload is rejected
+  before a single byte is decompressed.
+* On read the payload is decompressed as a stream straight into
+  ``SafeUnpickler``; the decompressed pickle is never held in full.  Its
+  size is capped (``RECOTEM_MAX_PAYLOAD_BYTES`` in ``serve``) as a
+  decompression-bomb guard.
+* A compressed payload is always a plain pickle.  Sections exist to be
+  memory-mapped, which compression rules out, so ``format_version: 2``
+  recipes that compress store no sections.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import pickle
+from typing import Any, Literal
+
+from recotem.artifact.format import ArtifactError
+
+try:
+    import zstandard
+
+    _ZSTD_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised via env without extra
+    _ZSTD_AVAILABLE = False
+
+Compression = Literal["none", "gzip", "zstd"]
+
+#: Codecs a payload may be compressed with.
+CODECS: tuple[str, ...] = ("gzip", "zstd")
+
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+
+
+def zstd_available() -> bool:
+    """Whether the optional ``zstandard`` package is installed."""
+    return _ZSTD_AVAILABLE
+
+
+def require_codec(compression: str) -> None:
+    """Raise ``ArtifactError`` unless *compression* can be written and read here."""
+    if compression == "none":
+        return
+    if compression not in CODECS:
+        raise ArtifactError(
+            f"unknown payload compression {compression!r}; "
+            f"expected one of {('none', *CODECS)!r}"
+        )
+    if compression == "zstd" and not _ZSTD_AVAILABLE:
+        raise ArtifactError(
+            "payload compression 'zstd' needs the zstandard package; "
+            "install recotem[binary]"
+        )
+
+
+def payload_compression(header_dict: dict[str, Any]) -> str:
+    """Return the codec recorded in *header_dict* (``"none"`` when absent).
+
+    Raises ``ArtifactError`` for a codec this build cannot decompress.
+    """
+    compression = header_dict.get("compression", "none")
+    if not isinstance(compression, str):
+        raise ArtifactError(
+            f"header JSON compression must be a string, got {compression!r}"
+        )
+    try:
+        require_codec(compression)
+    except ArtifactError as exc:
+        raise ArtifactError(f"header JSON compression unusable: {exc}") from exc
+    return compression
+
+
+def compress_pickle(obj: Any, compression: str) -> bytes:
+    """Pickle *obj* straight into a *compression* stream and return its bytes.
+
+    The uncompressed pickle is never materialized.
+    """
+    require_codec(compression)
+    sink = io.BytesIO()
+    if compression == "gzip":
+        with gzip.GzipFile(fileobj=sink, mode="wb", compresslevel=_GZIP_LEVEL) as gz:
+            pickle.dump(obj, gz, protocol=pickle.HIGHEST_PROTOCOL)
+    else:
+        compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+        with compressor.stream_writer(sink, closefd=False) as zw:
+            pickle.dump(obj, zw, protocol=pickle.HIGHEST_PROTOCOL)
+    return sink.getvalue()
+
+
+def open_decompressed(stream: Any, compression: str, max_bytes: int) -> Any:
+    """Return a file object decompressing *stream*, capped at *max_bytes*.
+
+    Reading past *max_bytes* of decompressed output raises ``ArtifactError``.
+    """
+    require_codec(compression)
+    if compression == "gzip":
+        inner: Any = gzip.GzipFile(fileobj=stream, mode="rb")
+    else:
+        inner = zstandard.ZstdDecompressor().stream_reader(stream)
+    return _BoundedReader(inner, max_bytes)
+
+
+class _BoundedReader:
+    """Pickle-compatible reader that stops a decompression bomb.
+
+    Reads always return the requested size unless the stream ends: pickle
+    treats a short read as truncation, and decompressing readers may return
+    less than asked.
+    """
+
+    def __init__(self, inner: Any, max_bytes: int) -> None:
+        self._inner = inner
+        self._remaining = max_bytes
+        self._max_bytes = max_bytes
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            data = self._inner.read(self._remaining + 1)
+            self._count(len(data))
+            return data
+        buf = bytearray(min(size, self._remaining + 1))
+        del buf[self.readinto(buf) :]
+        return bytes(buf)
+
+    def readinto(self, buffer: Any) -> int:
+        target = memoryview(buffer).cast("B")
+        filled = 0
+        while filled < len(target):
+            # One byte past the cap is enough to detect the overrun.
+            end = min(len(target), filled + self._remaining + 1)
+            n = self._inner.readinto(target[filled:end])
+            if not n:
+                break
+            self._count(n)
+            filled += n
+        return filled
+
+    def readline(self, size: int | None = -1) -> bytes:
+        # Only the text opcodes of pickle protocols 0-3 read lines.
+        line = bytearray()
+        while size is None or size < 0 or len(line) < size:
+            byte = self.read(1)
+            line += byte
+            if not byte or byte == b"\n":
+                break
+        return bytes(line)
+
+    def _count(self, n: int) -> None:
+        self._remaining -= n
+        if self._remaining < 0:
+            raise ArtifactError(
+                "deserialization failed: decompressed payload exceeds cap "
+                f"{self._max_bytes}; refusing to load"
+            )
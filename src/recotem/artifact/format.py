@@ -8,14 +8,48 @@ Layout (all integers little-endian):
     Offset  Size  Field
     ------  ----  -----
     0       8     Magic bytes: b"RECOTEM\\0"
-    8       2     Format version (uint16 LE); must be FORMAT_VERSION (1)
+    8       2     Format version (uint16 LE); 1 ≤ version ≤ MAX_FORMAT_VERSION (3)
     10      2     Reserved (uint16 LE); must be 0
     12      1     Key-id length K (uint8); 1 ≤ K ≤ 32
     13      K     Key-id bytes (UTF-8)
     13+K    32    HMAC-SHA256 digest
     45+K    4     Header JSON length N (uint32 LE); N ≤ 65536
     49+K    N     Header JSON (UTF-8)
-    49+K+N  M     Pickle payload
+    49+K+N  M     Payload
+
+Payload layouts
+---------------
+Version 1 payloads are a single pickle.  Version 2 adds the *sectioned*
+layout, in which large NumPy buffers (factor matrices, similarity matrices,
+the CSR components of the interaction matrix) are stored outside the pickle
+stream so a reader can map them straight from the file instead of copying
+them into the heap:
+
+    Offset      Size   Field
+    ------      ----   -----
+    0           8      Section magic: b"RCTMSEC\0"
+    8           4      Section count S (uint32 LE); S ≤ MAX_SECTIONS
+    12          4      Reserved (uint32 LE); must be 0
+    16          8      Manifest length L (uint64 LE)
+    24          16·S   Section table: (offset uint64 LE, length uint64 LE)
+                       pairs, offsets relative to the payload start
+    24+16·S     L      Manifest: pickle protocol 5 whose out-of-band
+                       buffers are the sections, in table order
+    ...                Sections, each starting on a SECTION_ALIGNMENT
+                       boundary of the *file*
+
+The layout is identified by the section magic rather than by the container
+version (the magic can never start a pickle stream), so a version-2 container
+may still carry a plain pickle payload.  The HMAC covers the whole payload
+exactly as in version 1.
+
+Chunked integrity
+-----------------
+Version 3 keeps the version-2 payload layouts but changes what is signed:
+the header JSON carries a manifest of per-chunk SHA-256 digests of the
+payload, and the HMAC covers the kid and header JSON only.  Chunks can then
+be verified in parallel, or one byte range at a time.  See
+``artifact.integrity``.
 """
 
 from __future__ import annotations
@@ -28,7 +62,15 @@ from dataclasses import dataclass
 # ---------------------------------------------------------------------------
 
 MAGIC: bytes = b"RECOTEM\x00"
-FORMAT_VERSION: int = 1
+# Written by default.
+FORMAT_VERSION: int = 2
+# Last version whose payload is always a plain pickle; written for readers
+# that predate the sectioned layout.
+FORMAT_VERSION_V1: int = 1
+# Signs a manifest of per-chunk payload digests instead of the payload.
+FORMAT_VERSION_CHUNKED: int = 3
+# Newest version this build reads and writes.
+MAX_FORMAT_VERSION: int = FORMAT_VERSION_CHUNKED
 
 MAGIC_SIZE: int = 8
 VERSION_SIZE: int = 2
@@ -46,9 +88,18 @@ MIN_KID_LEN: int = 1
 MAX_HEADER_LEN: int = 65_536
 DEFAULT_MAX_PAYLOAD_BYTES: int = 512 * 1024 * 1024  # 512 MiB
 
+# Sectioned (version 2) payload
+SECTIONS_MAGIC: bytes = b"RCTMSEC\x00"
+SECTION_ALIGNMENT: int = 64
+MAX_SECTIONS: int = 65_536
+
 # Struct format strings (little-endian)
 _FMT_VERSION_RESERVED = "<HH"  # 2 × uint16 LE
 _FMT_HEADER_LEN = "<I"  # uint32 LE
+_FMT_SECTIONS_PREFIX = "<8sIIQ"  # magic, count, reserved, manifest length
+_FMT_SECTION_ENTRY = "<QQ"  # offset, length
+_SECTIONS_PREFIX_SIZE = struct.calcsize(_FMT_SECTIONS_PREFIX)  # = 24
+_SECTION_ENTRY_SIZE = struct.calcsize(_FMT_SECTION_ENTRY)  # = 16
 
 
 # ---------------------------------------------------------------------------
@@ -121,10 +172,10 @@ def parse_header_from_bytes(data: bytes, max_payload_bytes: int) -> ArtifactHead
     version, reserved = struct.unpack_from(_FMT_VERSION_RESERVED, data, offset)
     offset += VERSION_SIZE + RESERVED_SIZE
 
-    if version == 0 or version > FORMAT_VERSION:
+    if version == 0 or version > MAX_FORMAT_VERSION:
         raise ArtifactError(
             f"unsupported format version {version}; "
-            f"this build supports up to version {FORMAT_VERSION}"
+            f"this build supports up to version {MAX_FORMAT_VERSION}"
         )
     if reserved != 0:
         raise ArtifactError(f"reserved bytes must be 0, got {reserved!r}")
@@ -195,11 +246,23 @@ def parse_header_from_bytes(data: bytes, max_payload_bytes: int) -> ArtifactHead
     )
 
 
+def payload_offset_for(kid_bytes: bytes, header_json: bytes) -> int:
+    """Return the file offset at which the payload of an artifact will start."""
+    return (
+        FIXED_PREFIX_SIZE
+        + len(kid_bytes)
+        + HMAC_SIZE
+        + HEADER_LEN_SIZE
+        + len(header_json)
+    )
+
+
 def build_artifact_bytes(
     kid: str,
     hmac_digest: bytes,
     header_json: bytes,
     payload: bytes,
+    version: int = FORMAT_VERSION,
 ) -> bytes:
     """Assemble the complete artifact byte string from its components.
 
@@ -207,6 +270,11 @@ def build_artifact_bytes(
     (MAGIC, FORMAT_VERSION, etc.) are applied here so callers cannot omit
     them.
     """
+    if version < FORMAT_VERSION_V1 or version > MAX_FORMAT_VERSION:
+        raise ArtifactError(
+            f"unsupported format version {version}; "
+            f"this build writes versions {FORMAT_VERSION_V1}–{MAX_FORMAT_VERSION}"
+        )
     kid_bytes = kid.encode("utf-8")
     kid_len = len(kid_bytes)
     if kid_len < MIN_KID_LEN or kid_len > MAX_KID_LEN:
@@ -222,7 +290,7 @@ def build_artifact_bytes(
 
     parts: list[bytes] = [
         MAGIC,
-        struct.pack(_FMT_VERSION_RESERVED, FORMAT_VERSION, 0),  # version + reserved
+        struct.pack(_FMT_VERSION_RESERVED, version, 0),  # version + reserved
         bytes([kid_len]),
         kid_bytes,
         hmac_digest,
@@ -231,3 +299,96 @@ def build_artifact_bytes(
         payload,
     ]
     return b"".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Sectioned (version 2) payloads
+# ---------------------------------------------------------------------------
+
+
+def is_sectioned_payload(payload: bytes | memoryview) -> bool:
+    """Return True when *payload* uses the version-2 sectioned layout."""
+    return bytes(payload[: len(SECTIONS_MAGIC)]) == SECTIONS_MAGIC
+
+
+def build_sectioned_payload(
+    manifest: bytes,
+    sections: list[memoryview],
+    payload_offset: int = 0,
+) -> bytes:
+    """Assemble a sectioned payload from a manifest pickle and its buffers.
+
+    *payload_offset* is the file offset at which the payload will be written
+    (see ``payload_offset_for``); sections are padded so that each starts on
+    a ``SECTION_ALIGNMENT`` boundary of the file, not merely of the payload.
+    """
+    if len(sections) > MAX_SECTIONS:
+        raise ArtifactError(
+            f"section count {len(sections)} exceeds maximum {MAX_SECTIONS}"
+        )
+    table_end = _SECTIONS_PREFIX_SIZE + _SECTION_ENTRY_SIZE * len(sections)
+    cursor = table_end + len(manifest)
+    entries: list[tuple[int, int]] = []
+    for section in sections:
+        cursor += -(payload_offset + cursor) % SECTION_ALIGNMENT
+        entries.append((cursor, section.nbytes))
+        cursor += section.nbytes
+
+    parts: list[bytes | memoryview] = [
+        struct.pack(
+            _FMT_SECTIONS_PREFIX, SECTIONS_MAGIC, len(sections), 0, len(manifest)
+        ),
+        *(struct.pack(_FMT_SECTION_ENTRY, off, length) for off, length in entries),
+        manifest,
+    ]
+    written = table_end + len(manifest)
+    for (off, _length), section in zip(entries, sections, strict=True):
+        parts.append(b"\x00" * (off - written))
+        parts.append(section.cast("B"))
+        written = off + section.nbytes
+    return b"".join(parts)
+
+
+def split_sectioned_payload(
+    payload: bytes | memoryview,
+) -> tuple[memoryview, list[memoryview]]:
+    """Return ``(manifest, sections)`` views into a sectioned *payload*.
+
+    No bytes are copied: when *payload* is a view over a memory-mapped file
+    the returned sections are too, so arrays rebuilt from them share the page
+    cache.  Raises ``ArtifactError`` on any structural violation.
+    """
+    view = memoryview(payload).cast("B")
+    size = view.nbytes
+    if size < _SECTIONS_PREFIX_SIZE:
+        raise ArtifactError("sectioned payload too short: missing section prefix")
+    magic, count, reserved, manifest_len = struct.unpack_from(
+        _FMT_SECTIONS_PREFIX, view, 0
+    )
+    if magic != SECTIONS_MAGIC:
+        raise ArtifactError(f"section magic mismatch: got {magic!r}")
+    if reserved != 0:
+        raise ArtifactError(f"section reserved field must be 0, got {reserved!r}")
+    if count > MAX_SECTIONS:
+        raise ArtifactError(
+            f"section count {count} exceeds maximum {MAX_SECTIONS}; refusing allocation"
+        )
+    table_end = _SECTIONS_PREFIX_SIZE + _SECTION_ENTRY_SIZE * count
+    if table_end > size:
+        raise ArtifactError("sectioned payload too short: truncated section table")
+    if manifest_len > size - table_end:
+        raise ArtifactError("sectioned payload too short: truncated manifest")
+    manifest = view[table_end : table_end + manifest_len]
+
+    sections: list[memoryview] = []
+    for i in range(count):
+        off, length = struct.unpack_from(
+            _FMT_SECTION_ENTRY, view, _SECTIONS_PREFIX_SIZE + _SECTION_ENTRY_SIZE * i
+        )
+        if off < table_end + manifest_len or off > size or length > size - off:
+            raise ArtifactError(
+                f"section {i} (offset {off}, length {length}) lies outside "
+                f"the payload of {size} bytes"
+            )
+        sections.append(view[off : off + length])
+    return manifest, sections
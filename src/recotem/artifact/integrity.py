@@ -0,0 +1,256 @@
+"""Chunked payload integrity for format-3 .recotem artifacts.
+
+A format-1/2 artifact's HMAC runs over the whole payload: one core hashes
+every byte before any of the model can be trusted.  Format 3 signs a
+*manifest* instead:
+
+* The payload is cut into fixed-size chunks (``DEFAULT_CHUNK_BYTES``, grown
+  for very large payloads so the manifest stays under ``MAX_CHUNKS``
+  entries).  The SHA-256 of every chunk is recorded in the header JSON under
+  ``"integrity"``::
+
+      {"chunk_bytes": 8388608, "payload_bytes": 123456789,
+       "sha256": ["<hex>", ...]}
+
+* The HMAC covers ``CHUNKED_HMAC_DOMAIN || kid || header_json`` only (see
+  ``signing.compute_header_hmac``).  Verifying it authenticates the
+  manifest, and through the manifest every chunk.
+* Chunks are hashed on ``VERIFY_WORKERS`` threads (``hashlib`` releases the
+  GIL), so verification time scales with the core count.
+* Any byte range of the payload, e.g. one section of a format-3 sectioned
+  payload, can be fetched with a ranged read and verified on its own: only
+  the chunks it overlaps are read and hashed (``read_verified_range``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, NoReturn
+
+import structlog
+
+from recotem._log_safe import format_kid_for_log
+from recotem.artifact.format import ArtifactError
+
+logger = structlog.get_logger(__name__)
+
+#: Chunk size written unless a payload needs larger chunks.
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+MIN_CHUNK_BYTES = 64 * 1024
+MAX_CHUNK_BYTES = 1024 * 1024 * 1024
+#: Upper bound on the manifest length; keeps the header JSON well inside
+#: ``MAX_HEADER_LEN`` (about 67 bytes per digest).
+MAX_CHUNKS = 512
+
+#: Threads hashing chunks in parallel.
+VERIFY_WORKERS = min(8, os.cpu_count() or 1)
+
+_HEX_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+@dataclass(frozen=True)
+class ChunkManifest:
+    """The per-chunk SHA-256 digests a format-3 header signs."""
+
+    chunk_bytes: int
+    payload_bytes: int
+    sha256: tuple[str, ...]
+
+    def to_json(self) -> dict[str, Any]:
+        """The ``"integrity"`` value recorded in the header JSON."""
+        return {
+            "chunk_bytes": self.chunk_bytes,
+            "payload_bytes": self.payload_bytes,
+            "sha256": list(self.sha256),
+        }
+
+    def chunk_span(self, start: int, length: int) -> tuple[int, int]:
+        """Return ``(first, stop)`` chunk indices covering payload bytes
+        ``[start, start + length)``."""
+        if start < 0 or length < 0 or start + length > self.payload_bytes:
+            raise ArtifactError(
+                f"payload range [{start}, {start + length}) lies outside the "
+                f"payload of {self.payload_bytes} bytes"
+            )
+        if length == 0:
+            return 0, 0
+        return start // self.chunk_bytes, -(-(start + length) // self.chunk_bytes)
+
+
+def chunk_bytes_for(payload_bytes: int, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> int:
+    """Smallest power-of-two multiple of *chunk_bytes* within ``MAX_CHUNKS``."""
+    if not MIN_CHUNK_BYTES <= chunk_bytes <= MAX_CHUNK_BYTES:
+        raise ArtifactError(
+            f"integrity chunk size {chunk_bytes} out of range "
+            f"[{MIN_CHUNK_BYTES}, {MAX_CHUNK_BYTES}]"
+        )
+    while -(-payload_bytes // chunk_bytes) > MAX_CHUNKS:
+        chunk_bytes *= 2
+    if chunk_bytes > MAX_CHUNK_BYTES:
+        raise ArtifactError(
+            f"payload of {payload_bytes} bytes needs more than {MAX_CHUNKS} "
+            f"integrity chunks of {MAX_CHUNK_BYTES} bytes"
+        )
+    return chunk_bytes
+
+
+def hash_chunks(
+    source: Any,
+    chunk_bytes: int,
+    *,
+    target: Any = None,
+    workers: int | None = None,
+) -> tuple[bytes, ...]:
+    """SHA-256 each *chunk_bytes* piece of the buffer *source*, in parallel.
+
+    With *target* (a writable buffer as long as *source*), each chunk is
+    first copied into *target* and hashed from the copy, so the digests
+    describe exactly the bytes the caller goes on to use.
+    """
+    src = memoryview(source).cast("B")
+    dst = None if target is None else memoryview(target).cast("B")
+    starts = range(0, src.nbytes, chunk_bytes)
+
+    def _hash(start: int) -> bytes:
+        chunk = src[start : start + chunk_bytes]
+        if dst is not None:
+            dst[start : start + chunk.nbytes] = chunk
+            chunk = dst[start : start + chunk.nbytes]
+        return hashlib.sha256(chunk).digest()
+
+    workers = VERIFY_WORKERS if workers is None else workers
+    if workers <= 1 or len(starts) <= 1:
+        return tuple(_hash(start) for start in starts)
+    with ThreadPoolExecutor(
+        max_workers=min(workers, len(starts)), thread_name_prefix="artifact-verify"
+    ) as pool:
+        return tuple(pool.map(_hash, starts))
+
+
+def build_manifest(
+    payload: Any, chunk_bytes: int = DEFAULT_CHUNK_BYTES
+) -> ChunkManifest:
+    """Chunk *payload* and return its manifest."""
+    size = memoryview(payload).nbytes
+    chunk_bytes = chunk_bytes_for(size, chunk_bytes)
+    digests = hash_chunks(payload, chunk_bytes)
+    return ChunkManifest(
+        chunk_bytes=chunk_bytes,
+        payload_bytes=size,
+        sha256=tuple(d.hex() for d in digests),
+    )
+
+
+def manifest_from_header(header_dict: dict[str, Any]) -> ChunkManifest:
+    """Parse and validate the ``"integrity"`` entry of a format-3 header."""
+    raw = header_dict.get("integrity")
+    if not isinstance(raw, dict):
+        raise ArtifactError("header JSON integrity manifest missing or not an object")
+    chunk_bytes = raw.get("chunk_bytes")
+    payload_bytes = raw.get("payload_bytes")
+    digests = raw.get("sha256")
+    if (
+        not isinstance(chunk_bytes, int)
+        or isinstance(chunk_bytes, bool)
+        or not MIN_CHUNK_BYTES <= chunk_bytes <= MAX_CHUNK_BYTES
+    ):
+        raise ArtifactError(
+            f"header JSON integrity chunk_bytes invalid: {chunk_bytes!r}"
+        )
+    if (
+        not isinstance(payload_bytes, int)
+        or isinstance(payload_bytes, bool)
+        or payload_bytes < 0
+    ):
+        raise ArtifactError(
+            f"header JSON integrity payload_bytes invalid: {payload_bytes!r}"
+        )
+    expected = -(-payload_bytes // chunk_bytes)
+    if (
+        not isinstance(digests, list)
+        or len(digests) != expected
+        or not all(isinstance(d, str) and _HEX_DIGEST_RE.match(d) for d in digests)
+    ):
+        raise ArtifactError(
+            f"header JSON integrity sha256 must list {expected} hex digests"
+        )
+    return ChunkManifest(
+        chunk_bytes=chunk_bytes, payload_bytes=payload_bytes, sha256=tuple(digests)
+    )
+
+
+def verify_chunks(
+    kid: str,
+    manifest: ChunkManifest,
+    digests: tuple[bytes, ...] | None,
+    *,
+    payload_bytes: int | None = None,
+    first: int = 0,
+) -> None:
+    """Check computed chunk *digests* against a verified *manifest*.
+
+    *digests* start at chunk *first*; ``None`` means they were never
+    computed.  *payload_bytes*, when given, is the size of the whole payload
+    that was read.  Raises ``ArtifactError`` (worded as an HMAC failure) on
+    any mismatch.
+    """
+    if payload_bytes is not None and payload_bytes != manifest.payload_bytes:
+        _mismatch(
+            kid,
+            f"payload is {payload_bytes} bytes, the signed manifest covers "
+            f"{manifest.payload_bytes}",
+        )
+    if digests is None:
+        _mismatch(kid, "payload chunks were not hashed")
+    for index, digest in enumerate(digests, start=first):
+        if index >= len(manifest.sha256) or not hmac.compare_digest(
+            digest.hex(), manifest.sha256[index]
+        ):
+            _mismatch(kid, f"payload chunk {index} does not match the signed manifest")
+
+
+def read_verified_range(
+    fh: Any,
+    kid: str,
+    payload_offset: int,
+    manifest: ChunkManifest,
+    start: int,
+    length: int,
+) -> bytes:
+    """Read payload bytes ``[start, start + length)`` from *fh* and verify them.
+
+    Only the chunks overlapping the range are read (one seek and one ranged
+    read) and hashed.  *manifest* must come from a header whose HMAC has
+    already been verified.
+    """
+    first, stop = manifest.chunk_span(start, length)
+    if first == stop:
+        return b""
+    span_start = first * manifest.chunk_bytes
+    span_end = min(stop * manifest.chunk_bytes, manifest.payload_bytes)
+    fh.seek(payload_offset + span_start)
+    span = fh.read(span_end - span_start)
+    if len(span) != span_end - span_start:
+        _mismatch(kid, f"payload truncated at offset {span_start + len(span)}")
+    verify_chunks(
+        kid,
+        manifest,
+        hash_chunks(span, manifest.chunk_bytes),
+        first=first,
+    )
+    return bytes(span[start - span_start : start - span_start + length])
+
+
+def _mismatch(kid: str, detail: str) -> NoReturn:
+    logger.warning(
+        "artifact_chunk_mismatch", kid=format_kid_for_log(kid), detail=detail
+    )
+    raise ArtifactError(
+        f"HMAC verification failed for kid {kid!r}: {detail}; "
+        "artifact may have been tampered with"
+    )
@@ -2,10 +2,47 @@
 
 Read-once protocol
 ------------------
-``read_artifact`` reads the complete artifact bytes into memory in a single
-``fs.open().read()`` call, then parses the in-memory buffer.  This eliminates
-the stat-then-read TOCTOU race (a write could land between a stat and a read)
-and the file-still-being-written hazard.
+``read_artifact`` reads the complete artifact once through ``map_or_read``,
+then parses, hashes and verifies that one buffer in a single
+``digest_artifact`` pass and returns the payload without copying it.  This
+eliminates the stat-then-read TOCTOU race (a write could land between a stat
+and a read) and the file-still-being-written hazard.
+
+Bounded reads and memory mapping
+--------------------------------
+``map_or_read`` never maps a file the operator controls: a mapping of a
+file that is truncated or rewritten in place faults with ``SIGBUS`` or
+silently changes the bytes that were verified.  A local artifact is instead
+copied in ``READ_CHUNK_BYTES`` pieces into an unlinked temporary file that
+only this process can reach, and that copy is mapped read-only.  Files the
+server owns and never rewrites — the multi-worker shared model store — are
+mapped directly (``owned=True``).  Either way the sectioned (format 2)
+payload benefits: ``artifact_payload`` keeps its sections as views into the
+mapping, so large arrays live in reclaimable page cache rather than on the
+heap (and, in the shared store, are shared by every worker), while a plain
+pickle payload is copied out before it is unpickled.  Object-store handles
+are read into one preallocated buffer, so a read never holds the artifact
+twice.
+
+Single-pass verification
+------------------------
+``digest_artifact`` walks the buffer once, feeding each chunk to both the
+whole-file SHA-256 (the serving layer's change marker) and the payload HMAC.
+When a plain pickle payload has to be copied out of a mapping, the copy is
+made in the same pass and the HMAC is fed from the copy.  The payload it
+returns goes to ``unpickle_payload`` as is, which reads it without another
+copy: loading holds about one artifact's worth of memory, not three.
+Format-3 payloads are instead hashed chunk by chunk on several threads and
+checked against the signed manifest by ``verify_digest``; such an artifact
+is identified by the SHA-256 of its prefix (``artifact_sha256``).
+
+Header-only reads
+-----------------
+``read_artifact_header`` fetches just the fixed prefix and header JSON with
+one ranged read (``fs.cat_file``), resolving ``append_sha`` pointers.  It
+serves ``recotem inspect --header-only``, the watcher's check for a
+re-upload of the artifact it already serves (same stored HMAC, no download)
+and ``/v1/recipes/{name}`` for format-3 recipes that are not resident.
 
 Versioning modes
 ----------------
@@ -31,23 +68,49 @@ from __future__ import annotations
 import errno
 import hashlib
 import json
+import mmap
 import os
 import pickle
 import re
 import tempfile
+from dataclasses import dataclass
 from typing import Any, Literal
 
 import fsspec
 import structlog
 
+from recotem.artifact.compression import Compression, compress_pickle, require_codec
 from recotem.artifact.format import (
     DEFAULT_MAX_PAYLOAD_BYTES,
+    FORMAT_VERSION,
+    FORMAT_VERSION_CHUNKED,
+    FORMAT_VERSION_V1,
+    MAX_HEADER_LEN,
+    MAX_KID_LEN,
+    SECTION_ALIGNMENT,
     ArtifactError,
     ArtifactHeader,
     build_artifact_bytes,
+    build_sectioned_payload,
+    is_sectioned_payload,
     parse_header_from_bytes,
+    payload_offset_for,
+)
+from recotem.artifact.integrity import (
+    DEFAULT_CHUNK_BYTES,
+    ChunkManifest,
+    build_manifest,
+    hash_chunks,
+    manifest_from_header,
+    verify_chunks,
+)
+from recotem.artifact.signing import (
+    KeyRing,
+    compute_header_hmac,
+    compute_hmac,
+    new_payload_hmac,
+    verify_hmac_digest,
 )
-from recotem.artifact.signing import KeyRing, compute_hmac, verify_hmac
 
 logger = structlog.get_logger(__name__)
 
@@ -113,9 +176,18 @@ def _assert_output_root_containment(dest: str) -> None:
 # Matches the pointer file contents written in append_sha mode.
 # A pointer file contains a single line like "news_articles.a1b2c3d4.recotem".
 _POINTER_RE = re.compile(r"^[A-Za-z0-9_.-]+\.recotem\s*$")
+#: Pointer files are at most this many bytes; anything larger is an artifact.
+POINTER_MAX_BYTES = 512
 
 VersioningMode = Literal["always_overwrite", "append_sha"]
 
+# NumPy buffers smaller than this stay inside the manifest pickle of a
+# sectioned payload; a section costs a table entry plus alignment padding.
+_MIN_SECTION_BYTES = 16 * 1024
+
+#: Granularity of bounded reads and of the hashing pass.
+READ_CHUNK_BYTES = 4 * 1024 * 1024
+
 
 # ---------------------------------------------------------------------------
 # Write
@@ -129,6 +201,9 @@ def write_artifact(
     fs_path: str,
     *,
     versioning: VersioningMode = "append_sha",
+    format_version: int = FORMAT_VERSION,
+    compression: Compression = "none",
+    integrity_chunk_bytes: int = DEFAULT_CHUNK_BYTES,
 ) -> str:
     """Serialize *payload_obj*, sign, and write to *fs_path*.
 
@@ -147,6 +222,19 @@ def write_artifact(
         ``always_overwrite``: overwrite *fs_path* in-place (atomic on local FS).
         ``append_sha``: write to ``<fs_path>.<sha8>.recotem`` and update a
         pointer file at *fs_path*.
+    format_version:
+        ``2`` (default) stores large NumPy buffers as aligned sections that
+        serve can memory-map; ``1`` writes a single pickle for readers that
+        predate format 2.  ``3`` lays the payload out like ``2`` but signs a
+        manifest of per-chunk digests so readers verify it in parallel; see
+        ``artifact.integrity``.
+    compression:
+        ``"gzip"`` or ``"zstd"`` compresses the payload (always a plain
+        pickle then) and records the codec in the header; see
+        ``artifact.compression``.
+    integrity_chunk_bytes:
+        Format 3 only: the chunk size of the integrity manifest (grown for
+        payloads that would need more than ``integrity.MAX_CHUNKS``).
 
     Returns
     -------
@@ -158,20 +246,51 @@ def write_artifact(
     key = key_ring.get(kid)
     assert key is not None  # active_kid is always present
 
-    # 1. Serialize payload
-    payload: bytes = pickle.dumps(payload_obj, protocol=pickle.HIGHEST_PROTOCOL)
+    if format_version not in (
+        FORMAT_VERSION_V1,
+        FORMAT_VERSION,
+        FORMAT_VERSION_CHUNKED,
+    ):
+        raise ArtifactError(
+            f"unsupported format version {format_version}; "
+            f"expected {FORMAT_VERSION_V1}, {FORMAT_VERSION} or "
+            f"{FORMAT_VERSION_CHUNKED}"
+        )
 
-    # 2. Encode header
-    header_json: bytes = json.dumps(header_dict, separators=(",", ":")).encode("utf-8")
+    require_codec(compression)
 
-    # 3. Compute HMAC
+    if compression != "none":
+        header_dict = {**header_dict, "compression": compression}
     kid_bytes = kid.encode("utf-8")
-    digest = compute_hmac(key, kid_bytes, header_json, payload)
 
-    # 4. Assemble artifact bytes
-    artifact_bytes = build_artifact_bytes(kid, digest, header_json, payload)
+    if format_version == FORMAT_VERSION_CHUNKED:
+        # The manifest is part of the header, so the payload comes first.
+        # It is laid out for an aligned file offset, which padding the
+        # header JSON with trailing whitespace then makes true.
+        payload = _encode_payload(payload_obj, format_version, compression, 0)
+        manifest = build_manifest(payload, integrity_chunk_bytes)
+        header_json = json.dumps(
+            {**header_dict, "integrity": manifest.to_json()}, separators=(",", ":")
+        ).encode("utf-8")
+        header_json += b" " * (
+            -payload_offset_for(kid_bytes, header_json) % SECTION_ALIGNMENT
+        )
+        digest = compute_header_hmac(key, kid_bytes, header_json)
+    else:
+        header_json = json.dumps(header_dict, separators=(",", ":")).encode("utf-8")
+        payload = _encode_payload(
+            payload_obj,
+            format_version,
+            compression,
+            payload_offset_for(kid_bytes, header_json),
+        )
+        digest = compute_hmac(key, kid_bytes, header_json, payload)
+
+    artifact_bytes = build_artifact_bytes(
+        kid, digest, header_json, payload, version=format_version
+    )
 
-    # 5. Determine filesystem and write strategy
+    # Determine filesystem and write strategy
     fs, resolved_path = fsspec.core.url_to_fs(fs_path)
     is_local = _is_local_fs(fs)
 
@@ -212,6 +331,38 @@ def write_artifact(
     return sha_path
 
 
+def _encode_payload(
+    payload_obj: Any, format_version: int, compression: str, offset: int
+) -> bytes:
+    """Compressed or serialized payload bytes of *payload_obj*."""
+    if compression != "none":
+        return compress_pickle(payload_obj, compression)
+    return _serialize_payload(payload_obj, format_version, offset)
+
+
+def _serialize_payload(payload_obj: Any, format_version: int, offset: int) -> bytes:
+    """Pickle *payload_obj* in the payload layout of *format_version*.
+
+    For formats 2 and 3, contiguous NumPy buffers of at least ``_MIN_SECTION_BYTES``
+    are taken out of band (pickle protocol 5) and laid out as sections that
+    start on aligned file offsets; *offset* is where the payload will begin.
+    """
+    if format_version == FORMAT_VERSION_V1:
+        return pickle.dumps(payload_obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    sections: list[memoryview] = []
+
+    def _take_out_of_band(buf: pickle.PickleBuffer) -> bool:
+        raw = buf.raw()
+        if raw.nbytes < _MIN_SECTION_BYTES:
+            return True  # keep in-band
+        sections.append(raw)
+        return False
+
+    manifest = pickle.dumps(payload_obj, protocol=5, buffer_callback=_take_out_of_band)
+    return build_sectioned_payload(manifest, sections, offset)
+
+
 def _is_local_fs(fs: fsspec.AbstractFileSystem) -> bool:
     """Return True when *fs* is a local filesystem."""
     return type(fs).__name__ == "LocalFileSystem"
@@ -268,16 +419,291 @@ def _write_atomic(
 # ---------------------------------------------------------------------------
 
 
+def map_or_read(
+    fh: Any, max_bytes: int, *, owned: bool = False
+) -> bytes | bytearray | mmap.mmap:
+    """Return the contents of the open file *fh*, read once within a cap.
+
+    A local file between 1 byte and *max_bytes* is copied into a private,
+    unlinked temporary file that is then mapped read-only, so rewriting or
+    truncating the original cannot fault the mapping or change bytes that
+    were already verified.  With *owned*, the file is mapped directly; pass
+    it only for files the server itself wrote and never rewrites in place
+    (the shared model store).  fsspec object-store files of known size are
+    read in ``READ_CHUNK_BYTES`` pieces into one preallocated ``bytearray``.
+    Anything else (empty files, files over the cap, handles of unknown size)
+    falls back to a bounded ``fh.read(max_bytes + 1)`` so the caller's cap
+    check behaves exactly as before.
+    """
+    try:
+        fileno = fh.fileno()
+        size = os.fstat(fileno).st_size
+    except (AttributeError, OSError, ValueError):
+        size = getattr(fh, "size", None)
+        if isinstance(size, int) and 0 < size <= max_bytes:
+            return _read_exactly(fh, size)
+        return fh.read(max_bytes + 1)
+    if size == 0 or size > max_bytes:
+        return fh.read(max_bytes + 1)
+    if not owned:
+        return _map_private_copy(fh, size)
+    return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+
+def _map_private_copy(fh: Any, size: int) -> bytearray | mmap.mmap:
+    """Copy *size* bytes of *fh* to an unlinked temp file and map the copy.
+
+    The temp file has no name once created, so nothing else can rewrite it
+    under the mapping.  If the temp directory cannot hold the copy (e.g.
+    ``ENOSPC``) the bytes are read into private memory instead.
+    """
+    try:
+        with tempfile.TemporaryFile() as copy:
+            copied = 0
+            while copied < size:
+                chunk = fh.read(min(READ_CHUNK_BYTES, size - copied))
+                if not chunk:
+                    break  # truncated underneath us; parsing reports it
+                copy.write(chunk)
+                copied += len(chunk)
+            copy.flush()
+            if not copied:
+                return bytearray()
+            return mmap.mmap(copy.fileno(), copied, access=mmap.ACCESS_READ)
+    except OSError as exc:
+        logger.warning("artifact_private_copy_failed", size=size, error=str(exc))
+        fh.seek(0)
+        return _read_exactly(fh, size)
+
+
+def _read_exactly(fh: Any, size: int) -> bytearray:
+    """Read *size* bytes from *fh* into a single preallocated buffer.
+
+    A single ``fh.read(size)`` on an fsspec handle assembles the result from
+    its block cache, transiently holding the artifact twice.
+    """
+    buf = bytearray(size)
+    filled = 0
+    readinto = getattr(fh, "readinto", None)
+    with memoryview(buf) as view:
+        while filled < size:
+            end = min(filled + READ_CHUNK_BYTES, size)
+            if readinto is not None:
+                n = readinto(view[filled:end])
+            else:
+                chunk = fh.read(end - filled)
+                n = len(chunk)
+                view[filled : filled + n] = chunk
+            if not n:
+                break
+            filled += n
+    if filled < size:
+        del buf[filled:]  # truncated underneath us; parsing reports it
+    return buf
+
+
+def artifact_payload(
+    data: bytes | bytearray | mmap.mmap, payload_offset: int
+) -> bytes | memoryview:
+    """Return the payload of *data* for HMAC verification and deserialization.
+
+    A sectioned payload is returned as a zero-copy view so the arrays rebuilt
+    from it stay backed by *data*.  A plain pickle payload read through a
+    mapping is copied first: the pickle stream is what ``SafeUnpickler``
+    executes, so it must be the same bytes the HMAC was checked against.
+    """
+    payload = memoryview(data)[payload_offset:]
+    if isinstance(data, mmap.mmap) and not is_sectioned_payload(payload):
+        return bytes(payload)
+    return payload
+
+
+@dataclass(frozen=True)
+class ArtifactDigest:
+    """Everything ``digest_artifact`` computes in its pass over an artifact."""
+
+    #: Hex SHA-256 identifying the artifact (see ``artifact_sha256``).
+    sha256: str
+    #: The parsed header; ``None`` when the fixed-layout prefix is malformed.
+    header: ArtifactHeader | None = None
+    #: The payload to deserialize (see ``artifact_payload``).
+    payload: bytearray | memoryview | None = None
+    #: HMAC computed over the signed bytes; ``None`` without a key for the kid.
+    hmac_digest: bytes | None = None
+    #: Format 3: SHA-256 of each payload chunk; ``None`` when the manifest
+    #: is unusable.
+    chunk_digests: tuple[bytes, ...] | None = None
+
+
+def artifact_sha256(data: bytes | bytearray | mmap.mmap) -> str:
+    """Hex SHA-256 identifying the artifact *data*.
+
+    For formats 1 and 2 this is the digest of the whole file.  A format-3
+    artifact is identified by the digest of everything before its payload:
+    the signed header commits to every payload chunk, so the prefix changes
+    whenever any byte does, and it is hashed without a pass over the
+    payload.
+    """
+    view = memoryview(data)
+    try:
+        header = parse_header_from_bytes(data, len(view))
+    except ArtifactError:
+        header = None
+    if header is not None and header.version >= FORMAT_VERSION_CHUNKED:
+        return hashlib.sha256(view[: header.payload_offset]).hexdigest()
+    return content_sha256(data)
+
+
+def content_sha256(data: bytes | bytearray | mmap.mmap) -> str:
+    """Hex SHA-256 of every byte of *data*, whatever its format.
+
+    Equal to ``artifact_sha256`` for formats 1 and 2.  For format 3 it is
+    the key to use where the bytes themselves, not the artifact they claim
+    to be, must be identified (the shared model store).
+    """
+    view = memoryview(data)
+    sha = hashlib.sha256()
+    for start in range(0, len(view), READ_CHUNK_BYTES):
+        sha.update(view[start : start + READ_CHUNK_BYTES])
+    return sha.hexdigest()
+
+
+def digest_artifact(
+    data: bytes | bytearray | mmap.mmap,
+    key_ring: KeyRing | None,
+    max_payload_bytes: int,
+) -> ArtifactDigest:
+    """Hash *data* once, computing its SHA-256 and payload HMAC together.
+
+    The HMAC is computed with the key for the header's kid (none without a
+    *key_ring*); pass the result to ``verify_digest``.  A malformed header
+    leaves ``header`` unset and only the SHA-256 computed, so callers can
+    still compare the artifact against the one they loaded before reporting
+    the parse error.
+
+    The payload is the one ``artifact_payload`` would return, except that a
+    plain pickle read through a mapping is copied into a ``bytearray`` during
+    the pass and hashed from the copy, never from the mapping.
+
+    For format 3 the pass hashes the payload chunks in parallel instead, and
+    the HMAC covers only the header (see ``artifact.integrity``).
+    """
+    sha = hashlib.sha256()
+    view = memoryview(data)
+    try:
+        header = parse_header_from_bytes(data, max_payload_bytes)
+    except ArtifactError:
+        for start in range(0, len(view), READ_CHUNK_BYTES):
+            sha.update(view[start : start + READ_CHUNK_BYTES])
+        return ArtifactDigest(sha256=sha.hexdigest())
+
+    key = key_ring.get(header.kid) if key_ring is not None else None
+    if header.version >= FORMAT_VERSION_CHUNKED:
+        return _digest_chunked(data, header, key)
+    mac = (
+        None
+        if key is None
+        else new_payload_hmac(key, header.kid.encode("utf-8"), header.header_data)
+    )
+    sha.update(view[: header.payload_offset])
+    source = view[header.payload_offset :]
+    payload: bytearray | memoryview = source
+    target = source
+    if isinstance(data, mmap.mmap) and not is_sectioned_payload(source):
+        payload = bytearray(len(source))
+        target = memoryview(payload)
+    for start in range(0, len(source), READ_CHUNK_BYTES):
+        chunk = target[start : start + READ_CHUNK_BYTES]
+        if target is not source:
+            chunk[:] = source[start : start + READ_CHUNK_BYTES]
+        sha.update(chunk)
+        if mac is not None:
+            mac.update(chunk)
+    return ArtifactDigest(
+        sha256=sha.hexdigest(),
+        header=header,
+        payload=payload,
+        hmac_digest=None if mac is None else mac.digest(),
+    )
+
+
+def _digest_chunked(
+    data: bytes | bytearray | mmap.mmap, header: ArtifactHeader, key: bytes | None
+) -> ArtifactDigest:
+    """``digest_artifact`` for a format-3 artifact."""
+    view = memoryview(data)
+    source = view[header.payload_offset :]
+    payload: bytearray | memoryview = source
+    chunk_digests = None
+    manifest = _manifest_or_none(header)
+    if manifest is not None:
+        target = None
+        if isinstance(data, mmap.mmap) and not is_sectioned_payload(source):
+            payload = target = bytearray(len(source))
+        chunk_digests = hash_chunks(source, manifest.chunk_bytes, target=target)
+    return ArtifactDigest(
+        sha256=hashlib.sha256(view[: header.payload_offset]).hexdigest(),
+        header=header,
+        payload=payload,
+        hmac_digest=(
+            None
+            if key is None
+            else compute_header_hmac(
+                key, header.kid.encode("utf-8"), header.header_data
+            )
+        ),
+        chunk_digests=chunk_digests,
+    )
+
+
+def _manifest_or_none(header: ArtifactHeader) -> ChunkManifest | None:
+    try:
+        return _chunk_manifest(header)
+    except ArtifactError:
+        return None  # verify_digest reports it
+
+
+def _chunk_manifest(header: ArtifactHeader) -> ChunkManifest:
+    try:
+        header_dict = json.loads(header.header_data.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ArtifactError(f"header JSON decode failed: {exc}") from exc
+    if not isinstance(header_dict, dict):
+        raise ArtifactError("header JSON integrity manifest missing or not an object")
+    return manifest_from_header(header_dict)
+
+
+def verify_digest(digest: ArtifactDigest) -> None:
+    """Verify what ``digest_artifact`` computed against the artifact's signature.
+
+    Checks the HMAC (``signing.verify_hmac_digest``) and, for format 3, every
+    payload chunk against the manifest the HMAC authenticated.  Raises
+    ``ArtifactError`` on any mismatch.
+    """
+    header = digest.header
+    if header is None:
+        raise ArtifactError("artifact header is malformed; nothing to verify")
+    verify_hmac_digest(header.kid, digest.hmac_digest, header.hmac_digest)
+    if header.version >= FORMAT_VERSION_CHUNKED:
+        verify_chunks(
+            header.kid,
+            _chunk_manifest(header),
+            digest.chunk_digests,
+            payload_bytes=memoryview(digest.payload).nbytes,
+        )
+
+
 def read_artifact(
     fs_path: str,
     key_ring: KeyRing,
     *,
     max_bytes: int = DEFAULT_MAX_PAYLOAD_BYTES,
-) -> tuple[ArtifactHeader, bytes]:
+) -> tuple[ArtifactHeader, bytearray | memoryview]:
     """Read, validate, and HMAC-verify a .recotem artifact.
 
-    Implements the read-once protocol: all bytes are read in a single call
-    before any parsing begins.
+    Implements the read-once protocol: the bytes are read once through
+    ``map_or_read`` before any parsing begins, then hashed and verified in a
+    single ``digest_artifact`` pass for every format version.
 
     Parameters
     ----------
@@ -293,10 +719,10 @@ def read_artifact(
 
     Returns
     -------
-    tuple[ArtifactHeader, bytes]
-        The parsed header and the raw payload bytes.  The payload has been
-        HMAC-verified but **not** deserialized.  Call
-        ``artifact.signing.unpickle_payload(payload_bytes)`` to deserialize.
+    tuple[ArtifactHeader, bytearray | memoryview]
+        The parsed header and the payload (see ``artifact_payload``).  The
+        payload has been HMAC-verified but **not** deserialized; pass it to
+        ``artifact.signing.unpickle_payload`` as is.
 
     Raises
     ------
@@ -305,11 +731,9 @@ def read_artifact(
     """
     fs, resolved_path = fsspec.core.url_to_fs(fs_path)
 
-    # Read at most max_bytes+1 in a single call: caps memory before any cap
-    # check while still letting us tell "exactly at the cap" from "over it".
     try:
         with fs.open(resolved_path, "rb") as fh:
-            raw = fh.read(max_bytes + 1)
+            raw = map_or_read(fh, max_bytes)
     except FileNotFoundError as exc:
         raise ArtifactError(f"artifact not found: {fs_path}") from exc
     except OSError as exc:
@@ -327,34 +751,96 @@ def read_artifact(
             "refusing to load"
         )
 
-    # Parse fixed-layout header
-    header = parse_header_from_bytes(resolved_data, max_payload_bytes=max_bytes)
+    # Parse first so a malformed artifact reports its own error rather than
+    # verify_digest's generic one.
+    parse_header_from_bytes(resolved_data, max_payload_bytes=max_bytes)
+    digest = digest_artifact(resolved_data, key_ring, max_bytes)
+    verify_digest(digest)  # raises ArtifactError on failure
+    header = digest.header
+    assert header is not None and digest.payload is not None
 
-    # Extract components needed for HMAC verification
-    kid_bytes = header.kid.encode("utf-8")
-    header_json = header.header_data
-    payload = resolved_data[header.payload_offset :]
+    logger.info("artifact_loaded", kid=header.kid, path=resolved_path)
+    return header, digest.payload
 
-    # HMAC verify — raises ArtifactError on failure
-    verify_hmac(
-        key_ring=key_ring,
-        kid=header.kid,
-        kid_bytes=kid_bytes,
-        header_json=header_json,
-        payload=payload,
-        stored_digest=header.hmac_digest,
+
+#: Longest possible fixed prefix plus header JSON: a header-only read never
+#: needs more than this.
+MAX_HEADER_PREFIX_BYTES = payload_offset_for(
+    b"\x00" * MAX_KID_LEN, b"\x00" * MAX_HEADER_LEN
+)
+
+
+@dataclass(frozen=True)
+class ArtifactHeaderRead:
+    """What ``read_artifact_header`` fetched."""
+
+    #: The parsed header; its HMAC is not verified (see ``verify_header``).
+    header: ArtifactHeader
+    #: The artifact bytes up to the payload.
+    prefix: bytes
+    #: The artifact path, after pointer resolution.
+    path: str
+
+
+def read_artifact_header(fs_path: str) -> ArtifactHeaderRead:
+    """Fetch only the fixed prefix and header JSON of an artifact.
+
+    One ranged read of at most ``MAX_HEADER_PREFIX_BYTES`` (plus one for an
+    ``append_sha`` pointer file), instead of downloading the payload.
+    Nothing is verified: for formats 1 and 2 the HMAC covers the payload,
+    so the header alone can only be compared with one already verified.
+    ``verify_header`` authenticates a format-3 header.
+
+    Raises ``ArtifactError`` when the artifact cannot be read or its prefix
+    is malformed.
+    """
+    try:
+        fs, path = fsspec.core.url_to_fs(fs_path)
+        head = fs.cat_file(path, start=0, end=MAX_HEADER_PREFIX_BYTES)
+        target = _pointer_target(head, path)
+        if target is not None:
+            path = target
+            head = fs.cat_file(path, start=0, end=MAX_HEADER_PREFIX_BYTES)
+    except FileNotFoundError as exc:
+        raise ArtifactError(f"artifact not found: {fs_path}") from exc
+    except (MemoryError, RecursionError):
+        raise
+    except Exception as exc:
+        raise ArtifactError(f"failed to read artifact {fs_path}: {exc}") from exc
+    # The payload is not read, so there is no payload size to cap here.
+    header = parse_header_from_bytes(head, max_payload_bytes=len(head))
+    return ArtifactHeaderRead(
+        header=header, prefix=bytes(head[: header.payload_offset]), path=path
     )
 
-    logger.info("artifact_loaded", kid=header.kid, path=resolved_path)
-    return header, payload
+
+def verify_header(key_ring: KeyRing, header: ArtifactHeader) -> bool:
+    """Verify a header's HMAC without the payload, where the format allows it.
+
+    Returns ``True`` once a format-3 header is verified (its manifest then
+    vouches for every payload chunk), ``False`` for formats 1 and 2, whose
+    HMAC cannot be checked without the payload.  Raises ``ArtifactError``
+    on a mismatch or an unknown kid.
+    """
+    if header.version < FORMAT_VERSION_CHUNKED:
+        return False
+    key = key_ring.get(header.kid)
+    verify_hmac_digest(
+        header.kid,
+        None
+        if key is None
+        else compute_header_hmac(key, header.kid.encode("utf-8"), header.header_data),
+        header.hmac_digest,
+    )
+    return True
 
 
 def resolve_artifact_pointer(
-    raw: bytes,
+    raw: bytes | mmap.mmap,
     path: str,
     fs: fsspec.AbstractFileSystem,
     max_bytes: int,
-) -> tuple[bytes, str]:
+) -> tuple[bytes | mmap.mmap, str]:
     """If *raw* looks like a pointer file, resolve it and return the real bytes.
 
     A pointer file is a small text file (max 512 B) whose entire content
@@ -365,29 +851,13 @@ def resolve_artifact_pointer(
 
     Returns ``(raw, path)`` unchanged when *raw* is not a pointer.
     """
-    # Pointer files are at most a few hundred bytes; skip resolution for
-    # anything that might be a real artifact.
-    if len(raw) > 512:
+    target_path = _pointer_target(raw, path)
+    if target_path is None:
         return raw, path
 
-    try:
-        text = raw.decode("ascii")
-    except (UnicodeDecodeError, ValueError):
-        return raw, path
-
-    if not _POINTER_RE.match(text):
-        return raw, path
-
-    # Looks like a pointer — resolve relative to the directory of the pointer
-    target_name = text.strip()
-    parent = os.path.dirname(path)
-    target_path = os.path.join(parent, target_name) if parent else target_name
-
-    logger.debug("artifact_pointer_resolved", pointer=path, target=target_path)
-
     try:
         with fs.open(target_path, "rb") as fh:
-            artifact_raw = fh.read(max_bytes + 1)
+            artifact_raw = map_or_read(fh, max_bytes)
     except FileNotFoundError as exc:
         raise ArtifactError(
             f"pointer {path!r} references missing artifact {target_path!r}"
@@ -404,3 +874,27 @@ def resolve_artifact_pointer(
         )
 
     return artifact_raw, target_path
+
+
+def _pointer_target(raw: bytes | mmap.mmap, path: str) -> str | None:
+    """The artifact path a pointer file *raw* at *path* names, else ``None``."""
+    # Pointer files are at most a few hundred bytes; skip resolution for
+    # anything that might be a real artifact.
+    if len(raw) > POINTER_MAX_BYTES:
+        return None
+
+    try:
+        text = bytes(raw).decode("ascii")
+    except (UnicodeDecodeError, ValueError):
+        return None
+
+    if not _POINTER_RE.match(text):
+        return None
+
+    # Looks like a pointer — resolve relative to the directory of the pointer
+    target_name = text.strip()
+    parent = os.path.dirname(path)
+    target_path = os.path.join(parent, target_name) if parent else target_name
+
+    logger.debug("artifact_pointer_resolved", pointer=path, target=target_path)
+    return target_path
@@ -40,7 +40,13 @@ from typing import Any
 import structlog
 
 from recotem._log_safe import format_kid_for_log
-from recotem.artifact.format import ArtifactError
+from recotem.artifact.compression import open_decompressed
+from recotem.artifact.format import (
+    DEFAULT_MAX_PAYLOAD_BYTES,
+    ArtifactError,
+    is_sectioned_payload,
+    split_sectioned_payload,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -367,6 +373,19 @@ class KeyRing:
 # ---------------------------------------------------------------------------
 
 
+def new_payload_hmac(key: bytes, kid_bytes: bytes, header_json: bytes) -> hmac.HMAC:
+    """Start the artifact HMAC over ``kid_bytes || header_json``.
+
+    Feed the payload through ``update()`` and finish with ``digest()``; this
+    lets a reader hash the payload incrementally, in the same pass as its
+    SHA-256 (see ``artifact.io.digest_artifact``).
+    """
+    h = hmac.new(key, digestmod=hashlib.sha256)
+    h.update(kid_bytes)
+    h.update(header_json)
+    return h
+
+
 def compute_hmac(
     key: bytes,
     kid_bytes: bytes,
@@ -378,10 +397,27 @@ def compute_hmac(
     The HMAC scope deliberately includes the kid so that tampering with the
     kid to redirect verification to a different key will fail verification.
     """
+    h = new_payload_hmac(key, kid_bytes, header_json)
+    h.update(payload)
+    return h.digest()
+
+
+#: Prefix of the format-3 HMAC input.  Kids come from environment variables
+#: and can never contain NUL, so no format-1/2 input (which starts with the
+#: kid) can collide with a format-3 one.
+CHUNKED_HMAC_DOMAIN = b"RCTMCHK\x00"
+
+
+def compute_header_hmac(key: bytes, kid_bytes: bytes, header_json: bytes) -> bytes:
+    """Compute the format-3 HMAC over ``CHUNKED_HMAC_DOMAIN || kid || header``.
+
+    The payload is covered through the chunk manifest in *header_json*
+    (see ``artifact.integrity``).
+    """
     h = hmac.new(key, digestmod=hashlib.sha256)
+    h.update(CHUNKED_HMAC_DOMAIN)
     h.update(kid_bytes)
     h.update(header_json)
-    h.update(payload)
     return h.digest()
 
 
@@ -402,15 +438,27 @@ def verify_hmac(
     The raw key bytes are never exposed in log events; only the kid is logged.
     """
     key = key_ring.get(kid)
-    if key is None:
+    expected = (
+        None if key is None else compute_hmac(key, kid_bytes, header_json, payload)
+    )
+    verify_hmac_digest(kid, expected, stored_digest)
+
+
+def verify_hmac_digest(
+    kid: str, computed_digest: bytes | None, stored_digest: bytes
+) -> None:
+    """``verify_hmac`` for a digest the caller computed with ``new_payload_hmac``.
+
+    *computed_digest* is ``None`` when the key ring had no key for *kid*.
+    Logs and raises exactly like ``verify_hmac``.
+    """
+    if computed_digest is None:
         logger.warning("artifact_kid_unknown", kid=format_kid_for_log(kid))
         raise ArtifactError(
             f"artifact signed with unknown kid {kid!r}; "
             "check RECOTEM_SIGNING_KEYS configuration"
         )
-
-    expected = compute_hmac(key, kid_bytes, header_json, payload)
-    if not hmac.compare_digest(stored_digest, expected):
+    if not hmac.compare_digest(stored_digest, computed_digest):
         logger.warning("artifact_hmac_mismatch", kid=format_kid_for_log(kid))
         raise ArtifactError(
             f"HMAC verification failed for kid {kid!r}; "
@@ -441,20 +489,94 @@ class SafeUnpickler(pickle.Unpickler):
         return super().find_class(module, name)
 
 
-def unpickle_payload(payload_bytes: bytes) -> Any:
+class _BufferReader:
+    """Read-only file object over a buffer, for ``SafeUnpickler``.
+
+    ``io.BytesIO`` shares a ``bytes`` object but copies any other buffer
+    (a ``bytearray``, a memoryview into one or into a mapping), which would
+    double the peak memory of loading a plain pickle payload.
+    """
+
+    def __init__(self, buffer: bytes | bytearray | memoryview) -> None:
+        self._view = memoryview(buffer).cast("B")
+        self._pos = 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        end = len(self._view)
+        if size is not None and size >= 0:
+            end = min(self._pos + size, end)
+        data = self._view[self._pos : end].tobytes()
+        self._pos = end
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        target = memoryview(buffer).cast("B")
+        n = min(len(target), len(self._view) - self._pos)
+        target[:n] = self._view[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def readline(self, size: int | None = -1) -> bytes:
+        # Only the text opcodes of pickle protocols 0-3 read lines.
+        end = len(self._view)
+        if size is not None and size >= 0:
+            end = min(self._pos + size, end)
+        start = self._pos
+        while start < end:
+            chunk = self._view[start : min(start + 4096, end)].tobytes()
+            newline = chunk.find(b"\n")
+            if newline >= 0:
+                end = start + newline + 1
+                break
+            start += len(chunk)
+        return self.read(end - self._pos)
+
+
+def _payload_stream(payload: bytes | bytearray | memoryview) -> Any:
+    """File object over *payload* that does not copy it."""
+    if isinstance(payload, bytes):
+        return io.BytesIO(payload)
+    return _BufferReader(payload)
+
+
+def unpickle_payload(
+    payload_bytes: bytes | bytearray | memoryview,
+    *,
+    compression: str = "none",
+    max_decompressed_bytes: int = DEFAULT_MAX_PAYLOAD_BYTES,
+) -> Any:
     """Deserialize *payload_bytes* using ``SafeUnpickler``.
 
     This is intentionally separate from ``read_artifact`` so that callers
     such as ``recotem inspect`` can read and verify the artifact without
     triggering deserialization.
 
+    Both payload layouts are accepted.  For a sectioned (format 2) payload
+    only the manifest goes through ``SafeUnpickler``; its out-of-band buffers
+    are handed over as views into *payload_bytes*, so arrays rebuilt from a
+    memory-mapped artifact are read-only and backed by the mapping.  A plain
+    pickle is read straight out of *payload_bytes* without a copy.
+
+    A *compression* other than ``"none"`` (the header's ``"compression"``,
+    see ``artifact.compression``) is decompressed as a stream into
+    ``SafeUnpickler``; more than *max_decompressed_bytes* of output raises
+    ``ArtifactError``.
+
     Raises ``ArtifactError`` on any disallowed class or deserialization error.
     ``MemoryError`` and ``RecursionError`` are re-raised unwrapped so OOM /
     stack-exhaustion is not swallowed as ``ArtifactError`` in the watcher loop
     (M-8).
     """
     try:
-        return SafeUnpickler(io.BytesIO(payload_bytes)).load()
+        if compression != "none":
+            stream = open_decompressed(
+                _payload_stream(payload_bytes), compression, max_decompressed_bytes
+            )
+            return SafeUnpickler(stream).load()
+        if is_sectioned_payload(payload_bytes):
+            manifest, sections = split_sectioned_payload(payload_bytes)
+            return SafeUnpickler(_payload_stream(manifest), buffers=sections).load()
+        return SafeUnpickler(_payload_stream(payload_bytes)).load()
     except ArtifactError:
         raise
     except (MemoryError, RecursionError):
@@ -4,6 +4,7 @@ Commands:
   train     Fetch data, tune hyperparameters, train, and sign an artifact.
   serve     Start the FastAPI prediction server with hot-swap.
   inspect   Read and verify an artifact header (no deserialization).
+  score     Export top-k items for every user (or item) to Parquet / CSV.
   validate  Validate a recipe file and probe data-source connectivity.
   schema    Emit the JSON Schema for the Recipe model.
   keygen    Generate a signing or API key (kid, plaintext, hash triple).
@@ -23,13 +24,14 @@ Exit codes:
 from __future__ import annotations
 
 import base64
+import functools
 import hashlib
 import json
 import os
 import re
 import uuid
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
 import structlog
 import typer
@@ -319,11 +321,30 @@ def serve(
     cfg.dev_allow_unsigned = dev_allow_unsigned
     cfg.recipes_dir = str(recipes.resolve())
 
+    # RECOTEM_WORKERS > 1: this process becomes the supervisor that loads and
+    # watches artifacts once; uvicorn spawns workers that attach to the models
+    # it publishes through a shared store (see recotem.serving.shared).
+    store = None
+    supervisor = None
     try:
-        from recotem.serving.app import create_app
+        if cfg.workers > 1:
+            from recotem.serving.shared import SHARED_MODEL_DIR_ENV, SharedModelStore
+            from recotem.serving.supervisor import ModelSupervisor
+
+            store = SharedModelStore.create(cfg.shared_model_dir)
+            supervisor = ModelSupervisor(cfg, store)
+            supervisor.start()
+            os.environ[SHARED_MODEL_DIR_ENV] = str(store.root)
+            app_target: Any = "recotem.serving.supervisor:create_worker_app"
+            worker_kwargs: dict[str, Any] = {"factory": True, "workers": cfg.workers}
+        else:
+            from recotem.serving.app import create_app
 
-        fastapi_app = create_app(cfg)
+            app_target = create_app(cfg)
+            worker_kwargs = {}
     except Exception as exc:
+        if store is not None:
+            store.cleanup()
         code = _map_exception_to_exit(exc)
         _exit(code, f"Server startup failed: {exc}")
 
@@ -333,11 +354,12 @@ def serve(
 
     try:
         uvicorn.run(
-            fastapi_app,
+            app_target,
             host=cfg.host,
             port=cfg.port,
             timeout_graceful_shutdown=cfg.drain_seconds,
             log_config=None,
+            **worker_kwargs,
         )
     except KeyboardInterrupt:
         _srv_log.info("serve_terminated", reason="KeyboardInterrupt")
@@ -370,6 +392,11 @@ def serve(
         _srv_log.error("serve_startup_failed", error=str(exc))
         code = _map_exception_to_exit(exc)
         _exit(code, f"Server error: {exc}")
+    finally:
+        if supervisor is not None:
+            supervisor.stop()
+        if store is not None:
+            store.cleanup()
 
 
 # ---------------------------------------------------------------------------
@@ -422,6 +449,18 @@ def inspect(
             ),
         ),
     ] = False,
+    header_only: Annotated[
+        bool,
+        typer.Option(
+            "--header-only",
+            help=(
+                "Fetch only the artifact header with a ranged read instead of "
+                "the whole file.  The HMAC is verified for format-3 artifacts "
+                "only; formats 1 and 2 sign the payload, so their header is "
+                "printed as NOT VERIFIED."
+            ),
+        ),
+    ] = False,
 ) -> None:
     """Read and verify an artifact header without deserializing the payload.
 
@@ -429,6 +468,8 @@ def inspect(
     and prints the header JSON.  Does not invoke the deserializer — no
     ``--i-understand-this-loads-arbitrary-code`` flag is needed because
     inspect only reads the signed header, never the serialized payload.
+    ``--header-only`` skips the payload download (see
+    ``artifact.io.read_artifact_header``).
 
     Requires RECOTEM_SIGNING_KEYS to be set (or --dev-allow-unsigned with
     RECOTEM_ENV=development) so that a scripted pipeline can distinguish
@@ -451,7 +492,7 @@ def inspect(
         ArtifactError,
         parse_header_from_bytes,
     )
-    from recotem.artifact.io import resolve_artifact_pointer
+    from recotem.artifact.io import read_artifact_header, resolve_artifact_pointer
     from recotem.config import ServeConfig
 
     # Use max_artifact_bytes as the file read cap (matches the serving-watcher
@@ -467,8 +508,11 @@ def inspect(
         # Bounded read so a 100 GiB file cannot OOM the CLI before the cap
         # check fires; matches the serving-watcher protocol.
         fs, resolved_path = fsspec.core.url_to_fs(artifact_uri)
-        with fs.open(resolved_path, "rb") as fh:
-            data = fh.read(read_cap + 1)
+        if header_only:
+            data = read_artifact_header(artifact_uri).prefix
+        else:
+            with fs.open(resolved_path, "rb") as fh:
+                data = fh.read(read_cap + 1)
     except ImportError as exc:
         # A missing optional fsspec backend (gcsfs, s3fs, adlfs, …) raises
         # ImportError when url_to_fs resolves the scheme.  Surface a targeted
@@ -519,7 +563,10 @@ def inspect(
     try:
         # Resolve pointer files written by the default ``append_sha`` versioning
         # mode so users can inspect via the recipe's output.path directly.
-        data, _resolved = resolve_artifact_pointer(data, resolved_path, fs, read_cap)
+        if not header_only:
+            data, _resolved = resolve_artifact_pointer(
+                data, resolved_path, fs, read_cap
+            )
 
         if len(data) > read_cap:
             raise ArtifactError(
@@ -546,19 +593,24 @@ def inspect(
         signing_keys_raw = "dev:" + ("0" * 64)
     if signing_keys_raw:
         try:
-            from recotem.artifact.signing import KeyRing, verify_hmac
+            from recotem.artifact.io import (
+                digest_artifact,
+                verify_digest,
+                verify_header,
+            )
+            from recotem.artifact.signing import KeyRing
 
             key_ring = KeyRing(signing_keys_raw)
-            payload_bytes = data[hdr.payload_offset :]
-            verify_hmac(
-                key_ring,
-                hdr.kid,
-                hdr.kid.encode("utf-8"),
-                hdr.header_data,
-                payload_bytes,
-                hdr.hmac_digest,
-            )
-            typer.echo(f"HMAC: OK  (kid={hdr.kid!r})")
+            if not header_only:
+                verify_digest(digest_artifact(data, key_ring, parse_cap))
+                typer.echo(f"HMAC: OK  (kid={hdr.kid!r})")
+            elif verify_header(key_ring, hdr):
+                typer.echo(f"HMAC: OK  (kid={hdr.kid!r}; header only)")
+            else:
+                typer.echo(
+                    f"HMAC: NOT VERIFIED  (kid={hdr.kid!r}; format {hdr.version} "
+                    "signs the payload, which --header-only does not read)"
+                )
         except (MemoryError, RecursionError):
             raise
         except Exception as exc:
@@ -587,6 +639,178 @@ def inspect(
     typer.echo(json.dumps(header_dict, indent=2))
 
 
+# ---------------------------------------------------------------------------
+# recotem score
+# ---------------------------------------------------------------------------
+
+
+@app.command()
+def score(
+    artifact: Annotated[
+        str,
+        # str, not Path, so remote URIs survive; see ``inspect``.
+        typer.Argument(help="Path or URI to the .recotem artifact file."),
+    ],
+    output: Annotated[
+        str,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Destination path or fsspec URI (e.g. s3://bucket/topk.parquet).",
+        ),
+    ],
+    output_format: Annotated[
+        str | None,
+        typer.Option(
+            "--format",
+            help="parquet or csv.  Default: csv for *.csv / *.csv.gz, else parquet.",
+        ),
+    ] = None,
+    limit: Annotated[
+        int,
+        typer.Option("--limit", help="Items per user (or item).", min=1, max=1000),
+    ] = 10,
+    users_from: Annotated[
+        str | None,
+        typer.Option(
+            "--users-from",
+            help=(
+                "Text file (path or URI) with one ID per line to score instead "
+                "of every ID in the model.  Holds item IDs with --related-items."
+            ),
+        ),
+    ] = None,
+    related_items: Annotated[
+        bool,
+        typer.Option(
+            "--related-items",
+            help="Export related items for each item instead of items per user.",
+        ),
+    ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            help="Scoring processes (0 = CPU count; 1 = in-process).",
+            min=0,
+        ),
+    ] = 0,
+    chunk_size: Annotated[
+        int,
+        typer.Option(
+            "--chunk-size", help="IDs scored per vectorized call.", min=1, max=65536
+        ),
+    ] = 1024,
+    dev_allow_unsigned: Annotated[
+        bool,
+        typer.Option(
+            "--dev-allow-unsigned",
+            help=(
+                "Verify against the deterministic in-memory dev signing key "
+                "when RECOTEM_SIGNING_KEYS is unset.  Requires "
+                "RECOTEM_ENV=development AND "
+                "--i-understand-this-loads-arbitrary-code."
+            ),
+        ),
+    ] = False,
+    i_understand_this_loads_arbitrary_code: Annotated[
+        bool,
+        typer.Option(
+            "--i-understand-this-loads-arbitrary-code",
+            help="Required companion flag for --dev-allow-unsigned.",
+        ),
+    ] = False,
+) -> None:
+    """Export the top-k items for every user (or related items per item).
+
+    Reads and HMAC-verifies the artifact through ``read_artifact``, scores
+    IDs in chunks on a process pool and streams a long table (one row per
+    recommended item) to Parquet or CSV.  Unknown IDs in ``--users-from``
+    are skipped.  Prints the throughput when done.
+    """
+    _configure_logging_from_env()
+
+    if dev_allow_unsigned and not i_understand_this_loads_arbitrary_code:
+        # The payload is unpickled, so a file signed with the public dev key
+        # runs arbitrary code: same flag pair as train and serve.
+        _exit(
+            _EXIT_CONFIG,
+            "--dev-allow-unsigned requires "
+            "--i-understand-this-loads-arbitrary-code to also be passed.",
+        )
+    if dev_allow_unsigned:
+        _check_dev_env("--dev-allow-unsigned")
+    if output_format is not None and output_format not in ("parquet", "csv"):
+        _exit(_EXIT_CONFIG, f"--format must be parquet or csv; got {output_format!r}.")
+
+    try:
+        from recotem.config import ServeConfig
+
+        cfg = ServeConfig.from_env()
+    except Exception as exc:
+        _exit(_map_exception_to_exit(exc), f"Configuration error: {exc}")
+
+    signing_keys_raw = os.environ.get("RECOTEM_SIGNING_KEYS", "").strip()
+    if not signing_keys_raw and dev_allow_unsigned:
+        # Same in-memory dev key as ``inspect`` and ``train --dev-allow-unsigned``.
+        signing_keys_raw = "dev:" + ("0" * 64)
+    if not signing_keys_raw:
+        _exit(
+            _EXIT_CONFIG,
+            "Cannot verify artifact: RECOTEM_SIGNING_KEYS is not set and "
+            "--dev-allow-unsigned was not passed.",
+        )
+
+    from recotem import _bulk_score
+
+    load_model = functools.partial(
+        _bulk_score.load_recommender,
+        _repair_uri(artifact),
+        signing_keys_raw,
+        max_artifact_bytes=cfg.max_artifact_bytes,
+        max_payload_bytes=cfg.max_payload_bytes,
+    )
+    try:
+        recommender = load_model()
+    except (MemoryError, RecursionError):
+        raise
+    except Exception as exc:
+        _exit(_map_exception_to_exit(exc), f"Artifact load failed: {exc}")
+
+    subject = "items" if related_items else "users"
+    try:
+        stats = _bulk_score.export_scores(
+            recommender,
+            _repair_uri(output),
+            ids=_bulk_score.read_ids(_repair_uri(users_from)) if users_from else None,
+            limit=limit,
+            related=related_items,
+            fmt=output_format,  # type: ignore[arg-type]
+            chunk_size=chunk_size,
+            workers=workers or os.cpu_count() or 1,
+            load_model=load_model,
+        )
+    except (MemoryError, RecursionError):
+        raise
+    except Exception as exc:
+        _exit(_map_exception_to_exit(exc), f"Scoring failed: {exc}")
+
+    structlog.get_logger(__name__).info(
+        "score_done",
+        artifact=artifact,
+        scored=stats.scored,
+        skipped=stats.skipped,
+        rows=stats.rows,
+        seconds=round(stats.seconds, 3),
+    )
+    typer.echo(
+        f"Scored {stats.scored} {subject} ({stats.rows} rows) in "
+        f"{stats.seconds:.1f}s: {stats.per_second:.0f} {subject}/s"
+        + (f"; skipped {stats.skipped} unknown IDs" if stats.skipped else ""),
+        err=True,
+    )
+
+
 # ---------------------------------------------------------------------------
 # recotem validate
 # ---------------------------------------------------------------------------
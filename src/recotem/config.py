@@ -31,6 +31,73 @@ Environment variables:
                                  clamped 1–32)
   RECOTEM_MAX_SQL_ROWS         Hard cap on rows returned by the SQL source
                                  (default 50_000_000; clamped [1_000, 500_000_000])
+  RECOTEM_RESPONSE_CACHE_MAX_BYTES
+                               Byte budget of the in-process
+                                 :recommend / :recommend-related response
+                                 cache, shared by all recipes (default
+                                 0 = disabled; clamped [0, 16 GiB])
+  RECOTEM_RESPONSE_CACHE_TTL_SECONDS
+                               Optional expiry for cached responses
+                                 (default 0 = no TTL; clamped [0, 86400])
+  RECOTEM_COALESCE_WINDOW_MS   Micro-batching window for concurrent :recommend
+                                 calls to one recipe (default 0 = disabled;
+                                 clamped [0, 50])
+  RECOTEM_COALESCE_MAX_BATCH   Batch size that closes the window early
+                                 (default 32; clamped [1, 256])
+  RECOTEM_COALESCE_RECIPES     CSV of recipe names to coalesce (default empty
+                                 = every recipe when the window is > 0)
+  RECOTEM_RECIPE_POOL_SIZE     Threads in each recipe's inference executor
+                                 (default 8; clamped [1, 256])
+  RECOTEM_RECIPE_POOL_SIZES    CSV of ``<recipe>=<threads>`` overrides, e.g.
+                                 ``big-slim=2,news=16`` (same clamp)
+  RECOTEM_STREAM_CHUNK_SIZE    NDJSON lines scored together by
+                                 :stream-recommend (default 256; clamped
+                                 [1, 4096])
+  RECOTEM_WARMUP_REQUESTS      Synthetic :recommend and :recommend-related
+                                 calls run against a newly loaded model
+                                 before it is swapped in (default 16;
+                                 0 = no warmup; clamped [0, 1024])
+  RECOTEM_MODEL_MEMORY_BUDGET  Byte budget for resident models.  When set,
+                                 recipes load on their first request and the
+                                 least recently used models are evicted to
+                                 stay within it (default 0 = load every
+                                 recipe at startup; clamped [0, 1 TiB])
+  RECOTEM_WATCHER_LOAD_CONCURRENCY
+                               Changed artifacts the watcher loads at once
+                                 (default 4; clamped [1, 32])
+  RECOTEM_WATCHER_LOAD_BUDGET_BYTES
+                               Cap on the summed size of the artifacts being
+                                 loaded by the watcher at once (default 0 =
+                                 RECOTEM_MAX_ARTIFACT_BYTES; clamped
+                                 [0, 1 TiB])
+  RECOTEM_SERVER_TIMING        Truthy (1/true/yes/on) adds a ``Server-Timing``
+                                 header with the per-stage breakdown to
+                                 inference responses (default off)
+  RECOTEM_ADMISSION_MAX_INFLIGHT
+                               Cap on admitted request weight across all
+                                 recipes; a batch weighs its element count
+                                 (default 0 = unlimited; clamped [0, 1e6])
+  RECOTEM_ADMISSION_RECIPE_MAX_INFLIGHT
+                               Same cap per recipe (default 0 = unlimited)
+  RECOTEM_ADMISSION_RECIPE_LIMITS
+                               CSV of ``<recipe>=<weight>`` per-recipe caps
+  RECOTEM_ADMISSION_RETRY_AFTER_SECONDS
+                               ``Retry-After`` sent with 429 OVERLOADED
+                                 (default 1; clamped [1, 60])
+  RECOTEM_API_KEY_CACHE_MAX_ENTRIES
+                               Verified API keys remembered per process so
+                                 repeat requests skip the KDF (default 1024;
+                                 clamped [0, 65536]; 0 = disabled)
+  RECOTEM_API_KEY_CACHE_TTL_SECONDS
+                               Lifetime of a verified-key cache entry
+                                 (default 300; clamped [1, 3600])
+  RECOTEM_WORKERS              HTTP worker processes for ``recotem serve``
+                                 (default 1; clamped [1, 64]).  Above 1 a
+                                 supervisor loads and watches artifacts once
+                                 and the workers share its models.
+  RECOTEM_SHARED_MODEL_DIR     Directory the supervisor publishes verified
+                                 models into (default empty = a private temp
+                                 dir under /dev/shm when writable)
   RECOTEM_SQL_ALLOW_PRIVATE    Truthy (1/true/yes/on) opts the SQL source into
                                  accepting private/loopback host addresses.
                                  Default refuses RFC1918 / 127.0.0.0/8 to
@@ -87,6 +154,51 @@ _MAX_STARTUP_PARALLELISM = 32
 # Sentinel: 0 means "derive from len(recipes) at startup, capped at 8"
 _DEFAULT_STARTUP_PARALLELISM_SENTINEL = 0
 
+# Response cache (per recipe).  0 bytes disables the cache entirely.
+_DEFAULT_RESPONSE_CACHE_MAX_BYTES = 0
+_MAX_RESPONSE_CACHE_MAX_BYTES = 16 * 1024 * 1024 * 1024  # 16 GiB
+_MAX_RESPONSE_CACHE_TTL_SECONDS = 86400
+
+# :recommend coalescer.  A 0 ms window disables it.
+_MAX_COALESCE_WINDOW_MS = 50
+_DEFAULT_COALESCE_MAX_BATCH = 32
+_MAX_COALESCE_MAX_BATCH = 256
+
+# Per-recipe inference executors (bulkheads).
+_DEFAULT_RECIPE_POOL_SIZE = 8
+_MAX_RECIPE_POOL_SIZE = 256
+
+# :stream-recommend scoring chunk, in NDJSON lines.
+_DEFAULT_STREAM_CHUNK_SIZE = 256
+_MAX_STREAM_CHUNK_SIZE = 4096
+
+# Pre-swap warmup, in synthetic calls per verb.  0 disables it.
+_DEFAULT_WARMUP_REQUESTS = 16
+_MAX_WARMUP_REQUESTS = 1024
+
+# Lazy loading.  A 0-byte budget keeps every model resident (eager startup).
+_DEFAULT_MODEL_MEMORY_BUDGET = 0
+_MAX_MODEL_MEMORY_BUDGET = 1024 * 1024 * 1024 * 1024  # 1 TiB
+
+# Watcher loads.  A 0-byte budget means RECOTEM_MAX_ARTIFACT_BYTES.
+_DEFAULT_WATCHER_LOAD_CONCURRENCY = 4
+_MAX_WATCHER_LOAD_CONCURRENCY = 32
+_MAX_WATCHER_LOAD_BUDGET_BYTES = 1024 * 1024 * 1024 * 1024  # 1 TiB
+
+# Admission control.  0 means unlimited.
+_MAX_ADMISSION_INFLIGHT = 1_000_000
+_DEFAULT_ADMISSION_RETRY_AFTER_SECONDS = 1
+_MAX_ADMISSION_RETRY_AFTER_SECONDS = 60
+
+# Verified-API-key cache.  0 entries disables it.
+_DEFAULT_API_KEY_CACHE_MAX_ENTRIES = 1024
+_MAX_API_KEY_CACHE_MAX_ENTRIES = 65536
+_DEFAULT_API_KEY_CACHE_TTL_SECONDS = 300
+_MAX_API_KEY_CACHE_TTL_SECONDS = 3600
+
+# Multi-worker serving (1 = the classic single-process server).
+_MAX_WORKERS = 64
+
 # Exact hex length for a sha256 hash: 64 hex chars = 32 bytes.
 _SHA256_HEX_RE = re.compile(r"^[0-9a-fA-F]{64}$")
 
@@ -109,6 +221,29 @@ def _split_csv_env(name: str, default: list[str]) -> list[str]:
     return parts if parts else list(default)
 
 
+def _parse_recipe_int_map(name: str, hi: int) -> dict[str, int]:
+    """Parse a CSV env var of ``<recipe>=<int>`` entries, clamping to ``[1, hi]``.
+
+    Used for per-recipe overrides such as ``RECOTEM_RECIPE_POOL_SIZES``.  A
+    malformed entry raises :class:`ConfigError` so a typo cannot silently
+    fall back to the default.
+    """
+    values: dict[str, int] = {}
+    for item in _split_csv_env(name, []):
+        recipe, sep, raw_value = item.partition("=")
+        recipe = recipe.strip()
+        try:
+            if not sep or not recipe:
+                raise ValueError("expected <recipe>=<integer>")
+            value = int(raw_value.strip())
+        except ValueError as exc:
+            raise ConfigError(
+                f"{name} contains an invalid entry {item!r}: {exc}"
+            ) from exc
+        values[recipe] = max(1, min(hi, value))
+    return values
+
+
 def _clamped_int_env(name: str, default: int, lo: int, hi: int) -> int:
     """Return an integer env value clamped to ``[lo, hi]``, falling back to *default*.
 
@@ -256,6 +391,63 @@ class ServeConfig:
     # create_app).  Set via RECOTEM_STARTUP_PARALLELISM (clamped [1, 32]).
     startup_parallelism: int = _DEFAULT_STARTUP_PARALLELISM_SENTINEL
 
+    # Response cache — process-wide byte budget (0 = disabled) and optional TTL
+    # (0 = entries live until evicted or the recipe's model is swapped).
+    response_cache_max_bytes: int = _DEFAULT_RESPONSE_CACHE_MAX_BYTES
+    response_cache_ttl_seconds: int = 0
+
+    # :recommend micro-batching — window in milliseconds (0 = disabled), the
+    # batch size that closes it early, and an optional recipe allow-list.
+    coalesce_window_ms: int = 0
+    coalesce_max_batch: int = _DEFAULT_COALESCE_MAX_BATCH
+    coalesce_recipes: list[str] = field(default_factory=list)
+
+    # Per-recipe inference executors — default thread count and per-recipe
+    # overrides.  Each recipe scores on its own pool so a slow one cannot
+    # starve the others.
+    recipe_pool_size: int = _DEFAULT_RECIPE_POOL_SIZE
+    recipe_pool_sizes: dict[str, int] = field(default_factory=dict)
+
+    # :stream-recommend reads and scores this many NDJSON lines at a time;
+    # memory per stream is bounded by one chunk in and one chunk out.
+    stream_chunk_size: int = _DEFAULT_STREAM_CHUNK_SIZE
+
+    # Synthetic calls per verb run against a newly loaded model before it is
+    # swapped in, so the first real requests do not hit cold code paths.
+    warmup_requests: int = _DEFAULT_WARMUP_REQUESTS
+
+    # Lazy loading: recipes stay on standby until first requested and the
+    # least recently used models are evicted above this many bytes.
+    # 0 loads every recipe at startup and never evicts.
+    model_memory_budget: int = _DEFAULT_MODEL_MEMORY_BUDGET
+
+    # Watcher hot-swap loads run in parallel, bounded by a count and by the
+    # summed size of the artifacts being loaded (0 = max_artifact_bytes).
+    watcher_load_concurrency: int = _DEFAULT_WATCHER_LOAD_CONCURRENCY
+    watcher_load_budget_bytes: int = 0
+
+    # Per-stage timings returned as a Server-Timing header on inference
+    # responses.  The stage histogram follows RECOTEM_METRICS_ENABLED.
+    server_timing: bool = False
+
+    # Admission control — caps on admitted request weight (queued + running;
+    # a batch weighs its element count), global and per recipe.  0 means
+    # unlimited.  Rejections are 429 OVERLOADED with Retry-After.
+    admission_max_inflight: int = 0
+    admission_recipe_max_inflight: int = 0
+    admission_recipe_limits: dict[str, int] = field(default_factory=dict)
+    admission_retry_after_seconds: int = _DEFAULT_ADMISSION_RETRY_AFTER_SECONDS
+
+    # Verified-API-key cache — entries per process (0 = disabled) and how long
+    # a successful verification is trusted before scrypt runs again.
+    api_key_cache_max_entries: int = _DEFAULT_API_KEY_CACHE_MAX_ENTRIES
+    api_key_cache_ttl_seconds: int = _DEFAULT_API_KEY_CACHE_TTL_SECONDS
+
+    # Multi-worker serving — HTTP worker processes and the directory the
+    # supervisor shares verified models through (empty = private temp dir).
+    workers: int = 1
+    shared_model_dir: str = ""
+
     @classmethod
     def from_env(cls) -> ServeConfig:
         """Build a :class:`ServeConfig` from the current environment.
@@ -386,6 +578,102 @@ class ServeConfig:
             )
         # else leave as sentinel 0 → resolved at startup in create_app
 
+        cfg.response_cache_max_bytes = _clamped_int_env(
+            "RECOTEM_RESPONSE_CACHE_MAX_BYTES",
+            _DEFAULT_RESPONSE_CACHE_MAX_BYTES,
+            0,
+            _MAX_RESPONSE_CACHE_MAX_BYTES,
+        )
+        cfg.response_cache_ttl_seconds = _clamped_int_env(
+            "RECOTEM_RESPONSE_CACHE_TTL_SECONDS", 0, 0, _MAX_RESPONSE_CACHE_TTL_SECONDS
+        )
+
+        cfg.coalesce_window_ms = _clamped_int_env(
+            "RECOTEM_COALESCE_WINDOW_MS", 0, 0, _MAX_COALESCE_WINDOW_MS
+        )
+        cfg.coalesce_max_batch = _clamped_int_env(
+            "RECOTEM_COALESCE_MAX_BATCH",
+            _DEFAULT_COALESCE_MAX_BATCH,
+            1,
+            _MAX_COALESCE_MAX_BATCH,
+        )
+        cfg.coalesce_recipes = _split_csv_env("RECOTEM_COALESCE_RECIPES", [])
+
+        cfg.recipe_pool_size = _clamped_int_env(
+            "RECOTEM_RECIPE_POOL_SIZE",
+            _DEFAULT_RECIPE_POOL_SIZE,
+            1,
+            _MAX_RECIPE_POOL_SIZE,
+        )
+        cfg.recipe_pool_sizes = _parse_recipe_int_map(
+            "RECOTEM_RECIPE_POOL_SIZES", _MAX_RECIPE_POOL_SIZE
+        )
+
+        cfg.stream_chunk_size = _clamped_int_env(
+            "RECOTEM_STREAM_CHUNK_SIZE",
+            _DEFAULT_STREAM_CHUNK_SIZE,
+            1,
+            _MAX_STREAM_CHUNK_SIZE,
+        )
+
+        cfg.warmup_requests = _clamped_int_env(
+            "RECOTEM_WARMUP_REQUESTS",
+            _DEFAULT_WARMUP_REQUESTS,
+            0,
+            _MAX_WARMUP_REQUESTS,
+        )
+
+        cfg.model_memory_budget = _clamped_int_env(
+            "RECOTEM_MODEL_MEMORY_BUDGET",
+            _DEFAULT_MODEL_MEMORY_BUDGET,
+            0,
+            _MAX_MODEL_MEMORY_BUDGET,
+        )
+
+        cfg.watcher_load_concurrency = _clamped_int_env(
+            "RECOTEM_WATCHER_LOAD_CONCURRENCY",
+            _DEFAULT_WATCHER_LOAD_CONCURRENCY,
+            1,
+            _MAX_WATCHER_LOAD_CONCURRENCY,
+        )
+        cfg.watcher_load_budget_bytes = _clamped_int_env(
+            "RECOTEM_WATCHER_LOAD_BUDGET_BYTES", 0, 0, _MAX_WATCHER_LOAD_BUDGET_BYTES
+        )
+
+        cfg.server_timing = is_truthy_env(os.environ.get("RECOTEM_SERVER_TIMING"))
+
+        cfg.admission_max_inflight = _clamped_int_env(
+            "RECOTEM_ADMISSION_MAX_INFLIGHT", 0, 0, _MAX_ADMISSION_INFLIGHT
+        )
+        cfg.admission_recipe_max_inflight = _clamped_int_env(
+            "RECOTEM_ADMISSION_RECIPE_MAX_INFLIGHT", 0, 0, _MAX_ADMISSION_INFLIGHT
+        )
+        cfg.admission_recipe_limits = _parse_recipe_int_map(
+            "RECOTEM_ADMISSION_RECIPE_LIMITS", _MAX_ADMISSION_INFLIGHT
+        )
+        cfg.admission_retry_after_seconds = _clamped_int_env(
+            "RECOTEM_ADMISSION_RETRY_AFTER_SECONDS",
+            _DEFAULT_ADMISSION_RETRY_AFTER_SECONDS,
+            1,
+            _MAX_ADMISSION_RETRY_AFTER_SECONDS,
+        )
+
+        cfg.api_key_cache_max_entries = _clamped_int_env(
+            "RECOTEM_API_KEY_CACHE_MAX_ENTRIES",
+            _DEFAULT_API_KEY_CACHE_MAX_ENTRIES,
+            0,
+            _MAX_API_KEY_CACHE_MAX_ENTRIES,
+        )
+        cfg.api_key_cache_ttl_seconds = _clamped_int_env(
+            "RECOTEM_API_KEY_CACHE_TTL_SECONDS",
+            _DEFAULT_API_KEY_CACHE_TTL_SECONDS,
+            1,
+            _MAX_API_KEY_CACHE_TTL_SECONDS,
+        )
+
+        cfg.workers = _clamped_int_env("RECOTEM_WORKERS", 1, 1, _MAX_WORKERS)
+        cfg.shared_model_dir = os.environ.get("RECOTEM_SHARED_MODEL_DIR", "").strip()
+
         # Invariant: payload cap must not exceed the artifact cap.
         # RECOTEM_MAX_PAYLOAD_BYTES is documented as "Smaller than
         # RECOTEM_MAX_ARTIFACT_BYTES to bound deserialization memory expansion."
@@ -20,7 +20,9 @@ scheme allow-list, and userinfo redaction in logs. See
 ``dict[str, dict[str, Any]]`` keyed by item_id for O(1) per-item lookups
 during ``/v1/recipes/{name}:recommend`` and ``:recommend-related`` — NaN
 values are converted to ``None`` for JSON safety and deny-listed fields are
-stripped once at build time.
+stripped once at build time.  The returned :class:`MetadataIndex` also
+carries each item's response JSON pre-encoded, so the router splices bytes
+instead of serialising metadata on every request.
 """
 
 from __future__ import annotations
@@ -32,6 +34,7 @@ from typing import Any, Literal
 from urllib.parse import urlparse
 
 import pandas as pd
+import pydantic_core
 import structlog
 
 from recotem._http_fetch import (
@@ -81,6 +84,59 @@ class MetadataError(ValueError):
         self.cause = cause
 
 
+#: Response fields owned by the recommender; metadata never overrides them.
+RESERVED_ITEM_FIELDS = frozenset({"item_id", "score"})
+
+
+class MetadataIndex(dict[str, dict[str, Any]]):
+    """``{item_id: fields}`` plus each item's response JSON, pre-encoded.
+
+    ``parts[item_id]`` is the ``(head, tail)`` pair from
+    :func:`encode_item_parts`; a response item is ``head + score + tail``.
+    It is ``None`` when the fields are not JSON-encodable; the router then
+    serves the item bare and reports it as degraded.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.parts: dict[str, tuple[bytes, bytes] | None] = {}
+
+
+def encode_metadata_fragment(fields: dict[str, Any]) -> bytes | None:
+    """Encode *fields* as JSON object members with a leading comma.
+
+    Uses the same serialiser (and the same ``inf``/``nan`` → ``null`` rule)
+    as the pydantic response models, so a spliced item is byte-identical to a
+    model-serialised one.  ``item_id`` / ``score`` are skipped because the
+    recommender's values take precedence.  Returns ``b""`` when nothing is
+    left and ``None`` if a value cannot be encoded.
+    """
+    members = {k: v for k, v in fields.items() if k not in RESERVED_ITEM_FIELDS}
+    if not members:
+        return b""
+    try:
+        encoded = pydantic_core.to_json(members, inf_nan_mode="null")
+    except (pydantic_core.PydanticSerializationError, ValueError, TypeError):
+        return None
+    return b"," + encoded[1:-1]
+
+
+def encode_item_parts(
+    item_id: str, fields: dict[str, Any]
+) -> tuple[bytes, bytes] | None:
+    """Encode a response item around its score as ``(head, tail)``.
+
+    ``head`` is ``{"item_id":<id>,"score":`` and ``tail`` is the metadata
+    members plus the closing brace.  Returns ``None`` if *fields* cannot be
+    encoded (see :func:`encode_metadata_fragment`).
+    """
+    fragment = encode_metadata_fragment(fields)
+    if fragment is None:
+        return None
+    head = b'{"item_id":' + pydantic_core.to_json(item_id) + b',"score":'
+    return head, fragment + b"}"
+
+
 def load_item_metadata(
     config: object,
     fields: list[str],
@@ -230,7 +286,7 @@ def build_metadata_index(
     df: pd.DataFrame,
     deny_set: frozenset[str] | None = None,
     on_row_error: Callable[[], None] | None = None,
-) -> dict[str, dict[str, Any]]:
+) -> MetadataIndex:
     """Convert a metadata DataFrame into a pre-flattened dict for O(1) lookups.
 
     This function is called once at model-load time (in the watcher's
@@ -260,7 +316,7 @@ def build_metadata_index(
 
     Returns
     -------
-    dict[str, dict[str, Any]]
+    MetadataIndex
         ``{item_id: {field: value, ...}, ...}`` where:
 
         - ``item_id`` is the string index value (already str-coerced by
@@ -272,6 +328,9 @@ def build_metadata_index(
           ``model_construct``.
         - Fields whose lowercased name appears in *deny_set* are omitted.
         - Non-string column names are omitted defensively.
+
+        ``MetadataIndex.parts`` holds each item's response JSON encoded by
+        :func:`encode_item_parts`.
     """
     _deny: frozenset[str] = deny_set or frozenset()
 
@@ -280,7 +339,8 @@ def build_metadata_index(
     # with orient="index" materialises all rows in one vectorised pass).
     raw: dict[Any, dict[str, Any]] = df.to_dict(orient="index")
 
-    index: dict[str, dict[str, Any]] = {}
+    index = MetadataIndex()
+    unencodable = 0
     for item_id, row in raw.items():
         try:
             item_dict: dict[str, Any] = {}
@@ -296,7 +356,12 @@ def build_metadata_index(
                 if isinstance(val, float) and math.isnan(val):
                     val = None
                 item_dict[col] = val
-            index[str(item_id)] = item_dict
+            key = str(item_id)
+            index[key] = item_dict
+            parts = encode_item_parts(key, item_dict)
+            index.parts[key] = parts
+            if parts is None:
+                unencodable += 1
         except (MemoryError, RecursionError):
             raise
         except Exception as exc:
@@ -313,6 +378,9 @@ def build_metadata_index(
                 error=str(exc)[:200],
             )
 
+    if unencodable:
+        # Served without metadata (and counted as degraded) at request time.
+        logger.warning("metadata_index_unencodable_rows", count=unencodable)
     logger.debug(
         "metadata_index_built",
         n_items=len(index),
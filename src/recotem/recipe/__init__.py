@@ -1,8 +1,10 @@
 from recotem.recipe.errors import RecipeError
 from recotem.recipe.loader import load_recipe, load_recipes_directory
 from recotem.recipe.models import (
+    AnnConfig,
     CleansingConfig,
     ItemMetadataConfig,
+    NeighborsConfig,
     OutputConfig,
     Recipe,
     SchemaConfig,
@@ -12,8 +14,10 @@ from recotem.recipe.models import (
 )
 
 __all__ = [
+    "AnnConfig",
     "CleansingConfig",
     "ItemMetadataConfig",
+    "NeighborsConfig",
     "OutputConfig",
     "Recipe",
     "RecipeError",
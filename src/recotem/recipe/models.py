@@ -171,6 +171,66 @@ class OutputConfig(BaseModel, extra="forbid"):
         default="append_sha",
         pattern=r"^(always_overwrite|append_sha)$",
     )
+    format_version: int = Field(
+        default=2,
+        ge=1,
+        le=3,
+        description="Artifact format: 2 stores large arrays as mappable "
+        "sections; 3 adds per-chunk digests that serve verifies in parallel; "
+        "1 is readable by serve builds that predate format 2",
+    )
+    compression: str = Field(
+        default="none",
+        pattern=r"^(none|gzip|zstd)$",
+        description="Payload codec; zstd needs recotem[binary].  A compressed "
+        "payload is a plain pickle, so it has no mappable sections",
+    )
+
+
+class AnnConfig(BaseModel, extra="forbid"):
+    """Approximate nearest-neighbour index for factor models.
+
+    Only IALS, TruncatedSVD and BPRFM models get an index; other algorithms
+    are always scored exactly.
+    """
+
+    n_lists: int = Field(
+        default=0,
+        ge=0,
+        description="IVF cluster count; 0 means sqrt(number of items)",
+    )
+    n_probe: int = Field(
+        default=0,
+        ge=0,
+        description="Clusters scanned per query; 0 tunes it to target_recall",
+    )
+    target_recall: float = Field(default=0.95, gt=0.0, le=1.0)
+    min_items: int = Field(
+        default=50000,
+        ge=1,
+        description="Skip the index for catalogs smaller than this",
+    )
+    exact: bool = Field(
+        default=False,
+        description="Serve with exact scoring even if the artifact has an index",
+    )
+
+
+class NeighborsConfig(BaseModel, extra="forbid"):
+    """Precomputed item-to-item neighbour table for ``:recommend-related``."""
+
+    k: int = Field(
+        default=50,
+        ge=1,
+        le=1000,
+        description="Neighbours stored per item",
+    )
+    max_seeds: int = Field(
+        default=3,
+        ge=1,
+        le=32,
+        description="Largest seed list merged from the table",
+    )
 
 
 class ItemMetadataConfig(BaseModel, extra="forbid"):
@@ -226,6 +286,8 @@ class Recipe(BaseModel, extra="forbid"):
     cleansing: CleansingConfig = Field(default_factory=CleansingConfig)
     item_metadata: ItemMetadataConfig | None = None
     training: TrainingConfig = Field(default_factory=TrainingConfig)
+    ann: AnnConfig | None = None
+    neighbors: NeighborsConfig | None = None
     output: OutputConfig
 
     model_config = {"populate_by_name": True, "validate_assignment": True}
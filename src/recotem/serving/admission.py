@@ -0,0 +1,133 @@
+"""Admission control for the v1 inference verbs.
+
+Without a limit, a traffic spike piles requests up in the recipe executors
+(see ``recotem.serving.bulkhead``) until every queued request misses its
+deadline or the process runs out of memory.  :class:`AdmissionController`
+caps the work a process accepts instead: a request that would push the
+admitted weight above the global cap or its recipe's cap is rejected at once
+with ``429 OVERLOADED`` and a ``Retry-After`` header.  The requests that were
+admitted keep a bounded queue and therefore a bounded latency.
+
+*Weight* is the unit of work: ``1`` for a single-subject verb and the number
+of elements for a batch verb.  A batch heavier than a cap is clamped to it,
+so an oversized batch is admitted only when nothing else is in flight rather
+than never.
+
+Admitted weight covers requests queued for and running on the executor; a
+response-cache hit never reaches admission.  The serving layer acquires on
+the event loop and releases from the executor future's done-callback, so a
+request whose client disconnected keeps its weight until the scoring it
+started has actually finished; a lock keeps the controller safe to call from
+any thread.
+
+Limits come from ``RECOTEM_ADMISSION_MAX_INFLIGHT`` (global),
+``RECOTEM_ADMISSION_RECIPE_MAX_INFLIGHT`` (per-recipe default) and
+``RECOTEM_ADMISSION_RECIPE_LIMITS`` (per-recipe overrides); ``0`` means
+unlimited.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from typing import Literal
+
+from recotem.serving import metrics as _metrics
+
+AdmissionScope = Literal["global", "recipe"]
+
+
+class AdmissionRejected(Exception):
+    """Raised by :meth:`AdmissionController.acquire` when a cap is reached."""
+
+    def __init__(self, scope: AdmissionScope, retry_after_seconds: int) -> None:
+        super().__init__(f"{scope} admission limit reached")
+        self.scope = scope
+        self.retry_after_seconds = retry_after_seconds
+
+
+class AdmissionController:
+    """Weighted in-flight caps, global and per recipe.
+
+    Parameters
+    ----------
+    max_inflight:
+        Cap on the admitted weight across all recipes (0 = unlimited).
+    recipe_max_inflight:
+        Default cap on one recipe's admitted weight (0 = unlimited).
+    recipe_limits:
+        Per-recipe caps that replace *recipe_max_inflight*.
+    retry_after_seconds:
+        Value of the ``Retry-After`` header sent with a rejection.
+    """
+
+    def __init__(
+        self,
+        max_inflight: int = 0,
+        recipe_max_inflight: int = 0,
+        recipe_limits: Mapping[str, int] | None = None,
+        retry_after_seconds: int = 1,
+    ) -> None:
+        self.max_inflight = max_inflight
+        self.recipe_max_inflight = recipe_max_inflight
+        self.recipe_limits = dict(recipe_limits or {})
+        self.retry_after_seconds = retry_after_seconds
+        self._lock = threading.Lock()
+        self._total = 0
+        self._inflight: dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any cap is configured."""
+        return bool(
+            self.max_inflight
+            or self.recipe_max_inflight
+            or any(self.recipe_limits.values())
+        )
+
+    def limit_for(self, recipe: str) -> int:
+        """Return *recipe*'s cap (0 = unlimited)."""
+        return self.recipe_limits.get(recipe, self.recipe_max_inflight)
+
+    def inflight(self, recipe: str | None = None) -> int:
+        """Admitted weight for *recipe*, or across all recipes when ``None``."""
+        with self._lock:
+            if recipe is None:
+                return self._total
+            return self._inflight.get(recipe, 0)
+
+    def acquire(self, recipe: str, weight: int = 1) -> int:
+        """Admit *weight* units of *recipe*'s capacity until :meth:`release`.
+
+        Returns the weight actually held (clamped to the caps), which is what
+        must be released.  Raises :class:`AdmissionRejected` without
+        admitting anything when either cap would be exceeded.
+        """
+        weight = max(1, weight)
+        recipe_limit = self.limit_for(recipe)
+        for cap in (self.max_inflight, recipe_limit):
+            if cap:
+                weight = min(weight, cap)
+        with self._lock:
+            current = self._inflight.get(recipe, 0)
+            scope: AdmissionScope | None = None
+            if self.max_inflight and self._total + weight > self.max_inflight:
+                scope = "global"
+            elif recipe_limit and current + weight > recipe_limit:
+                scope = "recipe"
+            if scope is None:
+                self._total += weight
+                self._inflight[recipe] = current + weight
+                _metrics.set_admission_inflight(recipe, current + weight)
+        if scope is not None:
+            _metrics.inc_admission_rejected(recipe, scope)
+            raise AdmissionRejected(scope, self.retry_after_seconds)
+        return weight
+
+    def release(self, recipe: str, weight: int) -> None:
+        """Give back *weight* units returned by :meth:`acquire`."""
+        with self._lock:
+            self._total -= weight
+            remaining = self._inflight[recipe] - weight
+            self._inflight[recipe] = remaining
+            _metrics.set_admission_inflight(recipe, remaining)
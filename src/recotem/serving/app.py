@@ -16,16 +16,25 @@ Notes:
   function (it is not an env var).
 - The ``KeyRing`` is built here from ``serve_config.signing_keys_raw``.  If
   that string is empty and ``dev_allow_unsigned`` is False, startup fails.
+- Steps 1–5 live in ``bootstrap_registry`` so the multi-worker supervisor can
+  run them without building an app.  A worker app is created with
+  ``create_app(serve_config, model_store=...)`` and mirrors the supervisor's
+  registry instead of loading artifacts itself.
+- With ``RECOTEM_MODEL_MEMORY_BUDGET`` set, step 4 is deferred: recipes are
+  registered on standby and ``LazyModelLoader`` loads them on first request.
 """
 
 from __future__ import annotations
 
+import functools
 import json
 import re
+import threading
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -40,21 +49,36 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
 from recotem._irspack_compat import check_artifact_irspack_version
+from recotem.artifact.compression import payload_compression
 from recotem.artifact.format import ArtifactError, parse_header_from_bytes
-from recotem.artifact.signing import KeyRing, unpickle_payload, verify_hmac
+from recotem.artifact.io import (
+    artifact_sha256,
+    digest_artifact,
+    read_artifact_header,
+    verify_digest,
+    verify_header,
+)
+from recotem.artifact.signing import KeyRing, unpickle_payload
 from recotem.config import ConfigError, ServeConfig
 from recotem.recipe.loader import load_recipes_directory_lenient
 from recotem.serving import metrics as _metrics
 from recotem.serving._header_utils import extract_algorithms, normalize_config_digest
 from recotem.serving._naming import dedup_stub_name
+from recotem.serving.admission import AdmissionController
+from recotem.serving.auth import VerifiedKeyCache
+from recotem.serving.bulkhead import RecipeExecutors
+from recotem.serving.cache import ResponseCache
+from recotem.serving.coalescer import RecommendCoalescer
+from recotem.serving.lazy import LazyModelLoader, standby_entry
 from recotem.serving.registry import ModelEntry, ModelRegistry
 from recotem.serving.routes import make_router
+from recotem.serving.shared import SharedModelStore, StoreFollower
 from recotem.serving.watcher import (
     ArtifactWatcher,
+    apply_ann_config,
     build_initial_states,
     load_metadata,
     read_artifact_bytes,
-    sha256_bytes,
     stat_marker,
 )
 from recotem.version import __version__
@@ -75,7 +99,8 @@ _REQUEST_ID_RE = re.compile(r"^[A-Za-z0-9_\-]{1,128}$")
 # metrics rather than falling through to the unlabelled path.
 _V1_VERB_PATH_RE = re.compile(
     r"^/v1/recipes/(?P<name>[A-Za-z0-9_-]{1,64}):"
-    r"(?P<verb>recommend|recommend-related|batch-recommend|batch-recommend-related)$"
+    r"(?P<verb>recommend|recommend-related|batch-recommend|batch-recommend-related"
+    r"|stream-recommend)$"
 )
 
 # Default ``detail`` strings used by the HTTPException handler when callers
@@ -89,6 +114,7 @@ _DEFAULT_DETAIL_FOR: dict[int, str] = {
     404: "Not Found",
     405: "Method Not Allowed",
     422: "Unprocessable Entity",
+    429: "Too Many Requests",
     500: "Internal Server Error",
     503: "Service Unavailable",
 }
@@ -138,19 +164,51 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
 # ---------------------------------------------------------------------------
 
 
-def create_app(serve_config: ServeConfig) -> FastAPI:
-    """Create and configure the FastAPI application.
+@dataclass
+class RegistryBootstrap:
+    """Result of :func:`bootstrap_registry`: a populated registry plus the
+    state the ``ArtifactWatcher`` needs to take over from the startup load.
+    """
 
-    Parameters
-    ----------
-    serve_config:
-        Fully populated ServeConfig.  The caller (CLI serve command) must
-        have set ``serve_config.recipes_dir`` before calling this function.
+    registry: ModelRegistry
+    key_ring: KeyRing | None
+    recipes_dir: Path
+    initial_states: dict[str, Any]
+    yaml_failed_stub_paths: dict[str, Path]
+    lazy: bool = False
+
+    def make_watcher(
+        self, serve_config: ServeConfig, *, warmup: bool = True
+    ) -> ArtifactWatcher:
+        """Build (but do not start) the watcher that keeps the registry fresh."""
+        watcher = ArtifactWatcher(
+            registry=self.registry,
+            recipes_dir=self.recipes_dir,
+            serve_config=serve_config,
+            key_ring=self.key_ring,
+            initial_states=self.initial_states,
+            warmup=warmup,
+            lazy=self.lazy,
+        )
+        # Pre-seed the watcher's _yaml_path_to_name with startup-failed stubs
+        # so that the first rescan can look up the stub_name by yaml_path (I-9).
+        for stub_name, stub_yaml_path in self.yaml_failed_stub_paths.items():
+            watcher.preseed_yaml_path(stub_yaml_path, stub_name)
+        return watcher
 
-    Returns
-    -------
-    FastAPI
-        Configured application, ready for uvicorn.
+
+def bootstrap_registry(
+    serve_config: ServeConfig, *, lazy: bool = False
+) -> RegistryBootstrap:
+    """Validate the security posture and load every recipe's artifact.
+
+    Runs steps 1–6 of :func:`create_app`.  The multi-worker supervisor
+    (``recotem.serving.supervisor``) calls it directly: it owns the verified
+    registry and the watcher while the HTTP workers attach to its published
+    models.
+
+    With *lazy*, artifacts are not loaded: every parsed recipe is registered
+    on standby for :class:`~recotem.serving.lazy.LazyModelLoader`.
 
     Raises
     ------
@@ -284,7 +342,20 @@ def create_app(serve_config: ServeConfig) -> FastAPI:
     _startup_t0 = time.perf_counter()
 
     n_yaml_failed = len(yaml_failed_stubs)
-    if n_recipes == 0:
+    if lazy:
+        # Lazy mode: every recipe starts on standby and loads on its first
+        # request (see recotem.serving.lazy).
+        for recipe in recipes:
+            registry.replace(
+                recipe.name, standby_entry(recipe.name, recipe.output.path)
+            )
+        logger.info(
+            "startup_lazy_registration_complete",
+            standby=n_recipes,
+            failed=n_yaml_failed,
+            budget_bytes=serve_config.model_memory_budget,
+        )
+    elif n_recipes == 0:
         # Nothing to load; emit the summary immediately.
         logger.info(
             "startup_artifact_load_complete",
@@ -353,21 +424,105 @@ def create_app(serve_config: ServeConfig) -> FastAPI:
     # state right when it starts").
     initial_states = build_initial_states(recipes, loaded_entries)
 
-    # 7. Lifespan manages the watcher thread.
+    return RegistryBootstrap(
+        registry=registry,
+        key_ring=key_ring,
+        recipes_dir=recipes_dir,
+        initial_states=initial_states,
+        yaml_failed_stub_paths=yaml_failed_stub_paths,
+        lazy=lazy,
+    )
+
+
+def _recipe_pool_sizes(serve_config: ServeConfig) -> tuple[int, dict[str, int]]:
+    """Return the ``(default, overrides)`` sizes of the per-recipe executors.
+
+    A coalesced request waits on its executor thread until its batch has been
+    scored, so a coalesced recipe's pool is raised to at least
+    ``coalesce_max_batch`` threads; otherwise the pool size would cap the
+    batch instead.
+    """
+    default = serve_config.recipe_pool_size
+    overrides = dict(serve_config.recipe_pool_sizes)
+    if serve_config.coalesce_window_ms <= 0:
+        return default, overrides
+    floor = serve_config.coalesce_max_batch
+    if not serve_config.coalesce_recipes:
+        return max(default, floor), {k: max(v, floor) for k, v in overrides.items()}
+    for name in serve_config.coalesce_recipes:
+        overrides[name] = max(overrides.get(name, default), floor)
+    return default, overrides
+
+
+def create_app(
+    serve_config: ServeConfig,
+    model_store: SharedModelStore | None = None,
+) -> FastAPI:
+    """Create and configure the FastAPI application.
+
+    Parameters
+    ----------
+    serve_config:
+        Fully populated ServeConfig.  The caller (CLI serve command) must
+        have set ``serve_config.recipes_dir`` before calling this function.
+    model_store:
+        Multi-worker mode only.  When given, the app does not load recipes
+        or run a watcher itself; it attaches to the models a supervisor
+        published into this store (see ``recotem.serving.shared``).
+
+    Returns
+    -------
+    FastAPI
+        Configured application, ready for uvicorn.
+
+    Raises
+    ------
+    ConfigError
+        If security posture rules are violated or signing keys are missing
+        and dev_allow_unsigned is False.
+    """
+    lazy_loader: LazyModelLoader | None = None
+    if model_store is None:
+        lazy = serve_config.model_memory_budget > 0
+        boot = bootstrap_registry(serve_config, lazy=lazy)
+        registry = boot.registry
+        watcher = boot.make_watcher(serve_config)
+        if lazy:
+            lazy_loader = LazyModelLoader(
+                registry,
+                functools.partial(
+                    _load_on_demand, watcher, boot.key_ring, serve_config
+                ),
+                serve_config.model_memory_budget,
+                describe=functools.partial(_describe_standby, watcher, boot.key_ring),
+            )
+
+        def _start_background() -> threading.Thread:
+            watcher.start()
+            return watcher
+
+    else:
+        # Multi-worker mode: the supervisor process has already verified the
+        # artifacts and runs the only watcher; this worker mirrors its
+        # published generations.
+        serve_config.validate_insecure_flags()
+        serve_config.apply_auth_posture()
+        registry = ModelRegistry()
+        follower = StoreFollower(model_store, registry, serve_config)
+        follower.sync()
+
+        def _start_background() -> threading.Thread:
+            follower.start()
+            return follower
+
+    # Per-recipe inference executors (bulkheads).
+    executors = RecipeExecutors(*_recipe_pool_sizes(serve_config))
+
+    # 7. Lifespan manages the watcher (or, in a multi-worker worker, the
+    # shared-store follower) thread.
     @asynccontextmanager
     async def lifespan(app: FastAPI):  # type: ignore[type-arg]
-        watcher = ArtifactWatcher(
-            registry=registry,
-            recipes_dir=recipes_dir,
-            serve_config=serve_config,
-            key_ring=key_ring,
-            initial_states=initial_states,
-        )
-        # Pre-seed the watcher's _yaml_path_to_name with startup-failed stubs
-        # so that the first rescan can look up the stub_name by yaml_path (I-9).
-        for _stub_name, _stub_yaml_path in yaml_failed_stub_paths.items():
-            watcher.preseed_yaml_path(_stub_yaml_path, _stub_name)
-        watcher.start()
+        watcher = _start_background()
 
         banner_task = None
         if serve_config.insecure_no_auth or serve_config.dev_allow_unsigned:
@@ -406,6 +561,9 @@ def create_app(serve_config: ServeConfig) -> FastAPI:
                 "artifact_watcher_join_timeout",
                 timeout=watcher_join_timeout,
             )
+        executors.shutdown()
+        if lazy_loader is not None:
+            lazy_loader.shutdown()
         if banner_task is not None:
             import asyncio
 
@@ -591,10 +749,51 @@ def create_app(serve_config: ServeConfig) -> FastAPI:
     # ``RECOTEM_API_KEYS`` is still set in the environment, otherwise the flag
     # is documented but silently ineffective.
     router_api_keys = [] if serve_config.insecure_no_auth else serve_config.api_keys
+    response_cache: ResponseCache | None = None
+    if serve_config.response_cache_max_bytes > 0:
+        response_cache = ResponseCache(
+            serve_config.response_cache_max_bytes,
+            serve_config.response_cache_ttl_seconds,
+        )
+        # A hot-swap (or removal) drops the recipe's cached responses.
+        registry.add_swap_listener(response_cache.invalidate)
+
+    coalescer: RecommendCoalescer | None = None
+    if serve_config.coalesce_window_ms > 0:
+        coalescer = RecommendCoalescer(
+            serve_config.coalesce_window_ms / 1000.0,
+            serve_config.coalesce_max_batch,
+            frozenset(serve_config.coalesce_recipes),
+        )
+
+    api_key_cache: VerifiedKeyCache | None = None
+    if router_api_keys and serve_config.api_key_cache_max_entries > 0:
+        api_key_cache = VerifiedKeyCache(
+            serve_config.api_key_cache_max_entries,
+            serve_config.api_key_cache_ttl_seconds,
+        )
+
+    admission: AdmissionController | None = AdmissionController(
+        serve_config.admission_max_inflight,
+        serve_config.admission_recipe_max_inflight,
+        serve_config.admission_recipe_limits,
+        serve_config.admission_retry_after_seconds,
+    )
+    if not admission.enabled:
+        admission = None
+
     api_router = make_router(
         registry=registry,
         api_keys=router_api_keys,
         insecure_no_auth=serve_config.insecure_no_auth,
+        response_cache=response_cache,
+        coalescer=coalescer,
+        api_key_cache=api_key_cache,
+        executors=executors,
+        admission=admission,
+        server_timing=serve_config.server_timing,
+        stream_chunk_size=serve_config.stream_chunk_size,
+        lazy_loader=lazy_loader,
     )
     app.include_router(api_router, prefix="/v1")
 
@@ -758,6 +957,59 @@ def _failed_entry(recipe: Any, reason: str) -> ModelEntry:
     )
 
 
+def _load_on_demand(
+    watcher: ArtifactWatcher,
+    key_ring: KeyRing | None,
+    serve_config: ServeConfig,
+    name: str,
+) -> ModelEntry | None:
+    """Load a standby recipe for :class:`LazyModelLoader`.
+
+    The watcher owns the current recipe definitions.  Returns ``None`` when
+    it no longer tracks *name*.
+    """
+    recipe = watcher.recipe_for(name)
+    if recipe is None:
+        return None
+    entry, reason = _try_load_artifact(recipe, key_ring, serve_config)
+    if not entry.loaded:
+        _metrics.inc_artifact_load_failure(name, reason=reason)
+    return entry
+
+
+def _describe_standby(
+    watcher: ArtifactWatcher,
+    key_ring: KeyRing | None,
+    name: str,
+) -> ModelEntry | None:
+    """Describe a standby recipe from its artifact header alone.
+
+    Only a format-3 header can be verified without the payload, so formats
+    1 and 2 return ``None`` and the caller loads the model instead.  The
+    entry stays on standby; it is returned to the caller, never registered.
+    """
+    recipe = watcher.recipe_for(name)
+    if recipe is None or key_ring is None:
+        return None
+    read = read_artifact_header(recipe.output.path)
+    if not verify_header(key_ring, read.header):
+        return None
+    header_dict: dict[str, Any] = json.loads(read.header.header_data.decode("utf-8"))
+    return ModelEntry(
+        name=name,
+        recommender=None,
+        header=header_dict,
+        kid=read.header.kid,
+        artifact_path=recipe.output.path,
+        loaded=False,
+        standby=True,
+        _loaded_marker=(None, artifact_sha256(read.prefix)),
+        config_digest=normalize_config_digest(header_dict.get("config_digest")) or "",
+        algorithms=extract_algorithms(header_dict),
+        hmac_digest=read.header.hmac_digest,
+    )
+
+
 def _try_load_artifact(
     recipe: Any,
     key_ring: KeyRing | None,
@@ -785,31 +1037,29 @@ def _try_load_artifact(
         logger.warning("initial_artifact_read_error", name=recipe.name, error=str(exc))
         return _failed_entry(recipe, f"read error: {exc}"), "read"
 
-    sha256 = sha256_bytes(data)
+    # One pass over the bytes yields both the SHA-256 and the payload HMAC.
+    digest = digest_artifact(data, key_ring, max_payload_bytes)
+    sha256 = digest.sha256
 
-    try:
-        # Use max_payload_bytes (not max_artifact_bytes) as the payload cap so
-        # serve-side deserialization memory is bounded independently of the outer
-        # container size.
-        hdr = parse_header_from_bytes(data, max_payload_bytes)
-    except ArtifactError as exc:
-        logger.warning(
-            "initial_artifact_parse_failed", name=recipe.name, error=str(exc)
-        )
-        return _failed_entry(recipe, f"parse failed: {exc}"), "parse"
+    hdr = digest.header
+    if hdr is None:
+        try:
+            # Use max_payload_bytes (not max_artifact_bytes) as the payload cap
+            # so serve-side deserialization memory is bounded independently of
+            # the outer container size.  The header did not parse in the
+            # digest pass; parse again for the reason.
+            hdr = parse_header_from_bytes(data, max_payload_bytes)
+        except ArtifactError as exc:
+            logger.warning(
+                "initial_artifact_parse_failed", name=recipe.name, error=str(exc)
+            )
+            return _failed_entry(recipe, f"parse failed: {exc}"), "parse"
 
-    payload_bytes = data[hdr.payload_offset :]
+    payload_bytes = digest.payload
 
     if key_ring is not None:
         try:
-            verify_hmac(
-                key_ring,
-                hdr.kid,
-                hdr.kid.encode("utf-8"),
-                hdr.header_data,
-                payload_bytes,
-                hdr.hmac_digest,
-            )
+            verify_digest(digest)
         except ArtifactError as exc:
             # HMAC failure is a security signal (wrong key, tampered artifact);
             # log at ERROR with traceback so SIEM rules filtering on level
@@ -847,6 +1097,16 @@ def _try_load_artifact(
             _failed_entry(recipe, f"header JSON decode failed: {exc}"),
             "header_json",
         )
+    try:
+        compression = payload_compression(header_dict)
+    except ArtifactError as exc:
+        logger.warning(
+            "initial_artifact_header_json_failed",
+            name=recipe.name,
+            kid=hdr.kid,
+            error=str(exc),
+        )
+        return _failed_entry(recipe, str(exc)), "header_json"
 
     # Preflight the irspack version before deserializing: an unverified
     # (algorithm, version) combination may fail inside the C++ __setstate__
@@ -866,7 +1126,11 @@ def _try_load_artifact(
         return _failed_entry(recipe, str(exc)), "version_skew"
 
     try:
-        recommender = unpickle_payload(payload_bytes)
+        recommender = unpickle_payload(
+            payload_bytes,
+            compression=compression,
+            max_decompressed_bytes=max_payload_bytes,
+        )
     except ArtifactError as exc:
         logger.warning(
             "initial_artifact_deserialize_failed",
@@ -875,6 +1139,7 @@ def _try_load_artifact(
             error=str(exc),
         )
         return _failed_entry(recipe, f"deserialize failed: {exc}"), "deserialize"
+    apply_ann_config(recommender, recipe)
 
     metadata_df = None
     metadata_index = None
@@ -918,6 +1183,8 @@ def _try_load_artifact(
         loaded_at_unix=time.time(),
         config_digest=normalize_config_digest(header_dict.get("config_digest")) or "",
         algorithms=extract_algorithms(header_dict),
+        payload_bytes=len(payload_bytes),
+        hmac_digest=hdr.hmac_digest,
     )
 
     logger.info(
@@ -19,6 +19,12 @@ Security design:
 - The matching ``kid`` (never the plaintext key or hash) is attached to
   ``request.state.kid`` for use in structured logging.
 - Auth failures are logged at WARNING level with no key material in the event.
+- Successful verifications may be remembered in a :class:`VerifiedKeyCache`
+  so a repeat request skips the KDF.  The cache is keyed by a keyed-BLAKE2b
+  fingerprint (per-process random key), never the plaintext, holds only
+  ``(kid, expiry)``, and is flushed whenever the configured key set changes.
+  Failed attempts are never cached and always take the full path.  See
+  ``docs/security.md`` ("API-key verification cache").
 """
 
 from __future__ import annotations
@@ -26,11 +32,16 @@ from __future__ import annotations
 import collections
 import hashlib
 import hmac
+import secrets
+import threading
+import time
+from collections.abc import Callable, Sequence
 
 import structlog
 from fastapi import HTTPException, Request
 
 from recotem.config import ApiKeyEntry
+from recotem.serving import metrics as _metrics
 
 logger = structlog.get_logger(__name__)
 
@@ -119,10 +130,100 @@ def _hash_api_key(value: str) -> str:
     ).hex()
 
 
+# Snapshot of the configured key set a cache entry was verified against.
+KeySet = tuple[tuple[str, str], ...]
+
+# BLAKE2b personalisation for cache fingerprints (domain separation from any
+# other keyed hash in the process).
+_CACHE_FINGERPRINT_PERSON = b"recotem.akc.v1"
+
+
+def api_key_set(api_keys: Sequence[ApiKeyEntry]) -> KeySet:
+    """Return the ``(kid, digest)`` snapshot that identifies a key rotation."""
+    return tuple((entry.kid, entry.sha256_hex) for entry in api_keys)
+
+
+class VerifiedKeyCache:
+    """Bounded, process-local cache of recently verified ``X-API-Key`` values.
+
+    Maps a fingerprint of the header value to ``(kid, expires_at)``.  The
+    fingerprint is a BLAKE2b MAC under a random key drawn when the cache is
+    created, so it is meaningless outside this process and the plaintext is
+    never stored.  Only successful verifications are inserted.
+
+    Every lookup carries the current :func:`api_key_set`; when it differs
+    from the set the entries were verified against (``RECOTEM_API_KEYS``
+    rotated), the whole cache is dropped before answering.
+
+    Thread-safe: one internal lock guards O(1) work per call.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._secret = secrets.token_bytes(32)
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[bytes, tuple[str, float]] = (
+            collections.OrderedDict()
+        )
+        self._key_set: KeySet = ()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def fingerprint(self, value: str) -> bytes:
+        """Keyed BLAKE2b fingerprint of a header value."""
+        # codeql[py/weak-sensitive-data-hashing] keyed MAC used only as an
+        # in-memory lookup key; verification itself still goes through scrypt.
+        return hashlib.blake2b(
+            value.encode("utf-8"),
+            key=self._secret,
+            digest_size=32,
+            person=_CACHE_FINGERPRINT_PERSON,
+        ).digest()
+
+    def get(self, fingerprint: bytes, key_set: KeySet) -> str | None:
+        """Return the cached kid, or ``None`` on a miss."""
+        with self._lock:
+            if key_set != self._key_set:
+                self._entries.clear()
+                self._key_set = key_set
+                return None
+            cached = self._entries.get(fingerprint)
+            if cached is None:
+                return None
+            kid, expires_at = cached
+            if self._clock() >= expires_at:
+                del self._entries[fingerprint]
+                return None
+            self._entries.move_to_end(fingerprint)
+            return kid
+
+    def put(self, fingerprint: bytes, kid: str, key_set: KeySet) -> None:
+        """Remember a successful verification made against *key_set*.
+
+        Dropped if the key set rotated while the request was being verified.
+        """
+        with self._lock:
+            if key_set != self._key_set:
+                return
+            self._entries[fingerprint] = (kid, self._clock() + self.ttl_seconds)
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
 def verify_api_key(
     request: Request,
     api_keys: list[ApiKeyEntry],
     bypass_mode: str = "loopback_no_keys",
+    cache: VerifiedKeyCache | None = None,
 ) -> str:
     """Verify the ``X-API-Key`` header and return the matching ``kid``.
 
@@ -142,6 +243,10 @@ def verify_api_key(
         ``--insecure-no-auth``, or ``"loopback_no_keys"`` (default) when
         auth is absent because no API keys are configured (loopback-only
         bind is enforced by ``apply_auth_posture`` in that case).
+    cache:
+        Optional :class:`VerifiedKeyCache`.  A hit skips the KDF and the
+        digest comparison; a miss takes the normal path and a successful
+        match is then cached.
 
     Returns
     -------
@@ -265,6 +370,20 @@ def verify_api_key(
             detail={"detail": "Invalid API key", "code": "INVALID_API_KEY"},
         )
 
+    # Cache lookup happens only after the length guards, so every rejection
+    # branch above is unchanged.  Only verified keys are ever cached, so an
+    # invalid key always misses and falls through to the full KDF + fold.
+    key_set: KeySet = ()
+    fingerprint = b""
+    if cache is not None:
+        key_set = api_key_set(api_keys)
+        fingerprint = cache.fingerprint(raw_header)
+        cached_kid = cache.get(fingerprint, key_set)
+        _metrics.record_api_key_cache_lookup(hit=cached_kid is not None)
+        if cached_kid is not None:
+            request.state.kid = cached_kid
+            return cached_kid
+
     # No stripping — whitespace is part of the key.
     candidate_hash = _hash_api_key(raw_header)
 
@@ -288,6 +407,8 @@ def verify_api_key(
             matched = True
 
     if matched and matched_kid is not None:
+        if cache is not None:
+            cache.put(fingerprint, matched_kid, key_set)
         request.state.kid = matched_kid
         return matched_kid
 
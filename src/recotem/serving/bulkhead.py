@@ -0,0 +1,158 @@
+"""Per-recipe bulkhead executors for the v1 inference verbs.
+
+Starlette runs every sync route handler on one shared threadpool, so a recipe
+whose scoring is slow (a DenseSLIM over a very large catalogue, say) can hold
+every worker thread and stall requests for unrelated recipes.  The inference
+verbs are therefore ``async`` handlers that hand their scoring to
+:class:`RecipeExecutors`: one bounded ``ThreadPoolExecutor`` per recipe.  A
+slow recipe queues behind its own threads only.
+
+Pools are created on the first request for a recipe (only registered recipes
+reach the dispatch, so the number of pools is bounded by the registry) and
+are sized from ``RECOTEM_RECIPE_POOL_SIZE`` with per-recipe overrides from
+``RECOTEM_RECIPE_POOL_SIZES``.
+
+Each submission runs inside a copy of the caller's ``contextvars`` context,
+so structlog bindings made by the handler (``recipe``, ``kid``,
+``request_id``) reach log lines emitted during scoring.
+
+Two gauges per recipe make a saturated pool visible:
+``recotem_recipe_pool_queue_depth`` (submitted, not yet running) and
+``recotem_recipe_pool_active_workers`` (running).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+import structlog
+
+from recotem.serving import metrics as _metrics
+
+logger = structlog.get_logger(__name__)
+
+_T = TypeVar("_T")
+
+
+class RecipeExecutors:
+    """Lazily created, bounded thread pools keyed by recipe name.
+
+    Parameters
+    ----------
+    default_workers:
+        Threads per recipe pool unless overridden.
+    overrides:
+        Per-recipe thread counts that replace *default_workers*.
+    """
+
+    def __init__(
+        self,
+        default_workers: int,
+        overrides: Mapping[str, int] | None = None,
+    ) -> None:
+        self.default_workers = default_workers
+        self.overrides = dict(overrides or {})
+        self._lock = threading.Lock()
+        self._pools: dict[str, ThreadPoolExecutor] = {}
+        # recipe -> [queued, active]
+        self._state: dict[str, list[int]] = {}
+        self._closed = False
+
+    def workers_for(self, recipe: str) -> int:
+        """Return the pool size used for *recipe*."""
+        return self.overrides.get(recipe, self.default_workers)
+
+    async def run(
+        self,
+        recipe: str,
+        fn: Callable[..., _T],
+        *args: Any,
+        on_done: Callable[[], None] | None = None,
+    ) -> _T:
+        """Run ``fn(*args)`` on *recipe*'s pool and await its result.
+
+        Exceptions raised by *fn* propagate to the awaiting handler.
+        *on_done* is called exactly once: when the call finishes or is
+        cancelled before it started — not when the awaiting handler is
+        cancelled, since a running call cannot be — or at once if the call
+        cannot be submitted.
+        """
+        try:
+            pool = self._pool_for(recipe)
+        except RuntimeError:
+            if on_done is not None:
+                on_done()
+            raise
+        context = contextvars.copy_context()
+        self._adjust(recipe, queued=1)
+
+        def call() -> _T:
+            self._adjust(recipe, queued=-1, active=1)
+            try:
+                return context.run(fn, *args)
+            finally:
+                self._adjust(recipe, active=-1)
+
+        try:
+            future = pool.submit(call)
+        except RuntimeError:
+            # Pool shut down between lookup and submit.
+            self._adjust(recipe, queued=-1)
+            if on_done is not None:
+                on_done()
+            raise
+        if on_done is not None:
+            future.add_done_callback(lambda _future: on_done())
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict[str, tuple[int, int]]:
+        """Return ``{recipe: (queued, active)}`` for every pool created."""
+        with self._lock:
+            return {name: (s[0], s[1]) for name, s in self._state.items()}
+
+    def shutdown(self) -> None:
+        """Stop accepting work and release idle threads.
+
+        Called from the app lifespan after the server has drained, so no
+        request is waiting on a pool.  Queued work is cancelled and running
+        calls are not joined.
+        """
+        with self._lock:
+            self._closed = True
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _pool_for(self, recipe: str) -> ThreadPoolExecutor:
+        with self._lock:
+            pool = self._pools.get(recipe)
+            if pool is not None:
+                return pool
+            if self._closed:
+                raise RuntimeError("recipe executors are shut down")
+            workers = self.workers_for(recipe)
+            pool = self._pools[recipe] = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix=f"recotem-{recipe}",
+            )
+            self._state.setdefault(recipe, [0, 0])
+        logger.debug("recipe_pool_created", recipe=recipe, workers=workers)
+        return pool
+
+    def _adjust(self, recipe: str, queued: int = 0, active: int = 0) -> None:
+        with self._lock:
+            state = self._state.setdefault(recipe, [0, 0])
+            state[0] += queued
+            state[1] += active
+            # Under the lock so concurrent updates cannot publish stale values.
+            _metrics.set_recipe_pool_state(recipe, state[0], state[1])
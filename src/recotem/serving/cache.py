@@ -0,0 +1,227 @@
+"""In-process response cache for the single-item v1 verbs.
+
+Recommendation traffic is heavily skewed: a small set of users and seed lists
+accounts for most ``:recommend`` / ``:recommend-related`` calls.  This module
+keeps the built item list of recent responses so a repeat request skips the
+irspack scoring pass and the metadata join.
+
+Design
+------
+* One partition per recipe, all sharing a single process-wide budget,
+  ``RECOTEM_RESPONSE_CACHE_MAX_BYTES`` (an *estimate* of retained bytes, not
+  an exact accounting of the Python heap).  Eviction follows one LRU order
+  across every recipe, so a hot recipe can use the memory a cold one is not
+  using, and the bound holds however many recipes are served.
+* Optional TTL (``RECOTEM_RESPONSE_CACHE_TTL_SECONDS``); expired entries are
+  dropped lazily on lookup.
+* Keys embed the entry's ``model_version``, so a response computed against
+  one model can never be served for another.  On top of that the whole
+  partition is dropped when ``ModelRegistry`` swaps or removes the recipe
+  (``add_swap_listener``), which returns the memory immediately.
+* Only successful responses are cached; error outcomes (``UNKNOWN_USER``,
+  ``NO_CANDIDATES`` …) always go through the normal path.
+
+A late ``put`` from a request that resolved the *old* entry just before a
+swap can repopulate the partition with an old-version key.  Such an entry is
+unreachable (no lookup will carry the old version) and ages out through LRU
+eviction, so no extra synchronisation with the registry is needed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from recotem.serving import metrics as _metrics
+
+# Rough fixed costs used by the size estimate: a cached entry (key tuple,
+# OrderedDict slot, CachedResponse) and a pre-encoded item (``bytes`` header
+# plus list slot).
+_ENTRY_OVERHEAD_BYTES = 512
+_ENCODED_ITEM_OVERHEAD_BYTES = 40
+
+CacheKey = tuple[str, str, Any, int, bytes, bool]
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached ``_build_items`` result plus its bookkeeping."""
+
+    items: list[bytes]
+    fallback_count: int
+    dropped_count: int
+    size: int
+    expires_at: float | None
+
+
+def response_cache_key(
+    model_version: str,
+    verb: str,
+    subject: str | Iterable[str],
+    limit: int,
+    exclude_items: Iterable[str] | None,
+    include_metadata: bool,
+) -> CacheKey:
+    """Build the cache key for one request.
+
+    *subject* is the ``user_id`` for ``:recommend`` or the seed list for
+    ``:recommend-related``.  Seed lists are sorted (order does not change the
+    cold-user score) but duplicates are kept because they do.  The exclusion
+    list is folded into a 16-byte BLAKE2b digest so long lists do not bloat
+    the key.
+    """
+    subject_key: Any = subject if isinstance(subject, str) else tuple(sorted(subject))
+    exclude_digest = b""
+    if exclude_items:
+        h = hashlib.blake2b(digest_size=16)
+        for iid in sorted(set(exclude_items)):
+            h.update(iid.encode())
+            h.update(b"\x00")
+        exclude_digest = h.digest()
+    return (model_version, verb, subject_key, limit, exclude_digest, include_metadata)
+
+
+def _estimate_size(key: CacheKey, items: list[bytes]) -> int:
+    subject = key[2]
+    size = _ENTRY_OVERHEAD_BYTES + len(key[0]) + len(key[4])
+    size += len(subject) if isinstance(subject, str) else sum(map(len, subject))
+    size += sum(_ENCODED_ITEM_OVERHEAD_BYTES + len(item) for item in items)
+    return size
+
+
+class _Partition:
+    __slots__ = ("entries", "bytes")
+
+    def __init__(self) -> None:
+        self.entries: dict[CacheKey, CachedResponse] = {}
+        self.bytes = 0
+
+
+class ResponseCache:
+    """Byte-bounded, optionally TTL'd LRU of built responses.
+
+    Responses are partitioned by recipe (for invalidation and metrics) but
+    *max_bytes* bounds them all together, evicting in one LRU order.
+
+    Thread-safe: every method takes a single internal lock for O(1) work
+    (plus O(evicted) on insert).  Metric updates happen outside the lock.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._partitions: dict[str, _Partition] = {}
+        # Recency of every entry across recipes, oldest first.
+        self._lru: OrderedDict[tuple[str, CacheKey], None] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, recipe: str, verb: str, key: CacheKey) -> CachedResponse | None:
+        """Return the cached response for *key*, or ``None`` on a miss."""
+        expired = False
+        with self._lock:
+            part = self._partitions.get(recipe)
+            cached = part.entries.get(key) if part is not None else None
+            if cached is not None and part is not None:
+                if cached.expires_at is not None and self._clock() >= cached.expires_at:
+                    self._drop(recipe, part, key)
+                    size_after = part.bytes
+                    cached = None
+                    expired = True
+                else:
+                    self._lru.move_to_end((recipe, key))
+        _metrics.record_response_cache_lookup(recipe, verb, cached is not None)
+        if expired:
+            _metrics.inc_response_cache_evictions(recipe, "expired")
+            _metrics.set_response_cache_bytes(recipe, size_after)
+        return cached
+
+    def put(
+        self,
+        recipe: str,
+        key: CacheKey,
+        items: list[bytes],
+        fallback_count: int = 0,
+        dropped_count: int = 0,
+    ) -> None:
+        """Insert a built response, evicting least-recently-used entries.
+
+        Eviction may take entries of any recipe.  Responses larger than the
+        whole budget are not cached.
+        """
+        size = _estimate_size(key, items)
+        if size > self.max_bytes:
+            return
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds > 0 else None
+        cached = CachedResponse(items, fallback_count, dropped_count, size, expires_at)
+        evicted: dict[str, int] = {}
+        with self._lock:
+            part = self._partitions.setdefault(recipe, _Partition())
+            if key in part.entries:
+                self._drop(recipe, part, key)
+            part.entries[key] = cached
+            part.bytes += size
+            self._bytes += size
+            self._lru[(recipe, key)] = None
+            while self._bytes > self.max_bytes:
+                old_recipe, old_key = next(iter(self._lru))
+                self._drop(old_recipe, self._partitions[old_recipe], old_key)
+                evicted[old_recipe] = evicted.get(old_recipe, 0) + 1
+            sizes_after = {
+                name: self._partitions[name].bytes for name in {recipe, *evicted}
+            }
+        for name, count in evicted.items():
+            _metrics.inc_response_cache_evictions(name, "capacity", count)
+        for name, size_after in sizes_after.items():
+            _metrics.set_response_cache_bytes(name, size_after)
+
+    def invalidate(self, recipe: str) -> None:
+        """Drop every cached response for *recipe*.
+
+        Registered as a ``ModelRegistry`` swap listener so a hot-swapped or
+        removed recipe never keeps memory pinned for the old model.
+        """
+        with self._lock:
+            part = self._partitions.pop(recipe, None)
+            if part is not None:
+                for key in part.entries:
+                    del self._lru[(recipe, key)]
+                self._bytes -= part.bytes
+        if part is None:
+            return
+        _metrics.inc_response_cache_evictions(recipe, "invalidated", len(part.entries))
+        _metrics.set_response_cache_bytes(recipe, 0)
+
+    def size_bytes(self, recipe: str | None = None) -> int:
+        """Return the estimated bytes held for *recipe*, or in total."""
+        with self._lock:
+            if recipe is None:
+                return self._bytes
+            part = self._partitions.get(recipe)
+            return part.bytes if part is not None else 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(p.entries) for p in self._partitions.values())
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _drop(self, recipe: str, part: _Partition, key: CacheKey) -> None:
+        """Remove *key* from *recipe*'s partition; the caller holds the lock."""
+        cached = part.entries.pop(key)
+        del self._lru[(recipe, key)]
+        part.bytes -= cached.size
+        self._bytes -= cached.size
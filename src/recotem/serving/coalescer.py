@@ -0,0 +1,244 @@
+"""Request micro-batching for ``:recommend``.
+
+At high QPS many ``:recommend`` handlers for the same recipe run concurrently,
+each paying for its own score computation.  When enabled
+(``RECOTEM_COALESCE_WINDOW_MS`` > 0) the coalescer parks concurrent requests
+for a recipe for at most one short window, scores them with a single
+``IDMappedRecommender.get_recommendation_for_known_user_batch`` call and hands
+each waiting handler its own row.
+
+There is no background thread.  Scoring already runs on a worker thread (the
+recipe's executor, see ``recotem.serving.bulkhead``), so the first request to
+arrive at an empty queue becomes the *leader*: it waits until the window
+closes or the queue reaches ``RECOTEM_COALESCE_MAX_BATCH``, takes the batch,
+scores it and wakes the followers.  Followers hold their executor thread
+while they wait, which is why ``create_app`` sizes a coalesced recipe's pool
+to at least one full batch.  If more requests queued up than one batch can hold, the leader
+promotes the first leftover request to lead the next batch.
+
+Failure handling mirrors the batch verbs: if the batched call raises, every
+waiter re-scores its own request through
+``get_recommendation_for_known_user_id`` so that the error (or success) is
+attributed to the request that caused it.  ``MemoryError`` /
+``RecursionError`` are handed to every waiter unchanged.  A follower that is
+not woken within the window plus ``follower_timeout`` (a leader wedged in
+scoring) leaves the queue and scores its own request the same way.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from recotem.serving import metrics as _metrics
+
+logger = structlog.get_logger(__name__)
+
+#: How long a follower waits past the window before scoring on its own.
+_FOLLOWER_TIMEOUT_SECONDS = 10.0
+
+
+@dataclass
+class _Pending:
+    """One parked ``:recommend`` call."""
+
+    entry: Any
+    user_id: str
+    limit: int
+    exclude_items: list[str] | None
+    enqueued_at: float
+    done: threading.Event = field(default_factory=threading.Event)
+    result: list[tuple[str, float]] | None = None
+    error: BaseException | None = None
+    fallback: bool = False
+    promoted: bool = False
+
+
+@dataclass
+class _RecipeQueue:
+    cond: threading.Condition = field(default_factory=threading.Condition)
+    pending: list[_Pending] = field(default_factory=list)
+
+
+class RecommendCoalescer:
+    """Per-recipe micro-batcher for single-user ``:recommend`` scoring.
+
+    Parameters
+    ----------
+    window_seconds:
+        Longest time the leader waits for more requests before scoring.
+    max_batch:
+        Batch size that closes the window early.
+    recipes:
+        Optional allow-list of recipe names; empty means every recipe.
+    follower_timeout:
+        How long past the window a follower waits for its batch before it
+        scores its request alone.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        max_batch: int,
+        recipes: frozenset[str] = frozenset(),
+        clock: Callable[[], float] = time.monotonic,
+        *,
+        follower_timeout: float = _FOLLOWER_TIMEOUT_SECONDS,
+    ) -> None:
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self.recipes = recipes
+        self.follower_timeout = follower_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._queues: dict[str, _RecipeQueue] = {}
+
+    def enabled_for(self, recipe: str) -> bool:
+        """Return True when *recipe* should go through the coalescer."""
+        return not self.recipes or recipe in self.recipes
+
+    def recommend(
+        self,
+        recipe: str,
+        entry: Any,
+        user_id: str,
+        limit: int,
+        exclude_items: list[str] | None = None,
+    ) -> list[tuple[str, float]]:
+        """Score one known user, sharing the score pass with concurrent calls.
+
+        Blocks the calling thread for at most one window plus the batch's
+        scoring time (a follower gives up on its batch after
+        ``follower_timeout``).  Raises whatever the per-request fallback
+        raises.
+        """
+        pending = _Pending(entry, user_id, limit, exclude_items, self._clock())
+        queue = self._queue_for(recipe)
+        with queue.cond:
+            queue.pending.append(pending)
+            is_leader = len(queue.pending) == 1
+            if len(queue.pending) >= self.max_batch:
+                queue.cond.notify_all()
+
+        if not is_leader:
+            if not self._wait_for_batch(recipe, queue, pending):
+                return _score_alone(entry, user_id, limit, exclude_items)
+            if pending.promoted:
+                pending.promoted = False
+                pending.done.clear()
+                is_leader = True
+        if is_leader:
+            self._lead(recipe, queue, pending)
+            pending.done.wait()
+
+        if pending.error is not None:
+            raise pending.error
+        if pending.fallback:
+            return _score_alone(entry, user_id, limit, exclude_items)
+        assert pending.result is not None
+        return pending.result
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _queue_for(self, recipe: str) -> _RecipeQueue:
+        with self._lock:
+            queue = self._queues.get(recipe)
+            if queue is None:
+                queue = self._queues[recipe] = _RecipeQueue()
+            return queue
+
+    def _wait_for_batch(
+        self, recipe: str, queue: _RecipeQueue, pending: _Pending
+    ) -> bool:
+        """Wait as a follower; ``False`` when *pending* gave up on its batch."""
+        if pending.done.wait(self.window_seconds + self.follower_timeout):
+            return True
+        with queue.cond:
+            if pending.done.is_set():
+                return True  # woken (or promoted) just as the wait expired
+            # Still queued, or taken by a leader that has not finished
+            # scoring; either way nobody will wait for this request now.
+            queue.pending = [p for p in queue.pending if p is not pending]
+        logger.warning(
+            "coalesced_wait_timeout",
+            recipe=recipe,
+            timeout=self.window_seconds + self.follower_timeout,
+        )
+        return False
+
+    def _lead(self, recipe: str, queue: _RecipeQueue, leader: _Pending) -> None:
+        deadline = leader.enqueued_at + self.window_seconds
+        with queue.cond:
+            while len(queue.pending) < self.max_batch:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    break
+                queue.cond.wait(remaining)
+            batch = queue.pending[: self.max_batch]
+            queue.pending = queue.pending[self.max_batch :]
+            if queue.pending:
+                # Hand leadership of the overflow to its oldest request.
+                queue.pending[0].promoted = True
+                queue.pending[0].done.set()
+        self._score(recipe, batch)
+
+    def _score(self, recipe: str, batch: list[_Pending]) -> None:
+        started = self._clock()
+        try:
+            _metrics.observe_coalesced_batch(
+                recipe, len(batch), [started - p.enqueued_at for p in batch]
+            )
+            # Requests in one window normally share an entry; a hot-swap
+            # landing mid-window splits the batch into one group per model.
+            groups: dict[int, list[_Pending]] = {}
+            for p in batch:
+                groups.setdefault(id(p.entry), []).append(p)
+            for group in groups.values():
+                self._score_group(recipe, group)
+        finally:
+            for p in batch:
+                if p.result is None and p.error is None:
+                    # Left unscored by an unexpected error: score alone.
+                    p.fallback = True
+                p.done.set()
+
+    def _score_group(self, recipe: str, group: list[_Pending]) -> None:
+        recommender = group[0].entry.recommender
+        try:
+            rows = recommender.get_recommendation_for_known_user_batch(
+                [p.user_id for p in group],
+                [p.limit for p in group],
+                [p.exclude_items for p in group],
+            )
+        except (MemoryError, RecursionError) as exc:
+            for p in group:
+                p.error = exc
+            return
+        except Exception as exc:
+            logger.warning(
+                "coalesced_scoring_fallback",
+                recipe=recipe,
+                size=len(group),
+                exc_type=type(exc).__name__,
+            )
+            for p in group:
+                p.fallback = True
+            return
+        for p, row in zip(group, rows, strict=True):
+            p.result = row
+
+
+def _score_alone(
+    entry: Any, user_id: str, limit: int, exclude_items: list[str] | None
+) -> list[tuple[str, float]]:
+    kwargs = {"exclude_item_ids": exclude_items} if exclude_items else {}
+    return entry.recommender.get_recommendation_for_known_user_id(
+        user_id, limit, **kwargs
+    )
@@ -0,0 +1,263 @@
+"""Columnar (Arrow IPC / MessagePack) encodings of the v1 recommend responses.
+
+Service-to-service batch callers spend more CPU decoding a large
+``BatchRecommendResponse`` than the server spends scoring it.  A client that
+sends ``Accept: application/vnd.apache.arrow.stream`` or
+``Accept: application/msgpack`` instead receives the results as three
+parallel columns, ``index``, ``item_id`` and ``score``, with one row per
+recommended item.  ``index`` is the element's position in the batch (always
+``0`` for the single-subject verbs).  No per-item object is built on either
+side.
+
+Item metadata is not carried; callers that need it use JSON, which stays the
+default whenever the ``Accept`` header names neither binary type.  Per-element
+batch errors travel next to the columns as ``{index, code, message}`` records:
+
+* Arrow IPC: one record batch; ``request_id``, ``recipe``, ``model_version``
+  and ``errors`` (a JSON array) are schema metadata.
+* MessagePack: one map with ``request_id``, ``recipe``, ``model_version``,
+  ``index``, ``item_id``, ``score`` and ``errors``.
+
+A batch element with neither rows nor an error had an empty result.
+
+Binary bodies of at least :data:`COMPRESS_MIN_BYTES` are compressed when
+``Accept-Encoding`` allows it: ``zstd`` first, then ``gzip``.  MessagePack
+and zstd need the ``recotem[binary]`` extra; without it those options are
+simply not offered during negotiation.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import numpy as np
+import pyarrow as pa
+from fastapi import Response
+
+try:
+    import msgpack
+
+    _MSGPACK_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised via env without extra
+    _MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    _ZSTD_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised via env without extra
+    _ZSTD_AVAILABLE = False
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+#: Smallest body that is worth compressing.
+COMPRESS_MIN_BYTES = 1024
+
+ResponseFormat = Literal["json", "arrow", "msgpack"]
+ContentCoding = Literal["identity", "gzip", "zstd"]
+
+COLUMNAR_SCHEMA = pa.schema(
+    [
+        ("index", pa.int32()),
+        ("item_id", pa.string()),
+        ("score", pa.float64()),
+    ]
+)
+
+_MEDIA_TYPES: dict[str, ResponseFormat] = {
+    ARROW_STREAM_MEDIA_TYPE: "arrow",
+    MSGPACK_MEDIA_TYPE: "msgpack",
+    "application/x-msgpack": "msgpack",
+    "application/vnd.msgpack": "msgpack",
+}
+
+
+def msgpack_available() -> bool:
+    """Whether the optional ``msgpack`` package is installed."""
+    return _MSGPACK_AVAILABLE
+
+
+def zstd_available() -> bool:
+    """Whether the optional ``zstandard`` package is installed."""
+    return _ZSTD_AVAILABLE
+
+
+@dataclass(frozen=True, slots=True)
+class Negotiated:
+    """Outcome of ``Accept`` / ``Accept-Encoding`` negotiation for a request."""
+
+    format: ResponseFormat = "json"
+    coding: ContentCoding = "identity"
+
+    @property
+    def columnar(self) -> bool:
+        return self.format != "json"
+
+
+JSON_ONLY = Negotiated()
+
+
+def negotiate(accept: str | None, accept_encoding: str | None) -> Negotiated:
+    """Pick the response format and content coding for a request.
+
+    The binary format with the highest ``q`` wins when it is at least as
+    preferred as JSON; anything else (a missing header, ``*/*``,
+    ``application/json``, an unknown type) keeps the JSON default.  Content
+    coding applies to binary responses only.
+    """
+    if not accept:
+        return JSON_ONLY
+    best: ResponseFormat = "json"
+    best_q = 0.0
+    json_q = 0.0
+    for media_type, q in _parse_header(accept):
+        if media_type in ("application/json", "application/*", "*/*"):
+            json_q = max(json_q, q)
+            continue
+        fmt = _MEDIA_TYPES.get(media_type)
+        if fmt is None or q <= best_q:
+            continue
+        if fmt == "msgpack" and not _MSGPACK_AVAILABLE:
+            continue
+        best, best_q = fmt, q
+    if best == "json" or best_q < json_q:
+        return JSON_ONLY
+    return Negotiated(best, _negotiate_coding(accept_encoding))
+
+
+class ColumnarResults:
+    """Accumulates ``(index, item_id, score)`` rows and per-element errors."""
+
+    __slots__ = ("index", "item_ids", "scores", "errors")
+
+    def __init__(self) -> None:
+        self.index: list[int] = []
+        self.item_ids: list[str] = []
+        self.scores: list[float] = []
+        self.errors: list[dict[str, Any]] = []
+
+    def add_items(self, index: int, items: list[tuple[str, float]]) -> None:
+        """Append the rows of element *index* (already filtered and checked)."""
+        self.index.extend([index] * len(items))
+        for item_id, score in items:
+            self.item_ids.append(item_id)
+            self.scores.append(score)
+
+    def add_error(self, index: int, code: str, message: str) -> None:
+        self.errors.append({"index": index, "code": code, "message": message})
+
+
+def columnar_response(
+    negotiated: Negotiated,
+    results: ColumnarResults,
+    request_id: str,
+    recipe: str,
+    model_version: str,
+    headers: dict[str, str],
+) -> Response:
+    """Encode *results* in the negotiated format and return the response."""
+    envelope = {
+        "request_id": request_id,
+        "recipe": recipe,
+        "model_version": model_version,
+    }
+    results.errors.sort(key=lambda e: e["index"])
+    if negotiated.format == "arrow":
+        body = _arrow_body(envelope, results)
+        media_type = ARROW_STREAM_MEDIA_TYPE
+    else:
+        body = _msgpack_body(envelope, results)
+        media_type = MSGPACK_MEDIA_TYPE
+    headers["Vary"] = "Accept, Accept-Encoding"
+    if negotiated.coding != "identity" and len(body) >= COMPRESS_MIN_BYTES:
+        body = compress(body, negotiated.coding)
+        headers["Content-Encoding"] = negotiated.coding
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def compress(body: bytes, coding: ContentCoding) -> bytes:
+    """Compress *body* with *coding* (``identity`` returns it unchanged)."""
+    if coding == "gzip":
+        # Level 6 is gzip's default; mtime=0 keeps the output deterministic.
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    if coding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    return body
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _parse_header(value: str) -> list[tuple[str, float]]:
+    """Split an ``Accept``-style header into lowercase ``(token, q)`` pairs."""
+    parsed: list[tuple[str, float]] = []
+    for part in value.split(","):
+        token, _, params = part.partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, raw = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(raw.strip())
+                except ValueError:
+                    q = 0.0
+        # ``q=0`` is kept: it refuses a token a wildcard would allow.
+        parsed.append((token, max(0.0, min(q, 1.0))))
+    return parsed
+
+
+def _negotiate_coding(accept_encoding: str | None) -> ContentCoding:
+    if not accept_encoding:
+        return "identity"
+    offered = dict(_parse_header(accept_encoding))
+    wildcard = offered.get("*", 0.0)
+    zstd_q = offered.get("zstd", wildcard) if _ZSTD_AVAILABLE else 0.0
+    gzip_q = offered.get("gzip", wildcard)
+    if zstd_q > 0 and zstd_q >= gzip_q:
+        return "zstd"
+    if gzip_q > 0:
+        return "gzip"
+    return "identity"
+
+
+def _arrow_body(envelope: dict[str, str], results: ColumnarResults) -> bytes:
+    schema = COLUMNAR_SCHEMA.with_metadata(
+        {
+            **envelope,
+            "errors": json.dumps(results.errors, separators=(",", ":")),
+        }
+    )
+    batch = pa.RecordBatch.from_arrays(
+        [
+            pa.array(np.asarray(results.index, dtype=np.int32)),
+            pa.array(results.item_ids, pa.string()),
+            pa.array(np.asarray(results.scores, dtype=np.float64)),
+        ],
+        schema=schema,
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+def _msgpack_body(envelope: dict[str, str], results: ColumnarResults) -> bytes:
+    return msgpack.packb(
+        {
+            **envelope,
+            "index": results.index,
+            "item_id": results.item_ids,
+            "score": results.scores,
+            "errors": results.errors,
+        },
+        use_bin_type=True,
+    )
@@ -0,0 +1,174 @@
+"""Byte-level JSON encoding of the v1 recommend response bodies.
+
+Returning a ``RecommendResponse`` model makes FastAPI validate it against
+``response_model`` and serialise it again, on top of one
+``RecommendItem.model_validate`` per item.  For ``limit=1000`` with metadata
+that is thousands of pydantic round trips per request.
+
+Here the response is assembled from pre-encoded pieces instead:
+
+* Each item's JSON is encoded once, split around its score, when the
+  metadata index is built (``MetadataIndex.parts``).
+* Item IDs and scores are checked against the ``RecommendItem`` constraints
+  with plain comparisons.  Scores are encoded with a single serializer call
+  per response.
+* The envelope is concatenated around the item objects and returned as a raw
+  ``Response``.
+
+Every piece goes through ``pydantic_core.to_json``, which is the serializer
+behind the response models.  The body is therefore byte-identical to the
+model-serialised one, including float formatting and non-ASCII text.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+import pydantic_core
+from fastapi import Response
+from starlette.requests import ClientDisconnect
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from recotem.metadata.loader import encode_item_parts
+
+#: ``RecommendItem.item_id`` length bounds.
+ITEM_ID_MAX_LENGTH = 256
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_MISSING: Any = object()
+
+
+def json_bytes(value: Any) -> bytes:
+    """Encode one JSON value with the response models' serializer."""
+    return pydantic_core.to_json(value, inf_nan_mode="null")
+
+
+def valid_item(item_id: Any, score: float) -> bool:
+    """Whether ``(item_id, score)`` passes the ``RecommendItem`` constraints."""
+    return (
+        isinstance(item_id, str)
+        and 0 < len(item_id) <= ITEM_ID_MAX_LENGTH
+        and math.isfinite(score)
+    )
+
+
+def encode_scores(scores: Sequence[float]) -> list[bytes]:
+    """Encode finite *scores* in one serializer call.
+
+    JSON numbers never contain a comma, so the encoded array splits cleanly.
+    """
+    if not scores:
+        return []
+    return json_bytes(list(scores))[1:-1].split(b",")
+
+
+def bare_item_parts(item_id: str) -> tuple[bytes, bytes]:
+    """``(head, tail)`` of an item carrying only ``item_id`` and ``score``."""
+    return b'{"item_id":' + json_bytes(item_id) + b',"score":', b"}"
+
+
+def item_parts_lookup(
+    meta_index: Any,
+) -> Callable[[str], tuple[bytes, bytes] | None]:
+    """Return ``item_id -> (head, tail)`` for one response.
+
+    A response item is ``head + score + tail``; ``None`` means the item's
+    metadata cannot be encoded.  A ``MetadataIndex`` answers from its
+    pre-encoded parts.  A plain ``dict`` of field dicts is encoded on the fly
+    through the same function, so either form yields the same bytes.
+    """
+    if meta_index is None:
+        return bare_item_parts
+    parts = getattr(meta_index, "parts", None)
+    if parts is not None:
+
+        def from_parts(item_id: str) -> tuple[bytes, bytes] | None:
+            found = parts.get(item_id, _MISSING)
+            return bare_item_parts(item_id) if found is _MISSING else found
+
+        return from_parts
+
+    def from_fields(item_id: str) -> tuple[bytes, bytes] | None:
+        fields = meta_index.get(item_id)
+        if not fields:
+            return bare_item_parts(item_id)
+        return encode_item_parts(item_id, fields)
+
+    return from_fields
+
+
+def items_array(items: Iterable[bytes]) -> bytes:
+    return b"[" + b",".join(items) + b"]"
+
+
+def recommend_body(
+    request_id: str, recipe: str, model_version: str, items: Iterable[bytes]
+) -> bytes:
+    """``RecommendResponse`` JSON around pre-encoded *items*."""
+    return (
+        b'{"request_id":'
+        + json_bytes(request_id)
+        + b',"recipe":'
+        + json_bytes(recipe)
+        + b',"model_version":'
+        + json_bytes(model_version)
+        + b',"items":'
+        + items_array(items)
+        + b"}"
+    )
+
+
+def batch_ok_json(index: int, items: Iterable[bytes]) -> bytes:
+    """``BatchResultOk`` JSON around pre-encoded *items*."""
+    return (
+        b'{"index":'
+        + str(index).encode()
+        + b',"status":"ok","items":'
+        + items_array(items)
+        + b"}"
+    )
+
+
+def batch_body(
+    request_id: str, recipe: str, model_version: str, results: Iterable[bytes]
+) -> bytes:
+    """``BatchRecommendResponse`` JSON around pre-encoded *results*."""
+    return (
+        b'{"request_id":'
+        + json_bytes(request_id)
+        + b',"recipe":'
+        + json_bytes(recipe)
+        + b',"model_version":'
+        + json_bytes(model_version)
+        + b',"results":['
+        + b",".join(results)
+        + b"]}"
+    )
+
+
+def json_response(body: bytes, headers: dict[str, str]) -> Response:
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """``StreamingResponse`` for a handler that is still reading its body.
+
+    Below ASGI spec 2.4 Starlette watches for a disconnect by calling
+    ``receive()`` while the body is streamed, which would swallow the request
+    body chunks the ``:stream-recommend`` generator has yet to read.  Here
+    the body iterator is the only reader: a client that goes away surfaces
+    as ``ClientDisconnect`` from ``request.stream()`` instead.
+    """
+
+    media_type = NDJSON_MEDIA_TYPE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect() from None
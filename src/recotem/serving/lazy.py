@@ -0,0 +1,304 @@
+"""On-demand model loading under a global memory budget.
+
+With ``RECOTEM_MODEL_MEMORY_BUDGET`` set, ``serve`` does not load every
+artifact at startup.  Each recipe is registered as a *standby* entry
+(``loaded=False``, ``standby=True``) and :class:`LazyModelLoader` manages
+residency from then on:
+
+* The first request to a standby recipe starts its load; concurrent first
+  requests wait on the same load (single flight).  Loads run on a small
+  dedicated pool, so the event loop never blocks on one.
+* Every resident model has an estimated footprint
+  (:func:`estimate_footprint`).
+* Once the summed footprint exceeds the budget, the least recently used
+  models go back on standby.  The model that was just loaded or swapped is
+  never the victim, so a single model larger than the budget still serves.
+
+Requests that already hold an evicted entry finish on it; its memory is
+reclaimed when they drop the reference.  Accounting follows the registry
+through a swap listener, so the watcher's hot swaps of resident models are
+charged exactly like on-demand loads.
+
+Observed via ``recotem_model_loads_total``,
+``recotem_model_cold_start_seconds``, ``recotem_model_evictions_total`` and
+``recotem_resident_model_bytes``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+import structlog
+
+from recotem.serving import metrics as _metrics
+from recotem.serving.registry import ModelEntry, ModelRegistry
+
+logger = structlog.get_logger(__name__)
+
+#: Concurrent on-demand loads.  Loads are I/O and unpickling bound; more
+#: threads mostly multiply the transient memory peak.
+LOAD_WORKERS = 4
+
+#: How deep :func:`estimate_footprint` follows attributes and containers.
+_FOOTPRINT_MAX_DEPTH = 6
+#: Larger containers are ID lists and maps, not array holders; skip them.
+_FOOTPRINT_MAX_ITEMS = 1024
+
+
+def standby_entry(name: str, artifact_path: str) -> ModelEntry:
+    """Registry entry for a recipe that is known but not resident."""
+    return ModelEntry(
+        name=name,
+        recommender=None,
+        header={},
+        kid="",
+        metadata_df=None,
+        artifact_path=artifact_path,
+        loaded=False,
+        standby=True,
+    )
+
+
+def estimate_footprint(entry: ModelEntry) -> int:
+    """Estimated resident bytes of *entry*'s model and item metadata.
+
+    Sums the buffers of the numpy arrays and scipy sparse matrices reachable
+    from the recommender (each buffer counted once), plus the metadata
+    frame's deep memory usage.  State held by native extension objects is
+    invisible to that walk, so the unpickled payload size is used as a
+    floor.
+    """
+    seen: set[int] = set()
+    model_bytes = _reachable_array_bytes(entry.recommender, seen, 0)
+    total = max(model_bytes, entry.payload_bytes)
+    if entry.metadata_df is not None:
+        try:
+            total += int(entry.metadata_df.memory_usage(deep=True).sum())
+        except (MemoryError, RecursionError):
+            raise
+        except Exception:  # noqa: BLE001 - best effort; the model still counts
+            pass
+    return total
+
+
+class LazyModelLoader:
+    """Loads standby recipes on demand and evicts to a memory budget.
+
+    Parameters
+    ----------
+    registry:
+        The serving registry; the loader registers a swap listener on it.
+    load:
+        ``load(name)`` builds a fresh entry for recipe *name* — a loaded
+        entry, or a stub with ``last_load_error`` set when the artifact
+        failed to load — or returns ``None`` when the recipe is no longer
+        known.  Runs on the loader's own threads.
+    budget_bytes:
+        Upper bound on the summed footprint of resident models.
+    describe:
+        Optional ``describe(name)`` returning a standby entry whose header
+        was read (and verified) without loading the model, or ``None`` when
+        that is not possible.  Lets ``/v1/recipes/{name}`` answer without a
+        cold start.
+    """
+
+    def __init__(
+        self,
+        registry: ModelRegistry,
+        load: Callable[[str], ModelEntry | None],
+        budget_bytes: int,
+        *,
+        max_workers: int = LOAD_WORKERS,
+        describe: Callable[[str], ModelEntry | None] | None = None,
+    ) -> None:
+        self._registry = registry
+        self._load = load
+        self._describe = describe
+        self._budget = budget_bytes
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future[ModelEntry | None]] = {}
+        self._footprints: dict[str, int] = {}
+        # Written by touch() on the request path without the lock; a dict
+        # item assignment is atomic under the GIL.
+        self._last_used: dict[str, float] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="model-load"
+        )
+        registry.add_swap_listener(self._on_swap)
+
+    @property
+    def budget_bytes(self) -> int:
+        return self._budget
+
+    def resident_bytes(self) -> int:
+        """Summed footprint estimate of the resident models."""
+        with self._lock:
+            return sum(self._footprints.values())
+
+    def touch(self, name: str) -> None:
+        """Mark *name* as just used (called for every served request)."""
+        self._last_used[name] = time.monotonic()
+
+    def ensure(self, name: str) -> Future[ModelEntry | None]:
+        """Return a future for the entry that serves *name*.
+
+        Starts a load when *name* is on standby; callers arriving while that
+        load runs share its future.  The result is the freshly loaded entry
+        (or its failure stub), the current entry when *name* was not on
+        standby, or ``None`` when the recipe is gone.
+        """
+        with self._lock:
+            future = self._inflight.get(name)
+            if future is None:
+                future = self._executor.submit(self._load_standby, name)
+                self._inflight[name] = future
+        return future
+
+    def describe(self, name: str) -> ModelEntry | None:
+        """Return a header-only standby entry for *name*, or ``None``.
+
+        Never loads the model and never raises; ``None`` means the caller
+        has to fall back to :meth:`ensure`.
+        """
+        if self._describe is None:
+            return None
+        try:
+            return self._describe(name)
+        except (MemoryError, RecursionError):
+            raise
+        except Exception as exc:
+            logger.warning("model_describe_failed", recipe=name, error=str(exc))
+            return None
+
+    def shutdown(self) -> None:
+        """Stop accepting loads; in-flight loads finish in the background."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _load_standby(self, name: str) -> ModelEntry | None:
+        try:
+            current = self._registry.get(name)
+            if current is None or not current.standby:
+                return current
+            started = time.perf_counter()
+            try:
+                entry = self._load(name)
+            except Exception:
+                _metrics.observe_model_load(name, False, time.perf_counter() - started)
+                raise
+            if entry is None:
+                return self._registry.get(name)
+            seconds = time.perf_counter() - started
+            _metrics.observe_model_load(name, entry.loaded, seconds)
+            if entry.loaded:
+                logger.info(
+                    "model_loaded_on_demand", recipe=name, seconds=round(seconds, 3)
+                )
+            else:
+                logger.warning(
+                    "model_load_on_demand_failed",
+                    recipe=name,
+                    error=entry.last_load_error,
+                )
+            # The watcher may have swapped or removed the recipe meanwhile;
+            # never clobber its newer state.
+            if not self._registry.replace_if(name, current, entry):
+                return self._registry.get(name)
+            _metrics.set_model_loaded(name, entry.loaded)
+            _metrics.set_active_recipes(self._registry.loaded_count())
+            return entry
+        finally:
+            # Only after publication: a caller that still sees the standby
+            # entry joins this future instead of starting a second load.
+            with self._lock:
+                self._inflight.pop(name, None)
+
+    def _on_swap(self, name: str) -> None:
+        entry = self._registry.get(name)
+        if entry is not None and entry.loaded:
+            footprint = estimate_footprint(entry)
+            with self._lock:
+                self._footprints[name] = footprint
+            self.touch(name)
+            self._enforce_budget(keep=name)
+        else:
+            with self._lock:
+                self._footprints.pop(name, None)
+            if entry is None:
+                self._last_used.pop(name, None)
+        _metrics.set_resident_model_bytes(self.resident_bytes())
+
+    def _enforce_budget(self, keep: str) -> None:
+        """Evict least recently used models until the budget holds."""
+        while True:
+            with self._lock:
+                resident = sum(self._footprints.values())
+                if resident <= self._budget:
+                    return
+                candidates = [n for n in self._footprints if n != keep]
+                if not candidates:
+                    logger.warning(
+                        "model_memory_budget_exceeded",
+                        recipe=keep,
+                        resident_bytes=resident,
+                        budget_bytes=self._budget,
+                    )
+                    return
+                victim = min(candidates, key=lambda n: self._last_used.get(n, 0.0))
+                victim_bytes = self._footprints[victim]
+            entry = self._registry.get(victim)
+            if entry is None or not entry.loaded:
+                with self._lock:
+                    self._footprints.pop(victim, None)
+                continue
+            # The swap listener drops the victim's footprint.  A failed
+            # compare-and-swap means it was just replaced; look again.
+            if self._registry.replace_if(
+                victim, entry, standby_entry(victim, entry.artifact_path)
+            ):
+                _metrics.inc_model_eviction(victim)
+                _metrics.set_model_loaded(victim, False)
+                logger.info(
+                    "model_evicted",
+                    recipe=victim,
+                    footprint_bytes=victim_bytes,
+                    resident_bytes=resident - victim_bytes,
+                    budget_bytes=self._budget,
+                )
+
+
+def _reachable_array_bytes(obj: Any, seen: set[int], depth: int) -> int:
+    """Bytes of the distinct array buffers reachable from *obj*."""
+    if obj is None or isinstance(obj, (str, bytes, int, float, bool)):
+        return 0
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        base = obj
+        while isinstance(base.base, np.ndarray):
+            base = base.base
+        if base is not obj:
+            if id(base) in seen:
+                return 0
+            seen.add(id(base))
+        return int(base.nbytes)
+    if depth >= _FOOTPRINT_MAX_DEPTH:
+        return 0
+    if isinstance(obj, dict):
+        children: Any = obj.values() if len(obj) <= _FOOTPRINT_MAX_ITEMS else ()
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        children = obj if len(obj) <= _FOOTPRINT_MAX_ITEMS else ()
+    else:
+        # scipy.sparse matrices keep data/indices/indptr in __dict__, so they
+        # are covered by the generic attribute walk.
+        children = getattr(obj, "__dict__", {}).values()
+    return sum(_reachable_array_bytes(c, seen, depth + 1) for c in children)
@@ -0,0 +1,145 @@
+"""Bounded parallel artifact loading for the watcher.
+
+When many artifacts change in one poll (a nightly training run rewriting
+every recipe), loading them one after another makes the hot swaps trickle
+in over minutes.  :class:`LoadQueue` runs them on a small pool instead,
+bounded twice:
+
+* by count — at most ``RECOTEM_WATCHER_LOAD_CONCURRENCY`` loads run at once;
+* by bytes — the estimated sizes of the running loads stay within
+  ``RECOTEM_WATCHER_LOAD_BUDGET_BYTES``, so a burst of large artifacts
+  cannot hold more bytes in flight than the pod can afford.  A load larger
+  than the whole budget runs once nothing else is in flight rather than
+  never.
+
+Each load still swaps its own recipe's registry entry atomically; the queue
+only decides when a load may start.  Observed via
+``recotem_watcher_load_queue_depth``, ``recotem_watcher_load_inflight_bytes``
+and ``recotem_watcher_load_duration_seconds``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from recotem.serving import metrics as _metrics
+
+#: How often a load waiting for budget re-checks the stop event.
+_STOP_POLL_SECONDS = 0.5
+
+
+class LoadQueue:
+    """Runs watcher loads within a count and an in-flight-bytes budget.
+
+    Parameters
+    ----------
+    max_loads:
+        Loads running at once (the pool size).
+    budget_bytes:
+        Upper bound on the summed size estimates of the running loads.
+    stop_event:
+        Set when the watcher stops; loads still waiting for budget give up.
+    """
+
+    def __init__(
+        self,
+        max_loads: int,
+        budget_bytes: int,
+        stop_event: threading.Event,
+    ) -> None:
+        self._budget = budget_bytes
+        self._stop_event = stop_event
+        self._cond = threading.Condition()
+        self._inflight_bytes = 0
+        self._running = 0
+        self._queued = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_loads, thread_name_prefix="artifact-load"
+        )
+
+    @property
+    def budget_bytes(self) -> int:
+        return self._budget
+
+    def inflight_bytes(self) -> int:
+        """Summed size estimates of the loads running now."""
+        with self._cond:
+            return self._inflight_bytes
+
+    def queued(self) -> int:
+        """Loads submitted but not yet started."""
+        with self._cond:
+            return self._queued
+
+    def submit(
+        self, name: str, size_bytes: int, load: Callable[[], None]
+    ) -> Future[None]:
+        """Queue *load* for recipe *name*, expected to hold *size_bytes*."""
+        with self._cond:
+            self._queued += 1
+            _metrics.set_watcher_load_queue_depth(self._queued)
+        try:
+            future = self._executor.submit(self._run, name, size_bytes, load)
+        except BaseException:
+            self._leave_queue()
+            raise
+        # A load cancelled before it started never leaves the queue itself.
+        future.add_done_callback(
+            lambda f: self._leave_queue() if f.cancelled() else None
+        )
+        return future
+
+    def shutdown(self, *, wait: bool) -> None:
+        """Stop accepting loads; queued loads that have not started are dropped."""
+        with self._cond:
+            self._cond.notify_all()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _run(self, name: str, size_bytes: int, load: Callable[[], None]) -> None:
+        if not self._acquire(size_bytes):
+            return
+        started = time.perf_counter()
+        try:
+            load()
+        finally:
+            _metrics.observe_watcher_load(name, time.perf_counter() - started)
+            self._release(size_bytes)
+
+    def _acquire(self, size_bytes: int) -> bool:
+        """Wait until *size_bytes* fit the budget; ``False`` once stopped."""
+        with self._cond:
+            try:
+                while self._running and (
+                    self._inflight_bytes + size_bytes > self._budget
+                ):
+                    if self._stop_event.is_set():
+                        return False
+                    self._cond.wait(_STOP_POLL_SECONDS)
+                if self._stop_event.is_set():
+                    return False
+                self._running += 1
+                self._inflight_bytes += size_bytes
+                _metrics.set_watcher_load_inflight_bytes(self._inflight_bytes)
+                return True
+            finally:
+                self._queued -= 1
+                _metrics.set_watcher_load_queue_depth(self._queued)
+
+    def _release(self, size_bytes: int) -> None:
+        with self._cond:
+            self._running -= 1
+            self._inflight_bytes -= size_bytes
+            _metrics.set_watcher_load_inflight_bytes(self._inflight_bytes)
+            self._cond.notify_all()
+
+    def _leave_queue(self) -> None:
+        with self._cond:
+            self._queued -= 1
+            _metrics.set_watcher_load_queue_depth(self._queued)
@@ -23,10 +23,26 @@ Metric inventory (matches docs/operations.md):
 | ``recotem_v1_batch_element_errors_total``          | Counter    | recipe, verb, code      |
 | ``recotem_v1_metadata_degraded_items_total``       | Counter    | recipe, verb, kind      |
 | ``recotem_v1_validation_errors_outside_verb_total``| Counter    | —                       |
+| ``recotem_response_cache_requests_total``          | Counter    | recipe, verb, result    |
+| ``recotem_response_cache_evictions_total``         | Counter    | recipe, reason          |
+| ``recotem_response_cache_bytes``                   | Gauge      | recipe                  |
+| ``recotem_api_key_cache_requests_total``           | Counter    | result                  |
+| ``recotem_v1_stage_duration_seconds``              | Histogram  | recipe, verb, stage     |
+| ``recotem_recipe_pool_queue_depth``                | Gauge      | recipe                  |
+| ``recotem_recipe_pool_active_workers``             | Gauge      | recipe                  |
+| ``recotem_admission_inflight``                     | Gauge      | recipe                  |
+| ``recotem_admission_rejected_total``               | Counter    | recipe, scope           |
+| ``recotem_coalescer_batch_size``                   | Histogram  | recipe                  |
+| ``recotem_coalescer_queue_delay_seconds``          | Histogram  | recipe                  |
 | ``recotem_model_loaded``                           | Gauge      | recipe                  |
 | ``recotem_artifact_load_failures_total``           | Counter    | recipe, reason          |
 | ``recotem_active_recipes``                         | Gauge      | —                       |
 | ``recotem_swap_total``                             | Counter    | recipe, result          |
+| ``recotem_model_warmup_duration_seconds``          | Histogram  | recipe, result          |
+| ``recotem_model_loads_total``                      | Counter    | recipe, result          |
+| ``recotem_model_cold_start_seconds``               | Histogram  | recipe                  |
+| ``recotem_model_evictions_total``                  | Counter    | recipe                  |
+| ``recotem_resident_model_bytes``                   | Gauge      | —                       |
 | ``recotem_artifact_stat_failures_total``           | Counter    | recipe                  |
 | ``recotem_watcher_unhandled_errors_total``         | Counter    | —                       |
 | ``recotem_metadata_index_build_errors_total``      | Counter    | recipe                  |
@@ -392,7 +408,7 @@ def record_v1_request(
     *verb* ∈ {"recommend", "recommend-related", "batch-recommend",
     "batch-recommend-related"}.  *status* ∈ {"ok", "unknown_user",
     "unknown_seed_items", "no_candidates", "unavailable",
-    "recipe_not_found", "validation_error", "error"}.
+    "recipe_not_found", "validation_error", "overloaded", "error"}.
     """
     _ensure_v1_initialized()
     if _V1_REQUEST_COUNTER is None:
@@ -458,6 +474,441 @@ def inc_validation_error_outside_verb() -> None:
     _V1_VALIDATION_ERRORS_OUTSIDE_VERB.inc()
 
 
+# ---------------------------------------------------------------------------
+# Response-cache metrics
+# ---------------------------------------------------------------------------
+
+_RESPONSE_CACHE_REQUESTS: Any = None
+_RESPONSE_CACHE_EVICTIONS: Any = None
+_RESPONSE_CACHE_BYTES: Any = None
+
+_CACHE_EVICTION_REASONS: frozenset[str] = frozenset(
+    {"capacity", "expired", "invalidated"}
+)
+
+
+def _ensure_cache_initialized() -> None:
+    """Lazily create the response-cache metric families.
+
+    Kept separate from ``_ensure_v1_initialized`` so the cache families can be
+    reset independently in tests.  Gated on ``metrics_enabled()`` like the
+    other request-time metrics.
+    """
+    global _RESPONSE_CACHE_REQUESTS, _RESPONSE_CACHE_EVICTIONS
+    global _RESPONSE_CACHE_BYTES
+    if _RESPONSE_CACHE_REQUESTS is not None:
+        return
+    if not metrics_enabled():
+        return
+
+    _RESPONSE_CACHE_REQUESTS = Counter(
+        "recotem_response_cache_requests_total",
+        "Response-cache lookups by recipe, verb and result (hit | miss).",
+        ["recipe", "verb", "result"],
+    )
+    _RESPONSE_CACHE_EVICTIONS = Counter(
+        "recotem_response_cache_evictions_total",
+        "Entries removed from the response cache. reason ∈ {capacity, "
+        "expired, invalidated}; invalidated counts entries dropped because "
+        "the recipe's model was swapped or removed.",
+        ["recipe", "reason"],
+    )
+    _RESPONSE_CACHE_BYTES = Gauge(
+        "recotem_response_cache_bytes",
+        "Estimated bytes held by the response cache for a recipe.",
+        ["recipe"],
+    )
+
+
+def record_response_cache_lookup(recipe: str, verb: str, hit: bool) -> None:
+    """Record one response-cache lookup (``hit`` or ``miss``)."""
+    _ensure_cache_initialized()
+    if _RESPONSE_CACHE_REQUESTS is None:
+        return
+    _RESPONSE_CACHE_REQUESTS.labels(
+        recipe=recipe, verb=verb, result="hit" if hit else "miss"
+    ).inc()
+
+
+def inc_response_cache_evictions(recipe: str, reason: str, count: int = 1) -> None:
+    """Increment the eviction counter; unknown *reason* values are coerced
+    to ``"capacity"`` to keep the label set closed."""
+    _ensure_cache_initialized()
+    if _RESPONSE_CACHE_EVICTIONS is None or count <= 0:
+        return
+    label = reason if reason in _CACHE_EVICTION_REASONS else "capacity"
+    _RESPONSE_CACHE_EVICTIONS.labels(recipe=recipe, reason=label).inc(count)
+
+
+def set_response_cache_bytes(recipe: str, size: int) -> None:
+    """Set the per-recipe response-cache size gauge."""
+    _ensure_cache_initialized()
+    if _RESPONSE_CACHE_BYTES is None:
+        return
+    _RESPONSE_CACHE_BYTES.labels(recipe=recipe).set(size)
+
+
+# ---------------------------------------------------------------------------
+# API-key cache metrics
+# ---------------------------------------------------------------------------
+
+_API_KEY_CACHE_REQUESTS: Any = None
+
+
+def _ensure_api_key_cache_initialized() -> None:
+    """Lazily create the API-key cache counter (gated like v1 metrics)."""
+    global _API_KEY_CACHE_REQUESTS
+    if _API_KEY_CACHE_REQUESTS is not None:
+        return
+    if not metrics_enabled():
+        return
+
+    _API_KEY_CACHE_REQUESTS = Counter(
+        "recotem_api_key_cache_requests_total",
+        "Verified-API-key cache lookups by result (hit | miss). Requests "
+        "rejected by the header length guards are not looked up.",
+        ["result"],
+    )
+
+
+def record_api_key_cache_lookup(hit: bool) -> None:
+    """Record one verified-API-key cache lookup (``hit`` or ``miss``)."""
+    _ensure_api_key_cache_initialized()
+    if _API_KEY_CACHE_REQUESTS is None:
+        return
+    _API_KEY_CACHE_REQUESTS.labels(result="hit" if hit else "miss").inc()
+
+
+# ---------------------------------------------------------------------------
+# Per-stage latency (see recotem.serving.timing)
+# ---------------------------------------------------------------------------
+
+_V1_STAGE_DURATION: Any = None
+
+
+def _ensure_stage_initialized() -> None:
+    """Lazily create the stage histogram (gated like v1 metrics)."""
+    global _V1_STAGE_DURATION
+    if _V1_STAGE_DURATION is not None:
+        return
+    if not metrics_enabled():
+        return
+
+    _V1_STAGE_DURATION = Histogram(
+        "recotem_v1_stage_duration_seconds",
+        "Time spent in each stage of a v1 inference request "
+        "(auth, lookup, queue, validate, score, encode).",
+        ["recipe", "verb", "stage"],
+        buckets=(
+            0.0001,
+            0.00025,
+            0.0005,
+            0.001,
+            0.0025,
+            0.005,
+            0.01,
+            0.025,
+            0.05,
+            0.1,
+            0.25,
+            1.0,
+        ),
+    )
+
+
+def observe_v1_stage(recipe: str, verb: str, stage: str, seconds: float) -> None:
+    """Record one stage duration of a v1 inference request."""
+    _ensure_stage_initialized()
+    if _V1_STAGE_DURATION is None:
+        return
+    _V1_STAGE_DURATION.labels(recipe=recipe, verb=verb, stage=stage).observe(seconds)
+
+
+# ---------------------------------------------------------------------------
+# Per-recipe executor (bulkhead) metrics
+# ---------------------------------------------------------------------------
+
+_RECIPE_POOL_QUEUE_DEPTH: Any = None
+_RECIPE_POOL_ACTIVE_WORKERS: Any = None
+
+
+def _ensure_recipe_pool_initialized() -> None:
+    """Lazily create the recipe pool gauges (gated like v1 metrics)."""
+    global _RECIPE_POOL_QUEUE_DEPTH, _RECIPE_POOL_ACTIVE_WORKERS
+    if _RECIPE_POOL_QUEUE_DEPTH is not None:
+        return
+    if not metrics_enabled():
+        return
+
+    _RECIPE_POOL_QUEUE_DEPTH = Gauge(
+        "recotem_recipe_pool_queue_depth",
+        "Inference calls submitted to the recipe's executor and not yet running",
+        ["recipe"],
+    )
+    _RECIPE_POOL_ACTIVE_WORKERS = Gauge(
+        "recotem_recipe_pool_active_workers",
+        "Inference calls currently running on the recipe's executor",
+        ["recipe"],
+    )
+
+
+def set_recipe_pool_state(recipe: str, queued: int, active: int) -> None:
+    """Publish the queue depth and active workers of *recipe*'s executor."""
+    _ensure_recipe_pool_initialized()
+    if _RECIPE_POOL_QUEUE_DEPTH is None:
+        return
+    _RECIPE_POOL_QUEUE_DEPTH.labels(recipe=recipe).set(queued)
+    _RECIPE_POOL_ACTIVE_WORKERS.labels(recipe=recipe).set(active)
+
+
+# ---------------------------------------------------------------------------
+# Admission control metrics
+# ---------------------------------------------------------------------------
+
+_ADMISSION_INFLIGHT: Any = None
+_ADMISSION_REJECTED: Any = None
+
+_ADMISSION_SCOPES = frozenset({"global", "recipe"})
+
+
+def _ensure_admission_initialized() -> None:
+    """Lazily create the admission metrics (gated like v1 metrics)."""
+    global _ADMISSION_INFLIGHT, _ADMISSION_REJECTED
+    if _ADMISSION_INFLIGHT is not None:
+        return
+    if not metrics_enabled():
+        return
+
+    _ADMISSION_INFLIGHT = Gauge(
+        "recotem_admission_inflight",
+        "Admitted request weight (queued + running) per recipe; a batch "
+        "counts one unit per element",
+        ["recipe"],
+    )
+    _ADMISSION_REJECTED = Counter(
+        "recotem_admission_rejected_total",
+        "Requests rejected with 429 OVERLOADED by scope (global | recipe)",
+        ["recipe", "scope"],
+    )
+
+
+def set_admission_inflight(recipe: str, weight: int) -> None:
+    """Publish *recipe*'s admitted weight."""
+    _ensure_admission_initialized()
+    if _ADMISSION_INFLIGHT is None:
+        return
+    _ADMISSION_INFLIGHT.labels(recipe=recipe).set(weight)
+
+
+def inc_admission_rejected(recipe: str, scope: str) -> None:
+    """Count one shed request; unknown *scope* values are coerced to ``recipe``."""
+    _ensure_admission_initialized()
+    if _ADMISSION_REJECTED is None:
+        return
+    if scope not in _ADMISSION_SCOPES:
+        scope = "recipe"
+    _ADMISSION_REJECTED.labels(recipe=recipe, scope=scope).inc()
+
+
+# ---------------------------------------------------------------------------
+# :recommend coalescer metrics
+# ---------------------------------------------------------------------------
+
+_COALESCER_BATCH_SIZE: Any = None
+_COALESCER_QUEUE_DELAY: Any = None
+
+
+def _ensure_coalescer_initialized() -> None:
+    """Lazily create the coalescer metric families (gated like v1 metrics)."""
+    global _COALESCER_BATCH_SIZE, _COALESCER_QUEUE_DELAY
+    if _COALESCER_BATCH_SIZE is not None:
+        return
+    if not metrics_enabled():
+        return
+
+    _COALESCER_BATCH_SIZE = Histogram(
+        "recotem_coalescer_batch_size",
+        "Number of :recommend requests scored together by the coalescer.",
+        ["recipe"],
+        buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+    )
+    _COALESCER_QUEUE_DELAY = Histogram(
+        "recotem_coalescer_queue_delay_seconds",
+        "Time a :recommend request waited in the coalescer before its batch "
+        "started scoring (the latency the coalescer adds).",
+        ["recipe"],
+        buckets=(0.0001, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05),
+    )
+
+
+def observe_coalesced_batch(recipe: str, size: int, delays: list[float]) -> None:
+    """Record one coalesced batch: its size and each member's queueing delay."""
+    _ensure_coalescer_initialized()
+    if _COALESCER_BATCH_SIZE is None:
+        return
+    _COALESCER_BATCH_SIZE.labels(recipe=recipe).observe(size)
+    delay_hist = _COALESCER_QUEUE_DELAY.labels(recipe=recipe)
+    for delay in delays:
+        delay_hist.observe(delay)
+
+
+# ---------------------------------------------------------------------------
+# Pre-swap warmup metrics (see recotem.serving.warmup)
+# ---------------------------------------------------------------------------
+
+_MODEL_WARMUP_DURATION: Any = None
+
+
+def _ensure_warmup_initialized() -> None:
+    """Lazily create the warmup histogram (gated like v1 metrics)."""
+    global _MODEL_WARMUP_DURATION
+    if _MODEL_WARMUP_DURATION is not None:
+        return
+    if not metrics_enabled():
+        return
+
+    _MODEL_WARMUP_DURATION = Histogram(
+        "recotem_model_warmup_duration_seconds",
+        "Time spent warming a newly loaded model before it was swapped in.",
+        ["recipe", "result"],
+        buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+    )
+
+
+def observe_model_warmup(recipe: str, ok: bool, seconds: float) -> None:
+    """Record one warmup run; *ok* is False when a synthetic call raised."""
+    _ensure_warmup_initialized()
+    if _MODEL_WARMUP_DURATION is None:
+        return
+    _MODEL_WARMUP_DURATION.labels(
+        recipe=recipe, result="ok" if ok else "error"
+    ).observe(seconds)
+
+
+# ---------------------------------------------------------------------------
+# Lazy loading metrics (see recotem.serving.lazy)
+# ---------------------------------------------------------------------------
+
+_MODEL_LOADS: Any = None
+_MODEL_COLD_START: Any = None
+_MODEL_EVICTIONS: Any = None
+_RESIDENT_MODEL_BYTES: Any = None
+
+
+def _ensure_lazy_initialized() -> None:
+    """Lazily create the on-demand load metric families (gated like v1 metrics)."""
+    global _MODEL_LOADS, _MODEL_COLD_START, _MODEL_EVICTIONS, _RESIDENT_MODEL_BYTES
+    if _MODEL_LOADS is not None:
+        return
+    if not metrics_enabled():
+        return
+
+    _MODEL_LOADS = Counter(
+        "recotem_model_loads_total",
+        "On-demand model loads triggered by a request to a standby recipe.",
+        ["recipe", "result"],
+    )
+    _MODEL_COLD_START = Histogram(
+        "recotem_model_cold_start_seconds",
+        "Time from the first request to a standby recipe until its model was "
+        "ready to serve.",
+        ["recipe"],
+        buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+    )
+    _MODEL_EVICTIONS = Counter(
+        "recotem_model_evictions_total",
+        "Models unloaded to stay within RECOTEM_MODEL_MEMORY_BUDGET.",
+        ["recipe"],
+    )
+    _RESIDENT_MODEL_BYTES = Gauge(
+        "recotem_resident_model_bytes",
+        "Estimated memory footprint of all resident models.",
+    )
+
+
+def observe_model_load(recipe: str, ok: bool, seconds: float) -> None:
+    """Record one on-demand load; the cold start is observed only when *ok*."""
+    _ensure_lazy_initialized()
+    if _MODEL_LOADS is None:
+        return
+    _MODEL_LOADS.labels(recipe=recipe, result="ok" if ok else "error").inc()
+    if ok:
+        _MODEL_COLD_START.labels(recipe=recipe).observe(seconds)
+
+
+def inc_model_eviction(recipe: str) -> None:
+    """Count one model evicted to honour the memory budget."""
+    _ensure_lazy_initialized()
+    if _MODEL_EVICTIONS is None:
+        return
+    _MODEL_EVICTIONS.labels(recipe=recipe).inc()
+
+
+def set_resident_model_bytes(value: int) -> None:
+    """Set the summed footprint estimate of the resident models."""
+    _ensure_lazy_initialized()
+    if _RESIDENT_MODEL_BYTES is None:
+        return
+    _RESIDENT_MODEL_BYTES.set(value)
+
+
+# ---------------------------------------------------------------------------
+# Watcher load queue metrics (see recotem.serving.load_queue)
+# ---------------------------------------------------------------------------
+
+_LOAD_QUEUE_DEPTH: Any = None
+_LOAD_INFLIGHT_BYTES: Any = None
+_LOAD_DURATION: Any = None
+
+
+def _ensure_load_queue_initialized() -> None:
+    """Lazily create the watcher load queue families (gated like v1 metrics)."""
+    global _LOAD_QUEUE_DEPTH, _LOAD_INFLIGHT_BYTES, _LOAD_DURATION
+    if _LOAD_QUEUE_DEPTH is not None:
+        return
+    if not metrics_enabled():
+        return
+
+    _LOAD_QUEUE_DEPTH = Gauge(
+        "recotem_watcher_load_queue_depth",
+        "Changed artifacts waiting for a watcher load slot or byte budget.",
+    )
+    _LOAD_INFLIGHT_BYTES = Gauge(
+        "recotem_watcher_load_inflight_bytes",
+        "Estimated artifact bytes held by the watcher loads running now.",
+    )
+    _LOAD_DURATION = Histogram(
+        "recotem_watcher_load_duration_seconds",
+        "Time one watcher load took, from its start to its swap or failure.",
+        ["recipe"],
+        buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+    )
+
+
+def set_watcher_load_queue_depth(value: int) -> None:
+    """Set the number of watcher loads waiting to start."""
+    _ensure_load_queue_initialized()
+    if _LOAD_QUEUE_DEPTH is None:
+        return
+    _LOAD_QUEUE_DEPTH.set(value)
+
+
+def set_watcher_load_inflight_bytes(value: int) -> None:
+    """Set the summed size estimate of the running watcher loads."""
+    _ensure_load_queue_initialized()
+    if _LOAD_INFLIGHT_BYTES is None:
+        return
+    _LOAD_INFLIGHT_BYTES.set(value)
+
+
+def observe_watcher_load(recipe: str, seconds: float) -> None:
+    """Record the duration of one watcher load."""
+    _ensure_load_queue_initialized()
+    if _LOAD_DURATION is None:
+        return
+    _LOAD_DURATION.labels(recipe=recipe).observe(seconds)
+
+
 def generate_latest() -> tuple[bytes, str]:
     """Return Prometheus exposition (data, content_type) for the registry.
 
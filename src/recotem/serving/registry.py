@@ -1,28 +1,47 @@
 """ModelRegistry and ModelEntry for the Recotem serving layer.
 
-The registry is a ``dict[str, ModelEntry]`` guarded by a ``threading.Lock``.
-All public methods are synchronous (no asyncio) — FastAPI route handlers run
-in a threadpool so they can acquire the lock without blocking the event loop.
+Every inference request looks its recipe up, so reads must not contend.
+The registry therefore publishes a copy-on-write snapshot: an immutable
+``(entries, loaded_count, standby_count)`` tuple held in one attribute.
+
+* Readers (``get``, ``list``, ``names``, ``loaded_count``, ``availability``,
+  ``health_*``) take no lock.  They read the snapshot reference once and
+  work on that object, so a reader always sees one consistent generation.
+* Writers (``replace``, ``replace_if``, ``replace_with_marker``, ``remove``)
+  are serialized by a plain ``threading.Lock``.  They copy the mapping,
+  apply their change and publish the new snapshot with a single reference
+  assignment, which is atomic under the GIL.  A published mapping is never
+  mutated again.
+
+Copying costs O(recipes) per write, which is negligible next to loading a
+model.  ``set_load_error`` and ``update_loaded_marker`` annotate an entry in
+place (under the writer lock) without publishing a new snapshot.
 
 A plain ``threading.Lock`` (non-reentrant) is sufficient because no public
-method calls another public method while holding the lock.  Every method
-acquires ``self._lock`` exactly once on entry and releases it on exit.
+method calls another public method while holding the lock.
 
 Atomic replace strategy
 -----------------------
-``replace(name, entry)`` acquires the lock, drops the old reference, and
-inserts the new one.  Python's GIL plus the Lock means in-flight request
-threads that already hold the old ``ModelEntry`` reference continue safely
-until they finish — there is no shared mutable state between the old and new
-entries.
+``replace(name, entry)`` publishes a snapshot in which *name* maps to the new
+entry.  In-flight request threads that already hold the old ``ModelEntry``
+reference continue safely until they finish — there is no shared mutable
+state between the old and new entries.
+
+Swap listeners
+--------------
+Components that derive state from an entry (e.g. the response cache) register
+a callback with ``add_swap_listener``.  It is invoked with the recipe name
+after every ``replace`` / ``replace_if`` / ``replace_with_marker`` /
+``remove``, *outside* the lock, so a listener may call back into the registry.
 """
 
 from __future__ import annotations
 
 import threading
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 # ---------------------------------------------------------------------------
 # ModelEntry
@@ -57,6 +76,8 @@ class ModelEntry:
         response metadata join.  Built once at model-load
         time by :func:`~recotem.metadata.loader.build_metadata_index` with
         NaN→None normalisation and deny-list filtering already applied.
+        Its ``parts`` attribute holds each item's response JSON pre-encoded,
+        which the router splices into the response body.
         ``None`` when no item_metadata is configured for this recipe.
     last_load_error:
         If the most recent load attempt failed, this holds the error string.
@@ -71,6 +92,11 @@ class ModelEntry:
         which recipes are not serving, and the v1 inference endpoints
         (``:recommend``, ``:recommend-related``, ``:batch-recommend``,
         ``:batch-recommend-related``) should reject them with 503.
+    standby:
+        ``True`` for a recipe that is known but not resident: with
+        ``RECOTEM_MODEL_MEMORY_BUDGET`` set, recipes start on standby and
+        return to it when evicted.  Such an entry has ``loaded=False`` and no
+        recommender; it is loaded on its next request and is not a failure.
     """
 
     name: str
@@ -90,6 +116,13 @@ class ModelEntry:
     # Optional artifact-derived metadata used by /v1/recipes/{name}.
     config_digest: str = ""
     algorithms: list[str] = field(default_factory=list)
+    standby: bool = False
+    # Size of the unpickled payload; a floor for the memory footprint
+    # estimate of lazily loaded models.
+    payload_bytes: int = 0
+    # HMAC stored in the loaded artifact.  The watcher compares it with a
+    # header-only read to recognise a re-upload of the same artifact.
+    hmac_digest: bytes = b""
 
     # --- v1 API additions ---
     @property
@@ -152,6 +185,8 @@ class ModelEntry:
     def health_dict(self) -> dict[str, Any]:
         """Summarise entry state for the ``/health`` endpoint."""
         d: dict[str, Any] = {"loaded": self.loaded}
+        if self.standby:
+            d["standby"] = True
         if self.trained_at:
             d["trained_at"] = self.trained_at
         if self.best_class:
@@ -187,8 +222,30 @@ class ModelEntry:
 # ---------------------------------------------------------------------------
 
 
+class _Snapshot(NamedTuple):
+    """One published generation of the registry; never mutated."""
+
+    entries: dict[str, ModelEntry]
+    loaded: int
+    standby: int
+
+
+def _loaded_delta(old: ModelEntry | None, new: ModelEntry | None) -> int:
+    """Net change in the loaded count when *old* is replaced by *new*."""
+    was = old is not None and old.loaded
+    now = new is not None and new.loaded
+    return int(now) - int(was)
+
+
+def _standby_delta(old: ModelEntry | None, new: ModelEntry | None) -> int:
+    """Net change in the standby count when *old* is replaced by *new*."""
+    was = old is not None and old.standby
+    now = new is not None and new.standby
+    return int(now) - int(was)
+
+
 class ModelRegistry:
-    """Thread-safe name → ModelEntry registry.
+    """Thread-safe name → ModelEntry registry with lock-free reads.
 
     Methods
     -------
@@ -196,51 +253,66 @@ class ModelRegistry:
     list() → list[ModelEntry]
     replace(name, entry)
         Atomically replace (or insert) the entry for *name*.
+    replace_if(name, expected, entry) → bool
+        Replace the entry for *name* only if it is still *expected*.
     remove(name)
         Remove the entry for *name* if present.
     health_snapshot() → dict[str, Any]
         Return a shallow copy of the health state of all entries.
+    add_swap_listener(callback)
+        Call ``callback(name)`` after each replace / remove of *name*.
     """
 
     def __init__(self) -> None:
-        self._entries: dict[str, ModelEntry] = {}
-        # Plain Lock is sufficient: no public method calls another public
-        # method while holding the lock (no reentrant code paths).
+        # Read without a lock; replaced (never mutated) by writers.  The
+        # loaded count travels with the mapping so loaded_count() is O(1)
+        # and always consistent with it.
+        self._snapshot = _Snapshot({}, 0, 0)
+        # Serializes writers only.  Plain Lock is sufficient: no public
+        # method calls another public method while holding it.
         self._lock = threading.Lock()
-        # Maintained atomically inside the lock on every mutation that changes
-        # entry.loaded; enables O(1) loaded_count() without an O(N) walk.
-        self._loaded_count: int = 0
+        # Copy-on-write as well, so notification never takes the lock.
+        self._swap_listeners: tuple[Callable[[str], None], ...] = ()
 
     # ------------------------------------------------------------------
     # Core CRUD
     # ------------------------------------------------------------------
 
     def get(self, name: str) -> ModelEntry | None:
-        """Return the entry for *name*, or ``None`` if not present."""
-        with self._lock:
-            return self._entries.get(name)
+        """Return the entry for *name*, or ``None`` if not present (lock-free)."""
+        return self._snapshot.entries.get(name)
 
     def list(self) -> list[ModelEntry]:
         """Return a snapshot list of all current entries."""
-        with self._lock:
-            return list(self._entries.values())
+        return list(self._snapshot.entries.values())
 
     def replace(self, name: str, entry: ModelEntry) -> None:
         """Atomically replace (or insert) the entry for *name*.
 
         The previous entry — if any — is dereferenced; its memory is
         reclaimed once all in-flight request threads drop their references.
-        ``_loaded_count`` is updated under the same lock.
+        The loaded count is published in the same snapshot.
+        """
+        with self._lock:
+            self._publish(name, entry)
+        self._notify_swap(name)
+
+    def replace_if(
+        self, name: str, expected: ModelEntry | None, entry: ModelEntry
+    ) -> bool:
+        """Replace the entry for *name* only if it is still *expected*.
+
+        Compare-and-swap on object identity, for writers that decided on a
+        replacement outside the lock (the on-demand loader, the evictor) and
+        must not clobber a newer entry published meanwhile by the watcher.
+        Returns True when *entry* was published.
         """
         with self._lock:
-            old = self._entries.get(name)
-            old_loaded = old.loaded if old is not None else False
-            self._entries[name] = entry
-            # Adjust counter by the net change in loaded-ness.
-            if entry.loaded and not old_loaded:
-                self._loaded_count += 1
-            elif not entry.loaded and old_loaded:
-                self._loaded_count -= 1
+            if self._snapshot.entries.get(name) is not expected:
+                return False
+            self._publish(name, entry)
+        self._notify_swap(name)
+        return True
 
     def replace_with_marker(
         self, name: str, entry: ModelEntry, marker: tuple[Any, str]
@@ -248,45 +320,71 @@ class ModelRegistry:
         """Atomically replace entry AND set its ``_loaded_marker`` in one lock.
 
         Compared to calling ``replace()`` followed by ``update_loaded_marker()``,
-        this method holds the lock across both mutations so readers iterating
-        ``list()`` between the two ops can never observe a fresh recommender
-        with a stale ``_loaded_marker``.  ``_loaded_count`` is kept consistent
-        under the same lock.
+        the marker is set before the entry is published, so readers iterating
+        ``list()`` can never observe a fresh recommender with a stale
+        ``_loaded_marker``.
         """
         with self._lock:
-            old = self._entries.get(name)
-            old_loaded = old.loaded if old is not None else False
+            # Set before publication: no reader can see the entry without it.
             entry._loaded_marker = marker
-            self._entries[name] = entry
-            if entry.loaded and not old_loaded:
-                self._loaded_count += 1
-            elif not entry.loaded and old_loaded:
-                self._loaded_count -= 1
+            self._publish(name, entry)
+        self._notify_swap(name)
 
     def remove(self, name: str) -> None:
         """Remove the entry for *name*.  No-op if not present.
 
-        Decrements ``_loaded_count`` when a loaded entry is removed.
+        The loaded count drops when a loaded entry is removed.
+        """
+        with self._lock:
+            old = self._publish(name, None)
+        if old is not None:
+            self._notify_swap(name)
+
+    def add_swap_listener(self, callback: Callable[[str], None]) -> None:
+        """Register *callback* to run after *name*'s entry is replaced or removed.
+
+        Listeners run synchronously on the mutating thread (usually the
+        watcher), outside the registry lock, in registration order.  They
+        must be cheap and must not raise.
         """
         with self._lock:
-            old = self._entries.pop(name, None)
-            if old is not None and old.loaded:
-                self._loaded_count -= 1
+            self._swap_listeners = (*self._swap_listeners, callback)
+
+    def _notify_swap(self, name: str) -> None:
+        for callback in self._swap_listeners:
+            callback(name)
+
+    def _publish(self, name: str, entry: ModelEntry | None) -> ModelEntry | None:
+        """Publish a snapshot with *name* set to *entry* (removed if None).
+
+        Caller must hold ``self._lock``.  Returns the previous entry.
+        """
+        snapshot = self._snapshot
+        entries = dict(snapshot.entries)
+        old = entries.pop(name, None) if entry is None else entries.get(name)
+        if entry is not None:
+            entries[name] = entry
+        self._snapshot = _Snapshot(
+            entries,
+            snapshot.loaded + _loaded_delta(old, entry),
+            snapshot.standby + _standby_delta(old, entry),
+        )
+        return old
 
     def set_load_error(self, name: str, error: str | None) -> bool:
         """Record the latest artifact-load failure (if any) on the entry.
 
-        Holds the registry lock so the watcher's failure annotation never
-        races with ``replace()`` / readers iterating ``list()``.  Returns
+        Holds the writer lock so the annotation never lands on an entry that
+        a concurrent ``replace()`` is about to drop.  Returns
         True when the entry exists, False when there is nothing to mark
         (caller can decide whether that is worth logging).
 
         Note: ``set_load_error`` does NOT change ``entry.loaded``; it only
         annotates a stale-but-loaded entry with an error string.  Therefore
-        ``_loaded_count`` is not adjusted here.
+        the loaded count is not adjusted here.
         """
         with self._lock:
-            entry = self._entries.get(name)
+            entry = self._snapshot.entries.get(name)
             if entry is None:
                 return False
             entry.last_load_error = error
@@ -301,7 +399,7 @@ class ModelRegistry:
         lock.
         """
         with self._lock:
-            entry = self._entries.get(name)
+            entry = self._snapshot.entries.get(name)
             if entry is None:
                 return False
             entry._loaded_marker = marker
@@ -314,47 +412,47 @@ class ModelRegistry:
     def loaded_count(self) -> int:
         """Return the number of currently loaded (``loaded=True``) entries.
 
-        O(1) — maintained atomically inside the lock by every mutation that
-        changes the ``loaded`` boolean.  Safe to call from multiple threads.
+        O(1) — published with every snapshot by the mutation that changed
+        it.  Lock-free and safe to call from multiple threads.
         """
-        with self._lock:
-            return self._loaded_count
+        return self._snapshot.loaded
 
     def health_counts(self) -> tuple[int, int]:
-        """Return ``(loaded, total)`` under a single lock acquisition.
+        """Return ``(loaded, total)`` from a single snapshot.
 
         Avoids the TOCTOU window between a separate ``loaded_count()`` and
         ``health_snapshot()`` call in the ``/v1/health`` handler: both
-        numbers are read atomically so they are guaranteed to be consistent
+        numbers come from one published snapshot, so they are consistent
         with each other even if a hot-swap occurs between calls.
         """
-        with self._lock:
-            return self._loaded_count, len(self._entries)
+        snapshot = self._snapshot
+        return snapshot.loaded, len(snapshot.entries)
+
+    def availability(self) -> tuple[int, int, int]:
+        """Return ``(loaded, standby, total)`` from a single snapshot.
+
+        Like :meth:`health_counts`, plus the number of standby entries, which
+        are healthy although not loaded.
+        """
+        snapshot = self._snapshot
+        return snapshot.loaded, snapshot.standby, len(snapshot.entries)
 
     def health_snapshot(self) -> dict[str, dict[str, Any]]:
         """Return per-recipe health info (safe copy, no model objects).
 
-        The snapshot is taken in two phases to minimise lock hold time:
-
-        1. Under the lock: copy ``(name, entry)`` pairs into a local list.
-           This is O(N) in item count but performs no per-entry work.
-        2. Outside the lock: call ``entry.health_dict()`` for each entry.
+        Entries come from one published snapshot, read without a lock.
 
         ``health_dict()`` reads only immutable fields (``loaded``,
         ``trained_at``, ``best_class``, ``kid``) plus ``last_load_error``
         which is a single reference assignment — bytecode-atomic on CPython.
-        A concurrent ``set_load_error`` between steps 1 and 2 may cause the
-        snapshot to reflect either the old or the new error string, but never
-        a partially-written value.  This is a deliberate trade-off: ``/health``
-        is a monitoring endpoint, not a consistency primitive.
+        A concurrent ``set_load_error`` may cause the snapshot to reflect
+        either the old or the new error string, but never a partially-written
+        value.  This is a deliberate trade-off: ``/health`` is a monitoring
+        endpoint, not a consistency primitive.
         """
-        with self._lock:
-            items = list(self._entries.items())
-        # Build the dict outside the lock so /health cannot block `:recommend`
-        # threads waiting to acquire the lock.
-        return {name: entry.health_dict() for name, entry in items}
+        entries = self._snapshot.entries
+        return {name: entry.health_dict() for name, entry in entries.items()}
 
     def names(self) -> list[str]:
         """Return a sorted list of currently registered recipe names."""
-        with self._lock:
-            return sorted(self._entries.keys())
+        return sorted(self._snapshot.entries)
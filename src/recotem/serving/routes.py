@@ -2,43 +2,74 @@
 
 The router is mounted at ``/v1`` by ``serving/app.py`` and exposes the
 ``:recommend``, ``:recommend-related``, ``:batch-recommend``,
-``:batch-recommend-related`` colon-verb endpoints alongside the
-``/recipes`` discovery, ``/health``, and (optional) ``/metrics`` routes.
+``:batch-recommend-related`` and ``:stream-recommend`` colon-verb endpoints
+alongside the ``/recipes`` discovery, ``/health``, and (optional)
+``/metrics`` routes.
+
+The batch verbs validate every element first and then score all valid
+elements together (one score block per batch for ``IDMappedRecommender``),
+falling back to per-element scoring for other recommender types.
+``:stream-recommend`` applies the same scoring to an NDJSON body one chunk
+of lines at a time and streams NDJSON results back, so its memory does not
+grow with the number of users.
+
+The four inference verbs are ``async`` handlers.  Recipe lookup and the
+response-cache check run on the event loop; everything else (scoring and
+encoding) is dispatched to the recipe's own executor (see
+``recotem.serving.bulkhead``) so one slow recipe cannot starve the others.
+Dispatch first passes admission control (``recotem.serving.admission``):
+over its cap a request is shed with ``429 OVERLOADED`` and ``Retry-After``.
+Each handler stage is timed through ``recotem.serving.timing``.  A client
+that asks for ``application/vnd.apache.arrow.stream`` or
+``application/msgpack`` gets columnar results instead of JSON (see
+``recotem.serving.columnar``).
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import hashlib
+import json
 import math
 import time
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
 from contextlib import contextmanager
-from typing import Any
+from typing import Any, NamedTuple
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
 from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 
+from recotem._idmap import IDMappedRecommender
 from recotem.config import ApiKeyEntry
+from recotem.serving import columnar as _columnar
+from recotem.serving import encoding as _encoding
 from recotem.serving import metrics as _metrics
-from recotem.serving.auth import verify_api_key
+from recotem.serving.admission import AdmissionController, AdmissionRejected
+from recotem.serving.auth import VerifiedKeyCache, verify_api_key
+from recotem.serving.bulkhead import RecipeExecutors
+from recotem.serving.cache import CacheKey, ResponseCache, response_cache_key
+from recotem.serving.coalescer import RecommendCoalescer
+from recotem.serving.lazy import LazyModelLoader
 from recotem.serving.registry import ModelEntry, ModelRegistry
 from recotem.serving.schemas import (
     BATCH_AGGREGATE_LIMIT,
+    STREAM_MAX_LINE_BYTES,
     BatchRecommendRelatedRequest,
     BatchRecommendRequest,
     BatchRecommendResponse,
     BatchResultErr,
-    BatchResultOk,
     ErrorCode,
     ErrorDetail,
     RecipeDetailResponse,
     RecipesListResponse,
-    RecommendItem,
     RecommendRelatedRequest,
     RecommendRequest,
     RecommendResponse,
 )
+from recotem.serving.timing import NULL_TIMINGS, NullStageTimings, StageTimings
 
 logger = structlog.get_logger(__name__)
 
@@ -48,6 +79,18 @@ logger = structlog.get_logger(__name__)
 # ``_``/``-`` characters because the recipe loader already accepts them.
 _RECIPE_NAME_RE = r"^[A-Za-z0-9_-]{1,64}$"
 
+# Binary encodings negotiated via ``Accept`` (see ``recotem.serving.columnar``).
+_COLUMNAR_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "content": {
+            _columnar.ARROW_STREAM_MEDIA_TYPE: {},
+            _columnar.MSGPACK_MEDIA_TYPE: {},
+        },
+        "description": "JSON by default; Arrow IPC or MessagePack columns "
+        "(`index`, `item_id`, `score`) when the `Accept` header asks for them.",
+    }
+}
+
 # ---------------------------------------------------------------------------
 # Batch validation helpers
 # ---------------------------------------------------------------------------
@@ -94,19 +137,132 @@ def make_router(
     registry: ModelRegistry,
     api_keys: list[ApiKeyEntry],
     insecure_no_auth: bool = False,
+    response_cache: ResponseCache | None = None,
+    coalescer: RecommendCoalescer | None = None,
+    api_key_cache: VerifiedKeyCache | None = None,
+    executors: RecipeExecutors | None = None,
+    admission: AdmissionController | None = None,
+    server_timing: bool = False,
+    stream_chunk_size: int = 256,
+    lazy_loader: LazyModelLoader | None = None,
 ) -> APIRouter:
     router = APIRouter()
 
     # S5: distinguish explicit --insecure-no-auth from "no keys configured".
     _bypass_mode = "insecure_no_auth" if insecure_no_auth else "loopback_no_keys"
 
+    # Stage timing is decided once: with neither the histogram nor the
+    # Server-Timing header wanted, handlers get the no-op NULL_TIMINGS.
+    _record_stage_metrics = _metrics.metrics_enabled()
+    _stage_timing = _record_stage_metrics or server_timing
+
+    def _stage_timings(request: Request) -> StageTimings | NullStageTimings:
+        if not _stage_timing:
+            return NULL_TIMINGS
+        timings = StageTimings(_record_stage_metrics, server_timing)
+        auth_seconds = getattr(request.state, "auth_seconds", None)
+        if auth_seconds is not None:
+            timings.add("auth", auth_seconds)
+        return timings
+
+    async def _dispatch(
+        recipe: str,
+        weight: int,
+        status_holder: list[str],
+        timings: StageTimings | NullStageTimings,
+        fn: Callable[..., Any],
+        *args: Any,
+    ) -> Any:
+        """Admit *weight* units of work for *recipe*, then run ``fn(*args)``.
+
+        Scoring runs off the event loop: on the recipe's own executor when
+        bulkheads are configured, else on Starlette's shared threadpool.  A
+        request over an admission cap is shed with ``429 OVERLOADED``.
+        """
+        if timings.enabled:
+            fn = _timed_queue(timings, fn)
+        if admission is None:
+            return await _run_scoring(recipe, fn, *args)
+        try:
+            return await _run_admitted(admission, recipe, weight, fn, *args)
+        except AdmissionRejected as exc:
+            status_holder[0] = "overloaded"
+            logger.debug("request_shed", recipe=recipe, scope=exc.scope, weight=weight)
+            raise HTTPException(
+                status_code=429,
+                detail={
+                    "detail": "server overloaded, retry later",
+                    "code": "OVERLOADED",
+                },
+                headers={"Retry-After": str(exc.retry_after_seconds)},
+            ) from None
+
+    def _timed_queue(
+        timings: StageTimings | NullStageTimings, fn: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        """Wrap *fn* so the wait between dispatch and start counts as ``queue``."""
+        submitted = time.perf_counter()
+
+        def timed(*args: Any) -> Any:
+            timings.add("queue", time.perf_counter() - submitted)
+            return fn(*args)
+
+        return timed
+
+    async def _run_admitted(
+        controller: AdmissionController,
+        recipe: str,
+        weight: int,
+        fn: Callable[..., Any],
+        *args: Any,
+    ) -> Any:
+        """Run ``fn(*args)`` holding *weight* units of admission until it ends.
+
+        A client disconnect cancels the await but not the scoring already
+        handed to a thread, so the weight is released when that work
+        finishes (the executor future's done-callback), not when the
+        handler stops waiting.
+        """
+        held = controller.acquire(recipe, weight)
+        if executors is not None:
+            return await executors.run(
+                recipe,
+                fn,
+                *args,
+                on_done=lambda: controller.release(recipe, held),
+            )
+        try:
+            # run_in_threadpool only returns, even when cancelled, once the
+            # thread has finished.
+            return await run_in_threadpool(contextvars.copy_context().run, fn, *args)
+        finally:
+            controller.release(recipe, held)
+
+    async def _run_scoring(recipe: str, fn: Callable[..., Any], *args: Any) -> Any:
+        if executors is not None:
+            return await executors.run(recipe, fn, *args)
+        return await run_in_threadpool(contextvars.copy_context().run, fn, *args)
+
     def _require_auth(request: Request) -> str:
-        return verify_api_key(request, api_keys, bypass_mode=_bypass_mode)
+        if not _stage_timing:
+            return verify_api_key(
+                request, api_keys, bypass_mode=_bypass_mode, cache=api_key_cache
+            )
+        started = time.perf_counter()
+        try:
+            return verify_api_key(
+                request, api_keys, bypass_mode=_bypass_mode, cache=api_key_cache
+            )
+        finally:
+            request.state.auth_seconds = time.perf_counter() - started
 
-    def _resolve_entry(
+    async def _resolve_entry(
         name: str, request_id: str, kid: str, status_holder: list[str]
     ) -> ModelEntry:
         entry = registry.get(name)
+        if entry is not None and entry.standby and lazy_loader is not None:
+            # Cold start: wait for the (shared) on-demand load.
+            entry = await asyncio.wrap_future(lazy_loader.ensure(name))
         if entry is None:
             status_holder[0] = "recipe_not_found"
             logger.warning(
@@ -137,10 +293,17 @@ def make_router(
                     "code": "RECIPE_UNAVAILABLE",
                 },
             )
+        if lazy_loader is not None:
+            lazy_loader.touch(name)
         return entry
 
     @contextmanager
-    def _request_metrics(recipe: str, verb: str, kid: str) -> Iterator[list[str]]:
+    def _request_metrics(
+        recipe: str,
+        verb: str,
+        kid: str,
+        timings: StageTimings | NullStageTimings = NULL_TIMINGS,
+    ) -> Iterator[list[str]]:
         start = time.monotonic()
         structlog.contextvars.bind_contextvars(recipe=recipe, kid=kid)
         status_holder: list[str] = ["error"]
@@ -150,6 +313,7 @@ def make_router(
             _metrics.record_v1_request(
                 recipe, verb, status_holder[0], time.monotonic() - start
             )
+            timings.observe(recipe, verb)
             structlog.contextvars.unbind_contextvars("recipe", "kid")
 
     def _build_items(
@@ -158,56 +322,89 @@ def make_router(
         meta_index: dict[str, Any] | None,
         recipe_name: str = "",
         verb: str = "",
-    ) -> tuple[list[RecommendItem], int, int]:
-        """Build the item list for a recommend response.
+    ) -> tuple[list[bytes], int, int]:
+        """Build the JSON-encoded item list for a recommend response.
+
+        ``exclude`` has normally been masked inside scoring already (see
+        ``_exclude_kwargs``); filtering again here keeps the contract for
+        recommenders that ignore exclusions.
+
+        Items are spliced from pre-encoded pieces (see
+        ``recotem.serving.encoding``) rather than validated one by one.  An
+        item whose metadata could not be encoded is served with only
+        ``item_id`` and ``score`` (fallback); an item whose id or score
+        violates the ``RecommendItem`` constraints is dropped.
 
         Returns ``(items, fallback_count, dropped_count)``.  The caller is
         responsible for setting ``X-Recotem-Items-Degraded`` and incrementing
         the degraded-items metrics when either count is non-zero.
         """
-        items: list[RecommendItem] = []
+        kept, dropped_count = _kept_items(raw_results, exclude, recipe_name, verb)
         fallback_count = 0
+        scores = _encoding.encode_scores([score for _, score in kept])
+        item_parts = _encoding.item_parts_lookup(meta_index)
+        items: list[bytes] = []
+        for (item_id, _), score_json in zip(kept, scores, strict=True):
+            parts = item_parts(item_id)
+            if parts is None:
+                _log_serialization_failure(
+                    item_id, "metadata is not JSON-encodable", recipe_name, verb
+                )
+                # Fallback: serve item with only item_id and score.
+                parts = _encoding.bare_item_parts(item_id)
+                fallback_count += 1
+            head, tail = parts
+            items.append(head + score_json + tail)
+        return items, fallback_count, dropped_count
+
+    def _kept_items(
+        raw_results: list[tuple[str, float]],
+        exclude: frozenset[str],
+        recipe_name: str,
+        verb: str,
+    ) -> tuple[list[tuple[str, float]], int]:
+        """Drop excluded items and items violating ``RecommendItem``.
+
+        Returns ``(kept, dropped_count)``; excluded items are not counted.
+        """
+        kept: list[tuple[str, float]] = []
         dropped_count = 0
         for item_id, score in raw_results:
             if item_id in exclude:
                 continue
-            fields: dict[str, Any] = {}
-            if meta_index is not None:
-                fields.update(meta_index.get(item_id, {}))
-            fields["item_id"] = item_id
-            fields["score"] = float(score)
-            try:
-                items.append(RecommendItem.model_validate(fields))
-            except ValidationError as exc:
-                logger.warning(
-                    "metadata_serialization_failed",
-                    item_id=str(item_id),
-                    error=str(exc)[:200],
-                    recipe=recipe_name,
+            score = float(score)
+            if not _encoding.valid_item(item_id, score):
+                _log_serialization_failure(
+                    item_id, "item_id or score out of range", recipe_name, verb
                 )
-                if recipe_name:
-                    _metrics.inc_metadata_serialization_error(recipe_name, verb)
-                # Fallback: serve item with only item_id and score.
-                bare: dict[str, Any] = {"item_id": item_id, "score": float(score)}
-                try:
-                    items.append(RecommendItem.model_validate(bare))
-                    fallback_count += 1
-                except ValidationError:
-                    # Even bare item fails (e.g. invalid item_id) — drop it.
-                    dropped_count += 1
-        return items, fallback_count, dropped_count
+                dropped_count += 1
+                continue
+            kept.append((item_id, score))
+        return kept, dropped_count
+
+    def _log_serialization_failure(
+        item_id: object, error: str, recipe_name: str, verb: str
+    ) -> None:
+        logger.warning(
+            "metadata_serialization_failed",
+            item_id=str(item_id)[:256],
+            error=error,
+            recipe=recipe_name,
+        )
+        if recipe_name:
+            _metrics.inc_metadata_serialization_error(recipe_name, verb)
 
     def _apply_build_items_degraded(
-        items_result: tuple[list[RecommendItem], int, int],
-        response: Response,
+        items_result: tuple[list[bytes], int, int],
+        headers: dict[str, str],
         recipe_name: str,
         verb: str,
-    ) -> list[RecommendItem]:
+    ) -> list[bytes]:
         """Apply degraded-item side-effects and return the item list."""
         items, fallback_count, dropped_count = items_result
         degraded = fallback_count + dropped_count
         if degraded > 0:
-            response.headers["X-Recotem-Items-Degraded"] = str(degraded)
+            headers["X-Recotem-Items-Degraded"] = str(degraded)
         if fallback_count > 0:
             _metrics.inc_metadata_degraded_items(
                 recipe_name, verb, "fallback", fallback_count
@@ -218,6 +415,55 @@ def make_router(
             )
         return items
 
+    def _recommend_response(
+        entry: ModelEntry,
+        items_result: tuple[list[bytes], int, int],
+        request_id: str,
+        name: str,
+        verb: str,
+        status_holder: list[str],
+    ) -> Response:
+        """Finish a single-verb response from a built (or cached) item list.
+
+        The body is returned pre-encoded, bypassing ``response_model``
+        re-validation; ``RecommendResponse`` still documents the schema.
+        """
+        headers: dict[str, str] = {}
+        items = _apply_build_items_degraded(items_result, headers, name, verb)
+        status_holder[0] = "ok"
+        headers["X-Recotem-Model-Version"] = entry.model_version
+        body = _encoding.recommend_body(request_id, name, entry.model_version, items)
+        return _encoding.json_response(body, headers)
+
+    def _columnar_recommend_response(
+        entry: ModelEntry,
+        raw_results: list[tuple[str, float]],
+        exclude_items: list[str] | None,
+        negotiated: _columnar.Negotiated,
+        request_id: str,
+        name: str,
+        verb: str,
+        status_holder: list[str],
+    ) -> Response:
+        """Encode a single-verb result as Arrow IPC or MessagePack columns."""
+        exclude = frozenset(exclude_items) if exclude_items else frozenset()
+        kept, dropped = _kept_items(raw_results, exclude, name, verb)
+        headers = {"X-Recotem-Model-Version": entry.model_version}
+        if dropped:
+            headers["X-Recotem-Items-Degraded"] = str(dropped)
+            _metrics.inc_metadata_degraded_items(name, verb, "dropped", dropped)
+        results = _columnar.ColumnarResults()
+        results.add_items(0, kept)
+        status_holder[0] = "ok"
+        return _columnar.columnar_response(
+            negotiated, results, request_id, name, entry.model_version, headers
+        )
+
+    def _negotiate(request: Request) -> _columnar.Negotiated:
+        return _columnar.negotiate(
+            request.headers.get("accept"), request.headers.get("accept-encoding")
+        )
+
     def _any_seed_known(
         entry: ModelEntry, seed_items: list[str], name: str
     ) -> bool | None:
@@ -247,15 +493,23 @@ def make_router(
     @router.get("/health", summary="Overall health status (probe-safe)")
     def health(response: Response) -> dict[str, Any]:
         # Intentional design difference vs /health/details: this probe endpoint
-        # uses count-based degraded detection (loaded < total) under a single
-        # lock acquisition so the two numbers are consistent with each other.
+        # uses count-based degraded detection (loaded < total) from a single
+        # registry snapshot so the numbers are consistent with each other.
+        # Standby recipes (lazy loading) are healthy without being loaded.
         # /health/details performs a per-recipe error scan for richer operator
         # diagnostics; see health_details below.
-        loaded_count, total = registry.health_counts()
-        overall = "ok" if total == 0 or loaded_count == total else "degraded"
+        loaded_count, standby, total = registry.availability()
+        overall = "ok" if loaded_count + standby == total else "degraded"
         if overall == "degraded":
             response.status_code = 503
-        return {"status": overall, "total": total, "loaded": loaded_count}
+        body: dict[str, Any] = {
+            "status": overall,
+            "total": total,
+            "loaded": loaded_count,
+        }
+        if standby:
+            body["standby"] = standby
+        return body
 
     @router.get(
         "/health/details",
@@ -274,7 +528,10 @@ def make_router(
             snapshot = registry.health_snapshot()
             overall = "ok"
             for entry_health in snapshot.values():
-                if not entry_health.get("loaded", True) or entry_health.get("error"):
+                available = entry_health.get("loaded", True) or entry_health.get(
+                    "standby", False
+                )
+                if not available or entry_health.get("error"):
                     overall = "degraded"
                     break
             if overall == "degraded":
@@ -298,100 +555,281 @@ def make_router(
             finally:
                 structlog.contextvars.unbind_contextvars("kid")
 
+    def _recommend_scored(
+        entry: ModelEntry,
+        name: str,
+        body: RecommendRequest,
+        cache_key: CacheKey | None,
+        request_id: str,
+        status_holder: list[str],
+        negotiated: _columnar.Negotiated,
+        timings: StageTimings | NullStageTimings,
+    ) -> Response:
+        """Score and encode a ``:recommend`` cache miss (runs on the executor)."""
+        verb = "recommend"
+
+        with timings.stage("score"):
+            # S1: determine known-membership BEFORE calling irspack so a
+            # genuine missing user produces UNKNOWN_USER, not INTERNAL_ERROR.
+            # Returns None when the recommender layout is unexpected (F4).
+            try:
+                user_known: bool | None = (
+                    body.user_id in entry.recommender._mapper.user_id_to_index
+                )
+            except AttributeError as _attr_exc:
+                # Unexpected recommender layout — mirror _any_seed_known sentinel.
+                logger.warning(
+                    "recommender_layout_unexpected",
+                    recipe=name,
+                    verb=verb,
+                    exc_type=type(_attr_exc).__name__,
+                )
+                _metrics.inc_recommender_layout_unexpected(name)
+                user_known = (
+                    None  # let irspack decide; None → INTERNAL_ERROR on KeyError
+                )
+
+            try:
+                raw_results: list[tuple[str, float]]
+                if (
+                    coalescer is not None
+                    and user_known
+                    and isinstance(entry.recommender, IDMappedRecommender)
+                    and coalescer.enabled_for(name)
+                ):
+                    # Share one score block with concurrent calls; only
+                    # known users are parked so UNKNOWN_USER stays fast.
+                    raw_results = coalescer.recommend(
+                        name,
+                        entry,
+                        body.user_id,
+                        body.limit,
+                        body.exclude_items,
+                    )
+                else:
+                    raw_results = (
+                        entry.recommender.get_recommendation_for_known_user_id(
+                            body.user_id,
+                            body.limit,
+                            **_exclude_kwargs(body.exclude_items),
+                        )
+                    )
+            except KeyError:
+                if user_known is False:
+                    # Deterministic miss: user was not in the id-map.
+                    status_holder[0] = "unknown_user"
+                    raise HTTPException(
+                        status_code=404,
+                        detail={
+                            "detail": "user not seen during training",
+                            "code": "UNKNOWN_USER",
+                        },
+                    ) from None
+                # user_known is True or None (unexpected layout): propagate as
+                # INTERNAL_ERROR so layout surprises are visible, not silent.
+                logger.exception(
+                    "recommender_unexpected_key_error",
+                    recipe=name,
+                    verb=verb,
+                    user_id_hash=hashlib.sha256(body.user_id.encode()).hexdigest()[:8],
+                )
+                raise HTTPException(
+                    status_code=500,
+                    detail={
+                        "detail": "internal error",
+                        "code": "INTERNAL_ERROR",
+                    },
+                ) from None
+
+        with timings.stage("encode"):
+            if negotiated.columnar:
+                return _columnar_recommend_response(
+                    entry,
+                    raw_results,
+                    body.exclude_items,
+                    negotiated,
+                    request_id,
+                    name,
+                    verb,
+                    status_holder,
+                )
+            exclude = (
+                frozenset(body.exclude_items) if body.exclude_items else frozenset()
+            )
+            items_result = _build_items(
+                raw_results, exclude, entry.metadata_index, name, verb
+            )
+            if cache_key is not None and response_cache is not None:
+                response_cache.put(name, cache_key, *items_result)
+            return _recommend_response(
+                entry,
+                items_result,
+                request_id,
+                name,
+                verb,
+                status_holder,
+            )
+
+    def _recommend_related_scored(
+        entry: ModelEntry,
+        name: str,
+        body: RecommendRelatedRequest,
+        cache_key: CacheKey | None,
+        request_id: str,
+        status_holder: list[str],
+        negotiated: _columnar.Negotiated,
+        timings: StageTimings | NullStageTimings,
+    ) -> Response:
+        """Score and encode a ``:recommend-related`` cache miss (on the executor)."""
+        verb = "recommend-related"
+
+        with timings.stage("score"):
+            seed_known = _any_seed_known(entry, body.seed_items, name)
+            if seed_known is None:
+                # M1: unexpected recommender layout — propagate as INTERNAL_ERROR.
+                status_holder[0] = "error"
+                raise HTTPException(
+                    status_code=500,
+                    detail={
+                        "detail": "internal error",
+                        "code": "INTERNAL_ERROR",
+                    },
+                )
+            if not seed_known:
+                status_holder[0] = "unknown_seed_items"
+                raise HTTPException(
+                    status_code=404,
+                    detail={
+                        "detail": "no known seed_items",
+                        "code": "UNKNOWN_SEED_ITEMS",
+                    },
+                )
+
+            try:
+                raw_results = entry.recommender.get_recommendation_for_new_user(
+                    body.seed_items,
+                    body.limit,
+                    **_exclude_kwargs(body.exclude_items),
+                )
+            except KeyError:
+                # S1: unexpected KeyError despite seed appearing known.
+                logger.exception(
+                    "recommender_unexpected_key_error",
+                    recipe=name,
+                    verb=verb,
+                    seed_items_count=len(body.seed_items),
+                )
+                raise HTTPException(
+                    status_code=500,
+                    detail={
+                        "detail": "internal error",
+                        "code": "INTERNAL_ERROR",
+                    },
+                ) from None
+
+            if not raw_results:
+                status_holder[0] = "no_candidates"
+                raise HTTPException(
+                    status_code=404,
+                    detail={
+                        "detail": "no candidates produced by ranker",
+                        "code": "NO_CANDIDATES",
+                    },
+                )
+
+        with timings.stage("encode"):
+            if negotiated.columnar:
+                return _columnar_recommend_response(
+                    entry,
+                    raw_results,
+                    body.exclude_items,
+                    negotiated,
+                    request_id,
+                    name,
+                    verb,
+                    status_holder,
+                )
+            exclude = (
+                frozenset(body.exclude_items) if body.exclude_items else frozenset()
+            )
+            items_result = _build_items(
+                raw_results, exclude, entry.metadata_index, name, verb
+            )
+            if cache_key is not None and response_cache is not None:
+                response_cache.put(name, cache_key, *items_result)
+            return _recommend_response(
+                entry,
+                items_result,
+                request_id,
+                name,
+                verb,
+                status_holder,
+            )
+
     @router.post(
         "/recipes/{name}:recommend",
         response_model=RecommendResponse,
+        responses=_COLUMNAR_RESPONSES,
         summary="Recommend items for a single user",
     )
-    def recommend(
+    async def recommend(
         name: str = Path(pattern=_RECIPE_NAME_RE),
         body: RecommendRequest = ...,
         request: Request = ...,
-        response: Response = ...,
         kid: str = Depends(_require_auth),
     ) -> Any:
         request_id = request.state.request_id
         verb = "recommend"
 
-        with _request_metrics(name, verb, kid) as status_holder:
+        timings = _stage_timings(request)
+        negotiated = _negotiate(request)
+
+        with _request_metrics(name, verb, kid, timings) as status_holder:
             try:
-                entry = _resolve_entry(name, request_id, kid, status_holder)
-
-                # S1: determine known-membership BEFORE calling irspack so a
-                # genuine missing user produces UNKNOWN_USER, not INTERNAL_ERROR.
-                # Returns None when the recommender layout is unexpected (F4).
-                try:
-                    user_known: bool | None = (
-                        body.user_id in entry.recommender._mapper.user_id_to_index
-                    )
-                except AttributeError as _attr_exc:
-                    # Unexpected recommender layout — mirror _any_seed_known sentinel.
-                    logger.warning(
-                        "recommender_layout_unexpected",
-                        recipe=name,
-                        verb=verb,
-                        exc_type=type(_attr_exc).__name__,
-                    )
-                    _metrics.inc_recommender_layout_unexpected(name)
-                    user_known = (
-                        None  # let irspack decide; None → INTERNAL_ERROR on KeyError
-                    )
+                with timings.stage("lookup"):
+                    entry = await _resolve_entry(name, request_id, kid, status_holder)
 
-                try:
-                    raw_results: list[tuple[str, float]] = (
-                        entry.recommender.get_recommendation_for_known_user_id(
-                            body.user_id, body.limit
+                    cache_key = None
+                    cached = None
+                    # The cache holds JSON item bytes; binary formats skip it.
+                    if response_cache is not None and not negotiated.columnar:
+                        cache_key = response_cache_key(
+                            entry.model_version,
+                            verb,
+                            body.user_id,
+                            body.limit,
+                            body.exclude_items,
+                            True,
                         )
-                    )
-                except KeyError:
-                    if user_known is False:
-                        # Deterministic miss: user was not in the id-map.
-                        status_holder[0] = "unknown_user"
-                        raise HTTPException(
-                            status_code=404,
-                            detail={
-                                "detail": "user not seen during training",
-                                "code": "UNKNOWN_USER",
-                            },
-                        ) from None
-                    # user_known is True or None (unexpected layout): propagate as
-                    # INTERNAL_ERROR so layout surprises are visible, not silent.
-                    logger.exception(
-                        "recommender_unexpected_key_error",
-                        recipe=name,
-                        verb=verb,
-                        user_id_hash=hashlib.sha256(body.user_id.encode()).hexdigest()[
-                            :8
-                        ],
-                    )
-                    raise HTTPException(
-                        status_code=500,
-                        detail={
-                            "detail": "internal error",
-                            "code": "INTERNAL_ERROR",
-                        },
-                    ) from None
+                        cached = response_cache.get(name, verb, cache_key)
+                if cached is not None:
+                    with timings.stage("encode"):
+                        response = _recommend_response(
+                            entry,
+                            (cached.items, cached.fallback_count, cached.dropped_count),
+                            request_id,
+                            name,
+                            verb,
+                            status_holder,
+                        )
+                    return timings.apply(response)
 
-                exclude = (
-                    frozenset(body.exclude_items) if body.exclude_items else frozenset()
-                )
-                items = _apply_build_items_degraded(
-                    _build_items(
-                        raw_results, exclude, entry.metadata_index, name, verb
-                    ),
-                    response,
+                response = await _dispatch(
                     name,
-                    verb,
-                )
-
-                status_holder[0] = "ok"
-                response.headers["X-Recotem-Model-Version"] = entry.model_version
-                return RecommendResponse(
-                    request_id=request_id,
-                    recipe=name,
-                    model_version=entry.model_version,
-                    items=items,
+                    1,
+                    status_holder,
+                    timings,
+                    _recommend_scored,
+                    entry,
+                    name,
+                    body,
+                    cache_key,
+                    request_id,
+                    status_holder,
+                    negotiated,
+                    timings,
                 )
+                return timings.apply(response)
             except HTTPException:
                 raise
             except (MemoryError, RecursionError):
@@ -402,258 +840,589 @@ def make_router(
     @router.post(
         "/recipes/{name}:recommend-related",
         response_model=RecommendResponse,
+        responses=_COLUMNAR_RESPONSES,
         summary="Recommend items related to a seed list",
     )
-    def recommend_related(
+    async def recommend_related(
         name: str = Path(pattern=_RECIPE_NAME_RE),
         body: RecommendRelatedRequest = ...,
         request: Request = ...,
-        response: Response = ...,
         kid: str = Depends(_require_auth),
     ) -> Any:
         request_id = request.state.request_id
         verb = "recommend-related"
 
-        with _request_metrics(name, verb, kid) as status_holder:
+        timings = _stage_timings(request)
+        negotiated = _negotiate(request)
+
+        with _request_metrics(name, verb, kid, timings) as status_holder:
             try:
-                entry = _resolve_entry(name, request_id, kid, status_holder)
+                with timings.stage("lookup"):
+                    entry = await _resolve_entry(name, request_id, kid, status_holder)
 
-                seed_known = _any_seed_known(entry, body.seed_items, name)
-                if seed_known is None:
-                    # M1: unexpected recommender layout — propagate as INTERNAL_ERROR.
-                    status_holder[0] = "error"
-                    raise HTTPException(
-                        status_code=500,
-                        detail={
-                            "detail": "internal error",
-                            "code": "INTERNAL_ERROR",
-                        },
-                    )
-                if not seed_known:
-                    status_holder[0] = "unknown_seed_items"
-                    raise HTTPException(
-                        status_code=404,
-                        detail={
-                            "detail": "no known seed_items",
-                            "code": "UNKNOWN_SEED_ITEMS",
-                        },
-                    )
+                    cache_key = None
+                    cached = None
+                    # The cache holds JSON item bytes; binary formats skip it.
+                    if response_cache is not None and not negotiated.columnar:
+                        cache_key = response_cache_key(
+                            entry.model_version,
+                            verb,
+                            body.seed_items,
+                            body.limit,
+                            body.exclude_items,
+                            True,
+                        )
+                        cached = response_cache.get(name, verb, cache_key)
+                if cached is not None:
+                    with timings.stage("encode"):
+                        response = _recommend_response(
+                            entry,
+                            (cached.items, cached.fallback_count, cached.dropped_count),
+                            request_id,
+                            name,
+                            verb,
+                            status_holder,
+                        )
+                    return timings.apply(response)
 
-                try:
-                    raw_results = entry.recommender.get_recommendation_for_new_user(
-                        body.seed_items, body.limit
-                    )
-                except KeyError:
-                    # S1: unexpected KeyError despite seed appearing known.
-                    logger.exception(
-                        "recommender_unexpected_key_error",
-                        recipe=name,
-                        verb=verb,
-                        seed_items_count=len(body.seed_items),
-                    )
-                    raise HTTPException(
-                        status_code=500,
-                        detail={
-                            "detail": "internal error",
-                            "code": "INTERNAL_ERROR",
-                        },
-                    ) from None
+                response = await _dispatch(
+                    name,
+                    1,
+                    status_holder,
+                    timings,
+                    _recommend_related_scored,
+                    entry,
+                    name,
+                    body,
+                    cache_key,
+                    request_id,
+                    status_holder,
+                    negotiated,
+                    timings,
+                )
+                return timings.apply(response)
+            except HTTPException:
+                raise
+            except (MemoryError, RecursionError):
+                raise
+            except Exception:
+                raise
 
-                if not raw_results:
-                    status_holder[0] = "no_candidates"
-                    raise HTTPException(
-                        status_code=404,
-                        detail={
-                            "detail": "no candidates produced by ranker",
-                            "code": "NO_CANDIDATES",
-                        },
+    def _batch_ok_entry(
+        idx: int,
+        raw_results: list[tuple[str, float]],
+        exclude_items: list[str] | None,
+        meta: dict[str, Any] | None,
+        name: str,
+        verb: str,
+    ) -> _EncodedResult:
+        exclude = frozenset(exclude_items) if exclude_items else frozenset()
+        items, _fb, _dr = _build_items(raw_results, exclude, meta, name, verb)
+        if _fb:
+            _metrics.inc_metadata_degraded_items(name, verb, "fallback", _fb)
+        if _dr:
+            _metrics.inc_metadata_degraded_items(name, verb, "dropped", _dr)
+        return _EncodedResult(idx, _encoding.batch_ok_json(idx, items))
+
+    def _batch_response(
+        entry: ModelEntry,
+        results: list[_EncodedResult | BatchResultErr],
+        request_id: str,
+        name: str,
+        status_holder: list[str],
+    ) -> Response:
+        """Encode a batch response; ``BatchRecommendResponse`` is its schema."""
+        results.sort(key=lambda r: r.index)
+        status_holder[0] = "ok"
+        body = _encoding.batch_body(
+            request_id,
+            name,
+            entry.model_version,
+            (
+                r.body if isinstance(r, _EncodedResult) else _encoding.json_bytes(r)
+                for r in results
+            ),
+        )
+        return _encoding.json_response(
+            body, {"X-Recotem-Model-Version": entry.model_version}
+        )
+
+    def _columnar_batch_response(
+        entry: ModelEntry,
+        rejected: list[_EncodedResult | BatchResultErr],
+        pending: list[tuple[int, RecommendRequest]]
+        | list[tuple[int, RecommendRelatedRequest]],
+        outcomes: dict[int, list[tuple[str, float]] | BatchResultErr],
+        negotiated: _columnar.Negotiated,
+        request_id: str,
+        name: str,
+        verb: str,
+        status_holder: list[str],
+    ) -> Response:
+        """Encode a batch as Arrow IPC or MessagePack columns.
+
+        *rejected* holds the elements that failed validation; item metadata
+        is never attached.
+        """
+        results = _columnar.ColumnarResults()
+        errors = [r for r in rejected if isinstance(r, BatchResultErr)]
+        dropped_total = 0
+        for idx, single in pending:
+            outcome = outcomes[idx]
+            if isinstance(outcome, BatchResultErr):
+                errors.append(outcome)
+                continue
+            exclude = (
+                frozenset(single.exclude_items) if single.exclude_items else frozenset()
+            )
+            try:
+                kept, dropped = _kept_items(outcome, exclude, name, verb)
+            except (MemoryError, RecursionError):
+                raise
+            except Exception as exc:
+                errors.append(_batch_element_failed(idx, exc, name, verb))
+                continue
+            dropped_total += dropped
+            results.add_items(idx, kept)
+        for err in errors:
+            results.add_error(err.index, err.error.code, err.error.message)
+        if dropped_total:
+            _metrics.inc_metadata_degraded_items(name, verb, "dropped", dropped_total)
+        status_holder[0] = "ok"
+        return _columnar.columnar_response(
+            negotiated,
+            results,
+            request_id,
+            name,
+            entry.model_version,
+            {"X-Recotem-Model-Version": entry.model_version},
+        )
+
+    def _batch_element_failed(
+        idx: int, exc: Exception, name: str, verb: str
+    ) -> BatchResultErr:
+        logger.exception(
+            "batch_element_error",
+            recipe=name,
+            verb=verb,
+            idx=idx,
+            exc_type=type(exc).__name__,
+            exc_module=type(exc).__module__,
+        )
+        _metrics.inc_batch_element_error(name, verb, "INTERNAL_ERROR")
+        return _batch_error_entry(idx, "INTERNAL_ERROR", "internal error")
+
+    def _validate_batch_element(
+        idx: int,
+        raw: Any,
+        model: type[RecommendRequest] | type[RecommendRelatedRequest],
+        name: str,
+        verb: str,
+    ) -> Any:
+        """Validate one batch element; a failure becomes its error entry."""
+        if not isinstance(raw, dict):
+            _metrics.inc_batch_element_error(name, verb, "VALIDATION_ERROR")
+            return _batch_error_entry(
+                idx, "VALIDATION_ERROR", "request must be an object"
+            )
+        try:
+            return model.model_validate(raw)
+        except ValidationError as exc:
+            logger.warning(
+                "batch_element_validation_failed",
+                recipe=name,
+                verb=verb,
+                idx=idx,
+                errors=_sanitize_validation_errors(exc),
+            )
+            _metrics.inc_batch_element_error(name, verb, "VALIDATION_ERROR")
+            return _batch_error_entry(
+                idx, "VALIDATION_ERROR", _format_batch_validation_message(exc)
+            )
+
+    def _encoded_results(
+        pending: list[tuple[int, RecommendRequest]],
+        outcomes: dict[int, list[tuple[str, float]] | BatchResultErr],
+        meta: dict[str, Any] | None,
+        name: str,
+        verb: str,
+    ) -> list[_EncodedResult | BatchResultErr]:
+        """Encode the scored outcome of every pending batch element."""
+        results: list[_EncodedResult | BatchResultErr] = []
+        for idx, single in pending:
+            outcome = outcomes[idx]
+            if isinstance(outcome, BatchResultErr):
+                results.append(outcome)
+                continue
+            try:
+                results.append(
+                    _batch_ok_entry(
+                        idx, outcome, single.exclude_items, meta, name, verb
                     )
+                )
+            except (MemoryError, RecursionError):
+                raise
+            except Exception as exc:
+                results.append(_batch_element_failed(idx, exc, name, verb))
+        return results
 
-                exclude = (
-                    frozenset(body.exclude_items) if body.exclude_items else frozenset()
+    def _recommend_known_user_one(
+        entry: ModelEntry,
+        idx: int,
+        single: RecommendRequest,
+        name: str,
+        verb: str,
+    ) -> list[tuple[str, float]] | BatchResultErr:
+        """Score one batch element on its own (per-element fallback path)."""
+        # F5: initialize user_known per element so stale values from a
+        # previous element cannot leak on future refactors.
+        batch_user_known: bool | None = True
+        try:
+            # S1/F4: check membership before calling irspack.
+            # Returns None when the recommender layout is unexpected.
+            try:
+                batch_user_known = (
+                    single.user_id in entry.recommender._mapper.user_id_to_index
                 )
-                items = _apply_build_items_degraded(
-                    _build_items(
-                        raw_results, exclude, entry.metadata_index, name, verb
-                    ),
-                    response,
-                    name,
-                    verb,
+            except AttributeError as _attr_exc:
+                # Mirror _any_seed_known sentinel: log + metric + None.
+                logger.warning(
+                    "recommender_layout_unexpected",
+                    recipe=name,
+                    verb=verb,
+                    exc_type=type(_attr_exc).__name__,
                 )
+                _metrics.inc_recommender_layout_unexpected(name)
+                batch_user_known = None
 
-                status_holder[0] = "ok"
-                response.headers["X-Recotem-Model-Version"] = entry.model_version
-                return RecommendResponse(
-                    request_id=request_id,
-                    recipe=name,
-                    model_version=entry.model_version,
-                    items=items,
+            return entry.recommender.get_recommendation_for_known_user_id(
+                single.user_id, single.limit, **_exclude_kwargs(single.exclude_items)
+            )
+        except KeyError:
+            if batch_user_known is False:
+                _metrics.inc_batch_element_error(name, verb, "UNKNOWN_USER")
+                return _batch_error_entry(
+                    idx, "UNKNOWN_USER", "user not seen during training"
                 )
-            except HTTPException:
-                raise
+            # batch_user_known is True or None (unexpected layout):
+            # propagate as INTERNAL_ERROR for observability.
+            logger.exception(
+                "recommender_unexpected_key_error",
+                recipe=name,
+                verb=verb,
+                idx=idx,
+            )
+            _metrics.inc_batch_element_error(name, verb, "INTERNAL_ERROR")
+            return _batch_error_entry(idx, "INTERNAL_ERROR", "internal error")
+        except (MemoryError, RecursionError):
+            raise
+        except Exception as exc:
+            return _batch_element_failed(idx, exc, name, verb)
+
+    def _recommend_known_user_batch(
+        entry: ModelEntry,
+        pending: list[tuple[int, RecommendRequest]],
+        name: str,
+        verb: str,
+    ) -> dict[int, list[tuple[str, float]] | BatchResultErr]:
+        """Score every validated batch element, in one matrix call if possible.
+
+        ``IDMappedRecommender`` scores all known users with a single
+        ``get_score_remove_seen`` call.  Any other recommender (or a failure
+        of the batched call) falls back to per-element scoring so that one
+        bad element still yields its own error entry instead of failing the
+        whole batch.
+        """
+        rec = entry.recommender
+        if not isinstance(rec, IDMappedRecommender):
+            return {
+                idx: _recommend_known_user_one(entry, idx, single, name, verb)
+                for idx, single in pending
+            }
+        outcomes: dict[int, list[tuple[str, float]] | BatchResultErr] = {}
+        known: list[tuple[int, RecommendRequest]] = []
+        user_index = rec._mapper.user_id_to_index
+        for idx, single in pending:
+            if single.user_id in user_index:
+                known.append((idx, single))
+            else:
+                outcomes[idx] = _batch_error_entry(
+                    idx, "UNKNOWN_USER", "user not seen during training"
+                )
+                _metrics.inc_batch_element_error(name, verb, "UNKNOWN_USER")
+        if not known:
+            return outcomes
+        try:
+            raw_rows = rec.get_recommendation_for_known_user_batch(
+                [single.user_id for _, single in known],
+                [single.limit for _, single in known],
+                [single.exclude_items for _, single in known],
+            )
+        except (MemoryError, RecursionError):
+            raise
+        except Exception as exc:
+            logger.warning(
+                "batch_scoring_fallback",
+                recipe=name,
+                verb=verb,
+                size=len(known),
+                exc_type=type(exc).__name__,
+            )
+            for idx, single in known:
+                outcomes[idx] = _recommend_known_user_one(
+                    entry, idx, single, name, verb
+                )
+            return outcomes
+        for (idx, _), raw_results in zip(known, raw_rows, strict=True):
+            outcomes[idx] = raw_results
+        return outcomes
+
+    def _recommend_related_one(
+        entry: ModelEntry,
+        idx: int,
+        single: RecommendRelatedRequest,
+        name: str,
+        verb: str,
+    ) -> list[tuple[str, float]] | BatchResultErr:
+        """Score one related batch element on its own (fallback path)."""
+        try:
+            return entry.recommender.get_recommendation_for_new_user(
+                single.seed_items, single.limit, **_exclude_kwargs(single.exclude_items)
+            )
+        except KeyError:
+            # S1: unexpected KeyError despite seed appearing known.
+            logger.exception(
+                "recommender_unexpected_key_error",
+                recipe=name,
+                verb=verb,
+                idx=idx,
+            )
+            _metrics.inc_batch_element_error(name, verb, "INTERNAL_ERROR")
+            return _batch_error_entry(idx, "INTERNAL_ERROR", "internal error")
+        except (MemoryError, RecursionError):
+            raise
+        except Exception as exc:
+            return _batch_element_failed(idx, exc, name, verb)
+
+    def _recommend_related_batch(
+        entry: ModelEntry,
+        pending: list[tuple[int, RecommendRelatedRequest]],
+        name: str,
+        verb: str,
+    ) -> dict[int, list[tuple[str, float]] | BatchResultErr]:
+        """Score every validated related element, in one matrix call if possible.
+
+        Seed lists with at least one known item are packed into a single
+        sparse seed matrix for ``IDMappedRecommender``; other recommenders
+        (and a failed batched call) are scored element by element.
+        """
+        outcomes: dict[int, list[tuple[str, float]] | BatchResultErr] = {}
+        known: list[tuple[int, RecommendRelatedRequest]] = []
+        for idx, single in pending:
+            try:
+                seed_known = _any_seed_known(entry, single.seed_items, name)
             except (MemoryError, RecursionError):
                 raise
-            except Exception:
+            except Exception as exc:
+                outcomes[idx] = _batch_element_failed(idx, exc, name, verb)
+                continue
+            if seed_known is None:
+                # M1: unexpected layout — INTERNAL_ERROR for this element.
+                outcomes[idx] = _batch_error_entry(
+                    idx, "INTERNAL_ERROR", "internal error"
+                )
+                _metrics.inc_batch_element_error(name, verb, "INTERNAL_ERROR")
+            elif not seed_known:
+                outcomes[idx] = _batch_error_entry(
+                    idx, "UNKNOWN_SEED_ITEMS", "no known seed_items"
+                )
+                _metrics.inc_batch_element_error(name, verb, "UNKNOWN_SEED_ITEMS")
+            else:
+                known.append((idx, single))
+        if not known:
+            return outcomes
+
+        rec = entry.recommender
+        if isinstance(rec, IDMappedRecommender):
+            try:
+                raw_rows = rec.get_recommendation_for_new_user_batch(
+                    [single.seed_items for _, single in known],
+                    [single.limit for _, single in known],
+                    [single.exclude_items for _, single in known],
+                )
+            except (MemoryError, RecursionError):
                 raise
+            except Exception as exc:
+                logger.warning(
+                    "batch_scoring_fallback",
+                    recipe=name,
+                    verb=verb,
+                    size=len(known),
+                    exc_type=type(exc).__name__,
+                )
+            else:
+                for (idx, _), raw_results in zip(known, raw_rows, strict=True):
+                    outcomes[idx] = raw_results
+                return outcomes
+        for idx, single in known:
+            outcomes[idx] = _recommend_related_one(entry, idx, single, name, verb)
+        return outcomes
+
+    def _batch_recommend_scored(
+        entry: ModelEntry,
+        name: str,
+        body: BatchRecommendRequest,
+        request_id: str,
+        status_holder: list[str],
+        negotiated: _columnar.Negotiated,
+        timings: StageTimings | NullStageTimings,
+    ) -> Response:
+        """``:batch-recommend`` after recipe lookup (runs on the executor)."""
+        verb = "batch-recommend"
+
+        with timings.stage("validate"):
+            results: list[_EncodedResult | BatchResultErr] = []
+            pending: list[tuple[int, RecommendRequest]] = []
+            aggregate_limit = 0
+            for idx, raw in enumerate(body.requests):
+                single = _validate_batch_element(idx, raw, RecommendRequest, name, verb)
+                if isinstance(single, BatchResultErr):
+                    results.append(single)
+                    continue
+                if aggregate_limit + single.limit > BATCH_AGGREGATE_LIMIT:
+                    results.append(
+                        _batch_error_entry(
+                            idx,
+                            "VALIDATION_ERROR",
+                            f"aggregate limit cap exceeded: {BATCH_AGGREGATE_LIMIT}",
+                        )
+                    )
+                    _metrics.inc_batch_element_error(name, verb, "VALIDATION_ERROR")
+                    continue
+                aggregate_limit += single.limit
+                pending.append((idx, single))
+
+        with timings.stage("score"):
+            outcomes = _recommend_known_user_batch(entry, pending, name, verb)
+        with timings.stage("encode"):
+            if negotiated.columnar:
+                return _columnar_batch_response(
+                    entry,
+                    results,
+                    pending,
+                    outcomes,
+                    negotiated,
+                    request_id,
+                    name,
+                    verb,
+                    status_holder,
+                )
+            meta = entry.metadata_index if body.include_metadata else None
+            results.extend(_encoded_results(pending, outcomes, meta, name, verb))
+            return _batch_response(entry, results, request_id, name, status_holder)
+
+    def _batch_recommend_related_scored(
+        entry: ModelEntry,
+        name: str,
+        body: BatchRecommendRelatedRequest,
+        request_id: str,
+        status_holder: list[str],
+        negotiated: _columnar.Negotiated,
+        timings: StageTimings | NullStageTimings,
+    ) -> Response:
+        """``:batch-recommend-related`` after recipe lookup (runs on the executor)."""
+        verb = "batch-recommend-related"
+
+        with timings.stage("validate"):
+            results: list[_EncodedResult | BatchResultErr] = []
+            pending: list[tuple[int, RecommendRelatedRequest]] = []
+            aggregate_limit = 0
+            for idx, raw in enumerate(body.requests):
+                single = _validate_batch_element(
+                    idx, raw, RecommendRelatedRequest, name, verb
+                )
+                if isinstance(single, BatchResultErr):
+                    results.append(single)
+                    continue
+                if aggregate_limit + single.limit > BATCH_AGGREGATE_LIMIT:
+                    results.append(
+                        _batch_error_entry(
+                            idx,
+                            "VALIDATION_ERROR",
+                            f"aggregate limit cap exceeded: {BATCH_AGGREGATE_LIMIT}",
+                        )
+                    )
+                    _metrics.inc_batch_element_error(name, verb, "VALIDATION_ERROR")
+                    continue
+                aggregate_limit += single.limit
+                pending.append((idx, single))
+
+        with timings.stage("score"):
+            outcomes = _recommend_related_batch(entry, pending, name, verb)
+            for idx, _ in pending:
+                outcome = outcomes[idx]
+                if not isinstance(outcome, BatchResultErr) and not outcome:
+                    outcomes[idx] = _batch_error_entry(
+                        idx, "NO_CANDIDATES", "no candidates produced by ranker"
+                    )
+                    _metrics.inc_batch_element_error(name, verb, "NO_CANDIDATES")
+        with timings.stage("encode"):
+            if negotiated.columnar:
+                return _columnar_batch_response(
+                    entry,
+                    results,
+                    pending,
+                    outcomes,
+                    negotiated,
+                    request_id,
+                    name,
+                    verb,
+                    status_holder,
+                )
+            meta = entry.metadata_index if body.include_metadata else None
+            results.extend(_encoded_results(pending, outcomes, meta, name, verb))
+            return _batch_response(entry, results, request_id, name, status_holder)
 
     @router.post(
         "/recipes/{name}:batch-recommend",
         response_model=BatchRecommendResponse,
+        responses=_COLUMNAR_RESPONSES,
         summary="Recommend items for multiple users",
     )
-    def batch_recommend(
+    async def batch_recommend(
         name: str = Path(pattern=_RECIPE_NAME_RE),
         body: BatchRecommendRequest = ...,
         request: Request = ...,
-        response: Response = ...,
         kid: str = Depends(_require_auth),
     ) -> Any:
         request_id = request.state.request_id
         verb = "batch-recommend"
 
-        with _request_metrics(name, verb, kid) as status_holder:
+        timings = _stage_timings(request)
+        negotiated = _negotiate(request)
+
+        with _request_metrics(name, verb, kid, timings) as status_holder:
             try:
-                entry = _resolve_entry(name, request_id, kid, status_holder)
+                with timings.stage("lookup"):
+                    entry = await _resolve_entry(name, request_id, kid, status_holder)
 
                 _metrics.observe_batch_size(name, verb, len(body.requests))
 
-                results: list[BatchResultOk | BatchResultErr] = []
-                aggregate_limit = 0
-                for idx, raw in enumerate(body.requests):
-                    if not isinstance(raw, dict):
-                        results.append(
-                            _batch_error_entry(
-                                idx, "VALIDATION_ERROR", "request must be an object"
-                            )
-                        )
-                        _metrics.inc_batch_element_error(name, verb, "VALIDATION_ERROR")
-                        continue
-                    try:
-                        single = RecommendRequest.model_validate(raw)
-                    except ValidationError as exc:
-                        _msg = _format_batch_validation_message(exc)
-                        logger.warning(
-                            "batch_element_validation_failed",
-                            recipe=name,
-                            verb=verb,
-                            idx=idx,
-                            errors=_sanitize_validation_errors(exc),
-                        )
-                        results.append(
-                            _batch_error_entry(idx, "VALIDATION_ERROR", _msg)
-                        )
-                        _metrics.inc_batch_element_error(name, verb, "VALIDATION_ERROR")
-                        continue
-                    if aggregate_limit + single.limit > BATCH_AGGREGATE_LIMIT:
-                        results.append(
-                            _batch_error_entry(
-                                idx,
-                                "VALIDATION_ERROR",
-                                f"aggregate limit cap exceeded: "
-                                f"{BATCH_AGGREGATE_LIMIT}",
-                            )
-                        )
-                        _metrics.inc_batch_element_error(name, verb, "VALIDATION_ERROR")
-                        continue
-                    aggregate_limit += single.limit
-                    # F5: initialize user_known at top of each iteration so
-                    # stale values from a previous iteration cannot leak on
-                    # future refactors.
-                    batch_user_known: bool | None = True
-                    try:
-                        # S1/F4: check membership before calling irspack.
-                        # Returns None when the recommender layout is unexpected.
-                        try:
-                            batch_user_known = (
-                                single.user_id
-                                in entry.recommender._mapper.user_id_to_index
-                            )
-                        except AttributeError as _attr_exc:
-                            # Mirror _any_seed_known sentinel: log + metric + None.
-                            logger.warning(
-                                "recommender_layout_unexpected",
-                                recipe=name,
-                                verb=verb,
-                                exc_type=type(_attr_exc).__name__,
-                            )
-                            _metrics.inc_recommender_layout_unexpected(name)
-                            batch_user_known = None
-
-                        raw_results = (
-                            entry.recommender.get_recommendation_for_known_user_id(
-                                single.user_id, single.limit
-                            )
-                        )
-                        exclude = (
-                            frozenset(single.exclude_items)
-                            if single.exclude_items
-                            else frozenset()
-                        )
-                        meta = entry.metadata_index if body.include_metadata else None
-                        items, _fb, _dr = _build_items(
-                            raw_results, exclude, meta, name, verb
-                        )
-                        if _fb + _dr > 0:
-                            if _fb:
-                                _metrics.inc_metadata_degraded_items(
-                                    name, verb, "fallback", _fb
-                                )
-                            if _dr:
-                                _metrics.inc_metadata_degraded_items(
-                                    name, verb, "dropped", _dr
-                                )
-                        results.append(
-                            BatchResultOk(index=idx, status="ok", items=items)
-                        )
-                    except KeyError:
-                        if batch_user_known is False:
-                            results.append(
-                                _batch_error_entry(
-                                    idx, "UNKNOWN_USER", "user not seen during training"
-                                )
-                            )
-                            _metrics.inc_batch_element_error(name, verb, "UNKNOWN_USER")
-                        else:
-                            # batch_user_known is True or None (unexpected layout):
-                            # propagate as INTERNAL_ERROR for observability.
-                            logger.exception(
-                                "recommender_unexpected_key_error",
-                                recipe=name,
-                                verb=verb,
-                                idx=idx,
-                            )
-                            results.append(
-                                _batch_error_entry(
-                                    idx, "INTERNAL_ERROR", "internal error"
-                                )
-                            )
-                            _metrics.inc_batch_element_error(
-                                name, verb, "INTERNAL_ERROR"
-                            )
-                    except (MemoryError, RecursionError):
-                        raise
-                    except Exception as exc:
-                        logger.exception(
-                            "batch_element_error",
-                            recipe=name,
-                            verb=verb,
-                            idx=idx,
-                            exc_type=type(exc).__name__,
-                            exc_module=type(exc).__module__,
-                        )
-                        results.append(
-                            _batch_error_entry(idx, "INTERNAL_ERROR", "internal error")
-                        )
-                        _metrics.inc_batch_element_error(name, verb, "INTERNAL_ERROR")
-
-                status_holder[0] = "ok"
-                response.headers["X-Recotem-Model-Version"] = entry.model_version
-                return BatchRecommendResponse(
-                    request_id=request_id,
-                    recipe=name,
-                    model_version=entry.model_version,
-                    results=results,
+                response = await _dispatch(
+                    name,
+                    len(body.requests),
+                    status_holder,
+                    timings,
+                    _batch_recommend_scored,
+                    entry,
+                    name,
+                    body,
+                    request_id,
+                    status_holder,
+                    negotiated,
+                    timings,
                 )
+                return timings.apply(response)
             except HTTPException:
                 raise
             except (MemoryError, RecursionError):
@@ -664,168 +1433,43 @@ def make_router(
     @router.post(
         "/recipes/{name}:batch-recommend-related",
         response_model=BatchRecommendResponse,
+        responses=_COLUMNAR_RESPONSES,
         summary="Recommend items related to multiple seed lists",
     )
-    def batch_recommend_related(
+    async def batch_recommend_related(
         name: str = Path(pattern=_RECIPE_NAME_RE),
         body: BatchRecommendRelatedRequest = ...,
         request: Request = ...,
-        response: Response = ...,
         kid: str = Depends(_require_auth),
     ) -> Any:
         request_id = request.state.request_id
         verb = "batch-recommend-related"
 
-        with _request_metrics(name, verb, kid) as status_holder:
+        timings = _stage_timings(request)
+        negotiated = _negotiate(request)
+
+        with _request_metrics(name, verb, kid, timings) as status_holder:
             try:
-                entry = _resolve_entry(name, request_id, kid, status_holder)
+                with timings.stage("lookup"):
+                    entry = await _resolve_entry(name, request_id, kid, status_holder)
 
                 _metrics.observe_batch_size(name, verb, len(body.requests))
 
-                results: list[BatchResultOk | BatchResultErr] = []
-                aggregate_limit = 0
-                for idx, raw in enumerate(body.requests):
-                    if not isinstance(raw, dict):
-                        results.append(
-                            _batch_error_entry(
-                                idx, "VALIDATION_ERROR", "request must be an object"
-                            )
-                        )
-                        _metrics.inc_batch_element_error(name, verb, "VALIDATION_ERROR")
-                        continue
-                    try:
-                        single = RecommendRelatedRequest.model_validate(raw)
-                    except ValidationError as exc:
-                        _msg = _format_batch_validation_message(exc)
-                        logger.warning(
-                            "batch_element_validation_failed",
-                            recipe=name,
-                            verb=verb,
-                            idx=idx,
-                            errors=_sanitize_validation_errors(exc),
-                        )
-                        results.append(
-                            _batch_error_entry(idx, "VALIDATION_ERROR", _msg)
-                        )
-                        _metrics.inc_batch_element_error(name, verb, "VALIDATION_ERROR")
-                        continue
-                    if aggregate_limit + single.limit > BATCH_AGGREGATE_LIMIT:
-                        results.append(
-                            _batch_error_entry(
-                                idx,
-                                "VALIDATION_ERROR",
-                                f"aggregate limit cap exceeded: "
-                                f"{BATCH_AGGREGATE_LIMIT}",
-                            )
-                        )
-                        _metrics.inc_batch_element_error(name, verb, "VALIDATION_ERROR")
-                        continue
-                    aggregate_limit += single.limit
-                    try:
-                        seed_known = _any_seed_known(entry, single.seed_items, name)
-                        if seed_known is None:
-                            # M1: unexpected layout — INTERNAL_ERROR for this element.
-                            results.append(
-                                _batch_error_entry(
-                                    idx, "INTERNAL_ERROR", "internal error"
-                                )
-                            )
-                            _metrics.inc_batch_element_error(
-                                name, verb, "INTERNAL_ERROR"
-                            )
-                            continue
-                        if not seed_known:
-                            results.append(
-                                _batch_error_entry(
-                                    idx,
-                                    "UNKNOWN_SEED_ITEMS",
-                                    "no known seed_items",
-                                )
-                            )
-                            _metrics.inc_batch_element_error(
-                                name, verb, "UNKNOWN_SEED_ITEMS"
-                            )
-                            continue
-                        try:
-                            raw_results = (
-                                entry.recommender.get_recommendation_for_new_user(
-                                    single.seed_items, single.limit
-                                )
-                            )
-                        except KeyError:
-                            # S1: unexpected KeyError despite seed appearing known.
-                            logger.exception(
-                                "recommender_unexpected_key_error",
-                                recipe=name,
-                                verb=verb,
-                                idx=idx,
-                            )
-                            results.append(
-                                _batch_error_entry(
-                                    idx, "INTERNAL_ERROR", "internal error"
-                                )
-                            )
-                            _metrics.inc_batch_element_error(
-                                name, verb, "INTERNAL_ERROR"
-                            )
-                            continue
-                        if not raw_results:
-                            results.append(
-                                _batch_error_entry(
-                                    idx,
-                                    "NO_CANDIDATES",
-                                    "no candidates produced by ranker",
-                                )
-                            )
-                            _metrics.inc_batch_element_error(
-                                name, verb, "NO_CANDIDATES"
-                            )
-                            continue
-                        exclude = (
-                            frozenset(single.exclude_items)
-                            if single.exclude_items
-                            else frozenset()
-                        )
-                        meta = entry.metadata_index if body.include_metadata else None
-                        items, _fb, _dr = _build_items(
-                            raw_results, exclude, meta, name, verb
-                        )
-                        if _fb + _dr > 0:
-                            if _fb:
-                                _metrics.inc_metadata_degraded_items(
-                                    name, verb, "fallback", _fb
-                                )
-                            if _dr:
-                                _metrics.inc_metadata_degraded_items(
-                                    name, verb, "dropped", _dr
-                                )
-                        results.append(
-                            BatchResultOk(index=idx, status="ok", items=items)
-                        )
-                    except (MemoryError, RecursionError):
-                        raise
-                    except Exception as exc:
-                        logger.exception(
-                            "batch_element_error",
-                            recipe=name,
-                            verb=verb,
-                            idx=idx,
-                            exc_type=type(exc).__name__,
-                            exc_module=type(exc).__module__,
-                        )
-                        results.append(
-                            _batch_error_entry(idx, "INTERNAL_ERROR", "internal error")
-                        )
-                        _metrics.inc_batch_element_error(name, verb, "INTERNAL_ERROR")
-
-                status_holder[0] = "ok"
-                response.headers["X-Recotem-Model-Version"] = entry.model_version
-                return BatchRecommendResponse(
-                    request_id=request_id,
-                    recipe=name,
-                    model_version=entry.model_version,
-                    results=results,
+                response = await _dispatch(
+                    name,
+                    len(body.requests),
+                    status_holder,
+                    timings,
+                    _batch_recommend_related_scored,
+                    entry,
+                    name,
+                    body,
+                    request_id,
+                    status_holder,
+                    negotiated,
+                    timings,
                 )
+                return timings.apply(response)
             except HTTPException:
                 raise
             except (MemoryError, RecursionError):
@@ -833,6 +1477,195 @@ def make_router(
             except Exception:
                 raise
 
+    def _stream_chunk_scored(
+        entry: ModelEntry,
+        name: str,
+        first_idx: int,
+        lines: list[bytes | None],
+        include_metadata: bool,
+    ) -> bytes:
+        """Score one chunk of ``:stream-recommend`` lines (runs on the executor).
+
+        *lines* are raw NDJSON lines (``None`` for one over
+        ``STREAM_MAX_LINE_BYTES``) numbered from *first_idx*.  Returns the
+        chunk's result lines in input order, each terminated by a newline.
+        """
+        verb = "stream-recommend"
+        results: list[_EncodedResult | BatchResultErr] = []
+        pending: list[tuple[int, RecommendRequest]] = []
+        for idx, line in enumerate(lines, first_idx):
+            if line is None:
+                results.append(
+                    _batch_error_entry(
+                        idx,
+                        "VALIDATION_ERROR",
+                        f"line exceeds {STREAM_MAX_LINE_BYTES} bytes",
+                    )
+                )
+                _metrics.inc_batch_element_error(name, verb, "VALIDATION_ERROR")
+                continue
+            try:
+                raw = json.loads(line)
+            except ValueError:
+                results.append(
+                    _batch_error_entry(idx, "VALIDATION_ERROR", "invalid JSON")
+                )
+                _metrics.inc_batch_element_error(name, verb, "VALIDATION_ERROR")
+                continue
+            single = _validate_batch_element(idx, raw, RecommendRequest, name, verb)
+            if isinstance(single, BatchResultErr):
+                results.append(single)
+                continue
+            pending.append((idx, single))
+
+        outcomes = _recommend_known_user_batch(entry, pending, name, verb)
+        meta = entry.metadata_index if include_metadata else None
+        results.extend(_encoded_results(pending, outcomes, meta, name, verb))
+        results.sort(key=lambda r: r.index)
+        return b"".join(
+            (r.body if isinstance(r, _EncodedResult) else _encoding.json_bytes(r))
+            + b"\n"
+            for r in results
+        )
+
+    async def _dispatch_stream_chunk(
+        recipe: str, weight: int, fn: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Run a ``:stream-recommend`` chunk after the first one.
+
+        The response has already started, so a chunk over an admission cap
+        can no longer be shed with a 429.  It waits ``Retry-After`` and tries
+        again instead: under overload a stream slows down rather than fails.
+        """
+        if admission is None:
+            return await _run_scoring(recipe, fn, *args)
+        while True:
+            try:
+                return await _run_admitted(admission, recipe, weight, fn, *args)
+            except AdmissionRejected as exc:
+                logger.debug(
+                    "stream_chunk_deferred",
+                    recipe=recipe,
+                    scope=exc.scope,
+                    weight=weight,
+                )
+                await asyncio.sleep(exc.retry_after_seconds)
+
+    async def _stream_results(
+        entry: ModelEntry,
+        name: str,
+        kid: str,
+        request_id: str,
+        lines: AsyncIterator[bytes | None],
+        first_body: bytes,
+        next_idx: int,
+        include_metadata: bool,
+        started: float,
+    ) -> AsyncIterator[bytes]:
+        """Yield the NDJSON response body chunk by chunk.
+
+        The next chunk is read from the request only once the previous one
+        has been handed to the server, so a slow reader throttles both the
+        scoring and the upload.
+        """
+        verb = "stream-recommend"
+        status = "error"
+        # The request-scoped bindings are gone by the time the body streams.
+        structlog.contextvars.bind_contextvars(
+            recipe=name, kid=kid, request_id=request_id
+        )
+        try:
+            if first_body:
+                yield first_body
+            while chunk := await _next_chunk(lines, stream_chunk_size):
+                yield await _dispatch_stream_chunk(
+                    name,
+                    len(chunk),
+                    _stream_chunk_scored,
+                    entry,
+                    name,
+                    next_idx,
+                    chunk,
+                    include_metadata,
+                )
+                next_idx += len(chunk)
+            status = "ok"
+        finally:
+            _metrics.record_v1_request(name, verb, status, time.monotonic() - started)
+            structlog.contextvars.unbind_contextvars("recipe", "kid", "request_id")
+
+    @router.post(
+        "/recipes/{name}:stream-recommend",
+        response_class=_encoding.NDJSONStreamingResponse,
+        summary="Stream recommendations for an NDJSON list of users",
+        openapi_extra={
+            "requestBody": {
+                "required": True,
+                "content": {
+                    _encoding.NDJSON_MEDIA_TYPE: {
+                        "schema": {
+                            "type": "string",
+                            "description": "One RecommendRequest object per line",
+                        }
+                    }
+                },
+            }
+        },
+    )
+    async def stream_recommend(
+        name: str = Path(pattern=_RECIPE_NAME_RE),
+        request: Request = ...,
+        include_metadata: bool = Query(
+            False, description="Include per-item metadata fields in each result"
+        ),
+        kid: str = Depends(_require_auth),
+    ) -> Any:
+        request_id = request.state.request_id
+        verb = "stream-recommend"
+
+        # Lookup, the first chunk and its admission happen before the
+        # response starts, so they can still fail with a proper status code.
+        started = time.monotonic()
+        status_holder: list[str] = ["error"]
+        try:
+            entry = await _resolve_entry(name, request_id, kid, status_holder)
+            lines = _ndjson_lines(request.stream(), STREAM_MAX_LINE_BYTES)
+            first = await _next_chunk(lines, stream_chunk_size)
+            first_body = b""
+            if first:
+                first_body = await _dispatch(
+                    name,
+                    len(first),
+                    status_holder,
+                    NULL_TIMINGS,
+                    _stream_chunk_scored,
+                    entry,
+                    name,
+                    0,
+                    first,
+                    include_metadata,
+                )
+        except BaseException:
+            _metrics.record_v1_request(
+                name, verb, status_holder[0], time.monotonic() - started
+            )
+            raise
+
+        return _encoding.NDJSONStreamingResponse(
+            _stream_results(
+                entry,
+                name,
+                kid,
+                request_id,
+                lines,
+                first_body,
+                len(first),
+                include_metadata,
+                started,
+            ),
+            headers={"X-Recotem-Model-Version": entry.model_version},
+        )
+
     @router.get(
         "/recipes",
         response_model=RecipesListResponse,
@@ -845,7 +1678,7 @@ def make_router(
             total = len(all_entries)
             summaries: list[dict[str, Any]] = []
             for e in all_entries:
-                if not e.loaded:
+                if not e.loaded and not e.standby:
                     continue
                 summaries.append(
                     {
@@ -881,6 +1714,16 @@ def make_router(
         structlog.contextvars.bind_contextvars(kid=kid, recipe=name)
         try:
             e = registry.get(name)
+            described = False
+            if e is not None and e.standby and lazy_loader is not None:
+                # The detail comes from the artifact header: read just that
+                # when it can be verified on its own, else load the model.
+                # This handler runs on the threadpool, so blocking is fine.
+                header_entry = lazy_loader.describe(name)
+                if header_entry is not None:
+                    e, described = header_entry, True
+                else:
+                    e = lazy_loader.ensure(name).result()
             if e is None:
                 logger.warning(
                     "recipe_not_found",
@@ -895,7 +1738,7 @@ def make_router(
                         "code": "RECIPE_NOT_FOUND",
                     },
                 )
-            if not e.loaded:
+            if not e.loaded and not described:
                 logger.warning(
                     "recipe_not_loaded",
                     name=name,
@@ -954,9 +1797,73 @@ def make_router(
     return router
 
 
+def _exclude_kwargs(exclude_items: list[str] | None) -> dict[str, Any]:
+    """Keyword arguments that push ``exclude_items`` down into scoring.
+
+    Exclusions are masked to ``-inf`` before top-k so a response still holds
+    ``limit`` items.  The keyword is only passed when there is something to
+    exclude, so recommenders exposing the original ``(id, cutoff)``
+    signature keep working for the common no-exclusion request.
+    """
+    return {"exclude_item_ids": exclude_items} if exclude_items else {}
+
+
+class _EncodedResult(NamedTuple):
+    """A pre-encoded ``BatchResultOk``; ``index`` keeps results sortable."""
+
+    index: int
+    body: bytes
+
+
 def _batch_error_entry(idx: int, code: ErrorCode, message: str) -> BatchResultErr:
     return BatchResultErr(
         index=idx,
         status="error",
         error=ErrorDetail(code=code, message=message),
     )
+
+
+async def _ndjson_lines(
+    chunks: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[bytes | None]:
+    """Split a streamed NDJSON body into its non-blank lines.
+
+    A line longer than *max_line_bytes* is not buffered: it is discarded up
+    to its newline and reported as ``None`` so the caller can answer it with
+    an error entry.
+    """
+    buf = bytearray()
+    overlong = False
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b"\n", start)) >= 0:
+            if not overlong and len(buf) + end - start <= max_line_bytes:
+                buf += chunk[start:end]
+                if buf.strip():
+                    yield bytes(buf)
+            else:
+                yield None
+            buf.clear()
+            overlong = False
+            start = end + 1
+        if not overlong:
+            buf += chunk[start:]
+            if len(buf) > max_line_bytes:
+                buf.clear()
+                overlong = True
+    if overlong:
+        yield None
+    elif buf.strip():
+        yield bytes(buf)
+
+
+async def _next_chunk(
+    lines: AsyncIterator[bytes | None], size: int
+) -> list[bytes | None]:
+    """Read up to *size* lines; an empty list means the body is exhausted."""
+    chunk: list[bytes | None] = []
+    async for line in lines:
+        chunk.append(line)
+        if len(chunk) >= size:
+            break
+    return chunk
@@ -12,6 +12,11 @@ from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 # request so a 256-element batch cannot demand 256_000 items in one go.
 BATCH_AGGREGATE_LIMIT = 5000
 
+# Longest NDJSON line accepted by ``:stream-recommend``.  Large enough for the
+# biggest valid ``RecommendRequest`` (1000 ``exclude_items`` of 256 chars);
+# a longer line is answered with a per-line VALIDATION_ERROR and skipped.
+STREAM_MAX_LINE_BYTES = 512 * 1024
+
 # Machine-readable error codes emitted by the v1 API. Kept as a Literal
 # union so OpenAPI / SDK generation produces an exhaustive enum and any
 # new code added in routes/auth/app fails type-check until listed here.
@@ -24,6 +29,7 @@ ErrorCode = Literal[
     "VALIDATION_ERROR",
     "MISSING_API_KEY",
     "INVALID_API_KEY",
+    "OVERLOADED",
     "INTERNAL_ERROR",
 ]
 
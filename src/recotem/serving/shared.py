@@ -0,0 +1,756 @@
+"""Share verified models between a supervisor and its HTTP worker processes.
+
+With ``RECOTEM_WORKERS`` > 1, ``recotem serve`` runs one supervisor process
+that loads, HMAC-verifies and watches every artifact exactly once, plus N
+uvicorn worker processes that only answer HTTP requests.  The two sides talk
+through a :class:`SharedModelStore` — a private directory (``0700``, on
+``/dev/shm`` when available) with this layout::
+
+    <root>/
+      manifest.json            published generations (see below)
+      serve.json               CLI-only serve settings for the workers
+      models/<sha256>.recotem  verified artifact bytes, keyed by the SHA-256
+                               of their full content
+      workers/<pid>.json       per-worker acknowledgements
+
+Workers open ``models/<sha256>.recotem`` with ``artifact.io.map_or_read``.
+For format-2 artifacts the numeric arrays are zero-copy views into that
+mapping, so every worker shares one physical copy of each model.  Format-1
+artifacts still work but are unpickled into each worker's private heap.
+
+Coordinated hot-swap
+--------------------
+``manifest.json`` holds an *active* generation and, while a swap is in
+progress, a *staged* one::
+
+    {"active": {"generation": 7, "recipes": {...}},
+     "staged": {"generation": 8, "recipes": {...}}}
+
+1. When the supervisor's watcher swaps a model, :class:`ModelPublisher` copies
+   the verified bytes into ``models/``, publishes generation N+1 as *staged*,
+   and waits for every live worker to acknowledge it.
+2. Each :class:`StoreFollower` builds the staged entries off to the side
+   (the expensive part: mapping and unpickling) and acknowledges.
+3. The supervisor promotes the staged generation to *active*; each follower
+   then swaps its pre-built entries into its registry, which is just a few
+   dict assignments.  All workers therefore change ``model_version`` within
+   one follower poll interval of each other.
+
+A worker that does not acknowledge within ``_SWAP_ACK_TIMEOUT_SECONDS`` is
+logged and skipped so that one wedged process cannot stall hot-swap for the
+rest; it catches up as soon as it sees the new active generation.
+
+Trust model: workers do not re-verify HMACs.  The store directory is created
+``0700`` and model files ``0400`` by the supervisor.  It copies an artifact
+into the store first and verifies that copy — identity SHA-256 against the
+artifact it loaded, then HMAC and, for format 3, every payload chunk — so
+the bytes workers map are exactly the bytes that were checked.  A format-3
+identity covers only the signed header, so files are keyed by the SHA-256
+of their full content instead.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+import time
+import types
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from recotem.artifact.format import ArtifactError
+from recotem.artifact.io import content_sha256, digest_artifact, verify_digest
+from recotem.artifact.signing import KeyRing
+from recotem.serving import metrics as _metrics
+from recotem.serving._header_utils import extract_algorithms, normalize_config_digest
+from recotem.serving.registry import ModelEntry, ModelRegistry
+from recotem.serving.warmup import warm_up
+
+logger = structlog.get_logger(__name__)
+
+#: Environment variable naming the store directory.  The supervisor exports
+#: it so that the uvicorn worker processes it spawns can attach.
+SHARED_MODEL_DIR_ENV = "RECOTEM_SHARED_MODEL_DIR"
+
+_MANIFEST = "manifest.json"
+_SERVE_SETTINGS = "serve.json"
+_MODELS_DIR = "models"
+_WORKERS_DIR = "workers"
+_MODEL_SUFFIX = ".recotem"
+
+#: Longest time the supervisor waits for workers to stage a generation.
+_SWAP_ACK_TIMEOUT_SECONDS = 30.0
+#: How often followers check the manifest and the supervisor checks acks.
+_POLL_INTERVAL_SECONDS = 0.05
+
+#: ServeConfig fields set from CLI flags rather than env vars; the supervisor
+#: hands them to the workers through ``serve.json``.
+_CLI_SETTINGS = ("host", "port", "insecure_no_auth", "dev_allow_unsigned")
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+
+class SharedModelStore:
+    """Directory of verified artifacts and the manifest that indexes them.
+
+    Use :meth:`create` in the supervisor and ``SharedModelStore(root)`` in
+    workers.  All writes are atomic (temp file + ``os.replace``) so readers
+    never observe a partially written manifest or model file.
+    """
+
+    def __init__(self, root: Path, *, owned: bool = False) -> None:
+        self.root = root
+        self._owned = owned
+
+    @classmethod
+    def create(cls, root: str = "") -> SharedModelStore:
+        """Create (or reuse) a store directory.
+
+        With an empty *root* a fresh directory is created under
+        ``/dev/shm`` when it is writable, else under the system temp dir,
+        and it is removed again by :meth:`cleanup`.
+        """
+        if root:
+            path = Path(root)
+            path.mkdir(mode=0o700, parents=True, exist_ok=True)
+            path.chmod(0o700)
+            owned = False
+        else:
+            base = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+            path = Path(tempfile.mkdtemp(prefix="recotem-models-", dir=base))
+            owned = True
+        (path / _MODELS_DIR).mkdir(mode=0o700, exist_ok=True)
+        (path / _WORKERS_DIR).mkdir(mode=0o700, exist_ok=True)
+        return cls(path, owned=owned)
+
+    def cleanup(self) -> None:
+        """Remove the directory if :meth:`create` made it."""
+        if self._owned:
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    # -- model files --------------------------------------------------------
+
+    def model_path(self, sha256: str) -> Path:
+        return self.root / _MODELS_DIR / f"{sha256}{_MODEL_SUFFIX}"
+
+    def stage(self, data: Any, verify: Callable[[Any], str]) -> str:
+        """Copy artifact *data* into the store and file it under its key.
+
+        *verify* receives a read-only mapping of the store's private copy and
+        returns the key to file it under, raising to reject it.  Checking
+        the copy rather than *data* leaves no window in which the origin
+        could change between verification and staging.  Idempotent.
+        """
+        tmp = self._tmp_path(self.root / _MODELS_DIR / "stage")
+        try:
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+            tmp.chmod(0o400)
+            with open(tmp, "rb") as fh:
+                copy = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                key = verify(copy)
+            finally:
+                copy.close()
+            path = self.model_path(key)
+            if path.exists():
+                tmp.unlink()
+            else:
+                os.replace(tmp, path)
+            return key
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                tmp.unlink()
+            raise
+
+    def collect_garbage(self, keep: set[str]) -> None:
+        """Unlink model files whose SHA-256 is not in *keep*.
+
+        Workers that still map an unlinked file keep reading it; the pages
+        are freed once the last mapping goes away.
+        """
+        for path in (self.root / _MODELS_DIR).glob(f"*{_MODEL_SUFFIX}"):
+            if path.name[: -len(_MODEL_SUFFIX)] not in keep:
+                with contextlib.suppress(FileNotFoundError):
+                    path.unlink()
+
+    # -- manifest -----------------------------------------------------------
+
+    def write_manifest(self, manifest: dict[str, Any]) -> None:
+        self._write_json(self.root / _MANIFEST, manifest)
+
+    def read_manifest(self) -> dict[str, Any] | None:
+        return self._read_json(self.root / _MANIFEST)
+
+    def manifest_marker(self) -> tuple[int, int] | None:
+        """Cheap change marker for the manifest (``None`` if absent)."""
+        try:
+            st = os.stat(self.root / _MANIFEST)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_ino)
+
+    # -- serve settings -----------------------------------------------------
+
+    def write_serve_settings(self, serve_config: Any) -> None:
+        self._write_json(
+            self.root / _SERVE_SETTINGS,
+            {key: getattr(serve_config, key) for key in _CLI_SETTINGS},
+        )
+
+    def apply_serve_settings(self, serve_config: Any) -> None:
+        """Copy the supervisor's CLI-only settings onto *serve_config*."""
+        for key, value in (self._read_json(self.root / _SERVE_SETTINGS) or {}).items():
+            if key in _CLI_SETTINGS:
+                setattr(serve_config, key, value)
+
+    # -- worker acknowledgements -------------------------------------------
+
+    def write_ack(self, pid: int, staged: int, active: int) -> None:
+        self._write_json(
+            self.root / _WORKERS_DIR / f"{pid}.json",
+            {"staged": staged, "active": active},
+        )
+
+    def drop_ack(self, pid: int) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            (self.root / _WORKERS_DIR / f"{pid}.json").unlink()
+
+    def live_acks(self) -> dict[int, dict[str, int]]:
+        """Return acknowledgements of live workers, pruning dead ones."""
+        acks: dict[int, dict[str, int]] = {}
+        for path in (self.root / _WORKERS_DIR).glob("*.json"):
+            try:
+                pid = int(path.stem)
+            except ValueError:
+                continue
+            if not _pid_alive(pid):
+                self.drop_ack(pid)
+                continue
+            ack = self._read_json(path)
+            if ack is not None:
+                acks[pid] = ack
+        return acks
+
+    # -- internals ----------------------------------------------------------
+
+    @staticmethod
+    def _tmp_path(path: Path) -> Path:
+        return path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+
+    def _write_atomic(self, path: Path, data: Any) -> None:
+        tmp = self._tmp_path(path)
+        try:
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                tmp.unlink()
+            raise
+
+    def _write_json(self, path: Path, obj: Any) -> None:
+        self._write_atomic(path, json.dumps(obj, sort_keys=True).encode("utf-8"))
+
+    @staticmethod
+    def _read_json(path: Path) -> Any:
+        try:
+            return json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Supervisor side
+# ---------------------------------------------------------------------------
+
+
+class ModelPublisher:
+    """Publish the supervisor registry's models to a :class:`SharedModelStore`.
+
+    Register :meth:`on_swap` as a registry swap listener.  It runs on the
+    watcher's load threads, several at once when many artifacts change
+    together.  Staging holds the publisher lock, but the wait for worker
+    acknowledgements does not: a swap published while another waits
+    supersedes it with a newer generation that carries both rows, and only
+    the newest generation is activated.
+
+    Parameters
+    ----------
+    store:
+        The store to publish into.
+    registry:
+        The supervisor's registry (populated by the startup load and kept
+        fresh by the ``ArtifactWatcher``).
+    recipe_for:
+        Returns the current ``Recipe`` for a name, or ``None``; used to hand
+        the item-metadata configuration to the workers.
+    read_artifact:
+        ``read_artifact_bytes(path, max_bytes)`` from the watcher module.
+    key_ring:
+        The ``KeyRing`` the registry's artifacts were verified with; staged
+        copies are verified again with it.  ``None`` under
+        ``dev_allow_unsigned``.
+    max_artifact_bytes:
+        Read cap passed to *read_artifact*.
+    max_payload_bytes:
+        Payload cap used when parsing the staged copies.
+    """
+
+    def __init__(
+        self,
+        store: SharedModelStore,
+        registry: ModelRegistry,
+        recipe_for: Callable[[str], Any],
+        read_artifact: Callable[[str, int], Any],
+        key_ring: KeyRing | None,
+        max_artifact_bytes: int,
+        max_payload_bytes: int,
+        *,
+        ack_timeout: float = _SWAP_ACK_TIMEOUT_SECONDS,
+        poll_interval: float = _POLL_INTERVAL_SECONDS,
+    ) -> None:
+        self._store = store
+        self._registry = registry
+        self._recipe_for = recipe_for
+        self._read_artifact = read_artifact
+        self._key_ring = key_ring
+        self._max_artifact_bytes = max_artifact_bytes
+        self._max_payload_bytes = max_payload_bytes
+        self._ack_timeout = ack_timeout
+        self._poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._rows: dict[str, dict[str, Any]] = {}
+        #: Identity SHA-256 -> content key of every artifact staged so far.
+        self._staged: dict[str, str] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def publish_initial(self) -> None:
+        """Publish every registry entry as the first active generation.
+
+        Called before any worker exists, so there is nothing to wait for.
+        """
+        with self._lock:
+            for entry in self._registry.list():
+                if not self._update_row(entry.name, entry):
+                    # Replaced between verification and staging: serve a stub
+                    # until the watcher reloads it and on_swap republishes.
+                    self._rows[entry.name] = {
+                        "loaded": False,
+                        "sha256": "",
+                        "content_sha256": "",
+                        "error": "artifact changed before it could be shared",
+                        "artifact_path": entry.artifact_path,
+                        "item_metadata": None,
+                        "exact_search": False,
+                    }
+            self._generation += 1
+            self._store.write_manifest(
+                {"active": self._snapshot(), "staged": None},
+            )
+            self._collect_garbage()
+
+    def on_swap(self, name: str) -> None:
+        """Registry swap listener: publish *name*'s new entry to the workers."""
+        try:
+            with self._lock:
+                if not self._update_row(name, self._registry.get(name)):
+                    return
+                self._generation += 1
+                generation = self._generation
+                staged = self._snapshot()
+                previous = self._store.read_manifest() or {}
+                self._store.write_manifest(
+                    {"active": previous.get("active"), "staged": staged}
+                )
+            self._wait_for_workers(generation)
+            with self._lock:
+                if self._generation != generation:
+                    # Superseded while waiting; the newer generation carries
+                    # this row and activates it.
+                    return
+                self._store.write_manifest({"active": staged, "staged": None})
+                self._collect_garbage()
+            logger.info(
+                "shared_model_generation_activated",
+                name=name,
+                generation=generation,
+            )
+        except (MemoryError, RecursionError):
+            raise
+        except Exception as exc:
+            # Swap listeners must not raise into the watcher.  Workers keep
+            # serving the previous generation; the next swap republishes.
+            logger.exception(
+                "shared_model_publish_failed",
+                name=name,
+                exc_type=type(exc).__name__,
+                error=str(exc),
+            )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _update_row(self, name: str, entry: ModelEntry | None) -> bool:
+        """Refresh the manifest row for *name*; False when nothing changed."""
+        if entry is None:
+            return self._rows.pop(name, None) is not None
+        row: dict[str, Any] = {
+            "loaded": entry.loaded,
+            "sha256": entry.artifact_sha256 if entry.loaded else "",
+            "content_sha256": "",
+            "error": entry.last_load_error,
+            "artifact_path": entry.artifact_path,
+            "item_metadata": None,
+            "exact_search": False,
+        }
+        if entry.loaded:
+            key = self._stage(name, entry)
+            if key is None:
+                return False
+            row["content_sha256"] = key
+            recipe = self._recipe_for(name)
+            if recipe is not None and recipe.item_metadata is not None:
+                row["item_metadata"] = recipe.item_metadata.model_dump(mode="json")
+            if recipe is not None and recipe.ann is not None:
+                row["exact_search"] = recipe.ann.exact
+        if self._rows.get(name) == row:
+            return False
+        self._rows[name] = row
+        return True
+
+    def _stage(self, name: str, entry: ModelEntry) -> str | None:
+        """Copy the bytes the registry entry was verified from into the store.
+
+        The artifact is re-read from its origin and the store's copy is only
+        kept when its identity SHA-256 still matches the registry entry and
+        it passes verification.  Returns the copy's content key, or ``None``.
+        An identity mismatch means the artifact was replaced since it was
+        loaded; the watcher picks that up on its next tick and triggers
+        another publish.
+        """
+        sha256 = entry.artifact_sha256
+        known = self._staged.get(sha256)
+        if known is not None and self._store.model_path(known).exists():
+            return known
+        data = self._read_artifact(entry.artifact_path, self._max_artifact_bytes)
+        try:
+            key = self._store.stage(data, lambda copy: self._verify_copy(copy, sha256))
+        except _StaleArtifactError:
+            logger.warning(
+                "shared_model_stage_stale",
+                name=name,
+                path=entry.artifact_path,
+            )
+            return None
+        except ArtifactError as exc:
+            logger.error(
+                "shared_model_stage_rejected",
+                name=name,
+                path=entry.artifact_path,
+                error=str(exc),
+            )
+            return None
+        finally:
+            close = getattr(data, "close", None)
+            if close is not None:
+                close()
+        self._staged[sha256] = key
+        return key
+
+    def _verify_copy(self, copy: mmap.mmap, sha256: str) -> str:
+        """``SharedModelStore.stage`` check: verify *copy*, return its key."""
+        digest = digest_artifact(copy, self._key_ring, self._max_payload_bytes)
+        stale = digest.sha256 != sha256
+        error = None
+        if not stale and self._key_ring is not None:
+            try:
+                verify_digest(digest)
+            except ArtifactError as exc:
+                error = str(exc)
+        # The digest holds views into *copy*; a traceback that references it
+        # would keep the mapping exported past ``stage``'s close().
+        del digest
+        if stale:
+            raise _StaleArtifactError(sha256)
+        if error is not None:
+            raise ArtifactError(error)
+        return content_sha256(copy)
+
+    def _snapshot(self) -> dict[str, Any]:
+        return {"generation": self._generation, "recipes": dict(self._rows)}
+
+    def _wait_for_workers(self, generation: int) -> None:
+        deadline = time.monotonic() + self._ack_timeout
+        while self._generation == generation:
+            lagging = sorted(
+                pid
+                for pid, ack in self._store.live_acks().items()
+                if ack.get("staged", -1) < generation
+            )
+            if not lagging:
+                return
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    "shared_model_swap_ack_timeout",
+                    generation=generation,
+                    lagging_workers=lagging,
+                    timeout=self._ack_timeout,
+                )
+                return
+            time.sleep(self._poll_interval)
+
+    def _collect_garbage(self) -> None:
+        keep = {
+            row["content_sha256"]
+            for row in self._rows.values()
+            if row["content_sha256"]
+        }
+        self._staged = {
+            sha256: key for sha256, key in self._staged.items() if key in keep
+        }
+        self._store.collect_garbage(keep)
+
+
+class _StaleArtifactError(Exception):
+    """The artifact re-read for staging is not the one the registry loaded."""
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+
+class StoreFollower(threading.Thread):
+    """Mirror the supervisor's published generations into a worker registry.
+
+    Call :meth:`sync` once before serving so that the worker starts with the
+    active generation, then :meth:`start` the thread to follow hot-swaps.
+    """
+
+    def __init__(
+        self,
+        store: SharedModelStore,
+        registry: ModelRegistry,
+        serve_config: Any,
+        *,
+        poll_interval: float = _POLL_INTERVAL_SECONDS,
+    ) -> None:
+        super().__init__(name="shared-model-follower", daemon=True)
+        self._store = store
+        self._registry = registry
+        self._config = serve_config
+        self._poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._pid = os.getpid()
+        self._marker: tuple[int, int] | None = None
+        self._active = 0
+        self._staged = 0
+        self._pending: dict[str, ModelEntry] = {}
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def run(self) -> None:
+        try:
+            while not self._stop_event.wait(self._poll_interval):
+                try:
+                    self.sync()
+                except (MemoryError, RecursionError):
+                    raise
+                except Exception as exc:
+                    logger.exception(
+                        "shared_model_follow_failed",
+                        exc_type=type(exc).__name__,
+                        error=str(exc),
+                    )
+        finally:
+            self._store.drop_ack(self._pid)
+
+    def sync(self) -> None:
+        """Catch up with the manifest: stage, acknowledge and/or activate."""
+        marker = self._store.manifest_marker()
+        if marker is None or marker == self._marker:
+            return
+        manifest = self._store.read_manifest()
+        if manifest is None:
+            return
+        self._marker = marker
+        active = manifest.get("active") or {"generation": 0, "recipes": {}}
+        staged = manifest.get("staged")
+
+        if active["generation"] > self._active:
+            if self._staged != active["generation"]:
+                self._pending = self._prepare(active["recipes"])
+            self._apply(self._pending, active["recipes"])
+            self._pending = {}
+            self._active = self._staged = active["generation"]
+        if staged is not None and staged["generation"] > self._staged:
+            self._pending = self._prepare(staged["recipes"])
+            self._staged = staged["generation"]
+        self._store.write_ack(self._pid, self._staged, self._active)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _prepare(self, rows: dict[str, dict[str, Any]]) -> dict[str, ModelEntry]:
+        """Build the entries for *rows*, reusing any that did not change."""
+        prepared: dict[str, ModelEntry] = {}
+        for name, row in rows.items():
+            current = self._registry.get(name)
+            if current is not None and _matches(current, row):
+                prepared[name] = current
+                continue
+            if not row["loaded"]:
+                prepared[name] = ModelEntry(
+                    name=name,
+                    recommender=None,
+                    header={},
+                    kid="",
+                    last_load_error=row["error"],
+                    artifact_path=row["artifact_path"],
+                    loaded=False,
+                )
+                continue
+            try:
+                prepared[name] = self._load(name, row)
+            except (MemoryError, RecursionError):
+                raise
+            except Exception as exc:
+                logger.error(
+                    "shared_model_attach_failed",
+                    name=name,
+                    sha256=row["sha256"],
+                    exc_type=type(exc).__name__,
+                    error=str(exc),
+                )
+                _metrics.inc_artifact_load_failure(name, reason="unexpected")
+                if current is not None and current.loaded:
+                    # Keep serving the previous model, as the watcher does
+                    # when a hot-swap fails.
+                    self._registry.set_load_error(name, f"attach failed: {exc}")
+                    prepared[name] = current
+                else:
+                    prepared[name] = ModelEntry(
+                        name=name,
+                        recommender=None,
+                        header={},
+                        kid="",
+                        last_load_error=f"attach failed: {exc}",
+                        artifact_path=row["artifact_path"],
+                        loaded=False,
+                    )
+        return prepared
+
+    def _load(self, name: str, row: dict[str, Any]) -> ModelEntry:
+        """Attach to a staged model file (no HMAC: the supervisor verified it)."""
+        from recotem.artifact.compression import payload_compression
+        from recotem.artifact.format import parse_header_from_bytes
+        from recotem.artifact.io import artifact_payload, map_or_read
+        from recotem.artifact.signing import unpickle_payload
+
+        with open(self._store.model_path(row["content_sha256"]), "rb") as fh:
+            data = map_or_read(fh, self._config.max_artifact_bytes, owned=True)
+        hdr = parse_header_from_bytes(data, self._config.max_payload_bytes)
+        header_dict: dict[str, Any] = json.loads(hdr.header_data.decode("utf-8"))
+        recommender = unpickle_payload(
+            artifact_payload(data, hdr.payload_offset),
+            compression=payload_compression(header_dict),
+            max_decompressed_bytes=self._config.max_payload_bytes,
+        )
+        if hasattr(recommender, "exact_search"):
+            recommender.exact_search = bool(row.get("exact_search", False))
+
+        metadata_df = None
+        metadata_index = None
+        if row["item_metadata"] is not None:
+            from recotem.metadata.loader import build_metadata_index
+            from recotem.recipe.models import ItemMetadataConfig
+            from recotem.serving.watcher import load_metadata
+
+            recipe = types.SimpleNamespace(
+                item_metadata=ItemMetadataConfig.model_validate(row["item_metadata"])
+            )
+            metadata_df = load_metadata(recipe, name)
+            deny_set: frozenset[str] = frozenset(
+                s.lower() for s in (self._config.metadata_field_deny or [])
+            )
+
+            def _on_row_error() -> None:
+                _metrics.inc_metadata_index_build_error(name)
+
+            metadata_index = build_metadata_index(
+                metadata_df, deny_set, on_row_error=_on_row_error
+            )
+
+        entry = ModelEntry(
+            name=name,
+            recommender=recommender,
+            header=header_dict,
+            kid=hdr.kid,
+            metadata_df=metadata_df,
+            metadata_index=metadata_index,
+            last_load_error=row["error"],
+            artifact_path=row["artifact_path"],
+            _loaded_marker=(None, row["sha256"]),
+            loaded_at_unix=time.time(),
+            config_digest=normalize_config_digest(header_dict.get("config_digest"))
+            or "",
+            algorithms=extract_algorithms(header_dict),
+        )
+        # Staging precedes activation, so the previous generation keeps
+        # serving while this worker warms the new model up.
+        warm_up(entry, self._config.warmup_requests)
+        return entry
+
+    def _apply(
+        self, prepared: dict[str, ModelEntry], rows: dict[str, dict[str, Any]]
+    ) -> None:
+        for name, entry in prepared.items():
+            if self._registry.get(name) is entry:
+                continue
+            self._registry.replace_with_marker(name, entry, entry._loaded_marker)
+            _metrics.set_model_loaded(name, entry.loaded)
+            if entry.loaded:
+                _metrics.record_swap(name, ok=True)
+        for entry in self._registry.list():
+            if entry.name not in rows:
+                self._registry.remove(entry.name)
+                _metrics.set_model_loaded(entry.name, False)
+        _metrics.set_active_recipes(self._registry.loaded_count())
+
+
+def _matches(entry: ModelEntry, row: dict[str, Any]) -> bool:
+    if entry.loaded != row["loaded"]:
+        return False
+    if entry.loaded:
+        return entry.artifact_sha256 == row["sha256"]
+    return entry.last_load_error == row["error"]
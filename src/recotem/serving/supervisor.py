@@ -0,0 +1,119 @@
+"""Multi-worker serving: the supervisor process and the worker app factory.
+
+``recotem serve`` with ``RECOTEM_WORKERS`` > 1 runs a :class:`ModelSupervisor`
+in the main process and lets uvicorn spawn the HTTP workers, each of which
+builds its app through :func:`create_worker_app`.  The supervisor performs
+the startup load and runs the only ``ArtifactWatcher``; every registry swap
+is published to the workers through a ``SharedModelStore`` (see
+``recotem.serving.shared`` for the on-disk protocol).
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import structlog
+from fastapi import FastAPI
+
+from recotem.config import ServeConfig
+from recotem.serving.app import bootstrap_registry, create_app
+from recotem.serving.shared import (
+    SHARED_MODEL_DIR_ENV,
+    ModelPublisher,
+    SharedModelStore,
+)
+from recotem.serving.watcher import ArtifactWatcher, read_artifact_bytes
+
+logger = structlog.get_logger(__name__)
+
+
+class ModelSupervisor:
+    """Load, verify and watch artifacts once on behalf of all workers.
+
+    Parameters
+    ----------
+    serve_config:
+        Fully populated ServeConfig (``recipes_dir`` set by the CLI).
+    store:
+        The store the workers attach to.
+    """
+
+    def __init__(self, serve_config: ServeConfig, store: SharedModelStore) -> None:
+        self._config = serve_config
+        self._store = store
+        self._watcher: ArtifactWatcher | None = None
+        self.publisher: ModelPublisher | None = None
+
+    def start(self) -> None:
+        """Load every recipe, publish generation 1 and start the watcher.
+
+        Raises whatever ``bootstrap_registry`` raises (``ConfigError`` for
+        posture or key problems) before any worker is started.
+        """
+        if self._config.model_memory_budget > 0:
+            # Workers mirror the supervisor's generations; they cannot hold
+            # a different subset of models each.
+            logger.warning(
+                "model_memory_budget_ignored",
+                reason="not supported with RECOTEM_WORKERS > 1",
+            )
+        boot = bootstrap_registry(self._config)
+        # Warmup belongs in the workers, which serve the models.
+        watcher = boot.make_watcher(self._config, warmup=False)
+        publisher = ModelPublisher(
+            self._store,
+            boot.registry,
+            watcher.recipe_for,
+            read_artifact_bytes,
+            boot.key_ring,
+            self._config.max_artifact_bytes,
+            self._config.max_payload_bytes,
+        )
+        self._store.write_serve_settings(self._config)
+        publisher.publish_initial()
+        boot.registry.add_swap_listener(publisher.on_swap)
+        watcher.start()
+        self._watcher = watcher
+        self.publisher = publisher
+        logger.info(
+            "shared_model_supervisor_started",
+            store=str(self._store.root),
+            workers=self._config.workers,
+            recipes=boot.registry.loaded_count(),
+        )
+
+    def stop(self) -> None:
+        """Stop the watcher (bounded join, as in the single-process lifespan)."""
+        if self._watcher is None:
+            return
+        self._watcher.stop()
+        timeout = max(1.0, min(5.0, float(self._config.drain_seconds)))
+        self._watcher.join(timeout=timeout)
+        if self._watcher.is_alive():
+            logger.warning("artifact_watcher_join_timeout", timeout=timeout)
+        self._watcher = None
+
+
+def create_worker_app() -> FastAPI:
+    """uvicorn app factory for one worker process.
+
+    Worker processes are spawned fresh by uvicorn, so the serve settings are
+    rebuilt from the environment plus the CLI flags the supervisor recorded
+    in the store.
+    """
+    _configure_worker_logging()
+    store = SharedModelStore(Path(os.environ[SHARED_MODEL_DIR_ENV]))
+    serve_config = ServeConfig.from_env()
+    store.apply_serve_settings(serve_config)
+    return create_app(serve_config, model_store=store)
+
+
+def _configure_worker_logging() -> None:
+    """Best-effort structlog setup, mirroring ``recotem serve`` in the parent."""
+    try:
+        from recotem.logging import configure_logging  # noqa: PLC0415
+
+        configure_logging(os.environ.get("RECOTEM_LOG_FORMAT", "auto").strip().lower())
+    except (ImportError, OSError):
+        pass
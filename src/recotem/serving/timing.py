@@ -0,0 +1,108 @@
+"""Per-stage latency breakdown for the v1 inference verbs.
+
+``recotem_v1_request_latency_seconds`` only says how long a request took.
+:class:`StageTimings` splits that time into the stages of a handler:
+
+========  ==============================================================
+auth      ``X-API-Key`` verification (scrypt unless the key cache hits)
+lookup    registry lookup and the response-cache check
+queue     waiting for a thread on the recipe's executor
+validate  per-element validation of a batch body
+score     the recommender call (including coalescer waits)
+encode    metadata join and JSON assembly of the response body
+========  ==============================================================
+
+Each stage is observed into ``recotem_v1_stage_duration_seconds`` when
+metrics are enabled and, with ``RECOTEM_SERVER_TIMING``, also returned to the
+client as a ``Server-Timing`` header (``score;dur=1.234, ...`` in ms).
+
+When neither output is enabled, handlers get :data:`NULL_TIMINGS`, whose
+methods do nothing and whose :meth:`~NullStageTimings.stage` returns one
+shared ``nullcontext``; the cost is a method call per stage.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+
+from fastapi import Response
+
+from recotem.serving import metrics as _metrics
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+class StageTimings:
+    """Accumulated stage durations for one request.
+
+    Not thread-safe, and it does not need to be: a request runs one stage at
+    a time, whether on the event loop or on its executor thread.
+    """
+
+    __slots__ = ("durations", "record_metrics", "server_timing")
+
+    enabled = True
+
+    def __init__(self, record_metrics: bool, server_timing: bool) -> None:
+        self.durations: dict[str, float] = {}
+        self.record_metrics = record_metrics
+        self.server_timing = server_timing
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Add *seconds* to *stage* (a stage may run more than once)."""
+        self.durations[stage] = self.durations.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the ``with`` body as stage *name*."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def header_value(self) -> str:
+        """``Server-Timing`` value, durations in milliseconds."""
+        return ", ".join(
+            f"{name};dur={seconds * 1000:.3f}"
+            for name, seconds in self.durations.items()
+        )
+
+    def apply(self, response: Response) -> Response:
+        """Attach the ``Server-Timing`` header when it is enabled."""
+        if self.server_timing and self.durations:
+            response.headers[SERVER_TIMING_HEADER] = self.header_value()
+        return response
+
+    def observe(self, recipe: str, verb: str) -> None:
+        """Record every stage into the stage histogram."""
+        if not self.record_metrics:
+            return
+        for name, seconds in self.durations.items():
+            _metrics.observe_v1_stage(recipe, verb, name, seconds)
+
+
+class NullStageTimings:
+    """Stand-in used when stage timing is disabled; every method is a no-op."""
+
+    __slots__ = ()
+
+    enabled = False
+    _NULL_CONTEXT: AbstractContextManager[None] = nullcontext()
+
+    def add(self, stage: str, seconds: float) -> None:
+        pass
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        return self._NULL_CONTEXT
+
+    def apply(self, response: Response) -> Response:
+        return response
+
+    def observe(self, recipe: str, verb: str) -> None:
+        pass
+
+
+NULL_TIMINGS = NullStageTimings()
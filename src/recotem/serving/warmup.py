@@ -0,0 +1,105 @@
+"""Pre-swap warmup of newly loaded models.
+
+The first requests served by a freshly loaded model pay for cold code paths:
+lazy BLAS initialisation, page faults on arrays that were just read or
+memory-mapped, and irspack's first-call overheads.  Without a warmup every
+hot swap shows up as a p99 spike.
+
+:func:`warm_up` runs a handful of synthetic calls against a new
+:class:`~recotem.serving.registry.ModelEntry` *before* it is published:
+
+* ``requests`` single-user calls (the ``:recommend`` path) for sampled known
+  users, plus one batched call over the same users (the batch verbs and the
+  coalescer);
+* ``requests`` single-seed calls (the ``:recommend-related`` path) for
+  sampled known items;
+* a metadata-index lookup for every returned item, so the index pages are
+  touched too.
+
+Callers run it between building an entry and swapping it into the registry,
+so the previous model keeps serving until the warmup finishes.  Warmup is
+best effort: a synthetic call that raises is logged and the swap goes ahead.
+Only ``IDMappedRecommender`` models are warmed.
+
+The call count comes from ``RECOTEM_WARMUP_REQUESTS`` (0 disables warmup)
+and each run is observed into ``recotem_model_warmup_duration_seconds``.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Sequence
+
+import structlog
+
+from recotem._idmap import IDMappedRecommender
+from recotem.serving import encoding as _encoding
+from recotem.serving import metrics as _metrics
+from recotem.serving.registry import ModelEntry
+
+logger = structlog.get_logger(__name__)
+
+#: ``limit`` used by the synthetic calls (the API default).
+WARMUP_LIMIT = 10
+
+
+def warm_up(
+    entry: ModelEntry, requests: int, *, rng: random.Random | None = None
+) -> float | None:
+    """Run synthetic inference calls against *entry* before it is swapped in.
+
+    Returns the warmup duration in seconds, or ``None`` when nothing ran
+    (*requests* is 0 or the recommender is not an ``IDMappedRecommender``).
+    Never raises except for ``MemoryError`` / ``RecursionError``.
+    """
+    rec = entry.recommender
+    if requests <= 0 or not isinstance(rec, IDMappedRecommender):
+        return None
+    rng = rng or random.Random()
+    started = time.perf_counter()
+    calls = 0
+    try:
+        users = _sample(rec.user_ids, requests, rng)
+        items = _sample(rec.item_ids, requests, rng)
+        lookup = _encoding.item_parts_lookup(entry.metadata_index)
+        for user_id in users:
+            for item_id, _ in rec.get_recommendation_for_known_user_id(
+                user_id, WARMUP_LIMIT
+            ):
+                lookup(item_id)
+            calls += 1
+        if users:
+            rec.get_recommendation_for_known_user_batch(users, WARMUP_LIMIT)
+            calls += 1
+        for seed in items:
+            for item_id, _ in rec.get_recommendation_for_new_user([seed], WARMUP_LIMIT):
+                lookup(item_id)
+            calls += 1
+    except (MemoryError, RecursionError):
+        raise
+    except Exception as exc:
+        seconds = time.perf_counter() - started
+        _metrics.observe_model_warmup(entry.name, False, seconds)
+        logger.warning(
+            "model_warmup_failed",
+            recipe=entry.name,
+            calls=calls,
+            exc_type=type(exc).__name__,
+            error=str(exc),
+        )
+        return seconds
+    seconds = time.perf_counter() - started
+    _metrics.observe_model_warmup(entry.name, True, seconds)
+    logger.info(
+        "model_warmup_complete",
+        recipe=entry.name,
+        calls=calls,
+        seconds=round(seconds, 4),
+    )
+    return seconds
+
+
+def _sample(ids: Sequence[str], k: int, rng: random.Random) -> list[str]:
+    """Up to *k* distinct IDs drawn uniformly from *ids*."""
+    return [ids[i] for i in rng.sample(range(len(ids)), min(k, len(ids)))]
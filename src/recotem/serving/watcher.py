@@ -4,10 +4,19 @@ Design (Watcher loop):
 - Runs as a daemon thread; started once during app lifespan.
 - Polls every ``watch_interval`` seconds with +-10% jitter.
 - For each known recipe, stats the artifact pointer via fsspec.
-- If the pointer (mtime / ETag) has changed, reads the entire artifact once
-  into memory, computes sha256, HMAC-verifies, deserializes, then atomically
-  replaces the registry entry.
+- If the pointer (mtime / ETag) has changed, first fetches only the header
+  (``artifact.io.read_artifact_header``); a stored HMAC equal to the loaded
+  one means an identical re-upload and nothing more is read.  Otherwise
+  reads the entire artifact once into memory, computes sha256 and the HMAC
+  in a single pass (``artifact.io.digest_artifact``), verifies,
+  deserializes, warms the new model up (``recotem.serving.warmup``), then atomically replaces the
+  registry entry.
 - Concurrent stat() calls are bounded at 16 in-flight.
+- Changed artifacts load in parallel on a ``LoadQueue``
+  (``recotem.serving.load_queue``) bounded by
+  ``RECOTEM_WATCHER_LOAD_CONCURRENCY`` and
+  ``RECOTEM_WATCHER_LOAD_BUDGET_BYTES``; each load swaps its own registry
+  entry atomically, and the poll waits for its loads before the next tick.
 - Rescans the recipes directory each cycle: new YAML files are added; removed
   YAML files cause the entry to be dropped from the registry.
 - On any failure: logs ERROR with the kid (never the key), marks
@@ -16,7 +25,8 @@ Design (Watcher loop):
 
 Integration assumptions:
 - recotem.artifact.format.parse_header_from_bytes exists.
-- recotem.artifact.signing.{verify_hmac, unpickle_payload, SafeUnpickler} exist.
+- recotem.artifact.io.{digest_artifact, verify_digest} exist.
+- recotem.artifact.signing.{unpickle_payload, SafeUnpickler} exist.
 - recotem.recipe.loader.load_recipe exists.
 - recotem.metadata.loader.load_item_metadata exists.
 """
@@ -24,12 +34,13 @@ Integration assumptions:
 from __future__ import annotations
 
 import errno
-import hashlib
+import hmac
 import json
+import mmap
 import random
 import threading
 import time as _time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -44,12 +55,17 @@ from recotem._irspack_compat import (
 from recotem._log_safe import format_kid_for_log as _format_kid_for_log
 from recotem._metrics_watcher import inc_recipes_dir_scan_failure as _inc_scan_failure
 from recotem.artifact.format import ArtifactError
+from recotem.artifact.io import POINTER_MAX_BYTES
 from recotem.serving import metrics as _metrics
 from recotem.serving._header_utils import extract_algorithms, normalize_config_digest
 from recotem.serving._naming import dedup_stub_name
+from recotem.serving.lazy import standby_entry
+from recotem.serving.load_queue import LoadQueue
 from recotem.serving.registry import ModelEntry, ModelRegistry
+from recotem.serving.warmup import warm_up
 
 if TYPE_CHECKING:
+    from recotem.artifact.io import ArtifactDigest
     from recotem.artifact.signing import KeyRing
     from recotem.config import ServeConfig
 
@@ -71,7 +87,7 @@ _STAT_ERROR_SENTINEL = object()
 # ---------------------------------------------------------------------------
 
 
-def _read_artifact_bytes(path: str, max_bytes: int) -> bytes:
+def _read_artifact_bytes(path: str, max_bytes: int) -> bytes | bytearray | mmap.mmap:
     """Read artifact bytes once from *path* via fsspec, resolving pointers.
 
     For ``versioning: append_sha`` (the documented default), ``path`` is a
@@ -80,17 +96,23 @@ def _read_artifact_bytes(path: str, max_bytes: int) -> bytes:
     ``resolve_artifact_pointer`` so the rest of the serving layer always
     sees real artifact bytes regardless of the writer's versioning mode.
 
+    Local artifacts come back as a read-only ``mmap`` of a private copy (see
+    ``artifact.io.map_or_read``) so format-2 sections can stay in the page
+    cache, while an operator rewriting the artifact in place cannot change a
+    model that was already verified.  Callers treat the result as an opaque
+    bytes-like buffer.
+
     Raises
     ------
     ArtifactError
         If the file cannot be opened or exceeds *max_bytes*.
     """
-    from recotem.artifact.io import resolve_artifact_pointer
+    from recotem.artifact.io import map_or_read, resolve_artifact_pointer
 
     try:
         fs, fpath = fsspec.core.url_to_fs(path)
         with fs.open(fpath, "rb") as fh:
-            data = fh.read(max_bytes + 1)
+            data = map_or_read(fh, max_bytes)
         if len(data) > max_bytes:
             raise ArtifactError(
                 f"artifact at '{path}' exceeds cap {max_bytes}; refusing load"
@@ -166,7 +188,9 @@ def _stat_marker_with_error(
 
 
 def _sha256_bytes(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+    from recotem.artifact.io import artifact_sha256
+
+    return artifact_sha256(data)
 
 
 # ---------------------------------------------------------------------------
@@ -224,6 +248,15 @@ class ArtifactWatcher(threading.Thread):
     initial_states:
         Mapping of recipe name to _RecipeWatchState capturing the marker
         and sha256 from the initial load.
+    warmup:
+        Warm each new model up before swapping it in
+        (``serve_config.warmup_requests`` calls per verb).  The multi-worker
+        supervisor passes False: it does not serve, its workers warm up.
+    lazy:
+        Lazy-loading mode (``RECOTEM_MODEL_MEMORY_BUDGET``): newly discovered
+        recipes are registered on standby instead of being loaded.  Standby
+        entries are never loaded by the watcher in either mode; only
+        resident models are hot-swapped.
     """
 
     #: Number of consecutive unhandled poll-loop exceptions before the watcher
@@ -239,6 +272,8 @@ class ArtifactWatcher(threading.Thread):
         initial_states: dict[str, _RecipeWatchState] | None = None,
         *,
         unhealthy_threshold: int = 5,
+        warmup: bool = True,
+        lazy: bool = False,
     ) -> None:
         super().__init__(name="artifact-watcher", daemon=True)
         self._registry = registry
@@ -249,6 +284,8 @@ class ArtifactWatcher(threading.Thread):
         self._states: dict[str, _RecipeWatchState] = dict(initial_states or {})
         self._consecutive_errors: int = 0
         self._unhealthy_threshold: int = unhealthy_threshold
+        self._warmup_requests: int = serve_config.warmup_requests if warmup else 0
+        self._lazy = lazy
         # Per-recipe counter for consecutive post-HMAC deserialization failures.
         # Reset to 0 on success; triggers a distinct log event at threshold.
         self._post_hmac_failure_streak: dict[str, int] = {}
@@ -256,6 +293,13 @@ class ArtifactWatcher(threading.Thread):
             max_workers=_MAX_CONCURRENT_STATS,
             thread_name_prefix="artifact-stat",
         )
+        self._loads = LoadQueue(
+            serve_config.watcher_load_concurrency,
+            serve_config.watcher_load_budget_bytes or serve_config.max_artifact_bytes,
+            self._stop_event,
+        )
+        # Loads queued by the current poll; _finish_loads waits for them.
+        self._pending_loads: list[Future[None]] = []
         # Maps each recipe YAML path to the recipe.name parsed from it.
         # recipe.name is authoritative and may differ from the file stem when
         # the YAML declares an explicit ``name:`` field.  Initialized empty;
@@ -292,6 +336,11 @@ class ArtifactWatcher(threading.Thread):
         """
         self._yaml_path_to_name[yaml_path] = stub_name
 
+    def recipe_for(self, name: str) -> Any | None:
+        """Return the recipe currently tracked under *name*, or ``None``."""
+        state = self._states.get(name)
+        return state.recipe if state is not None else None
+
     def stop(self) -> None:
         """Signal the watcher thread to exit and cancel any pending futures.
 
@@ -318,6 +367,7 @@ class ArtifactWatcher(threading.Thread):
         except RuntimeError:
             # Executor was already shut down — idempotent.
             pass
+        self._loads.shutdown(wait=False)
 
     # ------------------------------------------------------------------
     # Thread main loop
@@ -362,6 +412,7 @@ class ArtifactWatcher(threading.Thread):
             except RuntimeError:
                 # Already shut down via stop() — safe to ignore.
                 pass
+            self._loads.shutdown(wait=True)
             logger.info("artifact_watcher_stopped")
 
     def _mark_all_unhealthy(self) -> None:
@@ -601,6 +652,12 @@ class ArtifactWatcher(threading.Thread):
                 # Track the yaml_path → recipe.name mapping so future rescan
                 # error handling is not forced to rely on file stem (M-6).
                 self._yaml_path_to_name[yaml_file] = recipe.name
+                if self._lazy:
+                    # Loaded by its first request, like every other recipe.
+                    self._registry.replace(
+                        recipe.name, standby_entry(recipe.name, artifact_path)
+                    )
+                    continue
                 # Insert a stub entry BEFORE attempting the load so that if
                 # the load fails, _record_load_failure → set_load_error finds
                 # a registered entry and the failure is visible in /health.
@@ -764,6 +821,54 @@ class ArtifactWatcher(threading.Thread):
                 pending = set()
                 break
 
+        self._finish_loads()
+
+    def _queue_load(self, name: str, state: _RecipeWatchState, marker: Any) -> None:
+        """Queue a hot-swap load of *name* on the bounded load queue."""
+        self._pending_loads.append(
+            self._loads.submit(
+                name,
+                self._load_size_estimate(name, marker),
+                lambda: self._load_recipe(name, state, force=False, marker=marker),
+            )
+        )
+
+    def _load_size_estimate(self, name: str, marker: Any) -> int:
+        """Bytes to charge a load of *name* whose new stat marker is *marker*.
+
+        A local ``(mtime, size)`` marker carries the new artifact's size.  An
+        object-store ETag carries none, and an ``append_sha`` pointer file's
+        size says nothing about its target; those fall back to the payload
+        size of the model being replaced or, for a first load, to an even
+        share of the budget so that unknown sizes still load in parallel up
+        to the count limit.
+        """
+        if isinstance(marker, tuple):
+            size = marker[1]
+            if isinstance(size, int) and size > POINTER_MAX_BYTES:
+                return min(size, self._config.max_artifact_bytes)
+        entry = self._registry.get(name)
+        if entry is not None and entry.payload_bytes > 0:
+            return entry.payload_bytes
+        return max(1, self._loads.budget_bytes // self._config.watcher_load_concurrency)
+
+    def _finish_loads(self) -> None:
+        """Wait for the loads queued this poll; re-raise what escaped one.
+
+        ``_load_recipe`` handles artifact errors itself, so only unexpected
+        exceptions (``MemoryError`` included) reach the poll loop's handler,
+        exactly as when loads ran inline.
+        """
+        import concurrent.futures
+
+        futures, self._pending_loads = self._pending_loads, []
+        not_done = set(futures)
+        while not_done and not self._stop_event.is_set():
+            _done, not_done = concurrent.futures.wait(not_done, timeout=0.5)
+        for fut in futures:
+            if fut.done() and not fut.cancelled() and fut.exception() is not None:
+                raise fut.exception()  # type: ignore[misc]
+
     def _process_stat_result(
         self,
         name: str,
@@ -823,6 +928,15 @@ class ArtifactWatcher(threading.Thread):
         # Successful stat — clear the error-class tracker (OBS-1).
         state._last_stat_error_class = None
 
+        entry = self._registry.get(name)
+        if entry is not None and entry.standby:
+            # Not resident: nothing to swap, and the next on-demand load
+            # reads whatever the artifact is by then.
+            state.last_marker = marker
+            if entry.last_load_error is not None:
+                self._registry.set_load_error(name, None)
+            return
+
         if marker == state.last_marker:
             # Fast path: pointer/mtime unchanged.  For append_sha
             # artifacts we additionally check the cheap ``.sha256``
@@ -846,10 +960,10 @@ class ArtifactWatcher(threading.Thread):
             # the problem.  Do NOT call _inc_scan_failure here — that feeds
             # the watcher-global consecutive-error counter and a single
             # misbehaving recipe must not mark all others unhealthy (W-5).
-            self._load_recipe(name, state, force=False, marker=marker)
+            self._queue_load(name, state, marker)
             return
 
-        self._load_recipe(name, state, force=False, marker=marker)
+        self._queue_load(name, state, marker)
 
     # ------------------------------------------------------------------
     # Load / verify / replace
@@ -872,6 +986,11 @@ class ArtifactWatcher(threading.Thread):
         artifact_path = state.artifact_path
         max_bytes = self._config.max_artifact_bytes
 
+        if not force and self._serves_same_artifact(name, artifact_path):
+            if marker is not None:
+                state.last_marker = marker
+            return
+
         try:
             data = _read_artifact_bytes(artifact_path, max_bytes)
         except ArtifactError as exc:
@@ -897,7 +1016,12 @@ class ArtifactWatcher(threading.Thread):
             )
             return
 
-        sha256 = _sha256_bytes(data)
+        from recotem.artifact.io import digest_artifact
+
+        # One pass over the bytes yields the change-detection SHA-256 and the
+        # payload HMAC that _build_entry verifies.
+        digest = digest_artifact(data, self._key_ring, self._config.max_payload_bytes)
+        sha256 = digest.sha256
 
         if not force and sha256 == state.last_sha256:
             if marker is not None:
@@ -905,7 +1029,9 @@ class ArtifactWatcher(threading.Thread):
             return
 
         try:
-            entry = self._build_entry(name, state.recipe, data, artifact_path)
+            entry = self._build_entry(
+                name, state.recipe, data, artifact_path, digest=digest
+            )
         except ArtifactError as exc:
             kid_log, kid_reason = _extract_kid_safe(data)
             if kid_reason is not None:
@@ -969,6 +1095,9 @@ class ArtifactWatcher(threading.Thread):
             )
             return
 
+        # The previous model keeps serving while the new one warms up.
+        warm_up(entry, self._warmup_requests)
+
         new_marker = (
             marker
             if marker is not None
@@ -994,33 +1123,71 @@ class ArtifactWatcher(threading.Thread):
             trained_at=entry.trained_at,
         )
 
+    def _serves_same_artifact(self, name: str, artifact_path: str) -> bool:
+        """Whether the artifact's header shows it is the one already loaded.
+
+        Fetches only the header (``artifact.io.read_artifact_header``): a
+        stored HMAC equal to the loaded entry's means the same signed
+        content, e.g. an identical re-upload that only changed the ETag.
+        Any read problem returns ``False``; the full read reports it.
+        """
+        from recotem.artifact.io import read_artifact_header
+
+        entry = self._registry.get(name)
+        if entry is None or not entry.loaded or not entry.hmac_digest:
+            return False
+        try:
+            header = read_artifact_header(artifact_path).header
+        except (MemoryError, RecursionError):
+            raise
+        except Exception:  # noqa: BLE001 - fall back to the full read
+            return False
+        if header.kid != entry.kid or not hmac.compare_digest(
+            header.hmac_digest, entry.hmac_digest
+        ):
+            return False
+        logger.debug(
+            "artifact_unchanged_by_header",
+            name=name,
+            kid=_format_kid_for_log(header.kid),
+        )
+        return True
+
     def _build_entry(
-        self, name: str, recipe: Any, data: bytes, artifact_path: str
+        self,
+        name: str,
+        recipe: Any,
+        data: bytes,
+        artifact_path: str,
+        *,
+        digest: ArtifactDigest | None = None,
     ) -> ModelEntry:
-        """Parse, verify, deserialize data and return a fresh ModelEntry."""
+        """Parse, verify, deserialize data and return a fresh ModelEntry.
+
+        *digest* is ``digest_artifact``'s pass over *data* when the caller
+        already made it; otherwise it is made here.
+        """
+        from recotem.artifact.compression import payload_compression
         from recotem.artifact.format import parse_header_from_bytes
-        from recotem.artifact.signing import unpickle_payload, verify_hmac
+        from recotem.artifact.io import digest_artifact, verify_digest
+        from recotem.artifact.signing import unpickle_payload
 
         # Use the payload-specific cap for parse_header_from_bytes so
         # serve-side deserialization is bounded by max_payload_bytes (not
         # max_artifact_bytes). This separates the outer container size cap from
         # the deserialization cap.
         max_payload_bytes = self._config.max_payload_bytes
-        hdr = parse_header_from_bytes(data, max_payload_bytes)
+        if digest is None:
+            digest = digest_artifact(data, self._key_ring, max_payload_bytes)
+        hdr = digest.header
+        if hdr is None:
+            # The header did not parse; parse again to raise the reason.
+            hdr = parse_header_from_bytes(data, max_payload_bytes)
 
-        payload_bytes = data[hdr.payload_offset :]
+        payload_bytes = digest.payload
 
         if self._key_ring is not None:
-            kid_bytes = hdr.kid.encode("utf-8")
-            header_json_bytes = hdr.header_data
-            verify_hmac(
-                self._key_ring,
-                hdr.kid,
-                kid_bytes,
-                header_json_bytes,
-                payload_bytes,
-                hdr.hmac_digest,
-            )
+            verify_digest(digest)
         else:
             logger.warning(
                 "artifact_hmac_skipped_dev_allow_unsigned",
@@ -1041,7 +1208,12 @@ class ArtifactWatcher(threading.Thread):
         # the recipe nor the remedy.
         check_artifact_irspack_version(header_dict, name=name)
 
-        recommender = unpickle_payload(payload_bytes)
+        recommender = unpickle_payload(
+            payload_bytes,
+            compression=payload_compression(header_dict),
+            max_decompressed_bytes=max_payload_bytes,
+        )
+        apply_ann_config(recommender, recipe)
 
         metadata_df = None
         metadata_index = None
@@ -1081,6 +1253,8 @@ class ArtifactWatcher(threading.Thread):
             config_digest=normalize_config_digest(header_dict.get("config_digest"))
             or "",
             algorithms=extract_algorithms(header_dict),
+            payload_bytes=len(payload_bytes),
+            hmac_digest=hdr.hmac_digest,
         )
 
     def _mark_error(self, name: str, error: str) -> None:
@@ -1402,6 +1576,17 @@ def _load_metadata(recipe: Any, recipe_name: str) -> Any:
     )
 
 
+def apply_ann_config(recommender: Any, recipe: Any) -> None:
+    """Apply the recipe's ``ann.exact`` switch to a freshly loaded model.
+
+    Only ``IDMappedRecommender`` carries an ANN index; anything else (test
+    doubles, legacy payloads) is left untouched.
+    """
+    if hasattr(recommender, "exact_search"):
+        ann = getattr(recipe, "ann", None)
+        recommender.exact_search = bool(ann is not None and ann.exact)
+
+
 # ---------------------------------------------------------------------------
 # Factory helper used by app.py
 # ---------------------------------------------------------------------------
@@ -1426,6 +1611,7 @@ load_metadata = _load_metadata
 
 __all__ = [
     "ArtifactWatcher",
+    "apply_ann_config",
     "build_initial_states",
     "read_artifact_bytes",
     "stat_marker",
@@ -0,0 +1,130 @@
+"""Train-time ANN index construction and recall measurement.
+
+Builds the ``recotem._ann.IVFIndex`` for a trained factor model when the
+recipe has an ``ann`` block, tunes ``n_probe`` against exact scoring and
+returns the summary recorded as ``header["ann"]``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import structlog
+
+from recotem._ann import FactorView, IVFIndex, factor_view
+from recotem.recipe.models import AnnConfig
+from recotem.training._compat import IDMappedRecommender
+
+logger = structlog.get_logger(__name__)
+
+#: Users sampled to measure recall@k against exact scoring.
+RECALL_SAMPLE_USERS = 500
+_EXACT_CHUNK_USERS = 64
+
+
+def build_ann_index(
+    recommender: IDMappedRecommender,
+    config: AnnConfig | None,
+    cutoff: int,
+    seed: int,
+) -> dict[str, Any] | None:
+    """Attach an ANN index to *recommender* and return its header summary.
+
+    Returns ``None`` when the recipe has no ``ann`` block.  Otherwise the
+    summary is either ``{"status": "skipped", "reason": ...}`` (unsupported
+    algorithm or catalog below ``min_items``) or ``{"status": "built", ...}``
+    with the chosen ``n_lists`` / ``n_probe`` and the measured ``recall_at_k``.
+    """
+    if config is None:
+        return None
+    view = factor_view(recommender.recommender)
+    if view is None:
+        return {"status": "skipped", "reason": "unsupported_algorithm"}
+    n_items = view.item_factors.shape[0]
+    if n_items < config.min_items:
+        return {"status": "skipped", "reason": "below_min_items"}
+
+    index = IVFIndex.build(view, config.n_lists, seed=seed)
+    seen = recommender.recommender.X_train_all.tocsr()
+    rng = np.random.default_rng(seed)
+    n_users = view.user_factors.shape[0]
+    users = np.sort(
+        rng.choice(n_users, size=min(n_users, RECALL_SAMPLE_USERS), replace=False)
+    )
+    k = min(cutoff, n_items)
+    truth = _exact_top_k(view, seen, users, k)
+
+    if config.n_probe:
+        index.n_probe = min(config.n_probe, index.n_lists)
+        recall = _recall_at_k(index, view, seen, users, truth, k)
+    else:
+        index.n_probe = 1
+        recall = _recall_at_k(index, view, seen, users, truth, k)
+        while recall < config.target_recall and index.n_probe < index.n_lists:
+            index.n_probe = min(index.n_probe * 2, index.n_lists)
+            recall = _recall_at_k(index, view, seen, users, truth, k)
+
+    recommender.attach_ann_index(index)
+    logger.info(
+        "ann_index_built",
+        n_lists=index.n_lists,
+        n_probe=index.n_probe,
+        recall_at_k=recall,
+    )
+    return {
+        "status": "built",
+        "index": "ivf_flat",
+        "n_lists": index.n_lists,
+        "n_probe": index.n_probe,
+        "k": k,
+        "recall_at_k": round(recall, 4),
+        "sample_users": len(users),
+    }
+
+
+def _exact_top_k(
+    view: FactorView, seen: Any, users: np.ndarray, k: int
+) -> list[np.ndarray]:
+    """Exact top-*k* unseen items of each sampled user, in chunks."""
+    result: list[np.ndarray] = []
+    for start in range(0, len(users), _EXACT_CHUNK_USERS):
+        chunk = users[start : start + _EXACT_CHUNK_USERS]
+        block = np.asarray(
+            view.user_factors[chunk] @ view.item_factors.T, dtype=np.float64
+        )
+        if view.item_bias is not None:
+            block += view.item_bias
+        block[seen[chunk].nonzero()] = -np.inf
+        top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        for row, cols in enumerate(top):
+            result.append(cols[np.isfinite(block[row, cols])])
+    return result
+
+
+def _recall_at_k(
+    index: IVFIndex,
+    view: FactorView,
+    seen: Any,
+    users: np.ndarray,
+    truth: list[np.ndarray],
+    k: int,
+) -> float:
+    """Mean fraction of the exact top-*k* that the index retrieves."""
+    queries = view.user_factors[users]
+    hits = 0
+    total = 0
+    for row, candidates in enumerate(index.candidates(queries)):
+        expected = truth[row]
+        if not len(expected):
+            continue
+        scores = view.score(queries[row], candidates)
+        user_seen = seen.indices[seen.indptr[users[row]] : seen.indptr[users[row] + 1]]
+        scores[np.isin(candidates, user_seen)] = -np.inf
+        if len(scores) > k:
+            top = candidates[np.argpartition(-scores, k - 1)[:k]]
+        else:
+            top = candidates
+        hits += len(np.intersect1d(top, expected))
+        total += len(expected)
+    return hits / total if total else 1.0
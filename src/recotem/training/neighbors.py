@@ -0,0 +1,41 @@
+"""Train-time item-to-item neighbour table.
+
+Materializes ``recotem._neighbors`` for the final model when the recipe has
+a ``neighbors`` block and returns the summary recorded as
+``header["neighbors"]``.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import structlog
+
+from recotem._neighbors import build_neighbor_table
+from recotem.recipe.models import NeighborsConfig
+from recotem.training._compat import IDMappedRecommender
+
+logger = structlog.get_logger(__name__)
+
+
+def build_neighbors(
+    recommender: IDMappedRecommender,
+    config: NeighborsConfig | None,
+) -> dict[str, Any] | None:
+    """Build the table onto *recommender*; ``None`` when not configured.
+
+    Building costs one single-seed scoring pass per item, done in blocks.
+    """
+    if config is None:
+        return None
+    started = time.monotonic()
+    table = build_neighbor_table(recommender.recommender, config.k, config.max_seeds)
+    recommender.attach_neighbor_table(table)
+    summary = {
+        "k": table["k"],
+        "max_seeds": config.max_seeds if table["linear"] else 1,
+        "build_seconds": round(time.monotonic() - started, 3),
+    }
+    logger.info("neighbor_table_built", **summary)
+    return summary
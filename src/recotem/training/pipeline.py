@@ -32,11 +32,13 @@ from recotem.recipe.errors import RecipeError
 from recotem.recipe.models import Recipe
 from recotem.training._compat import IDMappedRecommender
 from recotem.training.algorithms import get_recommender_cls, resolve_algorithm_name
+from recotem.training.ann import build_ann_index
 from recotem.training.errors import (
     MinDataViolation,
     TrainingError,
 )
 from recotem.training.evaluate import build_evaluator
+from recotem.training.neighbors import build_neighbors
 from recotem.training.progress import ProgressReporter
 from recotem.training.search import SearchResult, run_search
 from recotem.training.split import split_interactions
@@ -334,6 +336,11 @@ def _run_training_locked(
 
         write_artifact_fn = write_artifact
 
+    # Fail before hours of training, not when the artifact is written.
+    from recotem.artifact.compression import require_codec  # noqa: PLC0415
+
+    require_codec(recipe.output.compression)
+
     # ------------------------------------------------------------------
     # 1. Compute recipe hash (SHA-256 of canonical YAML reserialization).
     #    We do this before any data fetch so the hash reflects config only.
@@ -460,6 +467,13 @@ def _run_training_locked(
         best_params=search_result.best_params,
     )
     bound_logger.info("final_model_trained")
+    ann_summary = build_ann_index(
+        trained_recommender,
+        recipe.ann,
+        cutoff=recipe.training.cutoff,
+        seed=random_seed,
+    )
+    neighbors_summary = build_neighbors(trained_recommender, recipe.neighbors)
 
     # ------------------------------------------------------------------
     # 8. Build artifact header and write.
@@ -487,6 +501,10 @@ def _run_training_locked(
         },
         "data_stats": data_stats,
     }
+    if ann_summary is not None:
+        header_dict["ann"] = ann_summary
+    if neighbors_summary is not None:
+        header_dict["neighbors"] = neighbors_summary
 
     artifact_path: str = write_artifact_fn(
         trained_recommender,
@@ -494,6 +512,8 @@ def _run_training_locked(
         key_ring,
         recipe.output.path,
         versioning=recipe.output.versioning,
+        format_version=recipe.output.format_version,
+        compression=recipe.output.compression,
     )
 
     # Canonical end-of-train marker.
@@ -365,6 +365,13 @@ def movielens_small_df(movielens_df: pd.DataFrame) -> pd.DataFrame:
 def build_v1_app(
     registry,
     api_keys=None,
+    response_cache=None,
+    coalescer=None,
+    executors=None,
+    admission=None,
+    server_timing=False,
+    stream_chunk_size=256,
+    lazy_loader=None,
 ):
     """Build a FastAPI app mounting the v1 router with production middleware.
 
@@ -374,6 +381,21 @@ def build_v1_app(
         ``ModelRegistry`` populated with the model entries the test needs.
     api_keys:
         Optional list of ``ApiKeyEntry`` (defaults to []).
+    response_cache:
+        Optional ``ResponseCache`` handed to ``make_router``.
+    coalescer:
+        Optional ``RecommendCoalescer`` handed to ``make_router``.
+    executors:
+        Optional ``RecipeExecutors`` handed to ``make_router`` (default:
+        inference runs on Starlette's shared threadpool).
+    admission:
+        Optional ``AdmissionController`` handed to ``make_router``.
+    server_timing:
+        Whether inference responses carry a ``Server-Timing`` header.
+    stream_chunk_size:
+        NDJSON lines scored together by ``:stream-recommend``.
+    lazy_loader:
+        Optional ``LazyModelLoader`` handed to ``make_router``.
 
     Returns
     -------
@@ -465,6 +487,53 @@ def build_v1_app(
     router = make_router(
         registry=registry,
         api_keys=api_keys or [],
+        response_cache=response_cache,
+        coalescer=coalescer,
+        executors=executors,
+        admission=admission,
+        server_timing=server_timing,
+        stream_chunk_size=stream_chunk_size,
+        lazy_loader=lazy_loader,
     )
     app.include_router(router, prefix="/v1")
     return app
+
+
+class DenseScoreRecommender:
+    """Minimal irspack-shaped recommender backed by a fixed score matrix.
+
+    Implements just the scoring surface ``IDMappedRecommender`` relies on and
+    records every call so tests can assert how many score blocks were built.
+    """
+
+    def __init__(self, scores: Any) -> None:
+        import numpy as np
+
+        self.scores = np.asarray(scores, dtype=np.float64)
+        self.n_users, self.n_items = self.scores.shape
+        self.known_calls: list[list[int]] = []
+        self.cold_calls: list[Any] = []
+
+    def get_score_remove_seen(self, user_indices: Any) -> Any:
+        self.known_calls.append([int(i) for i in user_indices])
+        return self.scores[user_indices].copy()
+
+    def get_score_cold_user_remove_seen(self, X: Any) -> Any:
+        import numpy as np
+
+        self.cold_calls.append(X)
+        score = np.asarray(X @ self.scores.T @ self.scores)
+        score[X.nonzero()] = -np.inf
+        return score
+
+
+def dense_idmapped_recommender(scores: Any) -> Any:
+    """Wrap a ``DenseScoreRecommender`` with ids ``u0..`` / ``i0..``."""
+    from recotem._idmap import IDMappedRecommender
+
+    inner = DenseScoreRecommender(scores)
+    return IDMappedRecommender(
+        inner,
+        [f"u{i}" for i in range(inner.n_users)],
+        [f"i{j}" for j in range(inner.n_items)],
+    )
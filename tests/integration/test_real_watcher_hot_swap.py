@@ -276,9 +276,9 @@ def test_watcher_does_not_reload_when_sha256_unchanged(
     unpickle_call_count: list[int] = [0]
     original_unpickle = signing_module.unpickle_payload
 
-    def _counting_unpickle(payload_bytes: bytes):
+    def _counting_unpickle(payload_bytes: bytes, **kwargs):
         unpickle_call_count[0] += 1
-        return original_unpickle(payload_bytes)
+        return original_unpickle(payload_bytes, **kwargs)
 
     monkeypatch.setattr(signing_module, "unpickle_payload", _counting_unpickle)
 
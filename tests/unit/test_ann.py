@@ -0,0 +1,173 @@
+"""Tests for the ANN candidate index (recotem._ann, recotem.training.ann)."""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+import scipy.sparse as sps
+
+import recotem.training._compat  # noqa: F401  (IPython stub before irspack)
+from recotem._ann import FactorView, IVFIndex, factor_view
+from recotem._idmap import IDMappedRecommender
+from recotem.recipe.models import AnnConfig
+from recotem.training.ann import build_ann_index
+
+N_USERS = 120
+N_ITEMS = 400
+
+
+def _interactions() -> sps.csr_matrix:
+    X = sps.random(N_USERS, N_ITEMS, density=0.03, random_state=0, format="csr")
+    X.data[:] = 1.0
+    return X
+
+
+def _idmapped(algorithm: str = "IALS") -> IDMappedRecommender:
+    from irspack import (
+        IALSRecommender,
+        TopPopRecommender,
+        TruncatedSVDRecommender,
+    )
+
+    X = _interactions()
+    if algorithm == "IALS":
+        rec = IALSRecommender(X, n_components=8, train_epochs=3).learn()
+    elif algorithm == "SVD":
+        rec = TruncatedSVDRecommender(X, n_components=8).learn()
+    else:
+        rec = TopPopRecommender(X).learn()
+    return IDMappedRecommender(
+        rec,
+        [f"u{i}" for i in range(N_USERS)],
+        [f"i{i}" for i in range(N_ITEMS)],
+    )
+
+
+def _ranked_ids(rows: list[list[tuple[str, float]]]) -> list[list[str]]:
+    return [[iid for iid, _ in row] for row in rows]
+
+
+def test_full_probe_lists_partition_the_catalog() -> None:
+    rng = np.random.default_rng(0)
+    view = FactorView(rng.normal(size=(5, 4)), rng.normal(size=(50, 4)))
+    index = IVFIndex.build(view, n_lists=6)
+
+    assert index.n_lists == 6 and index.n_probe == 6
+    assert sorted(index.list_items.tolist()) == list(range(50))
+    (candidates,) = index.candidates(view.user_factors[:1])
+    assert sorted(candidates.tolist()) == list(range(50))
+
+    restored = IVFIndex.from_state(index.to_state())
+    np.testing.assert_array_equal(restored.list_offsets, index.list_offsets)
+
+
+def test_probed_clusters_hold_the_best_inner_product_items() -> None:
+    rng = np.random.default_rng(1)
+    centres = np.eye(8) * 4
+    items = centres.repeat(25, axis=0) + rng.normal(size=(200, 8)) * 0.1
+    bias = rng.normal(size=200) * 0.01
+    view = FactorView(centres, items, bias)
+    index = IVFIndex.build(view, n_lists=8)
+    index.n_probe = 2
+
+    for user, candidates in enumerate(index.candidates(centres)):
+        assert len(candidates) < 200
+        best = np.argsort(-view.score(centres[user]))[:10]
+        assert set(best.tolist()) <= set(candidates.tolist())
+
+
+@pytest.mark.parametrize("algorithm", ["IALS", "SVD"])
+def test_full_probe_index_matches_exact_search(algorithm: str) -> None:
+    idmapped = _idmapped(algorithm)
+    summary = build_ann_index(
+        idmapped, AnnConfig(min_items=1, n_lists=10, n_probe=10), cutoff=10, seed=0
+    )
+    assert summary["status"] == "built"
+    assert summary["recall_at_k"] == pytest.approx(1.0)
+
+    users = [f"u{i}" for i in range(20)]
+    exclude = [["i0", "i1", "i2"]] * len(users)
+    seeds = [[f"i{j}" for j in range(k, k + 4)] for k in range(10)]
+    approx_known = idmapped.get_recommendation_for_known_user_batch(users, 10, exclude)
+    approx_cold = idmapped.get_recommendation_for_new_user_batch(seeds, 10)
+    idmapped.exact_search = True
+    exact_known = idmapped.get_recommendation_for_known_user_batch(users, 10, exclude)
+    exact_cold = idmapped.get_recommendation_for_new_user_batch(seeds, 10)
+
+    assert _ranked_ids(approx_known) == _ranked_ids(exact_known)
+    assert _ranked_ids(approx_cold) == _ranked_ids(exact_cold)
+    for approx, exact in zip(approx_known, exact_known, strict=True):
+        assert [s for _, s in approx] == pytest.approx([s for _, s in exact], rel=1e-5)
+    seen = set(_interactions()[0].indices.tolist())
+    assert not {int(iid[1:]) for iid, _ in approx_known[0]} & (seen | {0, 1, 2})
+
+
+def test_short_candidate_rows_fall_back_to_exact_scoring() -> None:
+    idmapped = _idmapped()
+    build_ann_index(
+        idmapped, AnnConfig(min_items=1, n_lists=40, n_probe=1), cutoff=5, seed=0
+    )
+    cutoff = N_ITEMS  # more than any single cluster holds
+    (row,) = idmapped.get_recommendation_for_known_user_batch(["u3"], cutoff)
+    idmapped.exact_search = True
+    (exact,) = idmapped.get_recommendation_for_known_user_batch(["u3"], cutoff)
+
+    assert _ranked_ids([row]) == _ranked_ids([exact])
+
+
+def test_auto_n_probe_reaches_target_recall() -> None:
+    idmapped = _idmapped()
+    summary = build_ann_index(
+        idmapped, AnnConfig(min_items=1, n_lists=16, target_recall=0.9), 10, seed=0
+    )
+
+    assert summary["recall_at_k"] >= 0.9 or summary["n_probe"] == 16
+    assert summary["k"] == 10 and summary["sample_users"] == N_USERS
+    assert idmapped.ann_index["n_probe"] == summary["n_probe"]
+
+
+def test_build_is_skipped_without_config_or_for_unsupported_models() -> None:
+    assert build_ann_index(_idmapped(), None, 10, seed=0) is None
+    assert build_ann_index(_idmapped(), AnnConfig(), 10, seed=0) == {
+        "status": "skipped",
+        "reason": "below_min_items",
+    }
+    toppop = _idmapped("TopPop")
+    assert factor_view(toppop.recommender) is None
+    assert build_ann_index(toppop, AnnConfig(min_items=1), 10, seed=0) == {
+        "status": "skipped",
+        "reason": "unsupported_algorithm",
+    }
+    assert toppop.ann_index is None
+
+
+def test_index_is_pickled_but_exact_switch_is_not() -> None:
+    idmapped = _idmapped()
+    build_ann_index(idmapped, AnnConfig(min_items=1, n_lists=8), 10, seed=0)
+    idmapped.exact_search = True
+    idmapped.get_recommendation_for_known_user_batch(["u0"], 5)
+
+    restored = pickle.loads(pickle.dumps(idmapped))
+    assert restored.ann_index["kind"] == "ivf_flat"
+    assert restored.exact_search is False
+    assert "_ann" not in restored.__dict__
+
+    legacy_state = idmapped.__getstate__()
+    del legacy_state["ann_index"]
+    legacy = IDMappedRecommender.__new__(IDMappedRecommender)
+    legacy.__setstate__(legacy_state)
+    assert legacy.ann_index is None
+
+
+def test_apply_ann_config_sets_the_exact_switch() -> None:
+    from types import SimpleNamespace
+
+    from recotem.serving.watcher import apply_ann_config
+
+    idmapped = _idmapped()
+    apply_ann_config(idmapped, SimpleNamespace(ann=AnnConfig(exact=True)))
+    assert idmapped.exact_search is True
+    apply_ann_config(idmapped, SimpleNamespace())
+    assert idmapped.exact_search is False
@@ -0,0 +1,82 @@
+"""Unit tests for recotem.artifact.compression."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import pickle
+
+import pytest
+
+from recotem.artifact import compression as _compression
+from recotem.artifact.compression import (
+    compress_pickle,
+    open_decompressed,
+    payload_compression,
+    require_codec,
+)
+from recotem.artifact.format import ArtifactError
+
+
+def test_compress_pickle_round_trips_through_the_bounded_reader() -> None:
+    obj = {"ids": [f"item-{i}" for i in range(1000)], "blob": b"\x00" * 200_000}
+    payload = compress_pickle(obj, "gzip")
+
+    assert len(payload) < len(pickle.dumps(obj)) // 10
+    stream = open_decompressed(io.BytesIO(payload), "gzip", 1 << 20)
+    assert pickle.Unpickler(stream).load() == obj
+
+
+def test_decompression_is_capped() -> None:
+    payload = compress_pickle(b"\x00" * 100_000, "gzip")
+    stream = open_decompressed(io.BytesIO(payload), "gzip", 50_000)
+
+    with pytest.raises(ArtifactError, match="exceeds cap 50000"):
+        pickle.Unpickler(stream).load()
+
+
+def test_reads_are_filled_across_short_inner_reads() -> None:
+    class _Trickle(io.RawIOBase):
+        """Inner stream that returns at most 3 bytes per call."""
+
+        def __init__(self, data: bytes) -> None:
+            self._data = io.BytesIO(data)
+
+        def readinto(self, buffer) -> int:
+            chunk = self._data.read(min(3, len(buffer)))
+            buffer[: len(chunk)] = chunk
+            return len(chunk)
+
+    reader = _compression._BoundedReader(_Trickle(b"abcdefghij\nk"), 100)
+    assert reader.read(4) == b"abcd"
+    assert reader.readline() == b"efghij\n"
+    assert reader.read() == b"k"
+
+
+def test_codec_validation(monkeypatch: pytest.MonkeyPatch) -> None:
+    require_codec("none")
+    require_codec("gzip")
+    with pytest.raises(ArtifactError, match="unknown payload compression"):
+        require_codec("lz4")
+    monkeypatch.setattr(_compression, "_ZSTD_AVAILABLE", False)
+    with pytest.raises(ArtifactError, match=r"recotem\[binary\]"):
+        require_codec("zstd")
+
+    assert payload_compression({}) == "none"
+    assert payload_compression({"compression": "gzip"}) == "gzip"
+    with pytest.raises(ArtifactError, match="^header JSON compression"):
+        payload_compression({"compression": "brotli"})
+    with pytest.raises(ArtifactError, match="^header JSON compression"):
+        payload_compression({"compression": 1})
+
+
+@pytest.mark.skipif(not _compression.zstd_available(), reason="needs zstandard")
+def test_zstd_round_trip() -> None:
+    obj = list(range(10_000))
+    payload = compress_pickle(obj, "zstd")
+    stream = open_decompressed(io.BytesIO(payload), "zstd", 1 << 20)
+    assert pickle.Unpickler(stream).load() == obj
+
+
+def test_gzip_payload_is_a_standard_gzip_stream() -> None:
+    assert pickle.loads(gzip.decompress(compress_pickle([1, 2], "gzip"))) == [1, 2]
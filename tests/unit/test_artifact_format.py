@@ -16,6 +16,7 @@ import pytest
 from recotem.artifact.format import (
     FORMAT_VERSION,
     MAGIC,
+    MAX_FORMAT_VERSION,
     MAX_HEADER_LEN,
     ArtifactError,
     ArtifactHeader,
@@ -101,7 +102,7 @@ def test_format_version_zero_rejected() -> None:
 
 def test_format_version_unsupported_future_rejected() -> None:
     data = bytearray(_valid_artifact())
-    struct.pack_into("<H", data, 8, FORMAT_VERSION + 1)
+    struct.pack_into("<H", data, 8, MAX_FORMAT_VERSION + 1)
     with pytest.raises(ArtifactError, match="version"):
         parse_header_from_bytes(bytes(data), max_payload_bytes=2**31)
 
@@ -219,3 +220,88 @@ def test_default_max_payload_bytes_is_512_mib() -> None:
         f"DEFAULT_MAX_PAYLOAD_BYTES should be {expected} (512 MiB), "
         f"got {DEFAULT_MAX_PAYLOAD_BYTES}"
     )
+
+
+# ---------------------------------------------------------------------------
+# Sectioned (format 2) payloads
+# ---------------------------------------------------------------------------
+
+
+def test_build_artifact_bytes_writes_requested_version() -> None:
+    from recotem.artifact.format import FORMAT_VERSION_V1
+
+    data = build_artifact_bytes("k", b"\x00" * 32, b"{}", b"", version=1)
+    assert parse_header_from_bytes(data, 2**31).version == FORMAT_VERSION_V1
+    with pytest.raises(ArtifactError, match="unsupported format version"):
+        build_artifact_bytes(
+            "k", b"\x00" * 32, b"{}", b"", version=MAX_FORMAT_VERSION + 1
+        )
+
+
+def test_sectioned_payload_roundtrip_aligns_sections_to_file_offset() -> None:
+    from recotem.artifact.format import (
+        SECTION_ALIGNMENT,
+        build_sectioned_payload,
+        is_sectioned_payload,
+        split_sectioned_payload,
+    )
+
+    sections = [memoryview(b"a" * 100), memoryview(b""), memoryview(b"bc" * 70)]
+    payload = build_sectioned_payload(b"manifest", sections, payload_offset=61)
+    assert is_sectioned_payload(payload)
+    assert not is_sectioned_payload(b"\x80\x05rest-of-a-pickle")
+
+    manifest, views = split_sectioned_payload(payload)
+    assert bytes(manifest) == b"manifest"
+    assert [bytes(v) for v in views] == [bytes(s) for s in sections]
+    base = memoryview(payload)
+    for view in views:
+        if view.nbytes:
+            offset = bytes(base).index(bytes(view))
+            assert (61 + offset) % SECTION_ALIGNMENT == 0
+
+
+def _sectioned(manifest: bytes = b"m", sections=(b"x" * 10,)) -> bytearray:
+    from recotem.artifact.format import build_sectioned_payload
+
+    return bytearray(
+        build_sectioned_payload(manifest, [memoryview(s) for s in sections])
+    )
+
+
+@pytest.mark.parametrize(
+    "mutate,match",
+    [
+        (lambda p: p[:20], "missing section prefix"),
+        (lambda p: p.__setitem__(slice(12, 16), b"\x01\x00\x00\x00"), "reserved"),
+        (
+            lambda p: p.__setitem__(slice(8, 12), struct.pack("<I", 70_000)),
+            "exceeds maximum",
+        ),
+        (
+            lambda p: p.__setitem__(slice(8, 12), struct.pack("<I", 4_000)),
+            "truncated section table",
+        ),
+        (
+            lambda p: p.__setitem__(slice(16, 24), struct.pack("<Q", 10**9)),
+            "truncated manifest",
+        ),
+        (
+            lambda p: p.__setitem__(slice(32, 40), struct.pack("<Q", 10**9)),
+            "outside the payload",
+        ),
+        (
+            lambda p: p.__setitem__(slice(24, 32), struct.pack("<Q", 0)),
+            "outside the payload",
+        ),
+    ],
+)
+def test_split_sectioned_payload_rejects_malformed_layout(mutate, match) -> None:
+    from recotem.artifact.format import split_sectioned_payload
+
+    payload = _sectioned()
+    result = mutate(payload)
+    if result is not None:
+        payload = result
+    with pytest.raises(ArtifactError, match=match):
+        split_sectioned_payload(bytes(payload))
@@ -0,0 +1,113 @@
+"""Unit tests for recotem.artifact.integrity."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import threading
+
+import pytest
+
+from recotem.artifact import integrity as _integrity
+from recotem.artifact.format import ArtifactError
+from recotem.artifact.integrity import (
+    MAX_CHUNKS,
+    MIN_CHUNK_BYTES,
+    build_manifest,
+    chunk_bytes_for,
+    hash_chunks,
+    manifest_from_header,
+    read_verified_range,
+    verify_chunks,
+)
+
+_PAYLOAD = bytes(range(256)) * (MIN_CHUNK_BYTES * 5 // 256) + b"tail"
+
+
+def test_manifest_lists_one_digest_per_chunk() -> None:
+    manifest = build_manifest(_PAYLOAD, MIN_CHUNK_BYTES)
+
+    assert manifest.payload_bytes == len(_PAYLOAD)
+    assert len(manifest.sha256) == 6  # five full chunks and the tail
+    assert manifest.sha256[-1] == hashlib.sha256(b"tail").hexdigest()
+    assert manifest_from_header({"integrity": manifest.to_json()}) == manifest
+
+
+def test_chunks_are_hashed_on_several_threads() -> None:
+    seen: set[str] = set()
+    real_sha256 = hashlib.sha256
+
+    def _recording_sha256(data: bytes) -> hashlib._Hash:
+        seen.add(threading.current_thread().name)
+        return real_sha256(data)
+
+    expected = hash_chunks(_PAYLOAD, MIN_CHUNK_BYTES, workers=1)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(_integrity.hashlib, "sha256", _recording_sha256)
+        parallel = hash_chunks(_PAYLOAD, MIN_CHUNK_BYTES, workers=3)
+
+    assert parallel == expected
+    assert all(name.startswith("artifact-verify") for name in seen)
+
+
+def test_hash_chunks_copies_into_the_target_it_hashes() -> None:
+    target = bytearray(len(_PAYLOAD))
+    digests = hash_chunks(_PAYLOAD, MIN_CHUNK_BYTES, target=target, workers=2)
+
+    assert bytes(target) == _PAYLOAD
+    assert digests == hash_chunks(_PAYLOAD, MIN_CHUNK_BYTES)
+
+
+def test_tampered_chunk_is_named_in_the_error() -> None:
+    manifest = build_manifest(_PAYLOAD, MIN_CHUNK_BYTES)
+    tampered = bytearray(_PAYLOAD)
+    tampered[MIN_CHUNK_BYTES * 3 + 7] ^= 0xFF
+
+    digests = hash_chunks(tampered, MIN_CHUNK_BYTES)
+    with pytest.raises(ArtifactError, match="HMAC verification failed.*chunk 3"):
+        verify_chunks("k", manifest, digests, payload_bytes=len(tampered))
+    with pytest.raises(ArtifactError, match="HMAC verification failed.*bytes"):
+        verify_chunks("k", manifest, digests[:-1], payload_bytes=len(_PAYLOAD) - 4)
+
+
+def test_ranged_read_verifies_only_the_chunks_it_touches() -> None:
+    manifest = build_manifest(_PAYLOAD, MIN_CHUNK_BYTES)
+    prefix = b"H" * 100
+    tampered = bytearray(_PAYLOAD)
+    tampered[10] ^= 0xFF  # chunk 0 only
+    fh = io.BytesIO(prefix + bytes(tampered))
+
+    start, length = MIN_CHUNK_BYTES * 2 - 10, MIN_CHUNK_BYTES + 20
+    got = read_verified_range(fh, "k", len(prefix), manifest, start, length)
+    assert got == _PAYLOAD[start : start + length]
+
+    with pytest.raises(ArtifactError, match="chunk 0"):
+        read_verified_range(fh, "k", len(prefix), manifest, 5, 10)
+    with pytest.raises(ArtifactError, match="outside the payload"):
+        read_verified_range(fh, "k", len(prefix), manifest, len(_PAYLOAD) - 1, 2)
+
+
+def test_chunk_size_grows_to_keep_the_manifest_bounded() -> None:
+    assert chunk_bytes_for(MIN_CHUNK_BYTES * MAX_CHUNKS, MIN_CHUNK_BYTES) == (
+        MIN_CHUNK_BYTES
+    )
+    assert chunk_bytes_for(MIN_CHUNK_BYTES * MAX_CHUNKS + 1, MIN_CHUNK_BYTES) == (
+        MIN_CHUNK_BYTES * 2
+    )
+    with pytest.raises(ArtifactError, match="out of range"):
+        chunk_bytes_for(10, 1024)
+
+
+@pytest.mark.parametrize(
+    "integrity",
+    [
+        None,
+        {"chunk_bytes": 1024, "payload_bytes": 0, "sha256": []},
+        {"chunk_bytes": MIN_CHUNK_BYTES, "payload_bytes": -1, "sha256": []},
+        {"chunk_bytes": MIN_CHUNK_BYTES, "payload_bytes": 1, "sha256": []},
+        {"chunk_bytes": MIN_CHUNK_BYTES, "payload_bytes": 1, "sha256": ["zz"]},
+    ],
+)
+def test_malformed_manifest_is_a_header_error(integrity: object) -> None:
+    with pytest.raises(ArtifactError, match="header JSON integrity"):
+        manifest_from_header({"integrity": integrity})
@@ -13,6 +13,7 @@ Tests pass plain Python objects; write_artifact handles serialization.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
@@ -56,7 +57,7 @@ def test_write_read_roundtrip_always_overwrite(tmp_path: Path) -> None:
     assert hdr.kid == "active"
     loaded_header = json.loads(hdr.header_data.decode("utf-8"))
     assert loaded_header["recipe_name"] == "roundtrip"
-    assert isinstance(payload_back, bytes)
+    assert isinstance(payload_back, (bytearray, memoryview))
 
 
 def test_write_read_roundtrip_append_sha(tmp_path: Path) -> None:
@@ -180,9 +181,9 @@ def test_inspect_runs_full_hmac_and_does_not_unpickle(tmp_path: Path) -> None:
         versioning="always_overwrite",
     )
 
-    # read_artifact returns (header, payload_bytes) — no deserialization yet
+    # read_artifact returns (header, payload) — no deserialization yet
     hdr, returned_payload = read_artifact(output_path, kr)
-    assert isinstance(returned_payload, bytes)
+    assert isinstance(returned_payload, (bytearray, memoryview))
     assert hdr.kid == "active"
 
     # Tamper the saved artifact and verify HMAC catches it
@@ -814,3 +815,639 @@ def test_read_artifact_default_max_bytes_is_512_mib(tmp_path: Path) -> None:
         f"read_artifact passed cap {observed_caps[0]} to parse_header_from_bytes; "
         f"expected {DEFAULT_MAX_PAYLOAD_BYTES} (512 MiB)"
     )
+
+
+# ---------------------------------------------------------------------------
+# Format 2: sectioned payloads and memory-mapped reads
+# ---------------------------------------------------------------------------
+
+_V2_HEADER = {
+    "recipe_name": "v2",
+    "trained_at": "2026-01-01T00:00:00Z",
+    "best_class": "TopPopRecommender",
+    "best_score": 0.5,
+}
+
+
+def _v2_payload_obj():
+    import numpy as np
+    import scipy.sparse as sps
+
+    rng = np.random.default_rng(0)
+    return {
+        "factors": rng.random((64, 48), dtype=np.float64),
+        "sim": sps.random(300, 300, density=0.1, format="csr", random_state=0),
+        "small": np.arange(4),
+    }
+
+
+def test_v2_artifact_moves_large_arrays_into_sections(tmp_path: Path) -> None:
+    import numpy as np
+
+    from recotem.artifact.format import (
+        FORMAT_VERSION,
+        SECTION_ALIGNMENT,
+        split_sectioned_payload,
+    )
+    from recotem.artifact.signing import unpickle_payload
+
+    kr = _make_keyring()
+    obj = _v2_payload_obj()
+    path = write_artifact(
+        obj, _V2_HEADER, kr, str(tmp_path / "m.recotem"), versioning="always_overwrite"
+    )
+
+    hdr, payload = read_artifact(path, kr)
+    assert hdr.version == FORMAT_VERSION
+    _manifest, sections = split_sectioned_payload(payload)
+    # factors + CSR data/indices (indptr is under the section threshold)
+    assert len(sections) >= 3
+    raw = Path(path).read_bytes()
+    for section in sections:
+        offset = raw.index(bytes(section[:64]))
+        assert offset % SECTION_ALIGNMENT == 0
+
+    loaded = unpickle_payload(payload)
+    np.testing.assert_array_equal(loaded["factors"], obj["factors"])
+    assert (loaded["sim"] != obj["sim"]).nnz == 0
+    np.testing.assert_array_equal(loaded["small"], obj["small"])
+
+
+def test_read_artifact_verifies_in_one_pass_without_copying_sections(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import numpy as np
+
+    import recotem.artifact.io as io_mod
+    from recotem.artifact.signing import unpickle_payload
+
+    digests = []
+    real_digest = io_mod.digest_artifact
+
+    def _counting_digest(*args, **kwargs):
+        digests.append(args[0])
+        return real_digest(*args, **kwargs)
+
+    monkeypatch.setattr(io_mod, "digest_artifact", _counting_digest)
+    kr = _make_keyring()
+    for version in (1, 2, 3):
+        digests.clear()
+        path = write_artifact(
+            _v2_payload_obj(),
+            _V2_HEADER,
+            kr,
+            str(tmp_path / f"v{version}.recotem"),
+            versioning="always_overwrite",
+            format_version=version,
+        )
+        hdr, payload = read_artifact(path, kr)
+        assert hdr.version == version
+        assert len(digests) == 1
+        factors = unpickle_payload(payload)["factors"]
+        # Sectioned payloads stay views of the buffer that was verified.
+        assert np.shares_memory(factors, np.frombuffer(digests[0], np.uint8)) == (
+            version != 1
+        )
+
+
+def test_v1_artifact_still_written_and_read(tmp_path: Path) -> None:
+    from recotem.artifact.format import FORMAT_VERSION_V1, is_sectioned_payload
+    from recotem.artifact.signing import unpickle_payload
+
+    kr = _make_keyring()
+    obj = _v2_payload_obj()
+    path = write_artifact(
+        obj,
+        _V2_HEADER,
+        kr,
+        str(tmp_path / "m.recotem"),
+        versioning="always_overwrite",
+        format_version=1,
+    )
+    hdr, payload = read_artifact(path, kr)
+    assert hdr.version == FORMAT_VERSION_V1
+    assert not is_sectioned_payload(payload)
+    assert unpickle_payload(payload)["factors"].shape == (64, 48)
+
+
+def test_write_artifact_rejects_unknown_format_version(tmp_path: Path) -> None:
+    with pytest.raises(ArtifactError, match="unsupported format version"):
+        write_artifact(
+            {},
+            {},
+            _make_keyring(),
+            str(tmp_path / "m.recotem"),
+            format_version=4,
+        )
+
+
+def test_map_or_read_maps_private_copies_of_local_files(tmp_path: Path) -> None:
+    import io
+    import mmap
+
+    from recotem.artifact.io import map_or_read
+
+    path = tmp_path / "blob"
+    path.write_bytes(b"x" * 100)
+    with open(path, "rb") as fh:
+        mapped = map_or_read(fh, 1000, owned=True)
+    assert isinstance(mapped, mmap.mmap)
+    assert mapped[:3] == b"xxx"
+
+    # Operator-managed files are mapped through a private copy, so
+    # rewriting or truncating them in place cannot change (or fault) what
+    # was already read.
+    (tmp_path / "rewritten").write_bytes(b"x" * 100)
+    with open(tmp_path / "rewritten", "r+b") as fh:
+        private = map_or_read(fh, 1000)
+        fh.write(b"y" * 100)
+    assert isinstance(private, mmap.mmap)
+    assert private[:] == b"x" * 100
+    (tmp_path / "rewritten").write_bytes(b"")
+    assert private[:] == b"x" * 100
+
+    with open(path, "rb") as fh:
+        over_cap = map_or_read(fh, 10)
+    assert over_cap == b"x" * 11  # bounded read; caller enforces the cap
+
+    (tmp_path / "empty").write_bytes(b"")
+    with open(tmp_path / "empty", "rb") as fh:
+        assert map_or_read(fh, 1000) == b""
+
+    assert map_or_read(io.BytesIO(b"remote"), 1000) == b"remote"
+
+
+def test_map_or_read_falls_back_to_memory_without_temp_space(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import errno
+    import tempfile
+
+    from recotem.artifact.io import map_or_read
+
+    def _full(*args, **kwargs):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(tempfile, "TemporaryFile", _full)
+    path = tmp_path / "blob"
+    path.write_bytes(b"x" * 100)
+    with open(path, "rb") as fh:
+        data = map_or_read(fh, 1000)
+    assert isinstance(data, bytearray)
+    assert data == b"x" * 100
+
+
+def test_serving_maps_private_copies_of_artifacts(tmp_path: Path) -> None:
+    """The serve path maps a private copy; v2 sections view the mapping."""
+    import mmap
+
+    import numpy as np
+
+    from recotem.artifact.format import parse_header_from_bytes
+    from recotem.artifact.io import artifact_payload
+    from recotem.artifact.signing import unpickle_payload
+    from recotem.serving.watcher import read_artifact_bytes
+
+    kr = _make_keyring()
+    for version in (1, 2):
+        write_artifact(
+            _v2_payload_obj(),
+            _V2_HEADER,
+            kr,
+            str(tmp_path / f"v{version}.recotem"),
+            versioning="append_sha",
+            format_version=version,
+        )
+        data = read_artifact_bytes(str(tmp_path / f"v{version}.recotem"), 1 << 30)
+        assert isinstance(data, mmap.mmap)
+        hdr = parse_header_from_bytes(data, 1 << 30)
+        payload = artifact_payload(data, hdr.payload_offset)
+        factors = unpickle_payload(payload)["factors"]
+        assert np.shares_memory(factors, np.frombuffer(data, np.uint8)) == (
+            version == 2
+        )
+
+
+def test_startup_loader_accepts_both_format_versions(tmp_path: Path) -> None:
+    import types
+
+    from recotem.config import ServeConfig
+    from recotem.serving.app import _try_load_artifact
+
+    kr = _make_keyring()
+    for version in (1, 2):
+        path = tmp_path / f"v{version}.recotem"
+        write_artifact(
+            _v2_payload_obj(),
+            _V2_HEADER,
+            kr,
+            str(path),
+            versioning="always_overwrite",
+            format_version=version,
+        )
+        recipe = types.SimpleNamespace(
+            name=f"v{version}",
+            output=types.SimpleNamespace(path=str(path)),
+            item_metadata=None,
+        )
+        entry, reason = _try_load_artifact(recipe, kr, ServeConfig())
+        assert reason == "ok", entry.last_load_error
+        assert entry.recommender["factors"].shape == (64, 48)
+
+
+# ---------------------------------------------------------------------------
+# Single-pass digest and bounded chunked reads
+# ---------------------------------------------------------------------------
+
+
+def test_digest_artifact_hashes_and_signs_in_one_pass(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import hashlib
+    import mmap
+
+    import recotem.artifact.io as io_mod
+    from recotem.artifact.format import parse_header_from_bytes
+    from recotem.artifact.signing import compute_hmac, unpickle_payload
+
+    monkeypatch.setattr(io_mod, "READ_CHUNK_BYTES", 4096)  # many chunks
+    kr = _make_keyring()
+    for version in (1, 2):
+        path = tmp_path / f"v{version}.recotem"
+        write_artifact(
+            _v2_payload_obj(),
+            _V2_HEADER,
+            kr,
+            str(path),
+            versioning="always_overwrite",
+            format_version=version,
+        )
+        raw = path.read_bytes()
+        hdr = parse_header_from_bytes(raw, 1 << 30)
+        payload = raw[hdr.payload_offset :]
+        with open(path, "rb") as fh:
+            data = io_mod.map_or_read(fh, 1 << 30, owned=True)
+        assert isinstance(data, mmap.mmap)
+
+        digest = io_mod.digest_artifact(data, kr, 1 << 30)
+
+        assert digest.sha256 == hashlib.sha256(raw).hexdigest()
+        assert digest.header == hdr
+        assert digest.hmac_digest == compute_hmac(
+            kr.get("active"), b"active", hdr.header_data, payload
+        )
+        assert digest.hmac_digest == hdr.hmac_digest
+        assert bytes(digest.payload) == payload
+        # A plain pickle is a private copy; sections stay in the mapping.
+        assert isinstance(digest.payload, bytearray) == (version == 1)
+        loaded = unpickle_payload(digest.payload)
+        assert loaded["factors"].flags.writeable == (version == 1)
+
+
+def test_digest_artifact_without_key_or_header(tmp_path: Path) -> None:
+    import hashlib
+
+    from recotem.artifact.io import digest_artifact
+
+    path = str(tmp_path / "m.recotem")
+    write_artifact({"a": 1}, {}, _make_keyring(), path, versioning="always_overwrite")
+    raw = Path(path).read_bytes()
+
+    unsigned = digest_artifact(raw, None, 1 << 20)
+    assert unsigned.header is not None and unsigned.hmac_digest is None
+    other_ring = KeyRing(f"other:{'ab' * 32}")
+    assert digest_artifact(raw, other_ring, 1 << 20).hmac_digest is None
+
+    garbage = b"not an artifact" * 10
+    broken = digest_artifact(garbage, _make_keyring(), 1 << 20)
+    assert broken.sha256 == hashlib.sha256(garbage).hexdigest()
+    assert broken.header is None and broken.payload is None
+
+
+def test_map_or_read_reads_sized_handles_in_bounded_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import io
+
+    import recotem.artifact.io as io_mod
+
+    class _RemoteFile(io.BytesIO):
+        """Object-store handle: a known size and no file descriptor."""
+
+        requested: list[int] = []
+
+        @property
+        def size(self) -> int:
+            return len(self.getbuffer())
+
+        def fileno(self) -> int:
+            raise io.UnsupportedOperation("fileno")
+
+        def readinto(self, buffer) -> int:
+            self.requested.append(len(buffer))
+            return super().readinto(buffer)
+
+    monkeypatch.setattr(io_mod, "READ_CHUNK_BYTES", 64)
+    content = bytes(range(256)) * 2
+    data = io_mod.map_or_read(_RemoteFile(content), 1000)
+
+    assert isinstance(data, bytearray) and data == content
+    assert _RemoteFile.requested == [64] * 8
+    # Over the cap the bounded read still lets the caller see the overrun.
+    assert io_mod.map_or_read(_RemoteFile(content), 100) == content[:101]
+
+
+# ---------------------------------------------------------------------------
+# Compressed payloads
+# ---------------------------------------------------------------------------
+
+
+def test_compressed_artifact_round_trip_and_tamper(tmp_path: Path) -> None:
+    import numpy as np
+
+    from recotem.artifact.compression import payload_compression
+    from recotem.artifact.signing import unpickle_payload
+
+    kr = _make_keyring()
+    obj = {"factors": np.zeros((256, 64)), "ids": [f"u{i}" for i in range(100)]}
+    path = write_artifact(
+        obj, _V2_HEADER, kr, str(tmp_path / "z.recotem"), compression="gzip"
+    )
+    plain = write_artifact(obj, _V2_HEADER, kr, str(tmp_path / "p.recotem"))
+    assert Path(path).stat().st_size * 5 < Path(plain).stat().st_size
+
+    hdr, payload = read_artifact(path, kr)
+    header = json.loads(hdr.header_data)
+    assert header["compression"] == "gzip"
+    loaded = unpickle_payload(payload, compression=payload_compression(header))
+    np.testing.assert_array_equal(loaded["factors"], obj["factors"])
+    assert loaded["ids"] == obj["ids"]
+
+    # The HMAC covers the compressed bytes: tampering fails before decompressing.
+    raw = bytearray(Path(path).read_bytes())
+    raw[-10] ^= 0xFF
+    Path(path).write_bytes(bytes(raw))
+    with pytest.raises(ArtifactError, match="HMAC verification failed"):
+        read_artifact(path, kr)
+
+
+def test_compressed_payload_decompression_is_bounded(tmp_path: Path) -> None:
+    from recotem.artifact.signing import unpickle_payload
+
+    kr = _make_keyring()
+    path = write_artifact(
+        b"\x00" * 1_000_000, {}, kr, str(tmp_path / "bomb.recotem"), compression="gzip"
+    )
+    _hdr, payload = read_artifact(path, kr)
+    assert len(payload) < 10_000
+
+    with pytest.raises(ArtifactError, match="decompressed payload exceeds cap"):
+        unpickle_payload(payload, compression="gzip", max_decompressed_bytes=100_000)
+
+
+def test_startup_loader_reads_compressed_artifacts(tmp_path: Path) -> None:
+    import types
+
+    import numpy as np
+
+    from recotem.config import ServeConfig
+    from recotem.serving.app import _try_load_artifact
+
+    kr = _make_keyring()
+    path = tmp_path / "z.recotem"
+    write_artifact(
+        {"factors": np.zeros((256, 64))},
+        _V2_HEADER,
+        kr,
+        str(path),
+        versioning="always_overwrite",
+        compression="gzip",
+    )
+    recipe = types.SimpleNamespace(
+        name="z", output=types.SimpleNamespace(path=str(path)), item_metadata=None
+    )
+    entry, reason = _try_load_artifact(recipe, kr, ServeConfig())
+    assert reason == "ok", entry.last_load_error
+    assert entry.recommender["factors"].shape == (256, 64)
+
+    # The compressed payload fits the cap; decompressing it does not.
+    cfg = ServeConfig(max_payload_bytes=50_000)
+    entry, reason = _try_load_artifact(recipe, kr, cfg)
+    assert reason == "deserialize"
+    assert "exceeds cap 50000" in entry.last_load_error
+
+
+def _write_chunked(tmp_path: Path, obj, **kwargs) -> str:
+    return write_artifact(
+        obj,
+        _V2_HEADER,
+        _make_keyring(),
+        str(tmp_path / "c.recotem"),
+        versioning="always_overwrite",
+        format_version=3,
+        integrity_chunk_bytes=64 * 1024,
+        **kwargs,
+    )
+
+
+def test_chunked_artifact_signs_a_manifest_and_keeps_sections_aligned(
+    tmp_path: Path,
+) -> None:
+    import numpy as np
+
+    from recotem.artifact.format import (
+        FORMAT_VERSION_CHUNKED,
+        SECTION_ALIGNMENT,
+        split_sectioned_payload,
+    )
+    from recotem.artifact.signing import unpickle_payload
+
+    kr = _make_keyring()
+    obj = _v2_payload_obj()
+    path = _write_chunked(tmp_path, obj)
+
+    hdr, payload = read_artifact(path, kr)
+    assert hdr.version == FORMAT_VERSION_CHUNKED
+    integrity = json.loads(hdr.header_data)["integrity"]
+    assert integrity["payload_bytes"] == len(payload)
+    assert len(integrity["sha256"]) > 1
+    assert hdr.payload_offset % SECTION_ALIGNMENT == 0
+    raw = Path(path).read_bytes()
+    for section in split_sectioned_payload(payload)[1]:
+        assert raw.index(bytes(section[:64])) % SECTION_ALIGNMENT == 0
+    np.testing.assert_array_equal(unpickle_payload(payload)["factors"], obj["factors"])
+
+
+def test_chunked_artifact_tamper_is_detected_per_chunk(tmp_path: Path) -> None:
+    kr = _make_keyring()
+    path = _write_chunked(tmp_path, _v2_payload_obj())
+    raw = bytearray(Path(path).read_bytes())
+    raw[-100] ^= 0xFF
+    Path(path).write_bytes(bytes(raw))
+
+    with pytest.raises(ArtifactError, match="HMAC verification failed.*chunk"):
+        read_artifact(path, kr)
+
+
+def test_chunked_artifact_header_tamper_fails_the_hmac(tmp_path: Path) -> None:
+    kr = _make_keyring()
+    path = _write_chunked(tmp_path, _v2_payload_obj())
+    raw = Path(path).read_bytes()
+    Path(path).write_bytes(raw.replace(b'"recipe_name"', b'"recipe_nbme"', 1))
+
+    with pytest.raises(ArtifactError, match="HMAC verification failed for kid"):
+        read_artifact(path, kr)
+
+
+def test_chunked_digest_verifies_mapped_plain_pickles_from_a_copy(
+    tmp_path: Path,
+) -> None:
+    import mmap
+
+    from recotem.artifact.io import (
+        artifact_sha256,
+        digest_artifact,
+        map_or_read,
+        verify_digest,
+    )
+    from recotem.artifact.signing import unpickle_payload
+
+    kr = _make_keyring()
+    obj = {"blob": os.urandom(300_000)}
+    path = _write_chunked(tmp_path, obj, compression="gzip")
+
+    with open(path, "rb") as fh:
+        data = map_or_read(fh, 1 << 30, owned=True)
+    assert isinstance(data, mmap.mmap)
+    digest = digest_artifact(data, kr, 1 << 30)
+    verify_digest(digest)
+    assert isinstance(digest.payload, bytearray)
+    assert len(digest.chunk_digests) == -(-len(digest.payload) // (64 * 1024))
+    assert unpickle_payload(digest.payload, compression="gzip") == obj
+
+    # Identified by the signed prefix, which commits to every chunk.
+    hdr = digest.header
+    assert digest.sha256 == artifact_sha256(data)
+    assert digest.sha256 == hashlib.sha256(data[: hdr.payload_offset]).hexdigest()
+
+
+def test_chunked_digest_without_the_key_reports_unknown_kid(tmp_path: Path) -> None:
+    from recotem.artifact.io import digest_artifact, verify_digest
+
+    path = _write_chunked(tmp_path, {"x": 1})
+    data = Path(path).read_bytes()
+    other = KeyRing("other:" + "cd" * 32)
+
+    with pytest.raises(ArtifactError, match="unknown kid"):
+        verify_digest(digest_artifact(data, other, 1 << 30))
+
+
+def test_startup_loader_verifies_chunked_artifacts(tmp_path: Path) -> None:
+    import types
+
+    from recotem.config import ServeConfig
+    from recotem.serving.app import _try_load_artifact
+
+    kr = _make_keyring()
+    path = _write_chunked(tmp_path, _v2_payload_obj())
+    recipe = types.SimpleNamespace(
+        name="c", output=types.SimpleNamespace(path=path), item_metadata=None
+    )
+    entry, reason = _try_load_artifact(recipe, kr, ServeConfig())
+    assert reason == "ok", entry.last_load_error
+    assert entry.recommender["factors"].shape == (64, 48)
+
+    raw = bytearray(Path(path).read_bytes())
+    raw[-100] ^= 0xFF
+    Path(path).write_bytes(bytes(raw))
+    entry, reason = _try_load_artifact(recipe, kr, ServeConfig())
+    assert reason == "hmac"
+    assert "does not match the signed manifest" in entry.last_load_error
+
+
+def test_header_read_fetches_only_the_prefix_through_a_pointer(
+    tmp_path: Path,
+) -> None:
+    import fsspec.implementations.local as fs_local
+
+    from recotem.artifact.io import (
+        MAX_HEADER_PREFIX_BYTES,
+        artifact_sha256,
+        read_artifact_header,
+        verify_header,
+    )
+
+    kr = _make_keyring()
+    obj = {"blob": os.urandom(MAX_HEADER_PREFIX_BYTES * 2)}
+    output_path = str(tmp_path / "h.recotem")
+    final_path = _write_chunked(tmp_path, obj)
+    Path(output_path).write_text(Path(final_path).name)
+
+    ranges: list[tuple[object, object]] = []
+    real_cat_file = fs_local.LocalFileSystem.cat_file
+
+    def _recording_cat_file(self, path, start=None, end=None, **kwargs):
+        ranges.append((start, end))
+        return real_cat_file(self, path, start=start, end=end, **kwargs)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(fs_local.LocalFileSystem, "cat_file", _recording_cat_file)
+        read = read_artifact_header(output_path)
+
+    assert ranges == [(0, MAX_HEADER_PREFIX_BYTES)] * 2
+    assert read.path.endswith(Path(final_path).name)
+    assert json.loads(read.header.header_data)["recipe_name"] == "v2"
+    assert verify_header(kr, read.header)
+    assert artifact_sha256(read.prefix) == artifact_sha256(
+        Path(final_path).read_bytes()
+    )
+
+    with pytest.raises(ArtifactError, match="unknown kid"):
+        verify_header(KeyRing("other:" + "cd" * 32), read.header)
+    with pytest.raises(ArtifactError, match="artifact not found"):
+        read_artifact_header(str(tmp_path / "missing.recotem"))
+
+
+def test_header_of_a_payload_signed_artifact_is_not_verified_alone(
+    tmp_path: Path,
+) -> None:
+    from recotem.artifact.io import read_artifact_header, verify_header
+
+    path = str(tmp_path / "v2.recotem")
+    write_artifact(
+        {"x": 1},
+        {"recipe_name": "v2"},
+        _make_keyring(),
+        path,
+        versioning="always_overwrite",
+    )
+
+    read = read_artifact_header(path)
+    assert read.header.version == 2
+    assert verify_header(_make_keyring(), read.header) is False
+
+
+def test_standby_recipe_is_described_from_a_verified_header(tmp_path: Path) -> None:
+    import types
+
+    from recotem.config import ServeConfig
+    from recotem.serving.app import _describe_standby, _try_load_artifact
+
+    kr = _make_keyring()
+    path = _write_chunked(tmp_path, _v2_payload_obj())
+    recipe = types.SimpleNamespace(
+        name="c", output=types.SimpleNamespace(path=path), item_metadata=None
+    )
+    watcher = types.SimpleNamespace(recipe_for=lambda name: recipe)
+
+    described = _describe_standby(watcher, kr, "c")
+    loaded, _reason = _try_load_artifact(recipe, kr, ServeConfig())
+    assert described is not None and described.standby
+    assert described.recommender is None
+    assert described.header == loaded.header
+    assert described.model_version == loaded.model_version
+
+    write_artifact(
+        _v2_payload_obj(), _V2_HEADER, kr, path, versioning="always_overwrite"
+    )
+    assert _describe_standby(watcher, kr, "c") is None
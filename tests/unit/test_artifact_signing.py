@@ -1398,3 +1398,36 @@ def test_unpickle_payload_attribute_error_emits_safe_unpickle_internal_error_log
         "AttributeError must emit 'safe_unpickle_internal_error' log event"
     )
     assert error_events[0].get("error_class") == "AttributeError"
+
+
+# ---------------------------------------------------------------------------
+# Incremental HMAC and copy-free unpickling
+# ---------------------------------------------------------------------------
+
+
+def test_incremental_hmac_matches_compute_hmac() -> None:
+    from recotem.artifact.signing import new_payload_hmac, verify_hmac_digest
+
+    key = bytes.fromhex(ACTIVE_KEY_HEX)
+    payload = bytes(range(256)) * 100
+    h = new_payload_hmac(key, b"active", b"{}")
+    for start in range(0, len(payload), 1000):
+        h.update(payload[start : start + 1000])
+    stored = compute_hmac(key, b"active", b"{}", payload)
+    assert h.digest() == stored
+
+    verify_hmac_digest("active", h.digest(), stored)  # no exception
+    with pytest.raises(ArtifactError, match="HMAC verification failed"):
+        verify_hmac_digest("active", bytes(32), stored)
+    with pytest.raises(ArtifactError, match="unknown kid"):
+        verify_hmac_digest("missing", None, stored)
+
+
+@pytest.mark.parametrize("protocol", [0, 2, 5])
+def test_unpickle_payload_reads_buffers_in_place(protocol: int) -> None:
+    import pickle
+
+    obj = {"ids": [f"item-{i}" for i in range(500)], "blob": "x" * 100_000}
+    raw = pickle.dumps(obj, protocol=protocol)
+    for payload in (bytearray(raw), memoryview(bytearray(raw))[:]):
+        assert unpickle_payload(payload) == obj
@@ -0,0 +1,119 @@
+"""Tests for offline bulk top-k export (recotem._bulk_score)."""
+
+from __future__ import annotations
+
+import gzip
+
+import numpy as np
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pytest
+
+from recotem._bulk_score import (
+    RELATED_SCHEMA,
+    USER_SCHEMA,
+    export_scores,
+    infer_format,
+    read_ids,
+    score_chunk,
+)
+from tests.conftest import dense_idmapped_recommender
+
+
+def _recommender():
+    return dense_idmapped_recommender(np.random.default_rng(0).random((7, 6)))
+
+
+def test_score_chunk_ranks_rows_like_the_batch_api() -> None:
+    rec = _recommender()
+    table = score_chunk(rec, ["u0", "u3"], 3, related=False)
+
+    assert table.schema == USER_SCHEMA
+    assert table.column("user_id").to_pylist() == ["u0"] * 3 + ["u3"] * 3
+    assert table.column("rank").to_pylist() == [1, 2, 3, 1, 2, 3]
+    expected = rec.get_recommendation_for_known_user_batch(["u3"], 3)[0]
+    assert (
+        list(
+            zip(
+                table.column("item_id").to_pylist()[3:],
+                table.column("score").to_pylist()[3:],
+                strict=True,
+            )
+        )
+        == expected
+    )
+
+
+def test_score_chunk_related_excludes_the_seed_item() -> None:
+    table = score_chunk(_recommender(), ["i1"], 4, related=True)
+    assert table.schema == RELATED_SCHEMA
+    assert "i1" not in table.column("related_item_id").to_pylist()
+    assert table.num_rows == 4
+
+
+def test_export_scores_all_users_in_chunks(tmp_path) -> None:
+    rec = _recommender()
+    out = tmp_path / "topk.parquet"
+    stats = export_scores(rec, str(out), limit=2, chunk_size=3)
+
+    assert (stats.scored, stats.skipped, stats.rows) == (7, 0, 14)
+    assert [len(call) for call in rec.recommender.known_calls] == [3, 3, 1]
+    table = pq.read_table(out)
+    assert table.column("user_id").to_pylist()[::2] == [f"u{i}" for i in range(7)]
+
+
+def test_export_scores_skips_unknown_ids_and_writes_csv(tmp_path) -> None:
+    ids_file = tmp_path / "ids.txt"
+    ids_file.write_text("u2\n\nnobody\nu5\n")
+    out = tmp_path / "topk.csv.gz"
+
+    stats = export_scores(
+        _recommender(), str(out), ids=read_ids(str(ids_file)), limit=1
+    )
+
+    assert (stats.scored, stats.skipped, stats.rows) == (2, 1, 2)
+    with gzip.open(out) as fh:
+        table = pa_csv.read_csv(fh)
+    assert table.column("user_id").to_pylist() == ["u2", "u5"]
+
+
+def test_export_scores_process_pool_matches_in_process(tmp_path) -> None:
+    single = tmp_path / "one.parquet"
+    pooled = tmp_path / "pool.parquet"
+    export_scores(_recommender(), str(single), limit=3, chunk_size=2, related=True)
+    rec = _recommender()
+    # Workers are not forked from this process; each loads its own model.
+    stats = export_scores(
+        rec,
+        str(pooled),
+        limit=3,
+        chunk_size=2,
+        related=True,
+        workers=2,
+        load_model=_recommender,
+    )
+
+    assert stats.scored == 6
+    assert pq.read_table(pooled).equals(pq.read_table(single))
+    assert rec.recommender.cold_calls == []
+
+
+def test_export_scores_without_a_loader_scores_in_process(tmp_path) -> None:
+    rec = _recommender()
+    stats = export_scores(rec, str(tmp_path / "out.parquet"), limit=2, workers=4)
+
+    assert stats.scored == 7
+    assert len(rec.recommender.known_calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("path", "fmt"),
+    [
+        ("out.csv", "csv"),
+        ("s3://b/OUT.CSV.GZ", "csv"),
+        ("out.parquet", "parquet"),
+        ("out", "parquet"),
+    ],
+)
+def test_infer_format(path: str, fmt: str) -> None:
+    assert infer_format(path) == fmt
@@ -228,6 +228,42 @@ def test_inspect_exit0_on_valid_artifact(tmp_path: Path, monkeypatch) -> None:
     assert "HMAC: OK" in result.stdout
 
 
+def test_inspect_header_only_verifies_chunked_headers(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """--header-only verifies a format-3 header without the payload and says
+    so for formats whose HMAC covers the payload."""
+    from recotem.artifact.io import write_artifact
+    from recotem.artifact.signing import KeyRing
+
+    kr = KeyRing(f"active:{ACTIVE_KEY_HEX}")
+    paths = {}
+    for version in (2, 3):
+        paths[version] = str(tmp_path / f"v{version}.recotem")
+        write_artifact(
+            {"x": 1},
+            {"recipe_name": "cli_test"},
+            kr,
+            paths[version],
+            versioning="always_overwrite",
+            format_version=version,
+        )
+    monkeypatch.setenv("RECOTEM_SIGNING_KEYS", f"active:{ACTIVE_KEY_HEX}")
+
+    result = runner.invoke(app, ["inspect", "--header-only", paths[3]])
+    assert result.exit_code == 0, result.output
+    assert "HMAC: OK  (kid='active'; header only)" in result.stdout
+    assert '"recipe_name": "cli_test"' in result.stdout
+
+    result = runner.invoke(app, ["inspect", "--header-only", paths[2]])
+    assert result.exit_code == 0, result.output
+    assert "HMAC: NOT VERIFIED" in result.stdout
+
+    monkeypatch.setenv("RECOTEM_SIGNING_KEYS", "other:" + "bb" * 32)
+    result = runner.invoke(app, ["inspect", "--header-only", paths[3]])
+    assert result.exit_code == 5
+
+
 def test_inspect_exit5_on_wrong_magic(tmp_path: Path, monkeypatch) -> None:
     """inspect exits 5 when the artifact has bad magic bytes."""
     artifact_path = tmp_path / "bad.recotem"
@@ -641,6 +677,46 @@ def test_serve_smoke_starts_and_responds_to_health(tmp_path: Path, monkeypatch)
     assert response.status_code == 200
 
 
+def test_serve_with_workers_runs_supervisor_and_worker_factory(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """RECOTEM_WORKERS > 1 hands uvicorn the worker factory and a shared store."""
+    import os
+    from unittest.mock import patch
+
+    from recotem.serving.shared import SHARED_MODEL_DIR_ENV
+
+    recipes_dir = tmp_path / "recipes"
+    recipes_dir.mkdir()
+    store_dir = tmp_path / "store"
+    monkeypatch.setenv("RECOTEM_SIGNING_KEYS", f"active:{ACTIVE_KEY_HEX}")
+    monkeypatch.setenv("RECOTEM_ENV", "test")
+    monkeypatch.setenv("RECOTEM_WORKERS", "3")
+    monkeypatch.setenv("RECOTEM_SHARED_MODEL_DIR", str(store_dir))
+
+    seen: dict[str, object] = {}
+
+    def _fake_run(target, **kwargs):
+        seen["target"] = target
+        seen.update(kwargs)
+        seen["manifest"] = (store_dir / "manifest.json").exists()
+        seen["env"] = os.environ.get(SHARED_MODEL_DIR_ENV)
+
+    with patch("uvicorn.run", side_effect=_fake_run):
+        result = runner.invoke(
+            app, ["serve", "--recipes", str(recipes_dir), "--insecure-no-auth"]
+        )
+
+    assert result.exit_code == 0, result.stdout
+    assert seen["target"] == "recotem.serving.supervisor:create_worker_app"
+    assert seen["factory"] is True
+    assert seen["workers"] == 3
+    assert seen["manifest"] is True
+    assert seen["env"] == str(store_dir)
+    settings = json.loads((store_dir / "serve.json").read_text())
+    assert settings["insecure_no_auth"] is True
+
+
 # ---------------------------------------------------------------------------
 # MAJOR-4: recotem inspect --dev-allow-unsigned must be gated by RECOTEM_ENV
 # ---------------------------------------------------------------------------
@@ -2646,3 +2722,187 @@ def test_train_lock_timeout_default_is_zero(tmp_path: Path, monkeypatch) -> None
 
     assert "lock_timeout" in captured_kwargs
     assert captured_kwargs["lock_timeout"] == pytest.approx(0.0)
+
+
+# ---------------------------------------------------------------------------
+# recotem score
+# ---------------------------------------------------------------------------
+
+
+def _write_toppop_artifact(path: Path) -> None:
+    import scipy.sparse as sps
+    from irspack import TopPopRecommender
+
+    import recotem.training._compat  # noqa: F401  (IPython stub before irspack)
+    from recotem._idmap import IDMappedRecommender
+    from recotem.artifact.io import write_artifact
+    from recotem.artifact.signing import KeyRing
+
+    X = sps.random(12, 8, density=0.4, random_state=0, format="csr")
+    X.data[:] = 1.0
+    rec = IDMappedRecommender(
+        TopPopRecommender(X).learn(),
+        [f"u{i}" for i in range(12)],
+        [f"i{i}" for i in range(8)],
+    )
+    write_artifact(
+        rec,
+        {"recipe_name": "score_test"},
+        KeyRing(f"active:{ACTIVE_KEY_HEX}"),
+        str(path),
+        versioning="always_overwrite",
+    )
+
+
+def test_score_exports_parquet_for_every_user(tmp_path: Path, monkeypatch) -> None:
+    import pyarrow.parquet as pq
+
+    artifact_path = tmp_path / "model.recotem"
+    _write_toppop_artifact(artifact_path)
+    out = tmp_path / "topk.parquet"
+    monkeypatch.setenv("RECOTEM_SIGNING_KEYS", f"active:{ACTIVE_KEY_HEX}")
+
+    result = runner.invoke(
+        app,
+        ["score", str(artifact_path), "-o", str(out), "--limit", "2", "--workers", "1"],
+    )
+
+    assert result.exit_code == 0, result.stdout + (result.stderr or "")
+    assert "Scored 12 users" in result.stderr
+    table = pq.read_table(out)
+    assert table.column_names == ["user_id", "rank", "item_id", "score"]
+    assert set(table.column("user_id").to_pylist()) <= {f"u{i}" for i in range(12)}
+
+
+def test_score_workers_load_the_artifact_themselves(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import pyarrow.parquet as pq
+
+    artifact_path = tmp_path / "model.recotem"
+    _write_toppop_artifact(artifact_path)
+    single = tmp_path / "one.parquet"
+    pooled = tmp_path / "pool.parquet"
+    monkeypatch.setenv("RECOTEM_SIGNING_KEYS", f"active:{ACTIVE_KEY_HEX}")
+
+    for out, workers in ((single, "1"), (pooled, "2")):
+        result = runner.invoke(
+            app,
+            ["score", str(artifact_path), "-o", str(out), "--workers", workers],
+        )
+        assert result.exit_code == 0, result.stdout + (result.stderr or "")
+
+    assert pq.read_table(pooled).equals(pq.read_table(single))
+
+
+def test_score_related_items_from_file_to_csv(tmp_path: Path, monkeypatch) -> None:
+    artifact_path = tmp_path / "model.recotem"
+    _write_toppop_artifact(artifact_path)
+    ids = tmp_path / "items.txt"
+    ids.write_text("i0\ni3\nmissing\n")
+    out = tmp_path / "related.csv"
+    monkeypatch.setenv("RECOTEM_SIGNING_KEYS", f"active:{ACTIVE_KEY_HEX}")
+
+    result = runner.invoke(
+        app,
+        [
+            "score",
+            str(artifact_path),
+            "-o",
+            str(out),
+            "--related-items",
+            "--users-from",
+            str(ids),
+            "--workers",
+            "1",
+        ],
+    )
+
+    assert result.exit_code == 0, result.stdout + (result.stderr or "")
+    assert "Scored 2 items" in result.stderr
+    assert "skipped 1 unknown IDs" in result.stderr
+    assert out.read_text().startswith('"item_id","rank","related_item_id","score"')
+
+
+def test_score_exit5_on_tampered_artifact(tmp_path: Path, monkeypatch) -> None:
+    artifact_path = tmp_path / "model.recotem"
+    _write_toppop_artifact(artifact_path)
+    data = bytearray(artifact_path.read_bytes())
+    data[-1] ^= 0xFF
+    artifact_path.write_bytes(bytes(data))
+    monkeypatch.setenv("RECOTEM_SIGNING_KEYS", f"active:{ACTIVE_KEY_HEX}")
+
+    result = runner.invoke(
+        app, ["score", str(artifact_path), "-o", str(tmp_path / "out.parquet")]
+    )
+
+    assert result.exit_code == 5
+    assert not (tmp_path / "out.parquet").exists()
+
+
+def test_score_exit8_without_signing_keys(tmp_path: Path, monkeypatch) -> None:
+    artifact_path = tmp_path / "model.recotem"
+    _write_toppop_artifact(artifact_path)
+    monkeypatch.delenv("RECOTEM_SIGNING_KEYS", raising=False)
+
+    result = runner.invoke(
+        app, ["score", str(artifact_path), "-o", str(tmp_path / "out.parquet")]
+    )
+
+    assert result.exit_code == 8
+
+
+def test_score_dev_allow_unsigned_requires_companion_flag(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """score unpickles the payload, so the dev key needs the flag pair."""
+    artifact_path = tmp_path / "model.recotem"
+    _write_toppop_artifact(artifact_path)
+    monkeypatch.delenv("RECOTEM_SIGNING_KEYS", raising=False)
+    monkeypatch.setenv("RECOTEM_ENV", "development")
+
+    result = runner.invoke(
+        app,
+        [
+            "score",
+            str(artifact_path),
+            "-o",
+            str(tmp_path / "out.parquet"),
+            "--dev-allow-unsigned",
+        ],
+    )
+
+    assert result.exit_code == 8
+    assert "--i-understand-this-loads-arbitrary-code" in result.stderr
+    assert not (tmp_path / "out.parquet").exists()
+
+
+def test_score_refuses_artifact_from_skewed_irspack(
+    tmp_path: Path, monkeypatch
+) -> None:
+    from recotem.artifact.format import ArtifactError
+
+    artifact_path = tmp_path / "model.recotem"
+    _write_toppop_artifact(artifact_path)
+    monkeypatch.setenv("RECOTEM_SIGNING_KEYS", f"active:{ACTIVE_KEY_HEX}")
+    unpickled = []
+    monkeypatch.setattr(
+        "recotem.artifact.signing.unpickle_payload",
+        lambda *a, **k: unpickled.append(a),
+    )
+
+    def _skewed(header_dict, *, name):
+        assert name == "score_test"
+        raise ArtifactError("artifact was trained on irspack 0.1")
+
+    monkeypatch.setattr(
+        "recotem._irspack_compat.check_artifact_irspack_version", _skewed
+    )
+
+    result = runner.invoke(
+        app, ["score", str(artifact_path), "-o", str(tmp_path / "out.parquet")]
+    )
+
+    assert result.exit_code == 5
+    assert "irspack 0.1" in result.stderr
+    assert unpickled == []
@@ -712,3 +712,174 @@ def test_max_sql_rows_non_integer_logs_env_var_unparseable(
     assert warn_events[0].get("name") == "RECOTEM_MAX_SQL_ROWS"
     assert warn_events[0].get("raw") == "notanumber"
     assert warn_events[0].get("fallback") == 50_000_000
+
+
+# ---------------------------------------------------------------------------
+# Response cache env vars
+# ---------------------------------------------------------------------------
+
+
+def test_response_cache_disabled_by_default(monkeypatch) -> None:
+    monkeypatch.delenv("RECOTEM_RESPONSE_CACHE_MAX_BYTES", raising=False)
+    monkeypatch.delenv("RECOTEM_RESPONSE_CACHE_TTL_SECONDS", raising=False)
+    cfg = ServeConfig.from_env()
+    assert cfg.response_cache_max_bytes == 0
+    assert cfg.response_cache_ttl_seconds == 0
+
+
+def test_response_cache_env_parsed_and_clamped(monkeypatch) -> None:
+    monkeypatch.setenv("RECOTEM_RESPONSE_CACHE_MAX_BYTES", "67108864")
+    monkeypatch.setenv("RECOTEM_RESPONSE_CACHE_TTL_SECONDS", "999999")
+    cfg = ServeConfig.from_env()
+    assert cfg.response_cache_max_bytes == 64 * 1024 * 1024
+    assert cfg.response_cache_ttl_seconds == 86400
+
+
+def test_coalescer_disabled_by_default(monkeypatch) -> None:
+    for var in (
+        "RECOTEM_COALESCE_WINDOW_MS",
+        "RECOTEM_COALESCE_MAX_BATCH",
+        "RECOTEM_COALESCE_RECIPES",
+    ):
+        monkeypatch.delenv(var, raising=False)
+    cfg = ServeConfig.from_env()
+    assert cfg.coalesce_window_ms == 0
+    assert cfg.coalesce_max_batch == 32
+    assert cfg.coalesce_recipes == []
+
+
+def test_coalescer_env_parsed_and_clamped(monkeypatch) -> None:
+    monkeypatch.setenv("RECOTEM_COALESCE_WINDOW_MS", "500")
+    monkeypatch.setenv("RECOTEM_COALESCE_MAX_BATCH", "0")
+    monkeypatch.setenv("RECOTEM_COALESCE_RECIPES", "news, movies")
+    cfg = ServeConfig.from_env()
+    assert cfg.coalesce_window_ms == 50
+    assert cfg.coalesce_max_batch == 1
+    assert cfg.coalesce_recipes == ["news", "movies"]
+
+
+def test_recipe_pool_defaults(monkeypatch) -> None:
+    monkeypatch.delenv("RECOTEM_RECIPE_POOL_SIZE", raising=False)
+    monkeypatch.delenv("RECOTEM_RECIPE_POOL_SIZES", raising=False)
+    cfg = ServeConfig.from_env()
+    assert cfg.recipe_pool_size == 8
+    assert cfg.recipe_pool_sizes == {}
+
+
+def test_recipe_pool_env_parsed_and_clamped(monkeypatch) -> None:
+    monkeypatch.setenv("RECOTEM_RECIPE_POOL_SIZE", "0")
+    monkeypatch.setenv("RECOTEM_RECIPE_POOL_SIZES", "big-slim=2, news = 1000")
+    cfg = ServeConfig.from_env()
+    assert cfg.recipe_pool_size == 1
+    assert cfg.recipe_pool_sizes == {"big-slim": 2, "news": 256}
+
+
+@pytest.mark.parametrize("raw", ["news", "=4", "news=many"])
+def test_recipe_pool_sizes_malformed_entry_rejected(monkeypatch, raw) -> None:
+    monkeypatch.setenv("RECOTEM_RECIPE_POOL_SIZES", raw)
+    with pytest.raises(ConfigError, match="RECOTEM_RECIPE_POOL_SIZES"):
+        ServeConfig.from_env()
+
+
+def test_admission_disabled_by_default(monkeypatch) -> None:
+    for var in (
+        "RECOTEM_ADMISSION_MAX_INFLIGHT",
+        "RECOTEM_ADMISSION_RECIPE_MAX_INFLIGHT",
+        "RECOTEM_ADMISSION_RECIPE_LIMITS",
+        "RECOTEM_ADMISSION_RETRY_AFTER_SECONDS",
+    ):
+        monkeypatch.delenv(var, raising=False)
+    cfg = ServeConfig.from_env()
+    assert cfg.admission_max_inflight == 0
+    assert cfg.admission_recipe_max_inflight == 0
+    assert cfg.admission_recipe_limits == {}
+    assert cfg.admission_retry_after_seconds == 1
+
+
+def test_admission_env_parsed_and_clamped(monkeypatch) -> None:
+    monkeypatch.setenv("RECOTEM_ADMISSION_MAX_INFLIGHT", "512")
+    monkeypatch.setenv("RECOTEM_ADMISSION_RECIPE_MAX_INFLIGHT", "-1")
+    monkeypatch.setenv("RECOTEM_ADMISSION_RECIPE_LIMITS", "news=64")
+    monkeypatch.setenv("RECOTEM_ADMISSION_RETRY_AFTER_SECONDS", "600")
+    cfg = ServeConfig.from_env()
+    assert cfg.admission_max_inflight == 512
+    assert cfg.admission_recipe_max_inflight == 0
+    assert cfg.admission_recipe_limits == {"news": 64}
+    assert cfg.admission_retry_after_seconds == 60
+
+
+def test_stream_chunk_size_env(monkeypatch) -> None:
+    monkeypatch.delenv("RECOTEM_STREAM_CHUNK_SIZE", raising=False)
+    assert ServeConfig.from_env().stream_chunk_size == 256
+    monkeypatch.setenv("RECOTEM_STREAM_CHUNK_SIZE", "100000")
+    assert ServeConfig.from_env().stream_chunk_size == 4096
+
+
+def test_server_timing_env(monkeypatch) -> None:
+    monkeypatch.delenv("RECOTEM_SERVER_TIMING", raising=False)
+    assert ServeConfig.from_env().server_timing is False
+    monkeypatch.setenv("RECOTEM_SERVER_TIMING", "yes")
+    assert ServeConfig.from_env().server_timing is True
+
+
+def test_api_key_cache_defaults(monkeypatch) -> None:
+    monkeypatch.delenv("RECOTEM_API_KEY_CACHE_MAX_ENTRIES", raising=False)
+    monkeypatch.delenv("RECOTEM_API_KEY_CACHE_TTL_SECONDS", raising=False)
+    cfg = ServeConfig.from_env()
+    assert cfg.api_key_cache_max_entries == 1024
+    assert cfg.api_key_cache_ttl_seconds == 300
+
+
+def test_api_key_cache_env_parsed_and_clamped(monkeypatch) -> None:
+    monkeypatch.setenv("RECOTEM_API_KEY_CACHE_MAX_ENTRIES", "0")
+    monkeypatch.setenv("RECOTEM_API_KEY_CACHE_TTL_SECONDS", "0")
+    cfg = ServeConfig.from_env()
+    assert cfg.api_key_cache_max_entries == 0
+    assert cfg.api_key_cache_ttl_seconds == 1
+
+
+def test_workers_default_to_single_process(monkeypatch) -> None:
+    monkeypatch.delenv("RECOTEM_WORKERS", raising=False)
+    monkeypatch.delenv("RECOTEM_SHARED_MODEL_DIR", raising=False)
+    cfg = ServeConfig.from_env()
+    assert cfg.workers == 1
+    assert cfg.shared_model_dir == ""
+
+
+def test_workers_env_parsed_and_clamped(monkeypatch) -> None:
+    monkeypatch.setenv("RECOTEM_WORKERS", "1000")
+    monkeypatch.setenv("RECOTEM_SHARED_MODEL_DIR", " /dev/shm/recotem ")
+    cfg = ServeConfig.from_env()
+    assert cfg.workers == 64
+    assert cfg.shared_model_dir == "/dev/shm/recotem"
+
+
+def test_warmup_requests_env(monkeypatch) -> None:
+    monkeypatch.delenv("RECOTEM_WARMUP_REQUESTS", raising=False)
+    assert ServeConfig.from_env().warmup_requests == 16
+    monkeypatch.setenv("RECOTEM_WARMUP_REQUESTS", "0")
+    assert ServeConfig.from_env().warmup_requests == 0
+    monkeypatch.setenv("RECOTEM_WARMUP_REQUESTS", "99999")
+    assert ServeConfig.from_env().warmup_requests == 1024
+
+
+def test_model_memory_budget_env(monkeypatch) -> None:
+    monkeypatch.delenv("RECOTEM_MODEL_MEMORY_BUDGET", raising=False)
+    assert ServeConfig.from_env().model_memory_budget == 0
+    monkeypatch.setenv("RECOTEM_MODEL_MEMORY_BUDGET", "8589934592")
+    assert ServeConfig.from_env().model_memory_budget == 8 * 1024**3
+    monkeypatch.setenv("RECOTEM_MODEL_MEMORY_BUDGET", "-1")
+    assert ServeConfig.from_env().model_memory_budget == 0
+
+
+def test_watcher_load_bounds_env(monkeypatch) -> None:
+    monkeypatch.delenv("RECOTEM_WATCHER_LOAD_CONCURRENCY", raising=False)
+    monkeypatch.delenv("RECOTEM_WATCHER_LOAD_BUDGET_BYTES", raising=False)
+    cfg = ServeConfig.from_env()
+    assert cfg.watcher_load_concurrency == 4
+    assert cfg.watcher_load_budget_bytes == 0
+    monkeypatch.setenv("RECOTEM_WATCHER_LOAD_CONCURRENCY", "999")
+    monkeypatch.setenv("RECOTEM_WATCHER_LOAD_BUDGET_BYTES", "4294967296")
+    cfg = ServeConfig.from_env()
+    assert cfg.watcher_load_concurrency == 32
+    assert cfg.watcher_load_budget_bytes == 4 * 1024**3
@@ -0,0 +1,109 @@
+"""Tests for the compact string-ID index (recotem._idindex)."""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+from recotem._idindex import CompactIDMapper, StringIndex
+
+
+def test_positions_round_trip_for_every_id() -> None:
+    ids = [f"user-{i}" for i in range(5000)] + ["", "ユーザー", "a,b", "🙂"]
+    index = StringIndex.from_strings(ids)
+
+    assert len(index) == len(ids)
+    assert list(index) == ids
+    assert index[-1] == "🙂" and index[1:3] == ["user-1", "user-2"]
+    for pos, iid in enumerate(ids):
+        assert index.position(iid) == pos
+    assert index.position("user-5000") is None
+    assert index.position(7) is None
+    with pytest.raises(IndexError):
+        index[len(ids)]
+
+
+def test_mapping_view_behaves_like_the_irspack_dict() -> None:
+    index = StringIndex.from_strings(["a", "b", "c"])
+    view = index.positions
+
+    assert "b" in view and "z" not in view
+    assert view["c"] == 2 and view.get("z") is None and view.get("z", -1) == -1
+    assert dict(view) == {"a": 0, "b": 1, "c": 2}
+    with pytest.raises(KeyError):
+        view["z"]
+
+
+def test_duplicates_are_rejected() -> None:
+    with pytest.raises(ValueError, match="Duplicates"):
+        StringIndex.from_strings(["a", "b", "a"])
+
+
+def test_state_is_plain_arrays_and_survives_pickling() -> None:
+    index = StringIndex.from_strings(str(i) for i in range(100))
+    state = index.to_state()
+
+    assert all(
+        isinstance(state[key], np.ndarray) for key in ("data", "offsets", "slots")
+    )
+    restored = StringIndex.from_state(pickle.loads(pickle.dumps(state)))
+    assert restored == index
+    assert restored.position("42") == 42
+
+
+def test_empty_index() -> None:
+    index = StringIndex.from_strings([])
+    assert len(index) == 0 and index.position("x") is None
+
+
+def test_profile_matrix_ignores_unknown_ids() -> None:
+    mapper = CompactIDMapper(
+        StringIndex.from_strings(["u0"]), StringIndex.from_strings(["i0", "i1"])
+    )
+    X = mapper.list_of_user_profile_to_matrix([["i1", "nope"], [], ["i0", "i1"]])
+
+    assert X.shape == (3, 2)
+    assert X.toarray().tolist() == [[0, 1], [0, 0], [1, 1]]
+    assert mapper.user_id_to_index["u0"] == 0
+
+
+def test_idmapped_recommender_pickles_sections_and_reads_legacy_lists() -> None:
+    from tests.conftest import dense_idmapped_recommender
+
+    idmapped = dense_idmapped_recommender([[0.1, 0.9], [0.5, 0.2]])
+    state = idmapped.__getstate__()
+    assert isinstance(state["item_ids"]["data"], np.ndarray)
+
+    restored = pickle.loads(pickle.dumps(idmapped))
+    assert restored.get_recommendation_for_known_user_id("u1", 1) == [("i0", 0.5)]
+
+    state["user_ids"] = ["u0", "u1"]  # artifacts written before the index
+    state["item_ids"] = ["i0", "i1"]
+    legacy = type(idmapped).__new__(type(idmapped))
+    legacy.__setstate__(state)
+    assert legacy.item_ids == ["i0", "i1"]
+    assert legacy._mapper.user_id_to_index["u1"] == 1
+
+
+def test_index_restored_from_mapped_artifact_sections(tmp_path) -> None:
+    from recotem.artifact.io import read_artifact, write_artifact
+    from recotem.artifact.signing import KeyRing, unpickle_payload
+    from tests.conftest import ACTIVE_KEY_HEX
+
+    key_ring = KeyRing(f"active:{ACTIVE_KEY_HEX}")
+    index = StringIndex.from_strings(f"user-{i}" for i in range(20000))
+    path = write_artifact(
+        {"user_ids": index.to_state()},
+        {"recipe_name": "ids"},
+        key_ring,
+        str(tmp_path / "ids.recotem"),
+        versioning="always_overwrite",
+    )
+    _, payload = read_artifact(path, key_ring)
+    restored = StringIndex.from_state(unpickle_payload(payload)["user_ids"])
+
+    assert not restored.to_state()["slots"].flags.writeable  # a mapped section
+    assert restored.position("user-19999") == 19999
+    assert restored[123] == "user-123"
@@ -4,6 +4,9 @@ Covers:
 - Fix 4: unknown user_id raises KeyError without calling underlying recommender.
 - Fix 4: known user_id that causes RuntimeError in the underlying recommender
   propagates as RuntimeError (not masked to KeyError).
+- Batched known-user / cold-user scoring: one score block per call, row-wise
+  top-k with non-finite scores dropped.
+- exclude_item_ids is masked before top-k so rows still reach their cutoff.
 """
 
 from __future__ import annotations
@@ -14,7 +17,7 @@ import pytest
 
 
 def _make_idmapped(user_ids: list[str], item_ids: list[str]) -> object:
-    """Build an IDMappedRecommender with a real IDMapper but a mock recommender."""
+    """Build an IDMappedRecommender with a real id index but a mock recommender."""
     from recotem._idmap import IDMappedRecommender
 
     mock_rec = MagicMock()
@@ -62,44 +65,33 @@ def test_known_user_internal_runtime_error_propagates() -> None:
     This ensures that genuine internal failures (e.g. numpy/scipy errors) are
     surfaced as 500 errors rather than silently becoming 404 responses.
     """
-    from unittest.mock import patch
-
     from recotem._idmap import IDMappedRecommender
 
     mock_rec = MagicMock()
+    mock_rec.get_score_remove_seen.side_effect = RuntimeError("internal scipy error")
     idmapped = IDMappedRecommender(mock_rec, ["u1"], ["i1"])
 
-    # Patch the mapper's recommend_for_known_user_id to raise RuntimeError
-    with patch.object(
-        idmapped._mapper,
-        "recommend_for_known_user_id",
-        side_effect=RuntimeError("internal scipy error"),
-    ):
-        with pytest.raises(RuntimeError, match="internal scipy error"):
-            idmapped.get_recommendation_for_known_user_id("u1", cutoff=5)
+    with pytest.raises(RuntimeError, match="internal scipy error"):
+        idmapped.get_recommendation_for_known_user_id("u1", cutoff=5)
 
 
 def test_known_user_internal_runtime_error_is_not_key_error() -> None:
     """Double-check that the RuntimeError is not wrapped in a KeyError."""
-    from unittest.mock import patch
-
     from recotem._idmap import IDMappedRecommender
 
     mock_rec = MagicMock()
+    mock_rec.get_score_remove_seen.side_effect = RuntimeError(
+        "matrix dimension mismatch"
+    )
     idmapped = IDMappedRecommender(mock_rec, ["u1"], ["i1"])
 
-    with patch.object(
-        idmapped._mapper,
-        "recommend_for_known_user_id",
-        side_effect=RuntimeError("matrix dimension mismatch"),
-    ):
-        try:
-            idmapped.get_recommendation_for_known_user_id("u1")
-            pytest.fail("Expected RuntimeError was not raised")
-        except KeyError:
-            pytest.fail("RuntimeError must not be caught and re-raised as KeyError")
-        except RuntimeError:
-            pass  # correct: propagates unchanged
+    try:
+        idmapped.get_recommendation_for_known_user_id("u1")
+        pytest.fail("Expected RuntimeError was not raised")
+    except KeyError:
+        pytest.fail("RuntimeError must not be caught and re-raised as KeyError")
+    except RuntimeError:
+        pass  # correct: propagates unchanged
 
 
 # ---------------------------------------------------------------------------
@@ -184,3 +176,134 @@ def test_ipython_stub_noop_when_both_present(
     assert sys.modules["IPython.display"] is existing_display, (
         "install() must not replace an already-present 'IPython.display' module"
     )
+
+
+# ---------------------------------------------------------------------------
+# Batched scoring: one score block per batch, row-wise top-k
+# ---------------------------------------------------------------------------
+
+
+def _batched(scores: list[list[float]]) -> object:
+    from tests.conftest import dense_idmapped_recommender
+
+    return dense_idmapped_recommender(scores)
+
+
+def test_known_user_batch_scores_once_and_ranks_rows() -> None:
+    import math
+
+    idmapped = _batched(
+        [
+            [0.1, 0.9, 0.5, -math.inf],
+            [0.7, 0.2, 0.3, 0.4],
+        ]
+    )
+    rows = idmapped.get_recommendation_for_known_user_batch(["u1", "u0"], [3, 2])
+
+    assert rows == [
+        [("i0", 0.7), ("i3", 0.4), ("i2", 0.3)],
+        [("i1", 0.9), ("i2", 0.5)],
+    ]
+    assert idmapped.recommender.known_calls == [[1, 0]]
+
+
+def test_known_user_batch_drops_non_finite_scores() -> None:
+    """Seen items (-inf) and degenerate inf/nan scores never reach the output."""
+    import math
+
+    idmapped = _batched([[math.inf, 0.3, -math.inf, math.nan]])
+    rows = idmapped.get_recommendation_for_known_user_batch(["u0"], 4)
+    assert rows == [[("i1", 0.3)]]
+
+
+def test_known_user_batch_matches_single_user_path() -> None:
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    scores = rng.random((5, 40)).tolist()
+    idmapped = _batched(scores)
+    users = [f"u{i}" for i in range(5)]
+
+    # irspack's own single-user path is the reference ranking.
+    from irspack.utils.id_mapping import IDMapper
+
+    reference = IDMapper(users, list(idmapped.item_ids))
+    batch = idmapped.get_recommendation_for_known_user_batch(users, 7)
+    for uid, row in zip(users, batch, strict=True):
+        single = reference.recommend_for_known_user_id(
+            idmapped.recommender, uid, cutoff=7
+        )
+        assert [i for i, _ in row] == [i for i, _ in single]
+
+
+def test_known_user_batch_unknown_user_raises_before_scoring() -> None:
+    idmapped = _batched([[0.1, 0.2]])
+    with pytest.raises(KeyError):
+        idmapped.get_recommendation_for_known_user_batch(["u0", "nobody"], 1)
+    assert idmapped.recommender.known_calls == []
+
+
+def test_known_user_batch_cutoff_length_mismatch() -> None:
+    idmapped = _batched([[0.1, 0.2]])
+    with pytest.raises(ValueError, match="expected 1 cutoffs"):
+        idmapped.get_recommendation_for_known_user_batch(["u0"], [1, 2])
+
+
+def test_known_user_batch_empty() -> None:
+    idmapped = _batched([[0.1, 0.2]])
+    assert idmapped.get_recommendation_for_known_user_batch([], []) == []
+    assert idmapped.recommender.known_calls == []
+
+
+def test_new_user_batch_builds_one_seed_matrix() -> None:
+    idmapped = _batched(
+        [
+            [1.0, 0.0, 1.0],
+            [0.0, 1.0, 1.0],
+        ]
+    )
+    rows = idmapped.get_recommendation_for_new_user_batch(
+        [["i0"], ["i1", "unknown"]], 5
+    )
+
+    # Seeds are masked; zero-score items are still candidates.
+    assert [[i for i, _ in row] for row in rows] == [["i2", "i1"], ["i2", "i0"]]
+    (X,) = idmapped.recommender.cold_calls
+    assert X.shape == (2, 3)
+    assert X.nnz == 2
+    single = idmapped.get_recommendation_for_new_user(["i0"], cutoff=5)
+    assert rows[0] == [(iid, float(score)) for iid, score in single]
+
+
+def test_known_user_exclusions_masked_before_top_k() -> None:
+    """Excluded items are removed before selection, so the row is still full."""
+    idmapped = _batched([[0.9, 0.8, 0.7, 0.6, 0.5]])
+    rows = idmapped.get_recommendation_for_known_user_id(
+        "u0", cutoff=3, exclude_item_ids=["i0", "i2", "not-an-item"]
+    )
+    assert rows == [("i1", 0.8), ("i3", 0.6), ("i4", 0.5)]
+
+
+def test_known_user_batch_exclusions_are_per_row() -> None:
+    idmapped = _batched([[0.9, 0.8, 0.7], [0.9, 0.8, 0.7]])
+    rows = idmapped.get_recommendation_for_known_user_batch(
+        ["u0", "u1"], 2, [["i0"], None]
+    )
+    assert [[i for i, _ in row] for row in rows] == [["i1", "i2"], ["i0", "i1"]]
+
+
+def test_new_user_exclusions_masked_before_top_k() -> None:
+    idmapped = _batched([[1.0, 1.0, 0.5, 0.2], [1.0, 0.0, 1.0, 1.0]])
+    full = idmapped.get_recommendation_for_new_user(["i0"], cutoff=3)
+    first = full[0][0]
+    rows = idmapped.get_recommendation_for_new_user(
+        ["i0"], cutoff=2, exclude_item_ids=[first]
+    )
+    assert len(rows) == 2
+    assert first not in [i for i, _ in rows]
+
+
+def test_exclusion_list_count_mismatch() -> None:
+    idmapped = _batched([[0.1, 0.2]])
+    with pytest.raises(ValueError, match="exclude lists"):
+        idmapped.get_recommendation_for_known_user_batch(["u0"], 1, [["i0"], ["i1"]])
@@ -13,6 +13,7 @@ Tests:
 from __future__ import annotations
 
 import hashlib
+import math
 from pathlib import Path
 
 import pandas as pd
@@ -1211,3 +1212,48 @@ def test_metadata_no_sha256_over_byte_cap_rejected(tmp_path: Path, monkeypatch)
         "MetadataError message must mention RECOTEM_MAX_DOWNLOAD_BYTES"
     )
     assert exc_info.value.cause == "io"
+
+
+# ---------------------------------------------------------------------------
+# Pre-encoded response items
+# ---------------------------------------------------------------------------
+
+
+def test_build_metadata_index_pre_encodes_items() -> None:
+    """Every row gets its item JSON split around the score; reserved fields
+    are left to the recommender."""
+    from recotem.metadata.loader import MetadataIndex, build_metadata_index
+
+    df = pd.DataFrame(
+        {"title": ["Wïdget ✓", None], "score": [1.0, 2.0], "rank": [1.5, math.nan]},
+        index=pd.Index(["i1", "i2"], name="item_id"),
+    )
+    index = build_metadata_index(df)
+
+    assert isinstance(index, MetadataIndex)
+    assert index.parts == {
+        "i1": (b'{"item_id":"i1","score":', ',"title":"Wïdget ✓","rank":1.5}'.encode()),
+        "i2": (b'{"item_id":"i2","score":', b',"title":null,"rank":null}'),
+    }
+
+
+def test_encode_metadata_fragment_edge_cases() -> None:
+    from recotem.metadata.loader import encode_metadata_fragment
+
+    assert encode_metadata_fragment({}) == b""
+    assert encode_metadata_fragment({"item_id": "x", "score": 1}) == b""
+    assert encode_metadata_fragment({"v": math.inf}) == b',"v":null'
+    assert encode_metadata_fragment({"v": object()}) is None
+
+
+def test_build_metadata_index_marks_unencodable_rows() -> None:
+    from recotem.metadata.loader import build_metadata_index
+
+    df = pd.DataFrame(
+        {"blob": [object(), "ok"]}, index=pd.Index(["i1", "i2"], name="item_id")
+    )
+    index = build_metadata_index(df)
+
+    assert index.parts["i1"] is None
+    assert index.parts["i2"] == (b'{"item_id":"i2","score":', b',"blob":"ok"}')
+    assert set(index) == {"i1", "i2"}
@@ -0,0 +1,133 @@
+"""Tests for the item-to-item neighbour table (recotem._neighbors)."""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+import scipy.sparse as sps
+
+import recotem.training._compat  # noqa: F401  (IPython stub before irspack)
+from recotem._idmap import IDMappedRecommender
+from recotem._neighbors import NeighborTable, build_neighbor_table
+from recotem.recipe.models import NeighborsConfig
+from recotem.training.neighbors import build_neighbors
+
+N_USERS = 150
+N_ITEMS = 80
+
+
+def _idmapped(algorithm: str) -> IDMappedRecommender:
+    from irspack import CosineKNNRecommender, IALSRecommender, TruncatedSVDRecommender
+
+    X = sps.random(N_USERS, N_ITEMS, density=0.08, random_state=0, format="csr")
+    X.data[:] = 1.0
+    if algorithm == "CosineKNN":
+        rec = CosineKNNRecommender(X).learn()
+    elif algorithm == "SVD":
+        rec = TruncatedSVDRecommender(X, n_components=6).learn()
+    else:
+        rec = IALSRecommender(X, n_components=6, train_epochs=3).learn()
+    return IDMappedRecommender(
+        rec,
+        [f"u{i}" for i in range(N_USERS)],
+        [f"i{i}" for i in range(N_ITEMS)],
+    )
+
+
+def _model_only(idmapped: IDMappedRecommender, *args):
+    table = idmapped.neighbor_table
+    idmapped.attach_neighbor_table(None)
+    try:
+        return idmapped.get_recommendation_for_new_user_batch(*args)
+    finally:
+        idmapped.attach_neighbor_table(table)
+
+
+def _scores(rows) -> list[list[float]]:
+    return [[round(score, 9) for _, score in row] for row in rows]
+
+
+@pytest.mark.parametrize("algorithm", ["CosineKNN", "SVD", "IALS"])
+def test_table_answers_match_the_model(algorithm: str) -> None:
+    idmapped = _idmapped(algorithm)
+    summary = build_neighbors(idmapped, NeighborsConfig(k=20, max_seeds=3))
+    assert summary["k"] == 20
+    assert summary["max_seeds"] == (1 if algorithm == "IALS" else 3)
+
+    rng = np.random.default_rng(0)
+    seeds = [
+        [f"i{j}" for j in rng.choice(N_ITEMS, size=n, replace=False)]
+        for n in (1, 1, 2, 3, 4, 1)
+    ]
+    exclude = [[f"i{j}" for j in rng.choice(N_ITEMS, size=3)] for _ in seeds]
+    got = idmapped.get_recommendation_for_new_user_batch(seeds, 10, exclude)
+    want = _model_only(idmapped, seeds, 10, exclude)
+
+    # Equal scores may be ordered differently; the ranked scores must agree.
+    assert _scores(got) == _scores(want)
+    for row, excluded, ids in zip(got, exclude, seeds, strict=True):
+        assert not {iid for iid, _ in row} & (set(excluded) | set(ids))
+
+
+def test_single_seed_is_a_row_slice() -> None:
+    table = NeighborTable(
+        {
+            "k": 3,
+            "indices": np.array([[2, 1, -1], [0, 2, 3], [1, 0, 3], [0, 1, 2]]),
+            "scores": np.array(
+                [[0.9, 0.5, -np.inf], [0.8, 0.7, 0.1], [0.4, 0.3, 0.2], [1, 1, 1.0]]
+            ),
+            "linear": True,
+            "max_seeds": 2,
+        }
+    )
+    assert table.related([0], 5, set()) == [(2, 0.9), (1, 0.5)]
+    assert table.related([1], 1, {0}) == [(2, 0.7)]
+    # A full row exhausted by exclusions cannot prove there is nothing else.
+    assert table.related([1], 3, {0}) is None
+    assert table.related([1], 0, set()) == []
+    # Merging sums the seed rows.  Seed 0's row is not full, so item 3 (absent
+    # from it) scores -inf and only item 2 remains; seeds are never returned.
+    assert table.related([0, 1], 2, set()) == [(2, pytest.approx(1.6))]
+    assert table.related([1, 2], 2, set()) == [
+        (0, pytest.approx(1.1)),
+        (3, pytest.approx(0.3)),
+    ]
+    assert table.related([0, 1, 2], 1, set()) is None  # above max_seeds
+
+
+def test_merge_falls_back_when_a_partial_score_could_win() -> None:
+    table = NeighborTable(
+        {
+            "k": 1,
+            "indices": np.array([[1], [2], [3], [0]]),
+            "scores": np.array([[0.9], [0.8], [0.7], [0.6]]),
+            "linear": True,
+            "max_seeds": 2,
+        }
+    )
+    # Items 1 and 3 each appear in one list only: their sums are bounds.
+    assert table.related([0, 2], 1, set()) is None
+
+
+def test_nonlinear_models_only_use_single_seed_rows() -> None:
+    idmapped = _idmapped("IALS")
+    state = build_neighbor_table(idmapped.recommender, k=10, max_seeds=3)
+    assert state["linear"] is False
+    assert NeighborTable(state).related([0, 1], 5, set()) is None
+
+
+def test_table_survives_pickling() -> None:
+    idmapped = _idmapped("CosineKNN")
+    build_neighbors(idmapped, NeighborsConfig(k=5))
+    idmapped.get_recommendation_for_new_user(["i1"], 3)
+
+    restored = pickle.loads(pickle.dumps(idmapped))
+    assert "_neighbors" not in restored.__dict__
+    assert restored.neighbor_table["k"] == 5
+    assert restored.get_recommendation_for_new_user(
+        ["i1"], 3
+    ) == idmapped.get_recommendation_for_new_user(["i1"], 3)
+    assert build_neighbors(idmapped, None) is None
@@ -619,3 +619,45 @@ def test_validate_source_warning_contains_error_class_and_message() -> None:
     warn = warnings[0]
     assert warn.get("error_class") == "RuntimeError"
     assert "plugin entry_point collision" in warn.get("error", "")
+
+
+def test_output_format_version_defaults_to_2_and_is_bounded() -> None:
+    assert OutputConfig(path="/tmp/x.recotem").format_version == 2
+    assert OutputConfig(path="/tmp/x.recotem", format_version=1).format_version == 1
+    assert OutputConfig(path="/tmp/x.recotem", format_version=3).format_version == 3
+    with pytest.raises(ValidationError):
+        OutputConfig(path="/tmp/x.recotem", format_version=4)
+
+
+def test_ann_config_is_optional_and_validated() -> None:
+    from recotem.recipe.models import AnnConfig
+
+    assert Recipe.model_validate(_minimal_recipe_dict()).ann is None
+    data = _minimal_recipe_dict()
+    data["ann"] = {"exact": True}
+    ann = Recipe.model_validate(data).ann
+    assert ann == AnnConfig(exact=True)
+    assert (ann.n_lists, ann.n_probe, ann.target_recall) == (0, 0, 0.95)
+    with pytest.raises(ValidationError):
+        AnnConfig(target_recall=0.0)
+    with pytest.raises(ValidationError):
+        AnnConfig(nprobe=4)
+
+
+def test_neighbors_config_bounds() -> None:
+    from recotem.recipe.models import NeighborsConfig
+
+    data = _minimal_recipe_dict()
+    data["neighbors"] = {}
+    assert Recipe.model_validate(data).neighbors == NeighborsConfig(k=50, max_seeds=3)
+    with pytest.raises(ValidationError):
+        NeighborsConfig(k=0)
+    with pytest.raises(ValidationError):
+        NeighborsConfig(max_seeds=33)
+
+
+def test_output_compression_defaults_to_none_and_is_validated() -> None:
+    assert OutputConfig(path="/tmp/x.recotem").compression == "none"
+    assert OutputConfig(path="/tmp/x.recotem", compression="gzip").compression == "gzip"
+    with pytest.raises(ValidationError):
+        OutputConfig(path="/tmp/x.recotem", compression="lz4")
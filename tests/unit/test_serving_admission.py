@@ -0,0 +1,159 @@
+"""Unit tests for recotem.serving.admission (429 load shedding).
+
+Tests:
+- Weight is admitted and released; caps are global and per recipe
+- A batch heavier than a cap is clamped to it
+- Router integration: 429 OVERLOADED with Retry-After, batch weighting,
+  response-cache hits bypass admission
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from recotem.serving.admission import AdmissionController, AdmissionRejected
+from recotem.serving.cache import ResponseCache
+from recotem.serving.registry import ModelEntry, ModelRegistry
+from tests.conftest import build_v1_app
+
+
+def _entry(rec) -> ModelEntry:
+    return ModelEntry(
+        name="demo",
+        recommender=rec,
+        header={},
+        kid="t",
+        metadata_df=None,
+        metadata_index=None,
+        loaded=True,
+        _loaded_marker=(None, "c" * 64),
+        loaded_at_unix=1.0,
+    )
+
+
+def _mock_recommender() -> MagicMock:
+    rec = MagicMock()
+    rec._mapper.user_id_to_index = {"u1": 0, "u2": 1}
+    rec.get_recommendation_for_known_user_id.return_value = [("i1", 0.5)]
+    return rec
+
+
+def test_acquire_tracks_and_release_returns_weight() -> None:
+    admission = AdmissionController(max_inflight=10, recipe_max_inflight=4)
+    assert admission.acquire("a", 3) == 3
+    assert admission.inflight("a") == 3
+    assert admission.inflight() == 3
+    admission.release("a", 3)
+    assert admission.inflight("a") == 0
+    assert admission.inflight() == 0
+
+
+def test_recipe_cap_rejects_only_that_recipe() -> None:
+    admission = AdmissionController(recipe_max_inflight=2, recipe_limits={"b": 5})
+    admission.acquire("a", 2)
+    with pytest.raises(AdmissionRejected) as exc_info:
+        admission.acquire("a")
+    assert exc_info.value.scope == "recipe"
+    admission.acquire("b", 4)
+    assert admission.inflight() == 6
+    assert admission.limit_for("b") == 5
+
+
+def test_global_cap_rejects_across_recipes() -> None:
+    admission = AdmissionController(max_inflight=3, retry_after_seconds=7)
+    admission.acquire("a", 2)
+    with pytest.raises(AdmissionRejected) as exc_info:
+        admission.acquire("b", 2)
+    assert exc_info.value.scope == "global"
+    assert exc_info.value.retry_after_seconds == 7
+    # A rejection admits nothing.
+    assert admission.inflight("b") == 0
+    assert admission.inflight() == 2
+
+
+def test_oversized_weight_is_clamped_to_cap() -> None:
+    admission = AdmissionController(recipe_max_inflight=4)
+    held = admission.acquire("a", 100)
+    assert held == 4
+    assert admission.inflight("a") == 4
+    with pytest.raises(AdmissionRejected):
+        admission.acquire("a", 1)
+    admission.release("a", held)
+    assert admission.inflight() == 0
+
+
+def test_enabled_only_with_a_cap() -> None:
+    assert not AdmissionController().enabled
+    assert AdmissionController(recipe_limits={"a": 1}).enabled
+    assert AdmissionController(max_inflight=1).enabled
+
+
+# ---------------------------------------------------------------------------
+# Router integration
+# ---------------------------------------------------------------------------
+
+
+def test_router_sheds_with_429_and_retry_after() -> None:
+    registry = ModelRegistry()
+    registry.replace("demo", _entry(_mock_recommender()))
+    admission = AdmissionController(recipe_max_inflight=1, retry_after_seconds=3)
+    client = TestClient(build_v1_app(registry, admission=admission))
+
+    admission.acquire("demo")
+    shed = client.post("/v1/recipes/demo:recommend", json={"user_id": "u1"})
+    admission.release("demo", 1)
+    ok = client.post("/v1/recipes/demo:recommend", json={"user_id": "u1"})
+
+    assert shed.status_code == 429
+    assert shed.json()["code"] == "OVERLOADED"
+    assert shed.headers["retry-after"] == "3"
+    assert ok.status_code == 200
+    assert admission.inflight() == 0
+
+
+def test_router_weights_batches_by_element_count() -> None:
+    registry = ModelRegistry()
+    registry.replace("demo", _entry(_mock_recommender()))
+    admission = AdmissionController(recipe_max_inflight=5)
+    client = TestClient(build_v1_app(registry, admission=admission))
+
+    def batch(n: int):
+        return client.post(
+            "/v1/recipes/demo:batch-recommend",
+            json={"requests": [{"user_id": "u1"}] * n},
+        )
+
+    admission.acquire("demo", 2)
+    too_heavy = batch(4)
+    fits = batch(3)
+    admission.release("demo", 2)
+
+    assert too_heavy.status_code == 429
+    assert fits.status_code == 200, fits.text
+
+
+def test_router_cache_hits_bypass_admission() -> None:
+    registry = ModelRegistry()
+    registry.replace("demo", _entry(_mock_recommender()))
+    admission = AdmissionController(recipe_max_inflight=1)
+    client = TestClient(
+        build_v1_app(
+            registry,
+            response_cache=ResponseCache(max_bytes=1 << 20),
+            admission=admission,
+        )
+    )
+
+    first = client.post("/v1/recipes/demo:recommend", json={"user_id": "u1"})
+    admission.acquire("demo")
+    cached = client.post("/v1/recipes/demo:recommend", json={"user_id": "u1"})
+    uncached = client.post("/v1/recipes/demo:recommend", json={"user_id": "u2"})
+    admission.release("demo", 1)
+
+    assert first.status_code == 200
+    assert cached.status_code == 200
+    assert cached.json()["items"] == first.json()["items"]
+    assert uncached.status_code == 429
@@ -1371,9 +1371,11 @@ def test_startup_respects_RECOTEM_STARTUP_PARALLELISM_env_var(
 
     from recotem.serving import app as app_module
 
-    source = inspect.getsource(app_module.create_app)
+    # create_app delegates the startup load to bootstrap_registry.
+    source = inspect.getsource(app_module.bootstrap_registry)
     assert "startup_parallelism" in source, (
-        "create_app must read serve_config.startup_parallelism to set max_workers"
+        "bootstrap_registry must read serve_config.startup_parallelism to set "
+        "max_workers"
     )
 
 
@@ -2520,3 +2522,60 @@ def test_request_id_replaced_when_client_supplies_empty_value(
     assert response.status_code == 200
     returned = response.headers.get("x-request-id", "")
     assert returned, "Empty X-Request-ID must be replaced by a server-generated value"
+
+
+# ---------------------------------------------------------------------------
+# Per-recipe executor sizing
+# ---------------------------------------------------------------------------
+
+
+def test_recipe_pool_sizes_without_coalescing() -> None:
+    from recotem.serving.app import _recipe_pool_sizes
+
+    cfg = ServeConfig(recipe_pool_size=4, recipe_pool_sizes={"slim": 2})
+    assert _recipe_pool_sizes(cfg) == (4, {"slim": 2})
+
+
+def test_recipe_pool_sizes_hold_a_full_coalesced_batch() -> None:
+    from recotem.serving.app import _recipe_pool_sizes
+
+    cfg = ServeConfig(
+        recipe_pool_size=4,
+        recipe_pool_sizes={"slim": 2, "news": 64},
+        coalesce_window_ms=2,
+        coalesce_max_batch=16,
+    )
+    assert _recipe_pool_sizes(cfg) == (16, {"slim": 16, "news": 64})
+
+    cfg.coalesce_recipes = ["movies"]
+    assert _recipe_pool_sizes(cfg) == (4, {"slim": 2, "news": 64, "movies": 16})
+
+
+# ---------------------------------------------------------------------------
+# Lazy loading (RECOTEM_MODEL_MEMORY_BUDGET)
+# ---------------------------------------------------------------------------
+
+
+def test_lazy_mode_defers_loads_to_the_first_request(tmp_path: Path) -> None:
+    """With a memory budget nothing loads at startup; the recipe is healthy
+    on standby until a request loads it (here: and fails to)."""
+    from fastapi.testclient import TestClient
+
+    from recotem.serving.app import create_app
+
+    cfg = _minimal_config(tmp_path)
+    cfg.model_memory_budget = 1 << 30
+    recipes_dir = Path(cfg.recipes_dir)  # type: ignore[arg-type]
+    _write_recipe_yaml(recipes_dir, "later", tmp_path / "does-not-exist.recotem")
+
+    client = TestClient(create_app(cfg))
+    health = client.get("/v1/health")
+    assert health.status_code == 200
+    assert health.json()["standby"] == 1
+
+    r = client.post("/v1/recipes/later:recommend", json={"user_id": "u"})
+    assert r.status_code == 503
+    assert r.json()["code"] == "RECIPE_UNAVAILABLE"
+    details = client.get("/v1/health/details").json()["recipes"]["later"]
+    assert details["loaded"] is False and "standby" not in details
+    assert details["error"].startswith("read failed")
@@ -1005,3 +1005,150 @@ def test_matched_kid_single_match_unchanged() -> None:
 
     assert kid == "beta"
     assert request.state.kid == "beta"
+
+
+# ---------------------------------------------------------------------------
+# Verified-key cache
+# ---------------------------------------------------------------------------
+
+_CACHED_KEY = "cached_key_value_of_32_chars_ok!"
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _verify_counting(request, api_keys, cache) -> tuple[str, int]:
+    from unittest.mock import patch
+
+    import recotem.serving.auth as auth_module
+
+    with patch.object(
+        auth_module, "_hash_api_key", wraps=auth_module._hash_api_key
+    ) as hash_spy:
+        kid = verify_api_key(request, api_keys, cache=cache)
+    return kid, hash_spy.call_count
+
+
+def test_cache_hit_skips_scrypt() -> None:
+    from recotem.serving.auth import VerifiedKeyCache
+
+    entry = _make_entry("k1", _CACHED_KEY)
+    cache = VerifiedKeyCache(max_entries=8, ttl_seconds=60)
+
+    kid, calls = _verify_counting(_make_request(_CACHED_KEY), [entry], cache)
+    assert (kid, calls) == ("k1", 1)
+
+    request = _make_request(_CACHED_KEY)
+    kid, calls = _verify_counting(request, [entry], cache)
+    assert (kid, calls) == ("k1", 0)
+    assert request.state.kid == "k1"
+
+
+def test_cache_never_stores_failed_attempts() -> None:
+    from recotem.serving.auth import VerifiedKeyCache
+
+    entry = _make_entry("k1", _CACHED_KEY)
+    cache = VerifiedKeyCache(max_entries=8, ttl_seconds=60)
+    wrong = "wrong_key_value_of_32_chars_ok!!"
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            _verify_counting(_make_request(wrong), [entry], cache)
+        assert exc_info.value.status_code == 401
+    assert len(cache) == 0
+
+
+def test_cache_rejection_branches_unchanged() -> None:
+    """Short and missing headers are rejected before the cache is consulted."""
+    from recotem.serving.auth import VerifiedKeyCache
+
+    entry = _make_entry("k1", _CACHED_KEY)
+    cache = VerifiedKeyCache(max_entries=8, ttl_seconds=60)
+    verify_api_key(_make_request(_CACHED_KEY), [entry], cache=cache)
+
+    for header in (None, _CACHED_KEY[:8]):
+        with pytest.raises(HTTPException) as exc_info:
+            verify_api_key(_make_request(header), [entry], cache=cache)
+        assert exc_info.value.status_code == 401
+
+
+def test_cache_stores_fingerprint_not_plaintext() -> None:
+    from recotem.serving.auth import VerifiedKeyCache
+
+    entry = _make_entry("k1", _CACHED_KEY)
+    cache = VerifiedKeyCache(max_entries=8, ttl_seconds=60)
+    verify_api_key(_make_request(_CACHED_KEY), [entry], cache=cache)
+
+    [(fingerprint, (kid, _expires))] = cache._entries.items()
+    assert kid == "k1"
+    assert fingerprint == cache.fingerprint(_CACHED_KEY)
+    assert _CACHED_KEY.encode() not in fingerprint
+    assert fingerprint != hashlib.sha256(_CACHED_KEY.encode()).digest()
+    # The fingerprint key is per instance, so it is useless outside it.
+    other = VerifiedKeyCache(max_entries=8, ttl_seconds=60)
+    assert other.fingerprint(_CACHED_KEY) != fingerprint
+
+
+def test_cache_entry_expires_after_ttl() -> None:
+    from recotem.serving.auth import VerifiedKeyCache
+
+    clock = _FakeClock()
+    entry = _make_entry("k1", _CACHED_KEY)
+    cache = VerifiedKeyCache(max_entries=8, ttl_seconds=60, clock=clock)
+    verify_api_key(_make_request(_CACHED_KEY), [entry], cache=cache)
+
+    clock.now += 59
+    assert _verify_counting(_make_request(_CACHED_KEY), [entry], cache)[1] == 0
+    clock.now += 1
+    assert _verify_counting(_make_request(_CACHED_KEY), [entry], cache)[1] == 1
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    from recotem.serving.auth import VerifiedKeyCache
+
+    keys = [f"key_{i}_padded_to_thirty_two_chars!!"[:32] for i in range(3)]
+    entries = [_make_entry(f"k{i}", key) for i, key in enumerate(keys)]
+    cache = VerifiedKeyCache(max_entries=2, ttl_seconds=60)
+
+    verify_api_key(_make_request(keys[0]), entries, cache=cache)
+    verify_api_key(_make_request(keys[1]), entries, cache=cache)
+    verify_api_key(_make_request(keys[0]), entries, cache=cache)  # refresh k0
+    verify_api_key(_make_request(keys[2]), entries, cache=cache)  # evicts k1
+
+    assert len(cache) == 2
+    assert _verify_counting(_make_request(keys[0]), entries, cache)[1] == 0
+    assert _verify_counting(_make_request(keys[1]), entries, cache)[1] == 1
+
+
+def test_cache_flushed_when_key_set_rotates() -> None:
+    from recotem.serving.auth import VerifiedKeyCache
+
+    old = _make_entry("k1", _CACHED_KEY)
+    new = _make_entry("k2", "replacement_key_of_32_characters")
+    cache = VerifiedKeyCache(max_entries=8, ttl_seconds=60)
+    verify_api_key(_make_request(_CACHED_KEY), [old], cache=cache)
+
+    # The old key was removed: the cached verification must not survive.
+    with pytest.raises(HTTPException) as exc_info:
+        verify_api_key(_make_request(_CACHED_KEY), [new], cache=cache)
+    assert exc_info.value.status_code == 401
+    assert len(cache) == 0
+
+
+def test_cache_put_dropped_for_stale_key_set() -> None:
+    from recotem.serving.auth import VerifiedKeyCache, api_key_set
+
+    old = [_make_entry("k1", _CACHED_KEY)]
+    new = [_make_entry("k2", "replacement_key_of_32_characters")]
+    cache = VerifiedKeyCache(max_entries=8, ttl_seconds=60)
+    fingerprint = cache.fingerprint(_CACHED_KEY)
+    assert cache.get(fingerprint, api_key_set(new)) is None
+
+    # A verification that raced with the rotation is not inserted.
+    cache.put(fingerprint, "k1", api_key_set(old))
+    assert len(cache) == 0
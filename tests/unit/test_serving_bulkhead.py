@@ -0,0 +1,190 @@
+"""Unit tests for recotem.serving.bulkhead (per-recipe inference executors).
+
+Tests:
+- Results and exceptions cross the executor boundary unchanged
+- Pool sizes: default and per-recipe overrides
+- A saturated recipe does not delay another recipe
+- Queue depth / active worker accounting while a pool is busy
+- contextvars bindings reach the worker thread
+- on_done fires when the call finishes, not when its awaiter is cancelled
+- Router integration: inference verbs score on the recipe's pool
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from recotem.serving.bulkhead import RecipeExecutors
+from recotem.serving.registry import ModelEntry, ModelRegistry
+from tests.conftest import build_v1_app
+
+_REQUEST_TAG: contextvars.ContextVar[str] = contextvars.ContextVar("_REQUEST_TAG")
+
+
+def _entry(name: str, rec) -> ModelEntry:
+    return ModelEntry(
+        name=name,
+        recommender=rec,
+        header={},
+        kid="t",
+        metadata_df=None,
+        metadata_index=None,
+        loaded=True,
+        _loaded_marker=(None, "c" * 64),
+        loaded_at_unix=1.0,
+    )
+
+
+def test_run_returns_result_and_propagates_errors() -> None:
+    executors = RecipeExecutors(2)
+
+    async def main() -> None:
+        assert await executors.run("a", lambda x, y: x + y, 2, 3) == 5
+        with pytest.raises(KeyError):
+            await executors.run("a", {}.__getitem__, "missing")
+
+    try:
+        asyncio.run(main())
+    finally:
+        executors.shutdown()
+    assert executors.stats() == {"a": (0, 0)}
+
+
+def test_pool_size_default_and_overrides() -> None:
+    executors = RecipeExecutors(4, {"slow": 1})
+    assert executors.workers_for("slow") == 1
+    assert executors.workers_for("other") == 4
+
+
+def test_saturated_recipe_does_not_block_other_recipe() -> None:
+    executors = RecipeExecutors(1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking() -> str:
+        started.set()
+        release.wait(5)
+        return "slow"
+
+    async def main() -> None:
+        slow = [
+            asyncio.ensure_future(executors.run("slow", blocking)) for _ in range(3)
+        ]
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        # One call runs, two wait for the single thread.
+        assert executors.stats()["slow"] == (2, 1)
+        assert await asyncio.wait_for(executors.run("fast", lambda: "fast"), 2) == (
+            "fast"
+        )
+        release.set()
+        assert await asyncio.gather(*slow) == ["slow"] * 3
+
+    try:
+        asyncio.run(main())
+    finally:
+        release.set()
+        executors.shutdown()
+    assert executors.stats()["slow"] == (0, 0)
+
+
+def test_context_is_copied_into_worker() -> None:
+    executors = RecipeExecutors(1)
+
+    async def main() -> tuple[str, str]:
+        _REQUEST_TAG.set("req-1")
+        return await executors.run(
+            "a", lambda: (_REQUEST_TAG.get(), threading.current_thread().name)
+        )
+
+    try:
+        tag, thread_name = asyncio.run(main())
+    finally:
+        executors.shutdown()
+    assert tag == "req-1"
+    assert thread_name.startswith("recotem-a")
+
+
+def test_run_after_shutdown_raises() -> None:
+    executors = RecipeExecutors(1)
+    executors.shutdown()
+    with pytest.raises(RuntimeError):
+        asyncio.run(executors.run("a", lambda: None))
+
+
+def test_on_done_waits_for_the_call_not_the_cancelled_awaiter() -> None:
+    executors = RecipeExecutors(1)
+    release = threading.Event()
+    started = threading.Event()
+    done: list[str] = []
+
+    def blocking() -> None:
+        started.set()
+        release.wait(5)
+
+    async def main() -> None:
+        task = asyncio.ensure_future(
+            executors.run("a", blocking, on_done=lambda: done.append("a"))
+        )
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        task.cancel()  # the client went away
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert done == []  # the call is still running
+        release.set()
+
+    try:
+        asyncio.run(main())
+    finally:
+        release.set()
+        executors.shutdown()
+    for _ in range(100):
+        if done:
+            break
+        threading.Event().wait(0.01)
+    assert done == ["a"]
+
+    done.clear()
+    with pytest.raises(RuntimeError):
+        asyncio.run(executors.run("a", lambda: None, on_done=lambda: done.append("x")))
+    assert done == ["x"]
+
+
+def test_router_scores_on_recipe_pool() -> None:
+    threads: list[str] = []
+
+    def score(user_id, limit, **_kw):
+        threads.append(threading.current_thread().name)
+        return [("i1", 0.5)]
+
+    rec = MagicMock()
+    rec._mapper.user_id_to_index = {"u1": 0}
+    rec._mapper.item_id_to_index = {"i1": 0}
+    rec.get_recommendation_for_known_user_id.side_effect = score
+    rec.get_recommendation_for_new_user.side_effect = score
+    registry = ModelRegistry()
+    registry.replace("demo", _entry("demo", rec))
+    executors = RecipeExecutors(2)
+    client = TestClient(build_v1_app(registry, executors=executors))
+
+    try:
+        single = client.post("/v1/recipes/demo:recommend", json={"user_id": "u1"})
+        related = client.post(
+            "/v1/recipes/demo:recommend-related", json={"seed_items": ["i1"]}
+        )
+        missing = client.post("/v1/recipes/nope:recommend", json={"user_id": "u1"})
+    finally:
+        executors.shutdown()
+
+    assert single.status_code == 200, single.text
+    assert related.status_code == 200, related.text
+    assert missing.status_code == 404
+    assert len(threads) == 2
+    assert all(name.startswith("recotem-demo") for name in threads)
+    # Unknown recipes are rejected before a pool is created.
+    assert set(executors.stats()) == {"demo"}
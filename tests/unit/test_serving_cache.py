@@ -0,0 +1,210 @@
+"""Unit tests for recotem.serving.cache (response cache).
+
+Tests:
+- Key construction: seed order independence, exclusion digest, model version
+- Byte-bounded LRU eviction and recency updates, one budget for all recipes
+- TTL expiry on lookup
+- invalidate() on registry swap
+- Router integration: a hit skips scoring, a swap forces a re-score
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from fastapi.testclient import TestClient
+
+from recotem.serving.cache import ResponseCache, response_cache_key
+from recotem.serving.registry import ModelEntry, ModelRegistry
+from tests.conftest import build_v1_app
+
+
+def _items(*ids: str) -> list[bytes]:
+    return [b'{"item_id":"%s","score":1.0}' % i.encode() for i in ids]
+
+
+def _key(subject="u1", version="sha256:" + "a" * 64, limit=10, exclude=None):
+    return response_cache_key(version, "recommend", subject, limit, exclude, True)
+
+
+# ---------------------------------------------------------------------------
+# Keys
+# ---------------------------------------------------------------------------
+
+
+def test_key_seed_order_is_irrelevant_but_duplicates_matter() -> None:
+    assert _key(["a", "b"]) == _key(["b", "a"])
+    assert _key(["a", "b"]) != _key(["a", "a", "b"])
+
+
+def test_key_exclusions_hashed_and_order_insensitive() -> None:
+    k1 = _key(exclude=["x", "y"])
+    assert k1 == _key(exclude=["y", "x", "y"])
+    assert k1 != _key(exclude=["x"])
+    assert k1 != _key()
+    assert len(k1[4]) == 16
+
+
+def test_key_includes_model_version_and_limit() -> None:
+    assert _key(version="sha256:" + "b" * 64) != _key()
+    assert _key(limit=5) != _key()
+
+
+# ---------------------------------------------------------------------------
+# LRU / TTL / invalidate
+# ---------------------------------------------------------------------------
+
+
+def test_put_then_get_returns_cached_items() -> None:
+    cache = ResponseCache(max_bytes=1 << 20)
+    items = _items("i1", "i2")
+    cache.put("r", _key(), items, 1, 0)
+    hit = cache.get("r", "recommend", _key())
+    assert hit is not None
+    assert hit.items is items
+    assert hit.fallback_count == 1
+    assert cache.get("other", "recommend", _key()) is None
+
+
+def test_lru_evicts_least_recently_used_within_byte_budget() -> None:
+    probe = ResponseCache(max_bytes=1 << 20)
+    probe.put("r", _key("u1"), _items("i1"))
+    one = probe.size_bytes("r")
+
+    cache = ResponseCache(max_bytes=2 * one)
+    cache.put("r", _key("u1"), _items("i1"))
+    cache.put("r", _key("u2"), _items("i1"))
+    assert cache.get("r", "recommend", _key("u1")) is not None  # u1 now MRU
+    cache.put("r", _key("u3"), _items("i1"))
+
+    assert cache.get("r", "recommend", _key("u2")) is None
+    assert cache.get("r", "recommend", _key("u1")) is not None
+    assert cache.get("r", "recommend", _key("u3")) is not None
+    assert cache.size_bytes("r") <= 2 * one
+
+
+def test_budget_is_shared_across_recipes() -> None:
+    probe = ResponseCache(max_bytes=1 << 20)
+    probe.put("r", _key("u1"), _items("i1"))
+    one = probe.size_bytes("r")
+
+    cache = ResponseCache(max_bytes=2 * one)
+    cache.put("a", _key("u1"), _items("i1"))
+    cache.put("b", _key("u1"), _items("i1"))
+    assert cache.get("a", "recommend", _key("u1")) is not None  # a now MRU
+    cache.put("c", _key("u1"), _items("i1"))
+
+    # The least recently used entry went, whichever recipe it belonged to.
+    assert cache.get("b", "recommend", _key("u1")) is None
+    assert cache.get("a", "recommend", _key("u1")) is not None
+    assert cache.get("c", "recommend", _key("u1")) is not None
+    assert cache.size_bytes() == 2 * one
+    cache.invalidate("a")
+    assert cache.size_bytes() == one
+
+
+def test_oversized_response_is_not_cached() -> None:
+    cache = ResponseCache(max_bytes=100)
+    cache.put("r", _key(), _items("i1"))
+    assert len(cache) == 0
+
+
+def test_ttl_expiry_on_lookup() -> None:
+    now = [1000.0]
+    cache = ResponseCache(max_bytes=1 << 20, ttl_seconds=5, clock=lambda: now[0])
+    cache.put("r", _key(), _items("i1"))
+    now[0] += 4.9
+    assert cache.get("r", "recommend", _key()) is not None
+    now[0] += 0.2
+    assert cache.get("r", "recommend", _key()) is None
+    assert cache.size_bytes("r") == 0
+
+
+def test_invalidate_drops_only_that_recipe() -> None:
+    cache = ResponseCache(max_bytes=1 << 20)
+    cache.put("a", _key(), _items("i1"))
+    cache.put("b", _key(), _items("i1"))
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert cache.get("a", "recommend", _key()) is None
+    assert cache.get("b", "recommend", _key()) is not None
+
+
+# ---------------------------------------------------------------------------
+# Router integration
+# ---------------------------------------------------------------------------
+
+
+def _entry(rec, sha: str) -> ModelEntry:
+    return ModelEntry(
+        name="demo",
+        recommender=rec,
+        header={},
+        kid="t",
+        metadata_df=None,
+        metadata_index=None,
+        loaded=True,
+        _loaded_marker=(None, sha),
+        loaded_at_unix=1.0,
+    )
+
+
+def test_router_serves_repeat_request_from_cache_until_swap() -> None:
+    rec = MagicMock()
+    rec.get_recommendation_for_known_user_id.return_value = [("i1", 0.9)]
+    registry = ModelRegistry()
+    registry.replace("demo", _entry(rec, "1" * 64))
+    cache = ResponseCache(max_bytes=1 << 20)
+    registry.add_swap_listener(cache.invalidate)
+    client = TestClient(build_v1_app(registry, response_cache=cache))
+    body = {"user_id": "u1", "limit": 3}
+
+    r1 = client.post("/v1/recipes/demo:recommend", json=body)
+    r2 = client.post("/v1/recipes/demo:recommend", json=body)
+    assert r1.status_code == r2.status_code == 200
+    assert r1.json()["items"] == r2.json()["items"]
+    assert rec.get_recommendation_for_known_user_id.call_count == 1
+    assert r2.headers["X-Recotem-Model-Version"] == "sha256:" + "1" * 64
+
+    rec2 = MagicMock()
+    rec2.get_recommendation_for_known_user_id.return_value = [("i7", 0.5)]
+    registry.replace_with_marker("demo", _entry(rec2, "2" * 64), (None, "2" * 64))
+    assert len(cache) == 0
+
+    r3 = client.post("/v1/recipes/demo:recommend", json=body)
+    assert [i["item_id"] for i in r3.json()["items"]] == ["i7"]
+    assert r3.json()["model_version"] == "sha256:" + "2" * 64
+
+
+def test_router_related_cache_keyed_on_seed_set() -> None:
+    rec = MagicMock()
+    rec._mapper.item_id_to_index = {"s1": 0, "s2": 1}
+    rec.get_recommendation_for_new_user.return_value = [("i1", 0.9)]
+    registry = ModelRegistry()
+    registry.replace("demo", _entry(rec, "3" * 64))
+    client = TestClient(
+        build_v1_app(registry, response_cache=ResponseCache(max_bytes=1 << 20))
+    )
+
+    for seeds in (["s1", "s2"], ["s2", "s1"]):
+        r = client.post(
+            "/v1/recipes/demo:recommend-related", json={"seed_items": seeds}
+        )
+        assert r.status_code == 200, r.text
+    assert rec.get_recommendation_for_new_user.call_count == 1
+
+
+def test_router_does_not_cache_errors() -> None:
+    rec = MagicMock()
+    rec._mapper.user_id_to_index = {}
+    rec.get_recommendation_for_known_user_id.side_effect = KeyError("ghost")
+    registry = ModelRegistry()
+    registry.replace("demo", _entry(rec, "4" * 64))
+    cache = ResponseCache(max_bytes=1 << 20)
+    client = TestClient(build_v1_app(registry, response_cache=cache))
+
+    for _ in range(2):
+        r = client.post("/v1/recipes/demo:recommend", json={"user_id": "ghost"})
+        assert r.status_code == 404
+    assert rec.get_recommendation_for_known_user_id.call_count == 2
+    assert len(cache) == 0
@@ -0,0 +1,243 @@
+"""Unit tests for recotem.serving.coalescer (:recommend micro-batching).
+
+Tests:
+- Concurrent requests inside one window share a single score block
+- A full batch closes the window early; overflow gets a promoted leader
+- A lone request is scored once the window expires
+- A failing batched call falls back to per-request scoring
+- Followers are woken even when recording metrics fails, and give up on a
+  wedged leader after ``follower_timeout``
+- Router integration: known users go through the coalescer, unknown users and
+  non-allow-listed recipes do not
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from recotem._idmap import IDMappedRecommender
+from recotem.serving.coalescer import RecommendCoalescer
+from recotem.serving.registry import ModelEntry, ModelRegistry
+from tests.conftest import build_v1_app, dense_idmapped_recommender
+
+
+def _entry(rec) -> ModelEntry:
+    return ModelEntry(
+        name="demo",
+        recommender=rec,
+        header={},
+        kid="t",
+        metadata_df=None,
+        metadata_index=None,
+        loaded=True,
+        _loaded_marker=(None, "c" * 64),
+        loaded_at_unix=1.0,
+    )
+
+
+def _scores(n_users: int = 8, n_items: int = 5) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.random((n_users, n_items))
+
+
+def _run_concurrently(fn, args_list):
+    with ThreadPoolExecutor(max_workers=len(args_list)) as pool:
+        return list(pool.map(lambda a: fn(*a), args_list))
+
+
+def test_concurrent_requests_share_one_score_block() -> None:
+    rec = dense_idmapped_recommender(_scores())
+    entry = _entry(rec)
+    coalescer = RecommendCoalescer(window_seconds=1.0, max_batch=4)
+
+    results = _run_concurrently(
+        lambda uid: coalescer.recommend("demo", entry, uid, 3),
+        [(f"u{i}",) for i in range(4)],
+    )
+
+    assert len(rec.recommender.known_calls) == 1
+    assert sorted(rec.recommender.known_calls[0]) == [0, 1, 2, 3]
+    for i, row in enumerate(results):
+        expected = rec.get_recommendation_for_known_user_batch([f"u{i}"], 3)[0]
+        assert row == expected
+
+
+def test_overflow_is_scored_by_promoted_leader() -> None:
+    rec = dense_idmapped_recommender(_scores())
+    entry = _entry(rec)
+    coalescer = RecommendCoalescer(window_seconds=0.2, max_batch=3)
+
+    results = _run_concurrently(
+        lambda uid: coalescer.recommend("demo", entry, uid, 2),
+        [(f"u{i}",) for i in range(7)],
+    )
+
+    calls = rec.recommender.known_calls
+    assert sum(len(c) for c in calls) == 7
+    assert all(len(c) <= 3 for c in calls)
+    assert all(len(r) == 2 for r in results)
+
+
+def test_lone_request_scored_after_window() -> None:
+    rec = dense_idmapped_recommender(_scores())
+    coalescer = RecommendCoalescer(window_seconds=0.005, max_batch=32)
+
+    started = time.monotonic()
+    out = coalescer.recommend("demo", _entry(rec), "u1", 2, ["i0"])
+    elapsed = time.monotonic() - started
+
+    assert elapsed >= 0.004
+    assert all(item_id != "i0" for item_id, _ in out)
+    assert rec.recommender.known_calls == [[1]]
+
+
+def test_batch_failure_falls_back_per_request() -> None:
+    rec = dense_idmapped_recommender(_scores())
+    entry = _entry(rec)
+    coalescer = RecommendCoalescer(window_seconds=1.0, max_batch=2)
+
+    with (
+        patch.object(
+            IDMappedRecommender,
+            "get_recommendation_for_known_user_batch",
+            side_effect=RuntimeError("boom"),
+        ),
+        patch.object(
+            IDMappedRecommender,
+            "get_recommendation_for_known_user_id",
+            return_value=[("i0", 0.9)],
+        ) as single,
+    ):
+        results = _run_concurrently(
+            lambda uid: coalescer.recommend("demo", entry, uid, 2),
+            [("u0",), ("u1",)],
+        )
+
+    assert results == [[("i0", 0.9)], [("i0", 0.9)]]
+    assert single.call_count == 2
+
+
+def test_metrics_failure_still_wakes_followers() -> None:
+    rec = dense_idmapped_recommender(_scores())
+    entry = _entry(rec)
+    coalescer = RecommendCoalescer(window_seconds=1.0, max_batch=2)
+
+    with patch(
+        "recotem.serving.coalescer._metrics.observe_coalesced_batch",
+        side_effect=RuntimeError("metrics down"),
+    ):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(coalescer.recommend, "demo", entry, uid, 2)
+                for uid in ("u0", "u1")
+            ]
+            outcomes = []
+            for fut in futures:
+                try:
+                    outcomes.append(fut.result(timeout=5))
+                except RuntimeError as exc:
+                    outcomes.append(exc)
+
+    # The leader surfaces the error; the follower is not left waiting.
+    assert sum(isinstance(o, RuntimeError) for o in outcomes) == 1
+
+
+def test_follower_scores_alone_when_the_leader_is_stuck() -> None:
+    rec = dense_idmapped_recommender(_scores())
+    entry = _entry(rec)
+    coalescer = RecommendCoalescer(
+        window_seconds=0.01, max_batch=2, follower_timeout=0.05
+    )
+    release = threading.Event()
+    real_batch = IDMappedRecommender.get_recommendation_for_known_user_batch
+    batch_calls = []
+
+    def stuck_batch(self, *args, **kwargs):
+        batch_calls.append(args)
+        if len(batch_calls) == 1:  # only the coalesced call wedges
+            assert release.wait(5)
+        return real_batch(self, *args, **kwargs)
+
+    with patch.object(
+        IDMappedRecommender, "get_recommendation_for_known_user_batch", stuck_batch
+    ):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(coalescer.recommend, "demo", entry, "u0", 2)
+            time.sleep(0.005)
+            follower = pool.submit(coalescer.recommend, "demo", entry, "u1", 2)
+            alone = follower.result(timeout=5)
+            assert not leader.done()
+            release.set()
+            leader.result(timeout=5)
+
+    assert alone == rec.get_recommendation_for_known_user_id("u1", 2)
+
+
+def test_enabled_for_respects_allow_list() -> None:
+    assert RecommendCoalescer(0.001, 8).enabled_for("anything")
+    limited = RecommendCoalescer(0.001, 8, frozenset({"a"}))
+    assert limited.enabled_for("a")
+    assert not limited.enabled_for("b")
+
+
+# ---------------------------------------------------------------------------
+# Router integration
+# ---------------------------------------------------------------------------
+
+
+def test_router_routes_known_users_through_coalescer() -> None:
+    rec = dense_idmapped_recommender(_scores())
+    registry = ModelRegistry()
+    registry.replace("demo", _entry(rec))
+    coalescer = RecommendCoalescer(window_seconds=0.001, max_batch=8)
+    client = TestClient(build_v1_app(registry, coalescer=coalescer))
+
+    with patch.object(coalescer, "recommend", wraps=coalescer.recommend) as spy:
+        ok = client.post("/v1/recipes/demo:recommend", json={"user_id": "u2"})
+        missing = client.post("/v1/recipes/demo:recommend", json={"user_id": "nope"})
+
+    assert ok.status_code == 200, ok.text
+    assert len(ok.json()["items"]) == 5
+    assert missing.status_code == 404
+    assert missing.json()["code"] == "UNKNOWN_USER"
+    assert spy.call_count == 1
+
+
+def test_router_skips_coalescer_for_other_recipes_and_mocks() -> None:
+    rec = MagicMock()
+    rec._mapper.user_id_to_index = {"u1": 0}
+    rec.get_recommendation_for_known_user_id.return_value = [("i1", 0.5)]
+    registry = ModelRegistry()
+    registry.replace("demo", _entry(rec))
+    coalescer = RecommendCoalescer(0.001, 8, frozenset({"other"}))
+    client = TestClient(build_v1_app(registry, coalescer=coalescer))
+
+    with patch.object(coalescer, "recommend") as spy:
+        r = client.post("/v1/recipes/demo:recommend", json={"user_id": "u1"})
+
+    assert r.status_code == 200
+    spy.assert_not_called()
+
+
+def test_concurrent_router_requests_are_batched() -> None:
+    rec = dense_idmapped_recommender(_scores())
+    registry = ModelRegistry()
+    registry.replace("demo", _entry(rec))
+    coalescer = RecommendCoalescer(window_seconds=1.0, max_batch=3)
+    client = TestClient(build_v1_app(registry, coalescer=coalescer))
+    barrier = threading.Barrier(3)
+
+    def call(uid: str) -> int:
+        barrier.wait()
+        r = client.post("/v1/recipes/demo:recommend", json={"user_id": uid})
+        return r.status_code
+
+    statuses = _run_concurrently(call, [("u0",), ("u1",), ("u2",)])
+    assert statuses == [200, 200, 200]
+    assert len(rec.recommender.known_calls) == 1
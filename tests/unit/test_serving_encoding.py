@@ -0,0 +1,139 @@
+"""Unit tests for recotem.serving.encoding.
+
+The pre-encoded bodies must be byte-identical to what the pydantic response
+models produce, so clients cannot tell the fast path from the model path.
+"""
+
+from __future__ import annotations
+
+import datetime
+
+import pytest
+
+from recotem.metadata.loader import build_metadata_index
+from recotem.serving import encoding
+from recotem.serving.schemas import (
+    BatchRecommendResponse,
+    BatchResultErr,
+    BatchResultOk,
+    ErrorDetail,
+    RecommendItem,
+    RecommendResponse,
+)
+
+_VERSION = "sha256:" + "a" * 64
+
+_ITEMS: list[tuple[str, float, dict]] = [
+    ("i1", 0.1, {"title": "Wïdget ✓", "n": None, "tags": ["a", "b"]}),
+    ('quo"te\\', 1e16, {}),
+    ("i3", 1e-7, {"when": datetime.datetime(2024, 1, 2, 3, 4, 5)}),
+    ("i4", 3.0, {"ratio": float("inf"), "count": 7}),
+    ("日本", -2.5e-300, {"nested": {"k": [1, 2.5]}}),
+]
+
+
+def _encoded_items(items: list[tuple[str, float, dict]]) -> list[bytes]:
+    scores = encoding.encode_scores([score for _, score, _ in items])
+    meta = {item_id: fields for item_id, _, fields in items}
+    item_parts = encoding.item_parts_lookup(meta)
+    encoded = []
+    for (item_id, _, _), score in zip(items, scores, strict=True):
+        head, tail = item_parts(item_id)
+        encoded.append(head + score + tail)
+    return encoded
+
+
+def _model_items(items: list[tuple[str, float, dict]]) -> list[RecommendItem]:
+    return [
+        RecommendItem.model_validate({**fields, "item_id": item_id, "score": score})
+        for item_id, score, fields in items
+    ]
+
+
+def test_recommend_body_matches_response_model() -> None:
+    expected = RecommendResponse(
+        request_id="req-1",
+        recipe="demo",
+        model_version=_VERSION,
+        items=_model_items(_ITEMS),
+    ).model_dump_json()
+
+    body = encoding.recommend_body("req-1", "demo", _VERSION, _encoded_items(_ITEMS))
+
+    assert body == expected.encode()
+
+
+def test_batch_body_matches_response_model() -> None:
+    err = BatchResultErr(
+        index=1,
+        status="error",
+        error=ErrorDetail(code="UNKNOWN_USER", message="user not seen"),
+    )
+    expected = BatchRecommendResponse(
+        request_id="req-2",
+        recipe="demo",
+        model_version=_VERSION,
+        results=[
+            BatchResultOk(index=0, status="ok", items=_model_items(_ITEMS[:2])),
+            err,
+            BatchResultOk(index=2, status="ok", items=[]),
+        ],
+    ).model_dump_json()
+
+    body = encoding.batch_body(
+        "req-2",
+        "demo",
+        _VERSION,
+        [
+            encoding.batch_ok_json(0, _encoded_items(_ITEMS[:2])),
+            encoding.json_bytes(err),
+            encoding.batch_ok_json(2, []),
+        ],
+    )
+
+    assert body == expected.encode()
+
+
+def test_metadata_index_parts_match_on_the_fly_encoding() -> None:
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {"title": ["A", "B"], "price": [1.25, float("nan")]},
+        index=pd.Index(["i1", "i2"], name="item_id"),
+    )
+    index = build_metadata_index(df)
+    from_parts = encoding.item_parts_lookup(index)
+    from_fields = encoding.item_parts_lookup(dict(index))
+    for item_id in ("i1", "i2", "missing"):
+        assert from_parts(item_id) == from_fields(item_id)
+    assert from_parts("missing") == encoding.bare_item_parts("missing")
+    assert encoding.item_parts_lookup(None)("i1") == (
+        b'{"item_id":"i1","score":',
+        b"}",
+    )
+
+
+@pytest.mark.parametrize(
+    ("item_id", "score", "ok"),
+    [
+        ("i", 0.0, True),
+        ("x" * 256, 1.0, True),
+        ("x" * 257, 1.0, False),
+        ("", 1.0, False),
+        (1, 1.0, False),
+        ("i", float("nan"), False),
+        ("i", float("-inf"), False),
+    ],
+)
+def test_valid_item_mirrors_recommend_item_constraints(
+    item_id: object, score: float, ok: bool
+) -> None:
+    from pydantic import ValidationError
+
+    assert encoding.valid_item(item_id, score) is ok
+    try:
+        RecommendItem.model_validate({"item_id": item_id, "score": score})
+    except ValidationError:
+        assert not ok
+    else:
+        assert ok
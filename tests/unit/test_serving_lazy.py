@@ -0,0 +1,249 @@
+"""Unit tests for recotem.serving.lazy (on-demand loading, LRU eviction)."""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from fastapi.testclient import TestClient
+
+from recotem.serving import lazy as _lazy
+from recotem.serving.lazy import LazyModelLoader, estimate_footprint, standby_entry
+from recotem.serving.registry import ModelEntry, ModelRegistry
+from tests.conftest import build_v1_app, dense_idmapped_recommender
+
+
+def _model(name: str, size: int = 100) -> ModelEntry:
+    return ModelEntry(
+        name=name,
+        recommender=object(),
+        header={},
+        kid="t",
+        payload_bytes=size,
+        _loaded_marker=(None, "a" * 64),
+    )
+
+
+def _registry(*names: str) -> ModelRegistry:
+    registry = ModelRegistry()
+    for name in names:
+        registry.replace(name, standby_entry(name, f"/artifacts/{name}.recotem"))
+    return registry
+
+
+def _load(registry: ModelRegistry, loader: LazyModelLoader, name: str) -> ModelEntry:
+    entry = loader.ensure(name).result(timeout=5)
+    assert entry is not None
+    loader.touch(name)
+    return entry
+
+
+def test_concurrent_first_requests_share_one_load():
+    registry = _registry("demo")
+    release = threading.Event()
+    calls: list[str] = []
+
+    def load(name: str) -> ModelEntry:
+        calls.append(name)
+        release.wait(5)
+        return _model(name)
+
+    loader = LazyModelLoader(registry, load, budget_bytes=1_000)
+    futures = [loader.ensure("demo") for _ in range(8)]
+    release.set()
+
+    entries = {id(f.result(timeout=5)) for f in futures}
+    assert calls == ["demo"]
+    assert len(entries) == 1
+    assert registry.get("demo").loaded
+    # Once resident, ensure() resolves to the entry without loading again.
+    assert loader.ensure("demo").result(timeout=5) is registry.get("demo")
+    assert calls == ["demo"]
+
+
+def test_least_recently_used_model_is_evicted_over_budget(monkeypatch):
+    evicted: list[str] = []
+    monkeypatch.setattr(_lazy._metrics, "inc_model_eviction", evicted.append)
+    registry = _registry("a", "b", "c")
+    loader = LazyModelLoader(registry, _model, budget_bytes=250)
+
+    _load(registry, loader, "a")
+    _load(registry, loader, "b")
+    loader.touch("a")  # b is now the least recently used
+    _load(registry, loader, "c")
+
+    assert evicted == ["b"]
+    assert registry.get("b").standby and not registry.get("b").loaded
+    assert registry.get("a").loaded and registry.get("c").loaded
+    assert loader.resident_bytes() == 200
+    assert registry.availability() == (2, 1, 3)
+
+    # An evicted recipe loads again on its next request.
+    _load(registry, loader, "b")
+    assert evicted == ["b", "a"]
+    assert registry.get("b").loaded
+
+
+def test_model_larger_than_budget_still_serves():
+    registry = _registry("big", "small")
+    loader = LazyModelLoader(registry, lambda n: _model(n, 500), budget_bytes=100)
+
+    _load(registry, loader, "small")
+    entry = _load(registry, loader, "big")
+
+    assert entry.loaded and registry.get("big") is entry
+    assert registry.get("small").standby
+
+
+def test_failed_load_registers_error_stub_once():
+    registry = _registry("broken")
+    calls: list[str] = []
+
+    def load(name: str) -> ModelEntry:
+        calls.append(name)
+        return ModelEntry(
+            name=name,
+            recommender=None,
+            header={},
+            kid="",
+            loaded=False,
+            last_load_error="HMAC verify failed",
+        )
+
+    loader = LazyModelLoader(registry, load, budget_bytes=1_000)
+    entry = loader.ensure("broken").result(timeout=5)
+
+    assert not entry.loaded and not entry.standby
+    assert registry.get("broken") is entry
+    # Not on standby any more: no load is retried until the artifact changes.
+    loader.ensure("broken").result(timeout=5)
+    assert calls == ["broken"]
+
+
+def test_load_never_clobbers_a_concurrent_swap():
+    registry = _registry("demo")
+    newer = _model("demo")
+
+    def load(name: str) -> ModelEntry:
+        registry.replace(name, newer)  # the watcher got there first
+        return _model(name)
+
+    loader = LazyModelLoader(registry, load, budget_bytes=1_000)
+    assert loader.ensure("demo").result(timeout=5) is newer
+    assert registry.get("demo") is newer
+
+
+def test_watcher_swaps_are_accounted():
+    registry = _registry("a", "b")
+    loader = LazyModelLoader(registry, _model, budget_bytes=150)
+    _load(registry, loader, "a")
+
+    registry.replace("b", _model("b"))  # e.g. a hot swap
+
+    assert registry.get("a").standby
+    assert loader.resident_bytes() == 100
+
+    registry.remove("b")
+    assert loader.resident_bytes() == 0
+
+
+def test_estimate_footprint_counts_shared_buffers_once():
+    dense = np.zeros((100, 10), dtype=np.float64)
+
+    class _Model:
+        def __init__(self) -> None:
+            self.factors = dense
+            self.view = dense[:50]
+            self.matrix = sp.csr_matrix(np.eye(10, dtype=np.float32))
+            self.ids = [f"u{i}" for i in range(5000)]
+
+    matrix = sp.csr_matrix(np.eye(10, dtype=np.float32))
+    sparse_bytes = matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+    entry = ModelEntry(name="m", recommender=_Model(), header={}, kid="")
+
+    assert estimate_footprint(entry) == dense.nbytes + sparse_bytes
+    # Opaque native state is invisible to the walk: the payload is a floor.
+    entry.payload_bytes = 10**9
+    assert estimate_footprint(entry) == 10**9
+
+
+@pytest.fixture
+def lazy_client():
+    registry = _registry("demo", "other")
+    rng = np.random.default_rng(0)
+
+    def load(name: str) -> ModelEntry:
+        return ModelEntry(
+            name=name,
+            recommender=dense_idmapped_recommender(rng.random((4, 8))),
+            header={"trained_at": "2026-01-01T00:00:00Z"},
+            kid="t",
+            _loaded_marker=(None, "b" * 64),
+            loaded_at_unix=1.0,
+        )
+
+    loader = LazyModelLoader(registry, load, budget_bytes=1 << 30)
+    return registry, TestClient(build_v1_app(registry, lazy_loader=loader))
+
+
+def test_standby_recipes_are_healthy_and_load_on_first_request(lazy_client):
+    registry, client = lazy_client
+    health = client.get("/v1/health")
+    assert health.status_code == 200
+    assert health.json() == {"status": "ok", "total": 2, "loaded": 0, "standby": 2}
+    names = [r["name"] for r in client.get("/v1/recipes").json()["recipes"]]
+    assert sorted(names) == ["demo", "other"]
+
+    r = client.post("/v1/recipes/demo:recommend", json={"user_id": "u1", "limit": 3})
+
+    assert r.status_code == 200
+    assert len(r.json()["items"]) == 3
+    assert registry.get("demo").loaded
+    assert client.get("/v1/health").json()["standby"] == 1
+
+
+def test_recipe_detail_loads_a_standby_recipe(lazy_client):
+    _, client = lazy_client
+    r = client.get("/v1/recipes/other")
+    assert r.status_code == 200
+    assert r.json()["trained_at"] == "2026-01-01T00:00:00Z"
+
+
+def test_recipe_detail_answers_from_a_described_header_without_loading():
+    registry = _registry("demo")
+    loads: list[str] = []
+
+    def load(name: str) -> ModelEntry:
+        loads.append(name)
+        raise AssertionError("detail must not load the model")
+
+    def describe(name: str) -> ModelEntry:
+        entry = standby_entry(name, "")
+        entry.header = {"trained_at": "2026-02-02T00:00:00Z"}
+        entry._loaded_marker = (None, "c" * 64)
+        return entry
+
+    loader = LazyModelLoader(registry, load, budget_bytes=1 << 30, describe=describe)
+    client = TestClient(build_v1_app(registry, lazy_loader=loader))
+
+    r = client.get("/v1/recipes/demo")
+
+    assert r.status_code == 200
+    assert r.json()["trained_at"] == "2026-02-02T00:00:00Z"
+    assert r.json()["model_version"] == "sha256:" + "c" * 64
+    assert loads == []
+    assert registry.get("demo").standby
+
+
+def test_failed_describe_falls_back_to_loading(lazy_client):
+    registry, _ = lazy_client
+
+    def describe(name: str) -> ModelEntry:
+        raise OSError("object store unreachable")
+
+    loader = LazyModelLoader(
+        registry, lambda name: None, budget_bytes=1 << 30, describe=describe
+    )
+    assert loader.describe("demo") is None
@@ -0,0 +1,123 @@
+"""Unit tests for recotem.serving.load_queue."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+import pytest
+
+from recotem.serving.load_queue import LoadQueue
+
+
+class _Loads:
+    """Loads that record their start and block until released."""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.release = threading.Event()
+
+    def __call__(self, name: str) -> Callable[[], None]:
+        def load() -> None:
+            self.started.append(name)
+            assert self.release.wait(5)
+
+        return load
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def stop_event():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def test_loads_run_in_parallel_up_to_the_count_limit(stop_event) -> None:
+    queue = LoadQueue(max_loads=2, budget_bytes=1 << 30, stop_event=stop_event)
+    loads = _Loads()
+
+    futures = [queue.submit(f"r{i}", 10, loads(f"r{i}")) for i in range(3)]
+    _wait_for(lambda: len(loads.started) == 2)
+    assert queue.queued() == 1
+    assert queue.inflight_bytes() == 20
+
+    loads.release.set()
+    for fut in futures:
+        fut.result(timeout=5)
+    assert sorted(loads.started) == ["r0", "r1", "r2"]
+    assert queue.queued() == 0
+    assert queue.inflight_bytes() == 0
+    queue.shutdown(wait=True)
+
+
+def test_byte_budget_holds_back_loads_that_do_not_fit(stop_event) -> None:
+    queue = LoadQueue(max_loads=4, budget_bytes=100, stop_event=stop_event)
+    loads = _Loads()
+
+    first = queue.submit("big", 70, loads("big"))
+    _wait_for(lambda: loads.started == ["big"])
+    second = queue.submit("also-big", 70, loads("also-big"))
+    small = queue.submit("small", 30, loads("small"))
+    _wait_for(lambda: "small" in loads.started)
+    time.sleep(0.05)
+    assert "also-big" not in loads.started
+    assert queue.inflight_bytes() == 100
+
+    loads.release.set()
+    for fut in (first, second, small):
+        fut.result(timeout=5)
+    assert loads.started[-1] == "also-big"
+    queue.shutdown(wait=True)
+
+
+def test_load_larger_than_the_budget_runs_alone(stop_event) -> None:
+    queue = LoadQueue(max_loads=2, budget_bytes=10, stop_event=stop_event)
+    loads = _Loads()
+    loads.release.set()
+
+    queue.submit("huge", 1000, loads("huge")).result(timeout=5)
+
+    assert loads.started == ["huge"]
+    queue.shutdown(wait=True)
+
+
+def test_stop_abandons_loads_waiting_for_budget(stop_event) -> None:
+    queue = LoadQueue(max_loads=2, budget_bytes=10, stop_event=stop_event)
+    loads = _Loads()
+
+    running = queue.submit("a", 10, loads("a"))
+    _wait_for(lambda: loads.started == ["a"])
+    waiting = queue.submit("b", 10, loads("b"))
+    time.sleep(0.05)
+
+    stop_event.set()
+    waiting.result(timeout=5)
+    loads.release.set()
+    running.result(timeout=5)
+    assert loads.started == ["a"]
+    assert queue.queued() == 0
+    queue.shutdown(wait=True)
+
+
+def test_shutdown_drops_loads_that_never_started(stop_event) -> None:
+    queue = LoadQueue(max_loads=1, budget_bytes=1 << 30, stop_event=stop_event)
+    loads = _Loads()
+
+    running = queue.submit("a", 1, loads("a"))
+    _wait_for(lambda: loads.started == ["a"])
+    dropped = queue.submit("b", 1, loads("b"))
+    queue.shutdown(wait=False)
+    loads.release.set()
+    running.result(timeout=5)
+
+    assert dropped.cancelled()
+    assert loads.started == ["a"]
+    assert queue.queued() == 0
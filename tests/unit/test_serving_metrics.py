@@ -261,3 +261,237 @@ def test_inc_metadata_degraded_items_coerces_unknown_kind(reset_metrics_registry
     assert "arbitrary_future_kind" not in text, (
         "raw unknown kind must not appear in Prometheus output"
     )
+
+
+# ---------------------------------------------------------------------------
+# Request-time metric families with their own lazy initializers
+# ---------------------------------------------------------------------------
+
+
+def _reset_metric_family(names: set[str], attrs: tuple[str, ...]) -> None:
+    """Unregister collectors named in *names* and null the module globals."""
+    from prometheus_client import REGISTRY
+
+    for collector in list(REGISTRY._names_to_collectors.values()):
+        describe = getattr(collector, "describe", None)
+        if describe is None:
+            continue
+        try:
+            described = describe()
+        except Exception:
+            continue
+        if any(getattr(m, "name", None) in names for m in described):
+            try:
+                REGISTRY.unregister(collector)
+            except (KeyError, ValueError):
+                pass
+    for attr in attrs:
+        setattr(_m, attr, None)
+
+
+@pytest.fixture()
+def reset_cache_metrics(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("RECOTEM_METRICS_ENABLED", "1")
+    names = {
+        "recotem_response_cache_requests",
+        "recotem_response_cache_evictions",
+        "recotem_response_cache_bytes",
+    }
+    attrs = (
+        "_RESPONSE_CACHE_REQUESTS",
+        "_RESPONSE_CACHE_EVICTIONS",
+        "_RESPONSE_CACHE_BYTES",
+    )
+    _reset_metric_family(names, attrs)
+    yield
+    _reset_metric_family(names, attrs)
+
+
+@pytest.mark.skipif(
+    not _prometheus_available(),
+    reason="prometheus_client not installed in this environment",
+)
+def test_response_cache_metrics_exposed(reset_cache_metrics):
+    from recotem.serving.cache import ResponseCache, response_cache_key
+
+    cache = ResponseCache(max_bytes=1 << 20)
+    key = response_cache_key("sha256:x", "recommend", "u1", 10, None, True)
+    cache.get("r1", "recommend", key)
+    cache.put("r1", key, [b'{"item_id":"i1","score":1.0}'])
+    cache.get("r1", "recommend", key)
+    cache.invalidate("r1")
+    _m.inc_response_cache_evictions("r1", "bogus")
+
+    text = _m.generate_latest()[0].decode()
+    assert (
+        'recotem_response_cache_requests_total{recipe="r1",result="hit",'
+        'verb="recommend"} 1.0' in text
+    )
+    assert 'result="miss"' in text
+    assert 'reason="invalidated"' in text
+    assert 'reason="capacity"' in text  # "bogus" coerced
+    assert 'recotem_response_cache_bytes{recipe="r1"} 0.0' in text
+
+
+@pytest.fixture()
+def reset_coalescer_metrics(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("RECOTEM_METRICS_ENABLED", "1")
+    names = {"recotem_coalescer_batch_size", "recotem_coalescer_queue_delay_seconds"}
+    attrs = ("_COALESCER_BATCH_SIZE", "_COALESCER_QUEUE_DELAY")
+    _reset_metric_family(names, attrs)
+    yield
+    _reset_metric_family(names, attrs)
+
+
+@pytest.mark.skipif(
+    not _prometheus_available(),
+    reason="prometheus_client not installed in this environment",
+)
+def test_coalescer_metrics_exposed(reset_coalescer_metrics):
+    _m.observe_coalesced_batch("r1", 3, [0.0005, 0.001, 0.002])
+
+    text = _m.generate_latest()[0].decode()
+    assert 'recotem_coalescer_batch_size_count{recipe="r1"} 1.0' in text
+    assert 'recotem_coalescer_batch_size_sum{recipe="r1"} 3.0' in text
+    assert 'recotem_coalescer_queue_delay_seconds_count{recipe="r1"} 3.0' in text
+
+
+@pytest.fixture()
+def reset_api_key_cache_metrics(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("RECOTEM_METRICS_ENABLED", "1")
+    names = {"recotem_api_key_cache_requests"}
+    attrs = ("_API_KEY_CACHE_REQUESTS",)
+    _reset_metric_family(names, attrs)
+    yield
+    _reset_metric_family(names, attrs)
+
+
+@pytest.mark.skipif(
+    not _prometheus_available(),
+    reason="prometheus_client not installed in this environment",
+)
+def test_api_key_cache_metrics_exposed(reset_api_key_cache_metrics):
+    _m.record_api_key_cache_lookup(hit=False)
+    _m.record_api_key_cache_lookup(hit=True)
+    _m.record_api_key_cache_lookup(hit=True)
+
+    text = _m.generate_latest()[0].decode()
+    assert 'recotem_api_key_cache_requests_total{result="hit"} 2.0' in text
+    assert 'recotem_api_key_cache_requests_total{result="miss"} 1.0' in text
+
+
+@pytest.fixture()
+def reset_recipe_pool_metrics(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("RECOTEM_METRICS_ENABLED", "1")
+    names = {"recotem_recipe_pool_queue_depth", "recotem_recipe_pool_active_workers"}
+    attrs = ("_RECIPE_POOL_QUEUE_DEPTH", "_RECIPE_POOL_ACTIVE_WORKERS")
+    _reset_metric_family(names, attrs)
+    yield
+    _reset_metric_family(names, attrs)
+
+
+@pytest.mark.skipif(
+    not _prometheus_available(),
+    reason="prometheus_client not installed in this environment",
+)
+def test_recipe_pool_metrics_exposed(reset_recipe_pool_metrics):
+    _m.set_recipe_pool_state("r1", 3, 2)
+
+    text = _m.generate_latest()[0].decode()
+    assert 'recotem_recipe_pool_queue_depth{recipe="r1"} 3.0' in text
+    assert 'recotem_recipe_pool_active_workers{recipe="r1"} 2.0' in text
+
+
+@pytest.fixture()
+def reset_admission_metrics(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("RECOTEM_METRICS_ENABLED", "1")
+    names = {"recotem_admission_inflight", "recotem_admission_rejected"}
+    attrs = ("_ADMISSION_INFLIGHT", "_ADMISSION_REJECTED")
+    _reset_metric_family(names, attrs)
+    yield
+    _reset_metric_family(names, attrs)
+
+
+@pytest.mark.skipif(
+    not _prometheus_available(),
+    reason="prometheus_client not installed in this environment",
+)
+def test_admission_metrics_exposed(reset_admission_metrics):
+    from recotem.serving.admission import AdmissionController, AdmissionRejected
+
+    admission = AdmissionController(recipe_max_inflight=2)
+    admission.acquire("r1", 2)
+    text = _m.generate_latest()[0].decode()
+    assert 'recotem_admission_inflight{recipe="r1"} 2.0' in text
+    with pytest.raises(AdmissionRejected):
+        admission.acquire("r1")
+    admission.release("r1", 2)
+    _m.inc_admission_rejected("r1", "bogus")
+
+    text = _m.generate_latest()[0].decode()
+    assert 'recotem_admission_inflight{recipe="r1"} 0.0' in text
+    assert 'recotem_admission_rejected_total{recipe="r1",scope="recipe"} 2.0' in text
+
+
+@pytest.fixture()
+def reset_stage_metrics(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("RECOTEM_METRICS_ENABLED", "1")
+    names = {"recotem_v1_stage_duration_seconds"}
+    attrs = ("_V1_STAGE_DURATION",)
+    _reset_metric_family(names, attrs)
+    yield
+    _reset_metric_family(names, attrs)
+
+
+@pytest.mark.skipif(
+    not _prometheus_available(),
+    reason="prometheus_client not installed in this environment",
+)
+def test_stage_histogram_exposed(reset_stage_metrics):
+    from recotem.serving.timing import StageTimings
+
+    timings = StageTimings(record_metrics=True, server_timing=False)
+    timings.add("score", 0.002)
+    timings.add("encode", 0.0001)
+    timings.observe("r1", "recommend")
+
+    text = _m.generate_latest()[0].decode()
+    assert (
+        'recotem_v1_stage_duration_seconds_count{recipe="r1",stage="score",'
+        'verb="recommend"} 1.0'
+    ) in text
+    assert 'stage="encode"' in text
+
+
+@pytest.fixture()
+def reset_load_queue_metrics(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("RECOTEM_METRICS_ENABLED", "1")
+    names = {
+        "recotem_watcher_load_queue_depth",
+        "recotem_watcher_load_inflight_bytes",
+        "recotem_watcher_load_duration_seconds",
+    }
+    attrs = ("_LOAD_QUEUE_DEPTH", "_LOAD_INFLIGHT_BYTES", "_LOAD_DURATION")
+    _reset_metric_family(names, attrs)
+    yield
+    _reset_metric_family(names, attrs)
+
+
+@pytest.mark.skipif(
+    not _prometheus_available(),
+    reason="prometheus_client not installed in this environment",
+)
+def test_watcher_load_queue_metrics_exposed(reset_load_queue_metrics):
+    import threading
+
+    from recotem.serving.load_queue import LoadQueue
+
+    stop = threading.Event()
+    queue = LoadQueue(max_loads=2, budget_bytes=1 << 20, stop_event=stop)
+    queue.submit("r1", 512, lambda: None).result(timeout=5)
+    queue.shutdown(wait=True)
+
+    text = _m.generate_latest()[0].decode()
+    assert "recotem_watcher_load_queue_depth 0.0" in text
+    assert "recotem_watcher_load_inflight_bytes 0.0" in text
+    assert 'recotem_watcher_load_duration_seconds_count{recipe="r1"} 1.0' in text
@@ -932,3 +932,146 @@ def test_last_load_error_truncated_to_200_chars() -> None:
     long_reason = "x" * 500
     sanitized = _sanitize_error(long_reason)
     assert len(sanitized) <= 200
+
+
+# ---------------------------------------------------------------------------
+# Swap listeners
+# ---------------------------------------------------------------------------
+
+
+def test_swap_listener_called_on_replace_marker_and_remove() -> None:
+    reg = ModelRegistry()
+    seen: list[str] = []
+    reg.add_swap_listener(seen.append)
+
+    reg.replace("r1", _make_entry("r1"))
+    reg.replace_with_marker("r1", _make_entry("r1"), (None, "a" * 64))
+    reg.remove("r1")
+    reg.remove("r1")  # no entry → no notification
+
+    assert seen == ["r1", "r1", "r1"]
+
+
+def test_swap_listener_runs_outside_lock() -> None:
+    """A listener may call back into the registry without deadlocking."""
+    reg = ModelRegistry()
+    observed: list[object] = []
+    reg.add_swap_listener(lambda name: observed.append(reg.get(name)))
+    entry = _make_entry("r1")
+    reg.replace("r1", entry)
+    assert observed == [entry]
+
+
+# ---------------------------------------------------------------------------
+# Copy-on-write snapshots: lock-free reads
+# ---------------------------------------------------------------------------
+
+
+class _ForbiddenLock:
+    """Stand-in lock that fails the test if anything acquires it."""
+
+    def __enter__(self):
+        raise AssertionError("reader acquired the registry lock")
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_readers_take_no_lock() -> None:
+    reg = ModelRegistry()
+    reg.replace("r1", _make_entry("r1"))
+    reg._lock = _ForbiddenLock()  # type: ignore[assignment]
+
+    assert reg.get("r1") is not None
+    assert reg.get("missing") is None
+    assert [e.name for e in reg.list()] == ["r1"]
+    assert reg.names() == ["r1"]
+    assert reg.loaded_count() == 1
+    assert reg.health_counts() == (1, 1)
+    assert reg.health_snapshot()["r1"]["loaded"] is True
+
+
+def test_published_snapshot_is_never_mutated() -> None:
+    reg = ModelRegistry()
+    first = _make_entry("r1")
+    reg.replace("r1", first)
+    held = reg._snapshot
+
+    reg.replace("r1", _make_entry("r1"))
+    reg.replace("r2", _make_entry("r2"))
+    reg.remove("r1")
+
+    assert held.entries == {"r1": first}
+    assert held.loaded == 1
+    assert reg.names() == ["r2"]
+
+
+def test_health_counts_consistent_under_concurrent_swaps() -> None:
+    """loaded never exceeds total, whatever the writers are doing."""
+    reg = ModelRegistry()
+    stop = threading.Event()
+    violations: list[tuple[int, int]] = []
+
+    def writer(name: str) -> None:
+        loaded = True
+        while not stop.is_set():
+            entry = _make_entry(name)
+            entry.loaded = loaded
+            reg.replace(name, entry)
+            if not loaded:
+                reg.remove(name)
+            loaded = not loaded
+
+    def reader() -> None:
+        while not stop.is_set():
+            loaded, total = reg.health_counts()
+            if not 0 <= loaded <= total <= 4:
+                violations.append((loaded, total))
+
+    threads = [threading.Thread(target=writer, args=(f"r{i}",)) for i in range(4)]
+    threads += [threading.Thread(target=reader) for _ in range(2)]
+    for t in threads:
+        t.start()
+    time.sleep(0.2)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    assert violations == []
+    assert reg.loaded_count() == sum(e.loaded for e in reg.list())
+
+
+def test_replace_if_only_swaps_the_expected_entry() -> None:
+    reg = ModelRegistry()
+    first = _make_entry("r")
+    reg.replace("r", first)
+    notified: list[str] = []
+    reg.add_swap_listener(notified.append)
+
+    newer = _make_entry("r")
+    assert not reg.replace_if("r", _make_entry("r"), newer)
+    assert reg.get("r") is first and notified == []
+
+    assert reg.replace_if("r", first, newer)
+    assert reg.get("r") is newer and notified == ["r"]
+    # ``expected=None`` inserts only when the name is absent.
+    assert not reg.replace_if("r", None, first)
+    assert reg.replace_if("s", None, _make_entry("s"))
+
+
+def test_availability_counts_standby_entries() -> None:
+    from recotem.serving.lazy import standby_entry
+
+    reg = ModelRegistry()
+    reg.replace("a", _make_entry("a"))
+    reg.replace("b", standby_entry("b", "/b.recotem"))
+    reg.replace(
+        "c", ModelEntry(name="c", recommender=None, header={}, kid="", loaded=False)
+    )
+
+    assert reg.availability() == (1, 1, 3)
+    assert reg.health_snapshot()["b"] == {"loaded": False, "standby": True}
+    reg.replace("b", _make_entry("b"))
+    assert reg.availability() == (2, 0, 3)
+    reg.remove("b")
+    assert reg.availability() == (1, 0, 2)
@@ -0,0 +1,370 @@
+"""Tests for multi-worker model sharing (recotem.serving.shared / supervisor)."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from recotem.artifact.format import FORMAT_VERSION_CHUNKED
+from recotem.artifact.io import write_artifact
+from recotem.artifact.signing import KeyRing
+from recotem.config import ServeConfig
+from recotem.serving.registry import ModelEntry, ModelRegistry
+from recotem.serving.shared import ModelPublisher, SharedModelStore, StoreFollower
+from recotem.serving.watcher import read_artifact_bytes, sha256_bytes
+from tests.conftest import ACTIVE_KEY_HEX
+
+_HEADER = {
+    "recipe_name": "news",
+    "trained_at": "2026-01-01T00:00:00Z",
+    "best_class": "TopPopRecommender",
+    "best_score": 0.5,
+}
+
+_RECIPE = """\
+name: news
+source:
+  type: csv
+  path: {csv}
+schema:
+  user_column: user_id
+  item_column: item_id
+training:
+  algorithms: [TopPop]
+output:
+  path: {out}
+"""
+
+
+def _key_ring() -> KeyRing:
+    return KeyRing(f"active:{ACTIVE_KEY_HEX}")
+
+
+def _payload(seed: int):
+    import numpy as np
+
+    return {"factors": np.random.default_rng(seed).random((64, 48))}
+
+
+def _write(path: Path, seed: int) -> str:
+    write_artifact(
+        _payload(seed),
+        _HEADER,
+        _key_ring(),
+        str(path),
+        versioning="always_overwrite",
+    )
+    return sha256_bytes(path.read_bytes())
+
+
+def _entry(path: Path, sha256: str) -> ModelEntry:
+    return ModelEntry(
+        name="news",
+        recommender=object(),
+        header={},
+        kid="active",
+        artifact_path=str(path),
+        _loaded_marker=(None, sha256),
+    )
+
+
+def _publisher(store, registry, **kwargs) -> ModelPublisher:
+    return ModelPublisher(
+        store,
+        registry,
+        lambda name: None,
+        read_artifact_bytes,
+        kwargs.pop("key_ring", None),
+        1 << 30,
+        1 << 30,
+        **kwargs,
+    )
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+@pytest.fixture()
+def serve_config(tmp_path: Path) -> ServeConfig:
+    recipes_dir = tmp_path / "recipes"
+    recipes_dir.mkdir()
+    (tmp_path / "data.csv").write_text("user_id,item_id\nu1,i1\n")
+    (recipes_dir / "news.yaml").write_text(
+        _RECIPE.format(csv=tmp_path / "data.csv", out=tmp_path / "news.recotem")
+    )
+    cfg = ServeConfig()
+    cfg.signing_keys_raw = f"active:{ACTIVE_KEY_HEX}"
+    cfg.recipes_dir = str(recipes_dir)
+    cfg.env = "test"
+    cfg.workers = 2
+    return cfg
+
+
+def test_supervisor_publishes_models_workers_map_zero_copy(
+    tmp_path: Path, serve_config: ServeConfig
+) -> None:
+    from recotem.serving.supervisor import ModelSupervisor
+
+    sha = _write(tmp_path / "news.recotem", seed=0)
+    store = SharedModelStore.create(str(tmp_path / "store"))
+    supervisor = ModelSupervisor(serve_config, store)
+    supervisor.start()
+    try:
+        assert stat.S_IMODE(os.stat(store.root / "models").st_mode) == 0o700
+        staged = store.model_path(sha)
+        assert stat.S_IMODE(staged.stat().st_mode) == 0o400
+
+        workers = [ModelRegistry(), ModelRegistry()]
+        for registry in workers:
+            StoreFollower(store, registry, serve_config).sync()
+        entries = [registry.get("news") for registry in workers]
+        assert all(e is not None and e.loaded for e in entries)
+        assert {e.model_version for e in entries} == {f"sha256:{sha}"}
+        for e in entries:
+            # Format-2 sections are views into the shared mapping.
+            assert not e.recommender["factors"].flags.writeable
+    finally:
+        supervisor.stop()
+
+
+def test_workers_switch_model_version_together(tmp_path: Path) -> None:
+    path = tmp_path / "news.recotem"
+    sha_a = _write(path, seed=0)
+    store = SharedModelStore.create(str(tmp_path / "store"))
+    registry = ModelRegistry()
+    registry.replace("news", _entry(path, sha_a))
+    publisher = _publisher(store, registry, ack_timeout=10.0)
+    publisher.publish_initial()
+
+    cfg = ServeConfig()
+    first, second = ModelRegistry(), ModelRegistry()
+    f1 = StoreFollower(store, first, cfg)
+    f2 = StoreFollower(store, second, cfg)
+    # Both followers run in this process; give the second a distinct live pid.
+    f2._pid = os.getppid()
+    f1.sync()
+    f2.sync()
+
+    sha_b = _write(path, seed=1)
+    registry.replace_with_marker("news", _entry(path, sha_b), (None, sha_b))
+    swap = threading.Thread(target=publisher.on_swap, args=("news",))
+    swap.start()
+    _wait_until(lambda: (store.read_manifest() or {}).get("staged") is not None)
+
+    f1.sync()  # stages generation 2 and acknowledges
+    time.sleep(0.2)
+    manifest = store.read_manifest()
+    assert manifest["active"]["generation"] == 1  # still waiting for f2
+    assert first.get("news").artifact_sha256 == sha_a
+
+    f2.sync()
+    swap.join(timeout=5)
+    assert not swap.is_alive()
+    assert store.read_manifest()["active"]["generation"] == 2
+
+    f1.sync()
+    f2.sync()
+    assert first.get("news").artifact_sha256 == sha_b
+    assert second.get("news").artifact_sha256 == sha_b
+    # The superseded model file is collected once no generation needs it.
+    assert not store.model_path(sha_a).exists()
+
+
+def test_publisher_does_not_wait_forever_for_a_stuck_worker(tmp_path: Path) -> None:
+    path = tmp_path / "news.recotem"
+    sha_a = _write(path, seed=0)
+    store = SharedModelStore.create(str(tmp_path / "store"))
+    registry = ModelRegistry()
+    registry.replace("news", _entry(path, sha_a))
+    publisher = _publisher(store, registry, ack_timeout=0.1)
+    publisher.publish_initial()
+    store.write_ack(os.getppid(), staged=0, active=0)  # alive, never acks
+
+    sha_b = _write(path, seed=1)
+    registry.replace("news", _entry(path, sha_b))
+    publisher.on_swap("news")
+
+    assert store.read_manifest()["active"]["generation"] == 2
+
+
+def test_concurrent_swaps_wait_for_acks_together(tmp_path: Path) -> None:
+    store = SharedModelStore.create(str(tmp_path / "store"))
+    registry = ModelRegistry()
+    publisher = _publisher(store, registry, ack_timeout=1.0)
+    publisher.publish_initial()
+    store.write_ack(os.getppid(), staged=0, active=0)  # alive, never acks
+
+    for name, seed in (("news", 0), ("sports", 1)):
+        path = tmp_path / f"{name}.recotem"
+        entry = _entry(path, _write(path, seed))
+        entry.name = name
+        registry.replace(name, entry)
+    swaps = [
+        threading.Thread(target=publisher.on_swap, args=(name,))
+        for name in ("news", "sports")
+    ]
+    started = time.monotonic()
+    for swap in swaps:
+        swap.start()
+    for swap in swaps:
+        swap.join(timeout=5)
+
+    # The second swap did not queue behind the first one's ack timeout.
+    assert time.monotonic() - started < 1.8
+    active = store.read_manifest()["active"]
+    assert active["generation"] == 3
+    assert sorted(active["recipes"]) == ["news", "sports"]
+
+
+def test_publisher_skips_artifact_replaced_after_verification(tmp_path: Path) -> None:
+    path = tmp_path / "news.recotem"
+    sha_a = _write(path, seed=0)
+    store = SharedModelStore.create(str(tmp_path / "store"))
+    registry = ModelRegistry()
+    registry.replace("news", _entry(path, sha_a))
+    publisher = _publisher(store, registry)
+    publisher.publish_initial()
+
+    _write(path, seed=1)
+    registry.replace("news", _entry(path, "0" * 64))  # verified bytes are gone
+    publisher.on_swap("news")
+
+    assert publisher.generation == 1
+    assert not store.model_path("0" * 64).exists()
+
+
+def test_publisher_keys_format3_models_by_full_content(tmp_path: Path) -> None:
+    path = tmp_path / "news.recotem"
+    write_artifact(
+        _payload(0),
+        _HEADER,
+        _key_ring(),
+        str(path),
+        versioning="always_overwrite",
+        format_version=FORMAT_VERSION_CHUNKED,
+    )
+    sha = sha256_bytes(path.read_bytes())
+    store = SharedModelStore.create(str(tmp_path / "store"))
+    registry = ModelRegistry()
+    registry.replace("news", _entry(path, sha))
+    _publisher(store, registry, key_ring=_key_ring()).publish_initial()
+
+    content = hashlib.sha256(path.read_bytes()).hexdigest()
+    assert content != sha  # a format-3 identity covers only the header
+    assert store.model_path(content).exists()
+    row = store.read_manifest()["active"]["recipes"]["news"]
+    assert (row["sha256"], row["content_sha256"]) == (sha, content)
+
+
+def test_publisher_rejects_payload_tampered_after_verification(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "news.recotem"
+    write_artifact(
+        _payload(0),
+        _HEADER,
+        _key_ring(),
+        str(path),
+        versioning="always_overwrite",
+        format_version=FORMAT_VERSION_CHUNKED,
+    )
+    sha = sha256_bytes(path.read_bytes())
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF  # the header, and so the identity, is unchanged
+    path.write_bytes(bytes(data))
+    assert sha256_bytes(path.read_bytes()) == sha
+    store = SharedModelStore.create(str(tmp_path / "store"))
+    registry = ModelRegistry()
+    registry.replace("news", _entry(path, sha))
+    _publisher(store, registry, key_ring=_key_ring()).publish_initial()
+
+    assert not any((store.root / "models").iterdir())
+    assert not store.read_manifest()["active"]["recipes"]["news"]["loaded"]
+
+
+def test_follower_mirrors_stubs_and_removals(tmp_path: Path) -> None:
+    path = tmp_path / "news.recotem"
+    sha = _write(path, seed=0)
+    store = SharedModelStore.create(str(tmp_path / "store"))
+    registry = ModelRegistry()
+    registry.replace("news", _entry(path, sha))
+    registry.replace(
+        "broken",
+        ModelEntry(
+            name="broken",
+            recommender=None,
+            header={},
+            kid="",
+            last_load_error="HMAC verify failed",
+            loaded=False,
+        ),
+    )
+    publisher = _publisher(store, registry)
+    publisher.publish_initial()
+
+    worker = ModelRegistry()
+    follower = StoreFollower(store, worker, ServeConfig())
+    follower.sync()
+    assert worker.get("broken").last_load_error == "HMAC verify failed"
+    assert not worker.get("broken").loaded
+
+    follower.start()
+    try:
+        registry.remove("news")
+        publisher.on_swap("news")  # returns once the follower has staged it
+        _wait_until(lambda: worker.get("news") is None)
+    finally:
+        follower.stop()
+        follower.join(timeout=5)
+    assert not (store.root / "workers" / f"{os.getpid()}.json").exists()
+    assert worker.get("broken") is not None
+
+
+def test_live_acks_prune_dead_workers(tmp_path: Path) -> None:
+    store = SharedModelStore.create(str(tmp_path / "store"))
+    store.write_ack(os.getpid(), staged=1, active=1)
+    store.write_ack(2**22 + 12345, staged=1, active=1)  # beyond pid_max
+
+    assert set(store.live_acks()) == {os.getpid()}
+    assert not (store.root / "workers" / f"{2**22 + 12345}.json").exists()
+
+
+def test_create_in_temp_dir_is_cleaned_up() -> None:
+    store = SharedModelStore.create()
+    assert stat.S_IMODE(os.stat(store.root).st_mode) == 0o700
+    store.cleanup()
+    assert not store.root.exists()
+
+
+def test_worker_app_serves_published_models(
+    tmp_path: Path, serve_config: ServeConfig, monkeypatch
+) -> None:
+    from fastapi.testclient import TestClient
+
+    from recotem.serving.shared import SHARED_MODEL_DIR_ENV
+    from recotem.serving.supervisor import ModelSupervisor, create_worker_app
+
+    sha = _write(tmp_path / "news.recotem", seed=0)
+    store = SharedModelStore.create(str(tmp_path / "store"))
+    serve_config.insecure_no_auth = True
+    supervisor = ModelSupervisor(serve_config, store)
+    supervisor.start()
+    try:
+        monkeypatch.setenv(SHARED_MODEL_DIR_ENV, str(store.root))
+        monkeypatch.setenv("RECOTEM_ENV", "test")
+        monkeypatch.setenv("RECOTEM_ALLOWED_HOSTS", "testserver")
+        with TestClient(create_worker_app()) as client:
+            body = client.get("/v1/recipes/news").json()
+        assert body["model_version"] == f"sha256:{sha}"
+    finally:
+        supervisor.stop()
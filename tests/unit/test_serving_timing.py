@@ -0,0 +1,112 @@
+"""Unit tests for recotem.serving.timing (per-stage latency breakdown).
+
+Tests:
+- StageTimings accumulates repeated stages and formats Server-Timing in ms
+- NULL_TIMINGS is a no-op
+- Router integration: Server-Timing carries every handler stage when
+  enabled and is absent by default
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from fastapi import Response
+from fastapi.testclient import TestClient
+
+from recotem.serving.registry import ModelEntry, ModelRegistry
+from recotem.serving.timing import NULL_TIMINGS, StageTimings
+from tests.conftest import build_v1_app
+
+
+def _entry(rec) -> ModelEntry:
+    return ModelEntry(
+        name="demo",
+        recommender=rec,
+        header={},
+        kid="t",
+        metadata_df=None,
+        metadata_index=None,
+        loaded=True,
+        _loaded_marker=(None, "c" * 64),
+        loaded_at_unix=1.0,
+    )
+
+
+def _client(server_timing: bool) -> TestClient:
+    rec = MagicMock()
+    rec._mapper.user_id_to_index = {"u1": 0}
+    rec.get_recommendation_for_known_user_id.return_value = [("i1", 0.5)]
+    registry = ModelRegistry()
+    registry.replace("demo", _entry(rec))
+    return TestClient(build_v1_app(registry, server_timing=server_timing))
+
+
+def _stages(header: str) -> dict[str, float]:
+    out = {}
+    for part in header.split(", "):
+        name, dur = part.split(";dur=")
+        out[name] = float(dur)
+    return out
+
+
+def test_stage_timings_accumulate_and_format() -> None:
+    timings = StageTimings(record_metrics=False, server_timing=True)
+    timings.add("score", 0.001)
+    timings.add("score", 0.0005)
+    with timings.stage("encode"):
+        pass
+
+    assert timings.durations["score"] == 0.0015
+    assert "encode" in timings.durations
+    assert timings.header_value().startswith("score;dur=1.500, encode;dur=")
+
+    response = timings.apply(Response())
+    assert response.headers["server-timing"] == timings.header_value()
+
+
+def test_stage_timings_without_header() -> None:
+    timings = StageTimings(record_metrics=False, server_timing=False)
+    timings.add("score", 0.001)
+    assert "server-timing" not in timings.apply(Response()).headers
+
+
+def test_null_timings_is_noop() -> None:
+    with NULL_TIMINGS.stage("score"):
+        NULL_TIMINGS.add("score", 1.0)
+    response = NULL_TIMINGS.apply(Response())
+    assert "server-timing" not in response.headers
+    NULL_TIMINGS.observe("demo", "recommend")
+    assert not NULL_TIMINGS.enabled
+
+
+# ---------------------------------------------------------------------------
+# Router integration
+# ---------------------------------------------------------------------------
+
+
+def test_router_returns_server_timing_for_recommend() -> None:
+    client = _client(server_timing=True)
+    resp = client.post("/v1/recipes/demo:recommend", json={"user_id": "u1"})
+    assert resp.status_code == 200
+    stages = _stages(resp.headers["server-timing"])
+    assert {"auth", "lookup", "queue", "score", "encode"} <= set(stages)
+    assert all(dur >= 0 for dur in stages.values())
+
+
+def test_router_returns_server_timing_for_batch() -> None:
+    client = _client(server_timing=True)
+    resp = client.post(
+        "/v1/recipes/demo:batch-recommend",
+        json={"requests": [{"user_id": "u1"}, {"user_id": "u1"}]},
+    )
+    assert resp.status_code == 200, resp.text
+    stages = _stages(resp.headers["server-timing"])
+    assert {"lookup", "queue", "validate", "score", "encode"} <= set(stages)
+
+
+def test_router_omits_server_timing_by_default() -> None:
+    client = _client(server_timing=False)
+    resp = client.post("/v1/recipes/demo:recommend", json={"user_id": "u1"})
+    assert resp.status_code == 200
+    assert "server-timing" not in resp.headers
@@ -0,0 +1,89 @@
+"""Unit tests for recotem.serving.warmup."""
+
+from __future__ import annotations
+
+import random
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from recotem.serving import warmup as _warmup
+from recotem.serving.registry import ModelEntry
+from recotem.serving.warmup import warm_up
+from tests.conftest import dense_idmapped_recommender
+
+
+def _entry(rec) -> ModelEntry:
+    return ModelEntry(name="demo", recommender=rec, header={}, kid="t")
+
+
+class _Spy:
+    """Count the calls made through an IDMappedRecommender's public methods."""
+
+    def __init__(self, rec) -> None:
+        self.calls: dict[str, int] = {}
+        for method in (
+            "get_recommendation_for_known_user_id",
+            "get_recommendation_for_known_user_batch",
+            "get_recommendation_for_new_user",
+        ):
+            setattr(rec, method, self._counting(method, getattr(rec, method)))
+
+    def _counting(self, method, fn):
+        def wrapper(*args, **kwargs):
+            self.calls[method] = self.calls.get(method, 0) + 1
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+
+def test_warm_up_runs_synthetic_calls_per_verb():
+    rec = dense_idmapped_recommender(np.random.default_rng(0).random((20, 30)))
+    spy = _Spy(rec)
+
+    seconds = warm_up(_entry(rec), 5, rng=random.Random(0))
+
+    assert seconds is not None and seconds >= 0
+    assert spy.calls["get_recommendation_for_known_user_id"] == 5
+    assert spy.calls["get_recommendation_for_new_user"] == 5
+    # One explicit batch call; single-user calls may also route through it.
+    assert spy.calls["get_recommendation_for_known_user_batch"] >= 1
+
+
+def test_warm_up_samples_at_most_the_known_ids():
+    rec = dense_idmapped_recommender(np.random.default_rng(0).random((2, 3)))
+    spy = _Spy(rec)
+
+    warm_up(_entry(rec), 100)
+
+    assert spy.calls["get_recommendation_for_known_user_id"] == 2
+    assert spy.calls["get_recommendation_for_new_user"] == 3
+
+
+def test_warm_up_skips_when_disabled_or_not_id_mapped():
+    rec = dense_idmapped_recommender(np.ones((2, 2)))
+    spy = _Spy(rec)
+    assert warm_up(_entry(rec), 0) is None
+    assert spy.calls == {}
+
+    other = MagicMock()
+    assert warm_up(_entry(other), 8) is None
+    other.assert_not_called()
+
+
+def test_warm_up_failure_is_logged_and_not_raised(monkeypatch):
+    rec = dense_idmapped_recommender(np.ones((3, 3)))
+
+    def boom(*_args, **_kwargs):
+        raise RuntimeError("cold path exploded")
+
+    rec.get_recommendation_for_known_user_id = boom
+    observed: list[tuple[str, bool]] = []
+    monkeypatch.setattr(
+        _warmup._metrics,
+        "observe_model_warmup",
+        lambda recipe, ok, seconds: observed.append((recipe, ok)),
+    )
+
+    assert warm_up(_entry(rec), 4) is not None
+    assert observed == [("demo", False)]
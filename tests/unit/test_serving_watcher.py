@@ -1975,6 +1975,7 @@ def test_public_reexports_in_module_all() -> None:
 
     expected = {
         "ArtifactWatcher",
+        "apply_ann_config",
         "build_initial_states",
         "read_artifact_bytes",
         "stat_marker",
@@ -5203,3 +5204,273 @@ def test_hot_swap_version_skewed_artifact_keeps_serving_old_model(
     assert "retrain" in entry.last_load_error.lower(), (
         f"the remedy must survive into last_load_error: {entry.last_load_error!r}"
     )
+
+
+# ---------------------------------------------------------------------------
+# Pre-swap warmup
+# ---------------------------------------------------------------------------
+
+
+def test_watcher_warms_new_model_before_swapping_it_in(tmp_path: Path, monkeypatch):
+    """The old entry keeps serving until warm_up has returned."""
+    recipes_dir = tmp_path / "recipes"
+    recipes_dir.mkdir()
+    artifact_path = tmp_path / "model.recotem"
+    _write_valid_artifact(artifact_path)
+    yaml_path = _write_recipe_yaml(recipes_dir, "test", artifact_path)
+
+    registry = ModelRegistry()
+    old_entry = _make_entry("test")
+    old_entry.artifact_path = str(artifact_path)
+    registry.replace("test", old_entry)
+
+    from recotem.recipe.loader import load_recipe
+
+    states = build_initial_states([load_recipe(yaml_path)], {"test": old_entry})
+    cfg = _make_serve_config()
+    cfg.warmup_requests = 7
+    watcher = ArtifactWatcher(
+        registry=registry,
+        recipes_dir=recipes_dir,
+        serve_config=cfg,
+        key_ring=KeyRing(f"active:{ACTIVE_KEY_HEX}"),
+        initial_states=states,
+    )
+
+    seen: list[tuple[bool, int]] = []
+
+    def fake_warm_up(entry, requests):
+        seen.append((registry.get("test") is old_entry, requests))
+        assert entry is not old_entry
+
+    import recotem.serving.watcher as _watcher_module
+
+    monkeypatch.setattr(_watcher_module, "warm_up", fake_warm_up)
+    watcher._load_recipe("test", states["test"], force=True)
+
+    assert seen == [(True, 7)]
+    assert registry.get("test") is not old_entry
+
+
+def test_watcher_without_warmup_passes_zero_requests():
+    cfg = ServeConfig()
+    cfg.warmup_requests = 9
+    watcher = ArtifactWatcher(
+        registry=ModelRegistry(),
+        recipes_dir=Path("."),
+        serve_config=cfg,
+        key_ring=None,
+        warmup=False,
+    )
+    assert watcher._warmup_requests == 0
+    assert (
+        ArtifactWatcher(
+            registry=ModelRegistry(),
+            recipes_dir=Path("."),
+            serve_config=cfg,
+            key_ring=None,
+        )._warmup_requests
+        == 9
+    )
+
+
+# ---------------------------------------------------------------------------
+# Lazy loading (standby entries)
+# ---------------------------------------------------------------------------
+
+
+def test_watcher_never_loads_standby_recipes(tmp_path: Path, monkeypatch):
+    """A changed artifact of a standby recipe is recorded, not loaded."""
+    recipes_dir = tmp_path / "recipes"
+    recipes_dir.mkdir()
+    artifact_path = tmp_path / "model.recotem"
+    _write_valid_artifact(artifact_path)
+    yaml_path = _write_recipe_yaml(recipes_dir, "test", artifact_path)
+
+    from recotem.recipe.loader import load_recipe
+    from recotem.serving.lazy import standby_entry
+
+    registry = ModelRegistry()
+    standby = standby_entry("test", str(artifact_path))
+    standby.last_load_error = "artifact missing or unreadable"
+    registry.replace("test", standby)
+    states = build_initial_states([load_recipe(yaml_path)], {})
+    watcher = ArtifactWatcher(
+        registry=registry,
+        recipes_dir=recipes_dir,
+        serve_config=_make_serve_config(),
+        key_ring=KeyRing(f"active:{ACTIVE_KEY_HEX}"),
+        initial_states=states,
+        lazy=True,
+    )
+    loads: list[str] = []
+    monkeypatch.setattr(
+        watcher, "_load_recipe", lambda name, *a, **k: loads.append(name)
+    )
+
+    watcher._poll_artifacts()
+
+    assert loads == []
+    assert registry.get("test") is standby
+    assert standby.last_load_error is None
+    assert states["test"].last_marker is not None
+
+
+def test_lazy_watcher_registers_discovered_recipes_on_standby(tmp_path: Path):
+    recipes_dir = tmp_path / "recipes"
+    recipes_dir.mkdir()
+    artifact_path = tmp_path / "model.recotem"
+    _write_valid_artifact(artifact_path)
+    _write_recipe_yaml(recipes_dir, "fresh", artifact_path)
+
+    registry = ModelRegistry()
+    watcher = ArtifactWatcher(
+        registry=registry,
+        recipes_dir=recipes_dir,
+        serve_config=_make_serve_config(),
+        key_ring=KeyRing(f"active:{ACTIVE_KEY_HEX}"),
+        lazy=True,
+    )
+    watcher._scan_recipes_dir()
+    watcher._poll_artifacts()
+
+    entry = registry.get("fresh")
+    assert entry is not None and entry.standby and not entry.loaded
+    assert watcher.recipe_for("fresh") is not None
+
+
+def test_identical_reupload_is_recognised_from_the_header(tmp_path: Path) -> None:
+    """Re-uploading the same artifact (new mtime/ETag, same signed bytes) is
+    settled by a header-only read; the payload is never downloaded again.
+    A different artifact still takes the full read.
+    """
+    from unittest.mock import patch
+
+    from recotem.recipe.loader import load_recipe
+    from recotem.serving import watcher as _watcher
+    from recotem.serving.watcher import ArtifactWatcher, _RecipeWatchState
+
+    recipes_dir = tmp_path / "recipes"
+    recipes_dir.mkdir()
+    artifact_path = tmp_path / "model.recotem"
+    _write_valid_artifact(artifact_path)
+    recipe = load_recipe(_write_recipe_yaml(recipes_dir, "same", artifact_path))
+    state = _RecipeWatchState(recipe=recipe, artifact_path=str(artifact_path))
+
+    registry = ModelRegistry()
+    watcher = ArtifactWatcher(
+        registry=registry,
+        recipes_dir=recipes_dir,
+        serve_config=_make_serve_config(),
+        key_ring=KeyRing(f"active:{ACTIVE_KEY_HEX}"),
+        initial_states={"same": state},
+    )
+    watcher._load_recipe("same", state, force=True)
+    loaded = registry.get("same")
+    assert loaded is not None and loaded.loaded and loaded.hmac_digest
+
+    reads: list[str] = []
+    real_read = _watcher._read_artifact_bytes
+
+    def _spy(path: str, max_bytes: int):
+        reads.append(path)
+        return real_read(path, max_bytes)
+
+    with patch.object(_watcher, "_read_artifact_bytes", side_effect=_spy):
+        artifact_path.write_bytes(artifact_path.read_bytes())
+        watcher._load_recipe("same", state, force=False, marker="etag-2")
+        assert reads == []
+        assert state.last_marker == "etag-2"
+        assert registry.get("same") is loaded
+
+        import pickle  # noqa: S403
+
+        artifact_path.write_bytes(
+            build_raw_artifact(
+                kid="active",
+                key_hex=ACTIVE_KEY_HEX,
+                header_dict={"recipe_name": "test", "best_class": "TopPop"},
+                payload_bytes=pickle.dumps({"key": "new"}, protocol=4),
+            )
+        )
+        watcher._load_recipe("same", state, force=False, marker="etag-3")
+        assert reads == [str(artifact_path)]
+        assert registry.get("same").recommender == {"key": "new"}
+
+
+def test_changed_artifacts_load_in_parallel_within_one_poll(tmp_path: Path) -> None:
+    """Several artifacts changing at once are loaded concurrently on the load
+    queue, and _poll_artifacts returns only once every load has finished."""
+    import threading
+    from unittest.mock import patch
+
+    from recotem.recipe.loader import load_recipe
+    from recotem.serving.watcher import ArtifactWatcher, _RecipeWatchState
+
+    recipes_dir = tmp_path / "recipes"
+    recipes_dir.mkdir()
+    registry = ModelRegistry()
+    states = {}
+    for name in ("a", "b", "c"):
+        artifact_path = tmp_path / f"{name}.recotem"
+        _write_valid_artifact(artifact_path)
+        recipe = load_recipe(_write_recipe_yaml(recipes_dir, name, artifact_path))
+        states[name] = _RecipeWatchState(
+            recipe=recipe, artifact_path=str(artifact_path)
+        )
+
+    # First loads (nothing registered yet) must not serialize on the budget.
+    cfg = _make_serve_config()
+    cfg.watcher_load_concurrency = 3
+    watcher = ArtifactWatcher(
+        registry=registry,
+        recipes_dir=recipes_dir,
+        serve_config=cfg,
+        key_ring=KeyRing(f"active:{ACTIVE_KEY_HEX}"),
+        initial_states=states,
+    )
+    all_started = threading.Barrier(3, timeout=5)
+    loaded: list[str] = []
+
+    def _load(name, state, *, force, marker=None):
+        all_started.wait()  # breaks unless all three loads overlap
+        loaded.append(name)
+
+    try:
+        with patch.object(watcher, "_load_recipe", side_effect=_load):
+            watcher._poll_artifacts()
+    finally:
+        watcher.stop()
+
+    assert sorted(loaded) == ["a", "b", "c"]
+
+
+def test_load_size_estimate_prefers_the_new_artifact_size(tmp_path: Path) -> None:
+    """Loads are charged the new local file size; markers without a usable size
+    fall back to the replaced model, then to an even share of the budget."""
+    from recotem.serving.watcher import ArtifactWatcher
+
+    registry = ModelRegistry()
+    cfg = _make_serve_config()
+    cfg.watcher_load_concurrency = 4
+    cfg.watcher_load_budget_bytes = 4000
+    watcher = ArtifactWatcher(
+        registry=registry,
+        recipes_dir=tmp_path,
+        serve_config=cfg,
+        key_ring=KeyRing(f"active:{ACTIVE_KEY_HEX}"),
+        initial_states={},
+    )
+    try:
+        # First load of an object-store artifact: an even share of the budget.
+        assert watcher._load_size_estimate("a", "etag-1") == 1000
+        entry = _make_entry("a")
+        entry.payload_bytes = 700
+        registry.replace("a", entry)
+        # Hot swap: the new file's size, not the old payload's.
+        assert watcher._load_size_estimate("a", (1.0, 3000)) == 3000
+        # ETags and append_sha pointer files carry no artifact size.
+        assert watcher._load_size_estimate("a", "etag-2") == 700
+        assert watcher._load_size_estimate("a", (1.0, 40)) == 700
+    finally:
+        watcher.stop()
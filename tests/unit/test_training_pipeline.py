@@ -124,7 +124,16 @@ def test_end_to_end_movielens_small_n_trials_2(
     kr = _make_key_ring()
     write_calls = []
 
-    def _mock_write(payload_obj, header_dict, key_ring, fs_path, *, versioning):
+    def _mock_write(
+        payload_obj,
+        header_dict,
+        key_ring,
+        fs_path,
+        *,
+        versioning,
+        format_version,
+        compression,
+    ):
         write_calls.append({"header": header_dict, "path": fs_path})
         return fs_path
 
@@ -137,6 +146,54 @@ def test_end_to_end_movielens_small_n_trials_2(
     assert len(write_calls) == 1
 
 
+def test_retrieval_blocks_record_summaries_in_header(tmp_path: Path) -> None:
+    """``ann`` and ``neighbors`` blocks attach their tables and header rows."""
+    import numpy as np
+
+    from recotem.recipe.models import AnnConfig, NeighborsConfig
+    from recotem.training.pipeline import run_training
+
+    rng = np.random.default_rng(0)
+    pd.DataFrame(
+        {
+            "user_id": [f"u{u}" for u in rng.integers(0, 150, 3000)],
+            "item_id": [f"i{i}" for i in rng.integers(0, 120, 3000)],
+        }
+    ).to_csv(tmp_path / "data.csv", index=False)
+    recipe = _make_recipe(tmp_path, algorithms=["IALS"])
+    recipe.ann = AnnConfig(min_items=1)
+    recipe.neighbors = NeighborsConfig(k=10)
+    written = []
+
+    def _mock_write(
+        payload_obj,
+        header_dict,
+        key_ring,
+        fs_path,
+        *,
+        versioning,
+        format_version,
+        compression,
+    ):
+        written.append((payload_obj, header_dict))
+        return fs_path
+
+    run_training(
+        recipe,
+        key_ring=_make_key_ring(),
+        signing_key="active",
+        write_artifact_fn=_mock_write,
+    )
+    payload, header = written[0]
+    assert header["ann"]["status"] == "built"
+    assert 0.0 <= header["ann"]["recall_at_k"] <= 1.0
+    assert header["ann"]["k"] == recipe.training.cutoff
+    assert payload.ann_index["n_probe"] == header["ann"]["n_probe"]
+    assert header["neighbors"]["k"] == 10
+    assert header["neighbors"]["max_seeds"] == 1  # IALS fold-in is not linear
+    assert payload.neighbor_table["indices"].shape[1] == 10
+
+
 # ---------------------------------------------------------------------------
 # min_data_violation
 # ---------------------------------------------------------------------------
@@ -1494,7 +1551,16 @@ def test_train_done_event_includes_recipe_hash_and_data_stats(
 
     kr = _make_key_ring()
 
-    def _mock_write(payload_obj, header_dict, key_ring, fs_path, *, versioning):
+    def _mock_write(
+        payload_obj,
+        header_dict,
+        key_ring,
+        fs_path,
+        *,
+        versioning,
+        format_version,
+        compression,
+    ):
         return fs_path
 
     with structlog.testing.capture_logs() as cap:
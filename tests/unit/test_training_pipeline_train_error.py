@@ -236,7 +236,16 @@ def test_run_training_emits_train_done_event_with_canonical_fields(
 
     fake_recommender = MagicMock()
 
-    def _mock_write(payload_obj, header_dict, key_ring, fs_path, *, versioning):
+    def _mock_write(
+        payload_obj,
+        header_dict,
+        key_ring,
+        fs_path,
+        *,
+        versioning,
+        format_version,
+        compression,
+    ):
         return artifact_path
 
     # Mock data fetch → tiny DataFrame.
@@ -434,3 +434,93 @@ def test_batch_recommend_no_items_degraded_header_even_when_metadata_degrades()
         ":batch-recommend must NOT set X-Recotem-Items-Degraded even when "
         "metadata serialization degrades"
     )
+
+
+def test_batch_recommend_scores_valid_elements_in_one_block() -> None:
+    """IDMappedRecommender batches are scored with a single score-block call;
+    invalid and unknown elements keep their own error entries in order."""
+    from tests.conftest import dense_idmapped_recommender
+
+    rec = dense_idmapped_recommender(
+        [
+            [0.9, 0.1, 0.5],
+            [0.2, 0.8, 0.3],
+        ]
+    )
+    r = _client(rec).post(
+        "/v1/recipes/demo:batch-recommend",
+        json={
+            "requests": [
+                {"user_id": "u1", "limit": 2},
+                {"user_id": "ghost"},
+                {"limit": 3},
+                {"user_id": "u0", "limit": 1},
+            ]
+        },
+    )
+    assert r.status_code == 200, r.text
+    results = r.json()["results"]
+    assert [e["index"] for e in results] == [0, 1, 2, 3]
+    assert [i["item_id"] for i in results[0]["items"]] == ["i1", "i2"]
+    assert results[1]["error"]["code"] == "UNKNOWN_USER"
+    assert results[2]["error"]["code"] == "VALIDATION_ERROR"
+    assert [i["item_id"] for i in results[3]["items"]] == ["i0"]
+    assert rec.recommender.known_calls == [[1, 0]]
+
+
+def test_batch_recommend_falls_back_per_element_when_block_fails() -> None:
+    """A failure of the batched call is isolated to the elements that also
+    fail on their own; the rest of the batch still succeeds."""
+    from unittest.mock import patch
+
+    from tests.conftest import dense_idmapped_recommender
+
+    rec = dense_idmapped_recommender([[0.9, 0.1], [0.2, 0.8]])
+
+    def _single(user_id, cutoff=20):
+        if user_id == "u1":
+            raise RuntimeError("boom")
+        return [("i0", 0.9)]
+
+    with (
+        patch.object(
+            rec,
+            "get_recommendation_for_known_user_batch",
+            side_effect=RuntimeError("boom"),
+        ),
+        patch.object(rec, "get_recommendation_for_known_user_id", side_effect=_single),
+    ):
+        r = _client(rec).post(
+            "/v1/recipes/demo:batch-recommend",
+            json={"requests": [{"user_id": "u0"}, {"user_id": "u1"}]},
+        )
+    assert r.status_code == 200, r.text
+    results = r.json()["results"]
+    assert results[0]["status"] == "ok"
+    assert results[0]["items"][0]["item_id"] == "i0"
+    assert results[1]["error"]["code"] == "INTERNAL_ERROR"
+
+
+def test_batch_recommend_exclusions_still_fill_limit() -> None:
+    """Per-element exclude_items is masked inside the batched score block."""
+    from tests.conftest import dense_idmapped_recommender
+
+    rec = dense_idmapped_recommender(
+        [
+            [0.9, 0.8, 0.7, 0.6],
+            [0.1, 0.2, 0.3, 0.4],
+        ]
+    )
+    r = _client(rec).post(
+        "/v1/recipes/demo:batch-recommend",
+        json={
+            "requests": [
+                {"user_id": "u0", "limit": 2, "exclude_items": ["i0"]},
+                {"user_id": "u1", "limit": 2, "exclude_items": ["i3", "i2"]},
+            ]
+        },
+    )
+    assert r.status_code == 200, r.text
+    results = r.json()["results"]
+    assert [i["item_id"] for i in results[0]["items"]] == ["i1", "i2"]
+    assert [i["item_id"] for i in results[1]["items"]] == ["i1", "i0"]
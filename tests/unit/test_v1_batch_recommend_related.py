@@ -377,3 +377,46 @@ def test_batch_recommend_related_no_items_degraded_header_even_when_metadata_deg
         ":batch-recommend-related must NOT set X-Recotem-Items-Degraded even when "
         "metadata serialization degrades"
     )
+
+
+def test_batch_related_scores_seed_lists_in_one_matrix() -> None:
+    """IDMappedRecommender seed lists are packed into one sparse matrix."""
+    from tests.conftest import build_v1_app, dense_idmapped_recommender
+
+    rec = dense_idmapped_recommender(
+        [
+            [1.0, 0.0, 1.0],
+            [0.0, 1.0, 1.0],
+        ]
+    )
+    entry = ModelEntry(
+        name="demo",
+        recommender=rec,
+        header={},
+        kid="t",
+        metadata_df=None,
+        metadata_index=None,
+        loaded=True,
+        _loaded_marker=(None, _FAKE_SHA256_HEX),
+        loaded_at_unix=1.0,
+    )
+    registry = ModelRegistry()
+    registry.replace("demo", entry)
+    r = TestClient(build_v1_app(registry)).post(
+        "/v1/recipes/demo:batch-recommend-related",
+        json={
+            "requests": [
+                {"seed_items": ["i0"], "limit": 1},
+                {"seed_items": ["zzz"]},
+                {"seed_items": ["i1", "i2"], "limit": 1},
+            ]
+        },
+    )
+    assert r.status_code == 200, r.text
+    results = r.json()["results"]
+    assert [e["status"] for e in results] == ["ok", "error", "ok"]
+    assert results[0]["items"][0]["item_id"] == "i2"
+    assert results[1]["error"]["code"] == "UNKNOWN_SEED_ITEMS"
+    assert results[2]["items"][0]["item_id"] == "i0"
+    (X,) = rec.recommender.cold_calls
+    assert X.shape == (2, 3)
@@ -0,0 +1,222 @@
+# tests/unit/test_v1_columnar_responses.py
+"""Arrow IPC / MessagePack responses of the v1 verbs, negotiated via Accept."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import numpy as np
+import pyarrow as pa
+import pytest
+from fastapi.testclient import TestClient
+
+from recotem.serving import columnar as _columnar
+from recotem.serving.cache import ResponseCache
+from recotem.serving.registry import ModelEntry, ModelRegistry
+from tests.conftest import build_v1_app, dense_idmapped_recommender
+
+_FAKE_SHA256_HEX = "c" * 64
+_ARROW = {"Accept": _columnar.ARROW_STREAM_MEDIA_TYPE}
+
+
+def _client(**kwargs) -> TestClient:
+    rng = np.random.default_rng(0)
+    entry = ModelEntry(
+        name="demo",
+        recommender=dense_idmapped_recommender(rng.random((6, 40))),
+        header={},
+        kid="t",
+        metadata_df=None,
+        metadata_index=None,
+        loaded=True,
+        _loaded_marker=(None, _FAKE_SHA256_HEX),
+        loaded_at_unix=1.0,
+    )
+    registry = ModelRegistry()
+    registry.replace("demo", entry)
+    return TestClient(build_v1_app(registry, **kwargs))
+
+
+def _read_arrow(content: bytes) -> pa.Table:
+    return pa.ipc.open_stream(pa.BufferReader(content)).read_all()
+
+
+def test_batch_recommend_arrow_matches_json():
+    client = _client()
+    body = {
+        "requests": [
+            {"user_id": "u0", "limit": 3},
+            {"user_id": "nobody"},
+            {"user_id": "u2", "limit": 2, "exclude_items": ["i1"]},
+            {"limit": 2},
+        ]
+    }
+    url = "/v1/recipes/demo:batch-recommend"
+    as_json = client.post(url, json=body).json()
+    r = client.post(url, json=body, headers=_ARROW)
+
+    assert r.status_code == 200
+    assert r.headers["content-type"] == _columnar.ARROW_STREAM_MEDIA_TYPE
+    assert "Accept" in r.headers["vary"]
+    table = _read_arrow(r.content)
+    assert table.schema.names == ["index", "item_id", "score"]
+    meta = table.schema.metadata
+    assert meta[b"request_id"] == r.headers["x-request-id"].encode()
+    assert meta[b"recipe"] == b"demo"
+    assert meta[b"model_version"].decode() == as_json["model_version"]
+
+    expected = [
+        (res["index"], item["item_id"], item["score"])
+        for res in as_json["results"]
+        if res["status"] == "ok"
+        for item in res["items"]
+    ]
+    assert (
+        list(
+            zip(
+                table["index"].to_pylist(),
+                table["item_id"].to_pylist(),
+                table["score"].to_pylist(),
+                strict=True,
+            )
+        )
+        == expected
+    )
+    errors = json.loads(meta[b"errors"])
+    assert [(e["index"], e["code"]) for e in errors] == [
+        (1, "UNKNOWN_USER"),
+        (3, "VALIDATION_ERROR"),
+    ]
+
+
+def test_batch_recommend_related_arrow_reports_no_candidates():
+    client = _client()
+    body = {
+        "requests": [
+            {"seed_items": ["i0"], "limit": 2},
+            {"seed_items": ["nope"]},
+            # Every candidate excluded: the ranker has nothing left.
+            {
+                "seed_items": ["i0"],
+                "limit": 1,
+                "exclude_items": [f"i{j}" for j in range(40)],
+            },
+        ]
+    }
+    r = client.post(
+        "/v1/recipes/demo:batch-recommend-related", json=body, headers=_ARROW
+    )
+    assert r.status_code == 200
+    table = _read_arrow(r.content)
+    assert set(table["index"].to_pylist()) == {0}
+    codes = {
+        e["index"]: e["code"] for e in json.loads(table.schema.metadata[b"errors"])
+    }
+    assert codes[1] == "UNKNOWN_SEED_ITEMS"
+    assert codes[2] == "NO_CANDIDATES"
+
+
+def test_recommend_arrow_bypasses_response_cache():
+    client = _client(response_cache=ResponseCache(max_bytes=1 << 20))
+    url = "/v1/recipes/demo:recommend"
+    body = {"user_id": "u1", "limit": 4}
+    first = client.post(url, json=body).json()
+
+    r = client.post(url, json=body, headers=_ARROW)
+    table = _read_arrow(r.content)
+    assert table["index"].to_pylist() == [0] * 4
+    assert table["item_id"].to_pylist() == [i["item_id"] for i in first["items"]]
+    # JSON is still served (from the cache) afterwards.
+    assert client.post(url, json=body).json()["items"] == first["items"]
+
+
+def test_recommend_unknown_user_keeps_json_error():
+    r = _client().post(
+        "/v1/recipes/demo:recommend", json={"user_id": "nobody"}, headers=_ARROW
+    )
+    assert r.status_code == 404
+    assert r.json()["code"] == "UNKNOWN_USER"
+
+
+@pytest.mark.parametrize(
+    "accept",
+    [
+        None,
+        "*/*",
+        "application/json",
+        "text/html",
+        f"{_columnar.ARROW_STREAM_MEDIA_TYPE};q=0.5, application/json",
+    ],
+)
+def test_json_stays_the_default(accept):
+    headers = {"Accept": accept} if accept else {}
+    r = _client().post(
+        "/v1/recipes/demo:recommend", json={"user_id": "u0"}, headers=headers
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/json")
+
+
+def test_arrow_response_is_gzip_compressed_when_accepted():
+    client = _client()
+    body = {"requests": [{"user_id": f"u{i}", "limit": 40} for i in range(6)]}
+    r = client.post(
+        "/v1/recipes/demo:batch-recommend",
+        json=body,
+        headers={**_ARROW, "Accept-Encoding": "gzip"},
+    )
+    assert r.status_code == 200
+    assert r.headers["content-encoding"] == "gzip"
+    # The test client decodes the body transparently.
+    assert _read_arrow(r.content).num_rows == 240
+
+
+def test_small_body_is_not_compressed():
+    r = _client().post(
+        "/v1/recipes/demo:recommend",
+        json={"user_id": "u0", "limit": 1},
+        headers={**_ARROW, "Accept-Encoding": "gzip"},
+    )
+    assert "content-encoding" not in r.headers
+
+
+@pytest.mark.skipif(
+    not _columnar.msgpack_available(), reason="msgpack extra not installed"
+)
+def test_batch_recommend_msgpack():
+    import msgpack
+
+    r = _client().post(
+        "/v1/recipes/demo:batch-recommend",
+        json={"requests": [{"user_id": "u0", "limit": 2}, {"user_id": "x"}]},
+        headers={"Accept": _columnar.MSGPACK_MEDIA_TYPE},
+    )
+    assert r.headers["content-type"] == _columnar.MSGPACK_MEDIA_TYPE
+    payload = msgpack.unpackb(r.content)
+    assert payload["index"] == [0, 0]
+    assert len(payload["item_id"]) == len(payload["score"]) == 2
+    assert payload["errors"] == [
+        {"index": 1, "code": "UNKNOWN_USER", "message": "user not seen during training"}
+    ]
+
+
+def test_negotiate_prefers_highest_q():
+    neg = _columnar.negotiate(
+        f"application/json;q=0.4, {_columnar.ARROW_STREAM_MEDIA_TYPE};q=0.9", None
+    )
+    assert neg == _columnar.Negotiated("arrow", "identity")
+    assert not _columnar.negotiate("application/json", "gzip").columnar
+
+
+def test_negotiate_coding_honours_q_zero():
+    arrow = _columnar.ARROW_STREAM_MEDIA_TYPE
+    assert _columnar.negotiate(arrow, "*, gzip;q=0, zstd;q=0").coding == "identity"
+    assert _columnar.negotiate(arrow, "br").coding == "identity"
+    assert _columnar.negotiate(arrow, "gzip;q=1, zstd;q=0").coding == "gzip"
+
+
+def test_compress_gzip_roundtrip():
+    data = b"x" * 4096
+    assert gzip.decompress(_columnar.compress(data, "gzip")) == data
+    assert _columnar.compress(data, "identity") is data
@@ -11,6 +11,7 @@ covered separately in ``tests/unit/test_metadata_loader.py``.
 
 from __future__ import annotations
 
+import math
 from unittest.mock import MagicMock
 
 import pandas as pd
@@ -334,11 +335,11 @@ def test_recommend_related_strips_denied_fields() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_build_items_fallback_path_via_monkeypatch(
+def test_build_items_fallback_path_for_unencodable_metadata(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Scenario A (fallback): first model_validate (full fields) raises
-    ValidationError; second call (bare item_id/score) succeeds.
+    """Scenario A (fallback): an item's metadata cannot be JSON-encoded, so
+    the item is served with only item_id and score.
 
     Asserts:
     - Response is 200.
@@ -348,17 +349,15 @@ def test_build_items_fallback_path_via_monkeypatch(
     - recotem_metadata_serialization_errors_total{recipe,verb} increments.
     """
     import structlog.testing
-    from pydantic import ValidationError
 
     import recotem.serving.metrics as _metrics_mod
-    from recotem.serving.schemas import RecommendItem
 
     rec = MagicMock()
     rec.get_recommendation_for_known_user_id.return_value = [
         ("i1", 0.9),
         ("i2", 0.5),
     ]
-    meta_index = {"i1": {"title": "Widget A"}, "i2": {"title": "Widget B"}}
+    meta_index = {"i1": {"title": object()}, "i2": {"title": "Widget B"}}
     entry = ModelEntry(
         name="demo",
         recommender=rec,
@@ -372,37 +371,7 @@ def test_build_items_fallback_path_via_monkeypatch(
     )
     client = _make_client(entry)
 
-    original_validate = RecommendItem.model_validate
-    call_state: dict[str, int] = {}
-
-    def _failing_first_with_title(data, *args, **kwargs):
-        key = (data.get("item_id"), "has_title" if "title" in data else "bare")
-        if key[0] == "i1" and key[1] == "has_title":
-            call_state.setdefault("fail_count", 0)
-            call_state["fail_count"] += 1
-            raise original_validate(
-                {"item_id": "i1", "score": float("inf")}  # triggers allow_inf_nan=False
-            ).__class__  # won't reach here — need real ValidationError below
-
-    del _failing_first_with_title
-
-    first_call: dict[str, bool] = {}
-
-    def _patched_validate(data, *args, **kwargs):
-        if isinstance(data, dict) and data.get("item_id") == "i1" and "title" in data:
-            first_call["seen"] = True
-            try:
-                return original_validate({"item_id": "i1", "score": float("inf")})
-            except ValidationError as exc:
-                raise exc
-        return original_validate(data, *args, **kwargs)
-
-    monkeypatch.setattr(
-        RecommendItem, "model_validate", staticmethod(_patched_validate)
-    )
-
     degraded_calls: list[tuple[str, str, str, int]] = []
-    real_inc = _metrics_mod.inc_metadata_degraded_items
 
     def _spy_degraded(recipe, verb, kind, count=1):
         degraded_calls.append((recipe, verb, kind, count))
@@ -410,7 +379,6 @@ def test_build_items_fallback_path_via_monkeypatch(
     monkeypatch.setattr(_metrics_mod, "inc_metadata_degraded_items", _spy_degraded)
 
     serialization_calls: list[tuple[str, str]] = []
-    real_serialization = _metrics_mod.inc_metadata_serialization_error
 
     def _spy_serialization(recipe, verb):
         serialization_calls.append((recipe, verb))
@@ -425,34 +393,30 @@ def test_build_items_fallback_path_via_monkeypatch(
         )
 
     assert r.status_code == 200, r.text
-    degraded_val = r.headers.get("x-recotem-items-degraded")
-    assert degraded_val is not None, (
-        "X-Recotem-Items-Degraded must be set when fallback occurs"
-    )
-    assert int(degraded_val) >= 1, (
-        f"X-Recotem-Items-Degraded must be >= 1; got {degraded_val!r}"
-    )
-
-    fallback_events = [e for e in degraded_calls if e[2] == "fallback"]
-    assert fallback_events, (
-        f"inc_metadata_degraded_items must be called with kind='fallback'; got {degraded_calls!r}"
-    )
+    assert r.json()["items"] == [
+        {"item_id": "i1", "score": 0.9},
+        {"item_id": "i2", "score": 0.5, "title": "Widget B"},
+    ]
+    assert r.headers.get("x-recotem-items-degraded") == "1"
+    assert degraded_calls == [("demo", "recommend", "fallback", 1)]
 
     log_events = [e for e in cap if e.get("event") == "metadata_serialization_failed"]
     assert log_events, (
         f"metadata_serialization_failed log event must be emitted; got {[e.get('event') for e in cap]!r}"
     )
-
-    assert serialization_calls, (
-        f"inc_metadata_serialization_error must be called; got {serialization_calls!r}"
-    )
+    assert serialization_calls == [("demo", "recommend")]
 
 
-def test_build_items_dropped_path_via_monkeypatch(
-    monkeypatch: pytest.MonkeyPatch,
+@pytest.mark.parametrize(
+    "bad_item",
+    [("x" * 257, 0.9), ("", 0.9), ("bad-item", float("inf")), ("bad", math.nan)],
+    ids=["long-id", "empty-id", "inf-score", "nan-score"],
+)
+def test_build_items_dropped_path_for_invalid_item(
+    monkeypatch: pytest.MonkeyPatch, bad_item: tuple[str, float]
 ) -> None:
-    """Scenario B (dropped): both model_validate calls (full and bare) raise
-    ValidationError for a specific item.
+    """Scenario B (dropped): an item violates the RecommendItem constraints
+    (item_id length, finite score), so it cannot be served even bare.
 
     Asserts:
     - Response is 200 (other items served).
@@ -462,16 +426,11 @@ def test_build_items_dropped_path_via_monkeypatch(
     - recotem_metadata_serialization_errors_total{recipe,verb} increments.
     """
     import structlog.testing
-    from pydantic import ValidationError
 
     import recotem.serving.metrics as _metrics_mod
-    from recotem.serving.schemas import RecommendItem
 
     rec = MagicMock()
-    rec.get_recommendation_for_known_user_id.return_value = [
-        ("bad-item", 0.9),
-        ("i2", 0.5),
-    ]
+    rec.get_recommendation_for_known_user_id.return_value = [bad_item, ("i2", 0.5)]
     meta_index: dict[str, dict] = {}
     entry = ModelEntry(
         name="demo",
@@ -486,20 +445,6 @@ def test_build_items_dropped_path_via_monkeypatch(
     )
     client = _make_client(entry)
 
-    original_validate = RecommendItem.model_validate
-
-    def _patched_validate(data, *args, **kwargs):
-        if isinstance(data, dict) and data.get("item_id") == "bad-item":
-            try:
-                return original_validate({"item_id": "bad-item", "score": float("inf")})
-            except ValidationError as exc:
-                raise exc
-        return original_validate(data, *args, **kwargs)
-
-    monkeypatch.setattr(
-        RecommendItem, "model_validate", staticmethod(_patched_validate)
-    )
-
     degraded_calls: list[tuple[str, str, str, int]] = []
 
     def _spy_degraded(recipe, verb, kind, count=1):
@@ -523,36 +468,24 @@ def test_build_items_dropped_path_via_monkeypatch(
 
     assert r.status_code == 200, r.text
     items = r.json()["items"]
-    item_ids = [it["item_id"] for it in items]
-    assert "bad-item" not in item_ids, "Dropped item must not appear in response"
-    assert "i2" in item_ids, "Valid item must still be served"
-
-    degraded_val = r.headers.get("x-recotem-items-degraded")
-    assert degraded_val is not None, (
-        "X-Recotem-Items-Degraded must be set when drop occurs"
-    )
-    assert int(degraded_val) >= 1
-
-    dropped_events = [e for e in degraded_calls if e[2] == "dropped"]
-    assert dropped_events, (
-        f"inc_metadata_degraded_items must be called with kind='dropped'; got {degraded_calls!r}"
+    assert [it["item_id"] for it in items] == ["i2"], (
+        "Dropped item must not appear; valid item must still be served"
     )
+    assert r.headers.get("x-recotem-items-degraded") == "1"
+    assert degraded_calls == [("demo", "recommend", "dropped", 1)]
 
     log_events = [e for e in cap if e.get("event") == "metadata_serialization_failed"]
     assert log_events, (
         f"metadata_serialization_failed log event must be emitted; got {[e.get('event') for e in cap]!r}"
     )
-
-    assert serialization_calls, (
-        f"inc_metadata_serialization_error must be called; got {serialization_calls!r}"
-    )
+    assert serialization_calls == [("demo", "recommend")]
 
 
 def test_build_items_fallback_and_degraded_header() -> None:
     """_build_items with no degradation must not set X-Recotem-Items-Degraded.
 
     This confirms the "all items OK" baseline is clean before the degradation
-    scenarios in the monkeypatch tests above.
+    scenarios in the tests above.
     """
     rec = MagicMock()
     rec.get_recommendation_for_known_user_id.return_value = [
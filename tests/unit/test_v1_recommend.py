@@ -124,6 +124,20 @@ def test_recommend_excludes_items() -> None:
     assert len(ids) == 3
 
 
+def test_recommend_exclusions_still_fill_limit() -> None:
+    """exclude_items is masked before top-k, so ``limit`` items come back."""
+    from tests.conftest import dense_idmapped_recommender
+
+    rec = dense_idmapped_recommender([[0.9, 0.8, 0.7, 0.6, 0.5, 0.4]])
+    client = _app_with_entry(_entry_with_recommender(rec))
+    r = client.post(
+        "/v1/recipes/demo:recommend",
+        json={"user_id": "u0", "limit": 3, "exclude_items": ["i0", "i2"]},
+    )
+    assert r.status_code == 200, r.text
+    assert [i["item_id"] for i in r.json()["items"]] == ["i1", "i3", "i4"]
+
+
 def test_recommend_rejects_context_field() -> None:
     """context field has been removed; sending it must produce 422 (extra=forbid)."""
     rec = MagicMock()
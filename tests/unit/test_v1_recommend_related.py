@@ -147,6 +147,20 @@ def test_recommend_related_excludes_items() -> None:
     assert len(ids) == 3
 
 
+def test_recommend_related_forwards_exclusions_to_scoring() -> None:
+    """Exclusions are pushed into the recommender call, not only post-filtered."""
+    rec = MagicMock()
+    rec.get_recommendation_for_new_user.return_value = [("i1", 0.9), ("i3", 0.7)]
+    r = _client_with_recommender(rec, known_items=["s1"]).post(
+        "/v1/recipes/demo:recommend-related",
+        json={"seed_items": ["s1"], "limit": 2, "exclude_items": ["i2"]},
+    )
+    assert r.status_code == 200, r.text
+    rec.get_recommendation_for_new_user.assert_called_once_with(
+        ["s1"], 2, exclude_item_ids=["i2"]
+    )
+
+
 def test_recommend_related_rejects_oversized_seed_item() -> None:
     rec = MagicMock()
     r = _client_with_recommender(rec).post(
@@ -0,0 +1,147 @@
+# tests/unit/test_v1_stream_recommend.py
+"""POST /v1/recipes/{name}:stream-recommend — NDJSON in, NDJSON out."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from recotem.serving.admission import AdmissionController
+from recotem.serving.registry import ModelEntry, ModelRegistry
+from recotem.serving.routes import _ndjson_lines
+from tests.conftest import build_v1_app, dense_idmapped_recommender
+
+_FAKE_SHA256_HEX = "b" * 64
+_URL = "/v1/recipes/demo:stream-recommend"
+
+
+def _recommender():
+    rng = np.random.default_rng(0)
+    return dense_idmapped_recommender(rng.random((6, 5)))
+
+
+def _client(rec, **kwargs) -> TestClient:
+    entry = ModelEntry(
+        name="demo",
+        recommender=rec,
+        header={},
+        kid="t",
+        metadata_df=None,
+        metadata_index=None,
+        loaded=True,
+        _loaded_marker=(None, _FAKE_SHA256_HEX),
+        loaded_at_unix=1.0,
+    )
+    registry = ModelRegistry()
+    registry.replace("demo", entry)
+    return TestClient(build_v1_app(registry, **kwargs))
+
+
+def _ndjson(*objs) -> bytes:
+    return b"".join(json.dumps(o).encode() + b"\n" for o in objs)
+
+
+def _results(resp) -> list[dict]:
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+def test_stream_recommend_per_line_semantics():
+    body = (
+        _ndjson({"user_id": "u0", "limit": 2})
+        + b"\n"  # blank lines are skipped and take no index
+        + b"{not json\n"
+        + b"[1, 2]\n"
+        + _ndjson({"user_id": "nobody"}, {"user_id": "u1", "limit": 0})
+        + b'{"user_id": "u2", "limit": 3}'  # no trailing newline
+    )
+    r = _client(_recommender()).post(
+        _URL, content=body, headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    assert r.headers["x-recotem-model-version"] == f"sha256:{_FAKE_SHA256_HEX}"
+
+    results = _results(r)
+    assert [res["index"] for res in results] == [0, 1, 2, 3, 4, 5]
+    assert results[0]["status"] == "ok"
+    assert len(results[0]["items"]) == 2
+    assert results[1]["error"] == {
+        "code": "VALIDATION_ERROR",
+        "message": "invalid JSON",
+    }
+    assert results[2]["error"]["message"] == "request must be an object"
+    assert results[3]["error"]["code"] == "UNKNOWN_USER"
+    assert results[4]["error"]["code"] == "VALIDATION_ERROR"
+    assert results[4]["error"]["message"].startswith("limit:")
+    assert len(results[5]["items"]) == 3
+
+
+def test_stream_recommend_scores_in_chunks():
+    rec = _recommender()
+    users = [{"user_id": f"u{i}", "limit": 1} for i in range(5)]
+    r = _client(rec, stream_chunk_size=2).post(_URL, content=_ndjson(*users))
+
+    assert r.status_code == 200, r.text
+    results = _results(r)
+    assert [res["index"] for res in results] == [0, 1, 2, 3, 4]
+    assert all(res["status"] == "ok" for res in results)
+    # One score block per chunk of (at most) two users.
+    assert [len(call) for call in rec.recommender.known_calls] == [2, 2, 1]
+    expected = rec.get_recommendation_for_known_user_batch(["u3"], 1)[0]
+    assert results[3]["items"] == [
+        {"item_id": item, "score": score} for item, score in expected
+    ]
+
+
+def test_stream_recommend_accepts_a_streamed_body():
+    def body():
+        for i in range(4):
+            # Split each line across two body chunks.
+            line = _ndjson({"user_id": f"u{i}", "limit": 1})
+            yield line[:5]
+            yield line[5:]
+
+    r = _client(_recommender(), stream_chunk_size=3).post(_URL, content=body())
+    assert r.status_code == 200, r.text
+    assert [res["status"] for res in _results(r)] == ["ok"] * 4
+
+
+def test_stream_recommend_empty_body():
+    r = _client(_recommender()).post(_URL, content=b"\n\n")
+    assert r.status_code == 200
+    assert r.text == ""
+
+
+def test_stream_recommend_404_before_streaming():
+    r = _client(_recommender()).post(
+        "/v1/recipes/missing:stream-recommend", content=_ndjson({"user_id": "u0"})
+    )
+    assert r.status_code == 404
+    assert r.json()["code"] == "RECIPE_NOT_FOUND"
+
+
+def test_stream_recommend_first_chunk_is_shed_with_429():
+    admission = AdmissionController(recipe_max_inflight=1, retry_after_seconds=2)
+    client = _client(_recommender(), admission=admission)
+    admission.acquire("demo")
+    r = client.post(_URL, content=_ndjson({"user_id": "u0"}))
+    admission.release("demo", 1)
+    assert r.status_code == 429
+    assert r.json()["code"] == "OVERLOADED"
+    assert r.headers["retry-after"] == "2"
+    assert admission.inflight() == 0
+
+
+def test_ndjson_lines_reports_overlong_lines():
+    async def chunks():
+        yield b'{"a": 1}\n' + b"x" * 6
+        yield b"x" * 6 + b"\n{}"
+        yield b"\n" + b"y" * 20
+
+    async def collect():
+        return [line async for line in _ndjson_lines(chunks(), 10)]
+
+    assert asyncio.run(collect()) == [b'{"a": 1}', None, b"{}", None]